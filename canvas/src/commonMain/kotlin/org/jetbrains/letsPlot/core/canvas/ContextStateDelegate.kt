@@ -90,6 +90,22 @@ open class ContextStateDelegate(
         return currentState.strokeWidth
     }
 
+    fun getLineCap(): LineCap {
+        return currentState.lineCap
+    }
+
+    fun getLineJoin(): LineJoin {
+        return currentState.lineJoin
+    }
+
+    fun getMiterLimit(): Double {
+        return currentState.miterLimit
+    }
+
+    fun getGlobalAlpha(): Double {
+        return currentState.globalAlpha
+    }
+
     fun getImageSmoothingEnabled(): Boolean {
         return currentState.imageSmoothingEnabled
     }
@@ -9,63 +9,58 @@ package org.jetbrains.letsPlot.commons.encoding
 object Base64 {
     private const val alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
     private const val padChar = '='
-    private val decoderMap = alphabet.mapIndexed { index, c -> c to index }.toMap()
-    private val validSymbols = alphabet.toSet() + padChar
 
-    private fun Char.alphabetToByte(): Int = decoderMap.getOrElse(this) { 0 }
+    // Char code -> 6-bit value, -1 for symbols not in the alphabet.
+    private val decoderTable = IntArray(128) { -1 }.also { table ->
+        alphabet.forEachIndexed { index, c -> table[c.code] = index }
+    }
 
-    fun encode(bytes: ByteArray): String {
-        val result = StringBuilder()
-        bytes.asSequence()
-            .map { it.toInt() and 0b11111111 } // reset a sign bit in case of negative value
-            .windowed(3, step = 3, partialWindows = true)
-            .forEach { block ->
-                val word =
-                    (block.getOrElse(0) { 0 } shl 16) or
-                            (block.getOrElse(1) { 0 } shl 8) or
-                            (block.getOrElse(2) { 0 })
+    private fun isValidSymbol(c: Char): Boolean = c == padChar || (c.code < 128 && decoderTable[c.code] >= 0)
+
+    private fun Char.alphabetToByte(): Int = if (code < 128) maxOf(decoderTable[code], 0) else 0
 
-                val c1 = alphabet[word ushr 18 and 0b111111]
-                val c2 = alphabet[word ushr 12 and 0b111111]
-                val c3 = alphabet[word ushr 6 and 0b111111]
-                val c4 = alphabet[word and 0b111111]
+    fun encode(bytes: ByteArray): String {
+        // Encoded by 3-byte blocks, each into 4 symbols (with '=' padding of the last partial block).
+        val result = CharArray((bytes.size + 2) / 3 * 4)
+        var i = 0
+        var j = 0
+        while (i < bytes.size) {
+            val blockSize = minOf(3, bytes.size - i)
+            val word =
+                ((bytes[i].toInt() and 0xff) shl 16) or
+                        ((if (blockSize > 1) bytes[i + 1].toInt() and 0xff else 0) shl 8) or
+                        (if (blockSize > 2) bytes[i + 2].toInt() and 0xff else 0)
 
-                when (block.size) {
-                    3 -> result.append(c1, c2, c3, c4)
-                    2 -> result.append(c1, c2, c3, padChar)
-                    1 -> result.append(c1, c2, padChar, padChar)
-                    else -> Unit
-                }
-            }
+            result[j++] = alphabet[word ushr 18 and 0b111111]
+            result[j++] = alphabet[word ushr 12 and 0b111111]
+            result[j++] = if (blockSize > 1) alphabet[word ushr 6 and 0b111111] else padChar
+            result[j++] = if (blockSize > 2) alphabet[word and 0b111111] else padChar
+            i += 3
+        }
 
-        return result.toString()
+        return result.concatToString()
     }
 
     fun decode(data: String): ByteArray {
         @Suppress("NAME_SHADOWING")
-        val data = data.filter { it in validSymbols }
+        val data = if (data.all(::isValidSymbol)) data else data.filter(::isValidSymbol)
 
         require(data.length % 4 == 0) { "Invalid string length: ${data.length}" }
 
         val buffer = ByteArray(data.length / 4 * 3 - data.takeLast(2).count { padChar == it })
         var i = 0
 
-        data.windowed(4, step = 4)
-            .forEach { block ->
-                val word =
-                    (block[0].alphabetToByte() shl 18) or
-                            (block[1].alphabetToByte() shl 12) or
-                            (block[2].alphabetToByte() shl 6) or
-                            (block[3].alphabetToByte())
-
-                val b1 = (word ushr 16).toByte()
-                val b2 = (word ushr 8).toByte()
-                val b3 = word.toByte()
+        for (start in data.indices step 4) {
+            val word =
+                (data[start].alphabetToByte() shl 18) or
+                        (data[start + 1].alphabetToByte() shl 12) or
+                        (data[start + 2].alphabetToByte() shl 6) or
+                        (data[start + 3].alphabetToByte())
 
-                buffer[i++] = b1
-                if (block[2] != padChar) buffer[i++] = b2
-                if (block[3] != padChar) buffer[i++] = b3
-            }
+            buffer[i++] = (word ushr 16).toByte()
+            if (data[start + 2] != padChar) buffer[i++] = (word ushr 8).toByte()
+            if (data[start + 3] != padChar) buffer[i++] = word.toByte()
+        }
 
         return buffer
     }
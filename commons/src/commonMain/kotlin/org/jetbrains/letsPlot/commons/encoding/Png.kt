@@ -6,11 +6,13 @@
 package org.jetbrains.letsPlot.commons.encoding
 
 import org.jetbrains.letsPlot.commons.values.Bitmap
+import kotlin.math.abs
+import kotlin.math.max
 import kotlin.math.min
 import kotlin.math.roundToLong
 
 /** * PNG encoder/decoder.
- * Supports only 8-bit RGBA PNG format without filters.
+ * Supports only 8-bit RGBA PNG format (non-interlaced).
  *
  * To clean up any PNG to match these requirements, use the following Python function:
  *
@@ -43,6 +45,19 @@ import kotlin.math.roundToLong
  *         writer.write(f_output, pixels_list_original_format)
  */
 object Png {
+    private val SIGNATURE = byteArrayOf(137.toByte(), 80, 78, 71, 13, 10, 26, 10)
+    private const val BYTES_PER_PIXEL = 4
+
+    /**
+     * Maximum size of an IDAT chunk: the compressed image data is split into several chunks.
+     */
+    const val DEF_IDAT_CHUNK_SIZE = 1 shl 20
+
+    private const val FILTER_NONE = 0
+    private const val FILTER_SUB = 1
+    private const val FILTER_UP = 2
+    private const val FILTER_AVERAGE = 3
+    private const val FILTER_PAETH = 4
 
     fun encodeDataImage(bitmap: Bitmap): String {
         val pngData = encode(bitmap)
@@ -68,11 +83,32 @@ object Png {
         return buf.array()
     }
 
-    fun encode(bitmap: Bitmap, dpi: Number? = null): ByteArray {
-        val output = OutputStream()
+    /**
+     * Encodes the bitmap as an 8-bit RGBA PNG.
+     *
+     * @param dpi - resolution written to the pHYs chunk (no pHYs chunk if null).
+     * @param compressionLevel - zlib compression level: 0..9 or [DEFAULT_DEFLATE_LEVEL].
+     * @param adaptiveFilter - choose the filter of each scanline by the "minimum sum of absolute differences"
+     *  heuristic (the rows are not filtered otherwise).
+     * @param idatChunkSize - maximum size of an IDAT chunk.
+     */
+    fun encode(
+        bitmap: Bitmap,
+        dpi: Number? = null,
+        compressionLevel: Int = DEFAULT_DEFLATE_LEVEL,
+        adaptiveFilter: Boolean = true,
+        idatChunkSize: Int = DEF_IDAT_CHUNK_SIZE
+    ): ByteArray {
+        require(idatChunkSize > 0) { "IDAT chunk size must be positive: $idatChunkSize" }
+
+        val deflated = deflate(filterScanlines(bitmap, adaptiveFilter), compressionLevel)
+        val idatChunkCount = max(1, (deflated.size + idatChunkSize - 1) / idatChunkSize)
+
+        // Signature, IHDR, pHYs, IEND and the IDAT chunks (12 bytes of a chunk are the length, type and CRC).
+        val output = OutputStream(initialCapacity = 8 + 25 + 21 + 12 + deflated.size + idatChunkCount * 12)
 
         // Write PNG signature
-        output.write(byteArrayOf(137.toByte(), 80, 78, 71, 13, 10, 26, 10))
+        output.write(SIGNATURE)
 
         // IHDR chunk
         output.writePngChunk("IHDR", buildIHDR(bitmap.width, bitmap.height))
@@ -82,21 +118,13 @@ object Png {
             output.writePngChunk("pHYs", buildPHYS(dpi.toDouble()))
         }
 
-        // IDAT chunk
-        val rawScanlines = run {
-            val rawScanlines = mutableListOf<Byte>()
-            bitmap.rgbaBytes()
-                .asSequence()
-                .windowed(bitmap.width * 4, bitmap.width * 4)
-                .forEach {
-                    rawScanlines += 0.toByte() // filter type 0
-                    rawScanlines += it
-                }
-
-            rawScanlines.toByteArray()
+        // IDAT chunks
+        var offset = 0
+        repeat(idatChunkCount) {
+            val length = min(idatChunkSize, deflated.size - offset)
+            output.writePngChunk("IDAT", deflated, offset, length)
+            offset += length
         }
-        val deflated = deflate(rawScanlines)
-        output.writePngChunk("IDAT", deflated)
 
         // IEND chunk
         output.writePngChunk("IEND", ByteArray(0))
@@ -104,18 +132,109 @@ object Png {
         return output.byteArray
     }
 
+    // The filtered scanlines: the filter type byte followed by the filtered RGBA bytes of the row.
+    private fun filterScanlines(bitmap: Bitmap, adaptiveFilter: Boolean): ByteArray {
+        val stride = bitmap.width * BYTES_PER_PIXEL
+        val scanlines = ByteArray((stride + 1) * bitmap.height)
+
+        var row = ByteArray(stride)
+        var prevRow = ByteArray(stride) // the row above the first one is zeros
+        var filtered = ByteArray(stride)
+        var candidate = ByteArray(stride)
+
+        for (y in 0 until bitmap.height) {
+            readRow(bitmap, y, row)
+
+            var filterType = FILTER_NONE
+            var filteredRow = row
+            if (adaptiveFilter) {
+                var minSum = Long.MAX_VALUE
+                for (type in FILTER_NONE..FILTER_PAETH) {
+                    val sum = filterRow(type, row, prevRow, candidate, minSum)
+                    if (sum < minSum) {
+                        minSum = sum
+                        filterType = type
+                        candidate = filtered.also { filtered = candidate }
+                    }
+                }
+                filteredRow = filtered
+            }
+
+            val offset = y * (stride + 1)
+            scanlines[offset] = filterType.toByte()
+            filteredRow.copyInto(scanlines, offset + 1)
+
+            prevRow = row.also { row = prevRow }
+        }
+
+        return scanlines
+    }
+
+    private fun readRow(bitmap: Bitmap, y: Int, row: ByteArray) {
+        val pixels = bitmap.argbInts
+        var i = 0
+        for (index in y * bitmap.width until (y + 1) * bitmap.width) {
+            val pixel = pixels[index]
+            row[i++] = (pixel shr 16).toByte()  // R
+            row[i++] = (pixel shr 8).toByte()   // G
+            row[i++] = pixel.toByte()           // B
+            row[i++] = (pixel ushr 24).toByte() // A
+        }
+    }
+
+    /**
+     * Applies the filter to the row and returns the sum of the absolute values of the filtered bytes
+     * (as signed bytes). Stops as soon as the sum reaches [limit].
+     */
+    private fun filterRow(type: Int, row: ByteArray, prevRow: ByteArray, out: ByteArray, limit: Long): Long {
+        var sum = 0L
+        for (i in row.indices) {
+            val x = row[i].toInt() and 0xFF
+            val predictor = when (type) {
+                FILTER_NONE -> 0
+                FILTER_SUB -> left(row, i)
+                FILTER_UP -> prevRow[i].toInt() and 0xFF
+                FILTER_AVERAGE -> (left(row, i) + (prevRow[i].toInt() and 0xFF)) ushr 1
+                else -> paeth(left(row, i), prevRow[i].toInt() and 0xFF, left(prevRow, i))
+            }
+            val value = (x - predictor).toByte()
+            out[i] = value
+
+            sum += abs(value.toInt())
+            if (sum >= limit) {
+                return sum
+            }
+        }
+        return sum
+    }
+
+    private fun left(row: ByteArray, i: Int): Int {
+        return if (i >= BYTES_PER_PIXEL) row[i - BYTES_PER_PIXEL].toInt() and 0xFF else 0
+    }
+
+    private fun paeth(a: Int, b: Int, c: Int): Int {
+        val p = a + b - c
+        val pa = abs(p - a)
+        val pb = abs(p - b)
+        val pc = abs(p - c)
+        return when {
+            pa <= pb && pa <= pc -> a
+            pb <= pc -> b
+            else -> c
+        }
+    }
+
     fun decode(input: ByteArray): Bitmap {
         val stream = InputPngStream(input)
 
         // 1. Verify PNG signature
         val signature = ByteArray(8)
         stream.read(signature)
-        val expected = byteArrayOf(137.toByte(), 80, 78, 71, 13, 10, 26, 10)
-        require(signature.contentEquals(expected)) { "Invalid PNG signature" }
+        require(signature.contentEquals(SIGNATURE)) { "Invalid PNG signature" }
 
         var width = 0
         var height = 0
-        val idatChunks = mutableListOf<Byte>()
+        val idatChunks = OutputStream()
 
         // 2. Read chunks
         while (true) {
@@ -137,7 +256,7 @@ object Png {
                 }
 
                 "IDAT" -> {
-                    idatChunks.addAll(data.toList())
+                    idatChunks.write(data)
                 }
 
                 "IEND" -> break
@@ -145,7 +264,7 @@ object Png {
         }
 
         // 3. Decompress IDAT data
-        val compressed = idatChunks.toByteArray()
+        val compressed = idatChunks.byteArray
         val scanlineLength = width * 4 + 1
         val decompressed = inflate(compressed, scanlineLength * height)
 
@@ -153,22 +272,50 @@ object Png {
         val rgba = ByteArray(height * strideLength)
         for (rowIndex in 0 until height) {
             val filterType = decompressed[rowIndex * scanlineLength].toInt() and 0xFF
-            if (filterType != 0) {
-                error("Unsupported filter type: $filterType")
+            val srcPos = rowIndex * scanlineLength + 1 // +1 to skip the filter byte
+            val destPos = rowIndex * strideLength
+
+            if (filterType == FILTER_NONE) {
+                arraycopy(
+                    src = decompressed,
+                    srcPos = srcPos,
+                    dest = rgba,
+                    destPos = destPos,
+                    length = strideLength
+                )
+            } else {
+                unfilterRow(filterType, decompressed, srcPos, rgba, destPos, strideLength)
             }
-
-            arraycopy(
-                src = decompressed,
-                srcPos = rowIndex * scanlineLength + 1, // +1 to skip the filter byte
-                dest = rgba,
-                destPos = rowIndex * strideLength,
-                length = strideLength
-            )
         }
 
         return Bitmap.fromRGBABytes(width, height, rgba)
     }
 
+    // Reconstructs the row from the filtered bytes and the previous (already reconstructed) row.
+    private fun unfilterRow(type: Int, src: ByteArray, srcPos: Int, dest: ByteArray, destPos: Int, length: Int) {
+        require(type in FILTER_SUB..FILTER_PAETH) { "Unsupported filter type: $type" }
+
+        val prevPos = destPos - length // negative for the first row
+        for (i in 0 until length) {
+            val a = if (i >= BYTES_PER_PIXEL) dest[destPos + i - BYTES_PER_PIXEL].toInt() and 0xFF else 0
+            val b = if (prevPos >= 0) dest[prevPos + i].toInt() and 0xFF else 0
+            val predictor = when (type) {
+                FILTER_SUB -> a
+                FILTER_UP -> b
+                FILTER_AVERAGE -> (a + b) ushr 1
+                else -> {
+                    val c = if (prevPos >= 0 && i >= BYTES_PER_PIXEL) {
+                        dest[prevPos + i - BYTES_PER_PIXEL].toInt() and 0xFF
+                    } else {
+                        0
+                    }
+                    paeth(a, b, c)
+                }
+            }
+            dest[destPos + i] = ((src[srcPos + i].toInt() and 0xFF) + predictor).toByte()
+        }
+    }
+
     private fun buildIHDR(width: Int, height: Int): ByteArray = ByteBuffer(ByteArray(13)).apply {
         putInt(width)
         putInt(height)
@@ -179,14 +326,16 @@ object Png {
         put(0) // Interlace method
     }.array()
 
-    private fun OutputStream.writePngChunk(type: String, data: ByteArray) {
+    private fun OutputStream.writePngChunk(type: String, data: ByteArray, offset: Int = 0, length: Int = data.size) {
         val typeBytes = type.encodeToByteArray()
-        val crcInput = typeBytes + data
-        val crc = Crc32.compute(crcInput)
+        val crc = Crc32().apply {
+            update(typeBytes)
+            update(data, offset, length)
+        }.getValue()
 
-        writeInt(data.size)
+        writeInt(length)
         write(typeBytes)
-        write(data)
+        write(data, offset, length)
         writeInt(crc)
     }
 
@@ -322,18 +471,26 @@ object Png {
     }
 
 
-    private class OutputStream {
-        private val buffer = mutableListOf<Byte>()
-        val byteArray get() = buffer.toByteArray()
+    private class OutputStream(initialCapacity: Int = 1024) {
+        private var buffer = ByteArray(max(initialCapacity, 16))
+        private var size = 0
+        val byteArray get() = buffer.copyOf(size)
 
-        fun write(data: ByteArray, off: Int, len: Int) {
-            (off until off + len).forEach { i ->
-                buffer.add(data[i])
+        private fun ensureCapacity(capacity: Int) {
+            if (capacity > buffer.size) {
+                buffer = buffer.copyOf(max(capacity, buffer.size * 2))
             }
         }
 
+        fun write(data: ByteArray, off: Int, len: Int) {
+            ensureCapacity(size + len)
+            data.copyInto(buffer, size, off, off + len)
+            size += len
+        }
+
         fun write(b: Int) {
-            buffer.add(b.toByte())
+            ensureCapacity(size + 1)
+            buffer[size++] = b.toByte()
         }
 
         fun write(data: ByteArray) {
@@ -341,7 +498,7 @@ object Png {
         }
 
         override fun toString(): String {
-            return buffer.joinToString { it.toUByte().toString(16) }
+            return byteArray.joinToString { it.toUByte().toString(16) }
         }
     }
 }
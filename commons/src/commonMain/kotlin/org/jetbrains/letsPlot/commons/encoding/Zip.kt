@@ -5,5 +5,10 @@
 
 package org.jetbrains.letsPlot.commons.encoding
 
-expect fun deflate(input: ByteArray): ByteArray
+/**
+ * zlib compression level: -1 for the platform default, 0 (no compression) to 9 (best compression).
+ */
+const val DEFAULT_DEFLATE_LEVEL = -1
+
+expect fun deflate(input: ByteArray, level: Int = DEFAULT_DEFLATE_LEVEL): ByteArray
 expect fun inflate(input: ByteArray, expectedSize: Int): ByteArray
@@ -7,6 +7,7 @@ package org.jetbrains.letsPlot.commons.encoding
 
 import org.jetbrains.letsPlot.commons.values.Bitmap
 import kotlin.test.Test
+import kotlin.test.assertContentEquals
 import kotlin.test.assertEquals
 
 class PngTest {
@@ -55,4 +56,38 @@ class PngTest {
         assertEquals(0xFF00FF00.toInt(), pixels[10])
         assertEquals(0xFFFF0000.toInt(), pixels[11])
     }
+
+    @Test
+    fun filteredScanlinesRoundTrip() {
+        // Gradients, noise and flat areas: each of the filter types gets selected for some rows.
+        val width = 37
+        val height = 23
+        var seed = 17
+        val bitmap = Bitmap(
+            width = width,
+            height = height,
+            argbInts = IntArray(width * height) { i ->
+                val x = i % width
+                val y = i / width
+                seed = seed * 1103515245 + 12345
+                when (y % 4) {
+                    0 -> seed
+                    1 -> (0xFF shl 24) or ((x * x + y) and 0xFF shl 16) or (x * y and 0xFFFF)
+                    2 -> (x * 5 shl 24) or (y * 3 shl 8)
+                    else -> 0xFF336699.toInt()
+                }
+            }
+        )
+
+        for (adaptiveFilter in listOf(true, false)) {
+            for (idatChunkSize in listOf(Png.DEF_IDAT_CHUNK_SIZE, 64)) {
+                val png = Png.encode(bitmap, adaptiveFilter = adaptiveFilter, idatChunkSize = idatChunkSize)
+                val decodedBitmap = Png.decode(png)
+
+                assertEquals(width, decodedBitmap.width)
+                assertEquals(height, decodedBitmap.height)
+                assertContentEquals(bitmap.argbInts, decodedBitmap.argbInts)
+            }
+        }
+    }
 }
@@ -12,15 +12,19 @@ import org.khronos.webgl.Uint8Array
 @JsModule("pako")
 @JsNonModule
 external object Pako {
-    fun deflate(input: Uint8Array): Uint8Array
+    fun deflate(input: Uint8Array, options: dynamic): Uint8Array
     fun inflate(input: Uint8Array): Uint8Array
 }
 
-actual fun deflate(input: ByteArray): ByteArray {
+actual fun deflate(input: ByteArray, level: Int): ByteArray {
     val inputInt8 = input.unsafeCast<Int8Array>()
     val inputUint8 = Uint8Array(inputInt8.buffer, inputInt8.byteOffset, inputInt8.length)
 
-    val outputUint8 = Pako.deflate(inputUint8)
+    val options: dynamic = js("({})")
+    if (level != DEFAULT_DEFLATE_LEVEL) {
+        options.level = level
+    }
+    val outputUint8 = Pako.deflate(inputUint8, options)
 
     return Int8Array(outputUint8.buffer, outputUint8.byteOffset, outputUint8.length).unsafeCast<ByteArray>()
 }
@@ -7,13 +7,13 @@ package org.jetbrains.letsPlot.commons.encoding
 
 import java.util.zip.Deflater
 
-actual fun deflate(input: ByteArray): ByteArray {
+actual fun deflate(input: ByteArray, level: Int): ByteArray {
     val deflater = java.util.zip.Deflater()
-    deflater.setLevel(Deflater.BEST_COMPRESSION)
+    deflater.setLevel(if (level == DEFAULT_DEFLATE_LEVEL) Deflater.BEST_COMPRESSION else level)
     deflater.setInput(input)
     deflater.finish()
     val output = java.io.ByteArrayOutputStream()
-    val buffer = ByteArray(1024)
+    val buffer = ByteArray(64 * 1024)
     while (!deflater.finished()) {
         val count = deflater.deflate(buffer)
         output.write(buffer, 0, count)
@@ -0,0 +1,68 @@
+/*
+ * Copyright (c) 2026. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.commons.encoding
+
+import org.jetbrains.letsPlot.commons.values.Bitmap
+import kotlin.random.Random
+import kotlin.test.Test
+import kotlin.test.assertContentEquals
+import kotlin.time.measureTimedValue
+
+/**
+ * Reports the encode time and the output size of a plot-like 300-dpi 12x8in image
+ * with the adaptive scanline filtering and without it, for several compression levels.
+ */
+class PngEncodeBenchmark {
+
+    @Test
+    fun encodePlotImage() {
+        val bitmap = plotLikeBitmap(width = 3600, height = 2400)
+
+        // Warm up and check the round trip.
+        val png = Png.encode(bitmap)
+        assertContentEquals(bitmap.argbInts, Png.decode(png).argbInts)
+
+        for (compressionLevel in listOf(1, 6, 9)) {
+            for (adaptiveFilter in listOf(false, true)) {
+                val (output, time) = measureTimedValue {
+                    Png.encode(bitmap, compressionLevel = compressionLevel, adaptiveFilter = adaptiveFilter)
+                }
+                println(
+                    "PNG ${bitmap.width}x${bitmap.height}, level: $compressionLevel, adaptive filter: $adaptiveFilter: " +
+                            "$time, ${output.size / 1024} KB"
+                )
+            }
+        }
+    }
+
+    // White background, a grid, a gradient area and antialiased-like scattered points.
+    private fun plotLikeBitmap(width: Int, height: Int): Bitmap {
+        val random = Random(42)
+        val pixels = IntArray(width * height) { 0xFFFFFFFF.toInt() }
+        for (y in 0 until height) {
+            for (x in 0 until width) {
+                val i = y * width + x
+                when {
+                    x % 300 == 0 || y % 300 == 0 -> pixels[i] = 0xFFEBEBEB.toInt()
+                    x > width / 2 && y > height / 2 -> pixels[i] = (0xFF shl 24) or ((x * 255 / width) shl 16) or
+                            ((y * 255 / height) shl 8) or 0x80
+                }
+            }
+        }
+
+        repeat(20_000) {
+            val cx = random.nextInt(width)
+            val cy = random.nextInt(height)
+            val alpha = random.nextInt(0x40, 0x100)
+            for (y in maxOf(0, cy - 6) until minOf(height, cy + 6)) {
+                for (x in maxOf(0, cx - 6) until minOf(width, cx + 6)) {
+                    pixels[y * width + x] = (alpha shl 24) or 0x1F77B4
+                }
+            }
+        }
+        return Bitmap(width, height, pixels)
+    }
+}
@@ -10,7 +10,7 @@ package org.jetbrains.letsPlot.commons.encoding
 import kotlinx.cinterop.*
 import platform.zlib.*
 
-actual fun deflate(input: ByteArray): ByteArray {
+actual fun deflate(input: ByteArray, level: Int): ByteArray {
     memScoped {
         val inputSize = input.size.toULong() // Use ULong for sourceLen
         if (inputSize == 0uL) { // Handle empty input
@@ -30,11 +30,10 @@ actual fun deflate(input: ByteArray): ByteArray {
         val destLen = alloc<uLongfVar>() // zlib uses uLongf for lengths
         destLen.value = maxOutputSize.convert() // Initialize with the TOTAL size of the output buffer
 
-        // Choose a valid compression level.
-        // Z_DEFAULT_COMPRESSION is a good general choice.
+        // Z_DEFAULT_COMPRESSION (-1) is the zlib default.
         // 0 means no compression, which can lead to output > input.
         // 1-9 are actual compression levels (1=fastest, 9=best compression).
-        val compressionLevel = Z_DEFAULT_COMPRESSION // Or a value from 1 to 9
+        val compressionLevel = if (level == DEFAULT_DEFLATE_LEVEL) Z_DEFAULT_COMPRESSION else level
 
         val result = compress2(
             dest = outputPtr.reinterpret(),     // Pointer to the output buffer
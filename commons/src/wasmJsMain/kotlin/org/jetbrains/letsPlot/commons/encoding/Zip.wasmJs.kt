@@ -3,7 +3,8 @@ package org.jetbrains.letsPlot.commons.encoding
 import js.buffer.toArrayBuffer
 import js.typedarrays.toByteArray
 
-actual fun deflate(input: ByteArray): ByteArray {
+// The level is ignored: pako uses its default compression level.
+actual fun deflate(input: ByteArray, level: Int): ByteArray {
     return pako.deflate(input.toArrayBuffer()).toByteArray()
 }
 
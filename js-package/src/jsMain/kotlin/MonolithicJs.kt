@@ -19,6 +19,7 @@ import org.jetbrains.letsPlot.core.spec.config.PlotConfig
 import org.jetbrains.letsPlot.core.util.MonolithicCommon
 import org.jetbrains.letsPlot.core.util.MonolithicCommon.PlotsBuildResult.Error
 import org.jetbrains.letsPlot.core.util.MonolithicCommon.PlotsBuildResult.Success
+import org.jetbrains.letsPlot.core.util.TypedArrayDataEncoding
 import org.jetbrains.letsPlot.core.util.sizing.SizingMode.*
 import org.jetbrains.letsPlot.core.util.sizing.SizingPolicy
 import org.jetbrains.letsPlot.platf.w3c.jsObject.dynamicObjectToMap
@@ -151,7 +152,8 @@ fun buildPlotFromProcessedSpecs(
     sizingJs: dynamic
 ): FigureModelJs? {
     return try {
-        val plotSpec = dynamicObjectToMap(plotSpecJs)
+        // Numeric columns may be embedded as Base64-encoded typed arrays (see PlotHtmlExport).
+        val plotSpec = TypedArrayDataEncoding.decode(dynamicObjectToMap(plotSpecJs))
         // Though the "plotSpec" might contain already "processed" specs,
         // we apply "frontend" transforms anyway, just to be sure that
         // we are going to use a truly processed specs.
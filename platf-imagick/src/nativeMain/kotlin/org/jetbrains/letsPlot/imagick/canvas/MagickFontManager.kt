@@ -8,6 +8,8 @@
 package org.jetbrains.letsPlot.imagick.canvas
 
 import kotlinx.cinterop.*
+import org.jetbrains.letsPlot.commons.intern.concurrent.Lock
+import org.jetbrains.letsPlot.commons.intern.concurrent.execute
 import org.jetbrains.letsPlot.core.canvas.Font
 import org.jetbrains.letsPlot.core.canvas.Font.FontVariant
 import org.jetbrains.letsPlot.core.canvas.FontStyle
@@ -33,6 +35,8 @@ class MagickFontManager private constructor(
         }
     }
 
+    // The manager is shared by plots exported concurrently from different threads.
+    private val cacheLock = Lock()
     private val fallbackFont: FontSet
     private val winMonospaceFonts = listOf("Consolas", "Courier New", "Lucida Console", "Courier")
     private val winSerifFonts = listOf("Times New Roman", "Georgia", "Cambria", "Serif")
@@ -131,34 +135,38 @@ class MagickFontManager private constructor(
     fun registerFont(font: Font, filePath: String) {
         log { "registerFont('$font', '$filePath')" }
 
-        val current = cache[font.fontFamily] ?: FontSet(embedded = true, familyName = font.fontFamily)
+        cacheLock.execute {
+            val current = cache[font.fontFamily] ?: FontSet(embedded = true, familyName = font.fontFamily)
 
-        cache[font.fontFamily] = current.copy(
-            regularFontPath = if (font.variant == FontVariant.NORMAL) filePath else current.regularFontPath,
-            italicFontPath = if (font.variant == FontVariant.ITALIC) filePath else current.italicFontPath,
-            boldFontPath = if (font.variant == FontVariant.BOLD) filePath else current.boldFontPath,
-            boldItalicFontPath = if (font.variant == FontVariant.BOLD_ITALIC) filePath else current.boldItalicFontPath,
-        )
+            cache[font.fontFamily] = current.copy(
+                regularFontPath = if (font.variant == FontVariant.NORMAL) filePath else current.regularFontPath,
+                italicFontPath = if (font.variant == FontVariant.ITALIC) filePath else current.italicFontPath,
+                boldFontPath = if (font.variant == FontVariant.BOLD) filePath else current.boldFontPath,
+                boldItalicFontPath = if (font.variant == FontVariant.BOLD_ITALIC) filePath else current.boldItalicFontPath,
+            )
+        }
     }
 
     fun resolveFont(fontFamily: String): FontSet {
         log { "resolveFont('$fontFamily')" }
-        val cachedFontSet = cache[fontFamily]
-        if (cachedFontSet != null) {
-            log { "resolveFont('$fontFamily') -> ${cachedFontSet.repr} (fontFile cache)" }
-            return cachedFontSet
-        }
+        cacheLock.execute {
+            val cachedFontSet = cache[fontFamily]
+            if (cachedFontSet != null) {
+                log { "resolveFont('$fontFamily') -> ${cachedFontSet.repr} (fontFile cache)" }
+                return cachedFontSet
+            }
 
-        val fontSet = findFamilyFontSet(fontFamily)
-        if (fontSet != null) {
-            log { "resolveFont('$fontFamily') -> ${fontSet.repr} (resolved)" }
-            cache[fontSet.familyName] = fontSet
-            return fontSet
-        }
+            val fontSet = findFamilyFontSet(fontFamily)
+            if (fontSet != null) {
+                log { "resolveFont('$fontFamily') -> ${fontSet.repr} (resolved)" }
+                cache[fontSet.familyName] = fontSet
+                return fontSet
+            }
 
-        log { "resolveFont('$fontFamily') -> ${fallbackFont.repr} (fallback)" }
-        cache[fontFamily] = fallbackFont
-        return fallbackFont
+            log { "resolveFont('$fontFamily') -> ${fallbackFont.repr} (fallback)" }
+            cache[fontFamily] = fallbackFont
+            return fallbackFont
+        }
     }
 
     private fun resolveFont(families: List<String>): FontSet? {
@@ -266,6 +274,35 @@ class MagickFontManager private constructor(
         val obliqueFontPath: String? = null,
         val boldObliqueFontPath: String? = null,
     ) {
+        /**
+         * The font file of the variant and whether the bold weight and the italic style have to be emulated
+         * (the family has no such font).
+         */
+        fun fontFile(variant: FontVariant): Triple<String?, Boolean, Boolean> {
+            return when (variant) {
+                FontVariant.NORMAL -> when {
+                    regularFontPath != null -> Triple(regularFontPath, false, false)
+                    else -> error("No regular font path found for family: $familyName")
+                }
+                FontVariant.ITALIC -> when {
+                    italicFontPath != null -> Triple(italicFontPath, false, false)
+                    obliqueFontPath != null -> Triple(obliqueFontPath, false, false)
+                    else -> Triple(regularFontPath, false, true) // take regular, emulate italic
+                }
+                FontVariant.BOLD -> when {
+                    boldFontPath != null -> Triple(boldFontPath, false, false)
+                    else -> Triple(regularFontPath, true, false) // take regular, emulate bold
+                }
+                FontVariant.BOLD_ITALIC -> when {
+                    boldItalicFontPath != null -> Triple(boldItalicFontPath, false, false)
+                    boldFontPath != null -> Triple(boldFontPath, false, true) // take bold, emulate italic
+                    italicFontPath != null -> Triple(italicFontPath, true, false) // take italic, emulate bold
+                    obliqueFontPath != null -> Triple(obliqueFontPath, true, false) // take oblique, emulate bold
+                    else -> Triple(regularFontPath, true, true)
+                }
+            }
+        }
+
         val repr: String
             get() {
                 return familyName + if (embedded) {
@@ -0,0 +1,188 @@
+/*
+ * Copyright (c) 2026. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+@file:OptIn(ExperimentalForeignApi::class)
+
+package org.jetbrains.letsPlot.imagick.canvas
+
+import kotlinx.cinterop.ExperimentalForeignApi
+import kotlinx.cinterop.addressOf
+import kotlinx.cinterop.convert
+import kotlinx.cinterop.usePinned
+import org.jetbrains.letsPlot.commons.intern.concurrent.Lock
+import org.jetbrains.letsPlot.commons.intern.concurrent.execute
+import org.jetbrains.letsPlot.commons.registration.Disposable
+import org.jetbrains.letsPlot.commons.values.Color
+import org.jetbrains.letsPlot.core.canvas.Font
+import org.jetbrains.letsPlot.core.canvas.Font.FontVariant
+import org.jetbrains.letsPlot.core.canvas.TextMetrics
+import platform.posix.*
+import kotlin.math.abs
+import kotlin.math.ceil
+import kotlin.math.roundToInt
+
+/**
+ * PDF fonts of the [MagickFontManager] fonts: the TrueType font files are embedded,
+ * other fonts (e.g. OpenType CFF or font collections) are replaced with the standard PDF fonts.
+ * The text a PDF font can't show is rendered by ImageMagick as an image.
+ * The provider can be shared by the pages painted concurrently.
+ */
+class MagickPdfFontProvider(
+    private val fontManager: MagickFontManager
+) : PdfFontProvider, Disposable {
+    private val lock = Lock()
+    private val measurer = MagickContext2d(1.0, fontManager)
+    private val fonts = HashMap<Pair<String, FontVariant>, PdfFont>()
+
+    override fun pdfFont(font: Font): PdfFont {
+        return lock.execute { fonts.getOrPut(font.fontFamily to font.variant) { createFont(font) } }
+    }
+
+    override fun measureText(font: Font, text: String): TextMetrics {
+        return lock.execute {
+            measurer.setFont(font)
+            measurer.measureText(text)
+        }
+    }
+
+    override fun textImage(font: Font, text: String, color: Color, lineWidth: Double, pixelDensity: Double): TextImage? {
+        return lock.execute {
+            val metrics = measureText(font, text)
+            // Room for the stroke and the emulated italic.
+            val padding = lineWidth + font.fontSize * 0.25
+            val width = ceil(metrics.bbox.width + 2 * padding)
+            val height = ceil(metrics.ascent + abs(metrics.descent) + 2 * padding)
+            if (width <= 0 || height <= 0) {
+                return@execute null
+            }
+
+            val canvas = MagickCanvas.create(width, height, pixelDensity, fontManager)
+            val context = canvas.context2d
+            try {
+                context.setFont(font)
+                if (lineWidth > 0) {
+                    context.setStrokeStyle(color)
+                    context.setLineWidth(lineWidth)
+                    context.strokeText(text, padding, padding + metrics.ascent)
+                } else {
+                    context.setFillStyle(color)
+                    context.fillText(text, padding, padding + metrics.ascent)
+                }
+
+                val snapshot = canvas.takeSnapshot()
+                try {
+                    TextImage(snapshot.bitmap, -padding, -padding - metrics.ascent, width, height)
+                } finally {
+                    snapshot.dispose()
+                }
+            } finally {
+                context.dispose()
+            }
+        }
+    }
+
+    override fun dispose() {
+        lock.execute { measurer.dispose() }
+    }
+
+    private fun createFont(font: Font): PdfFont {
+        val fontSet = fontManager.resolveFont(font.fontFamily)
+        val (path, emulateBold, emulateItalic) = fontSet.fontFile(font.variant)
+
+        // Metrics in 1/1000 of the font size.
+        val unitFont = font.copy(fontSize = 1000.0)
+        val metrics = measureText(unitFont, "Hg")
+        val ascent = metrics.ascent.roundToInt()
+        val descent = -abs(metrics.descent).roundToInt()
+
+        val trueType = path?.let(::readFile)?.let(TrueTypeFont::parse)
+        if (trueType != null) {
+            return PdfFont(
+                key = "$path:$emulateBold:$emulateItalic",
+                name = postScriptName(path),
+                widths = IntArray(0), // The glyph widths are in the font.
+                ascent = ascent,
+                descent = descent,
+                bbox = trueType.bbox ?: intArrayOf(-1000, descent, 2000, ascent),
+                fontFile = trueType,
+                emulateBold = emulateBold,
+                emulateItalic = emulateItalic
+            )
+        }
+
+        // The glyph widths are measured with ImageMagick, so the text fits the plot layout.
+        val widths = IntArray(PdfDocument.LAST_CHAR - PdfDocument.FIRST_CHAR + 1) { i ->
+            val ch = PdfDocument.winAnsiChar(PdfDocument.FIRST_CHAR + i) ?: return@IntArray 0
+            measureText(unitFont, ch.toString()).bbox.width.roundToInt()
+        }
+        return PdfFont(
+            key = "${fontSet.familyName}:${font.variant}",
+            name = standardFontName(fontSet.familyName, font.variant),
+            widths = widths,
+            ascent = ascent,
+            descent = descent,
+            bbox = intArrayOf(-200, descent, 1000, ascent),
+            fontFile = null,
+            emulateBold = false,
+            emulateItalic = false
+        )
+    }
+
+    companion object {
+        private fun standardFontName(family: String, variant: FontVariant): String {
+            val name = family.lowercase()
+            val bold = variant == FontVariant.BOLD || variant == FontVariant.BOLD_ITALIC
+            val italic = variant == FontVariant.ITALIC || variant == FontVariant.BOLD_ITALIC
+            return when {
+                listOf("mono", "courier", "consol", "menlo").any { it in name } ->
+                    "Courier" + styleSuffix(bold, italic, "Oblique")
+
+                "sans" !in name && listOf("serif", "times", "roman", "georgia").any { it in name } ->
+                    "Times" + when {
+                        bold && italic -> "-BoldItalic"
+                        bold -> "-Bold"
+                        italic -> "-Italic"
+                        else -> "-Roman"
+                    }
+
+                else -> "Helvetica" + styleSuffix(bold, italic, "Oblique")
+            }
+        }
+
+        private fun styleSuffix(bold: Boolean, italic: Boolean, italicName: String): String {
+            return when {
+                bold && italic -> "-Bold$italicName"
+                bold -> "-Bold"
+                italic -> "-$italicName"
+                else -> ""
+            }
+        }
+
+        // The file name without the extension: PDF names can't contain spaces and delimiters.
+        private fun postScriptName(path: String): String {
+            val fileName = path.substringAfterLast('/').substringAfterLast('\\').substringBeforeLast('.')
+            return fileName.filter { it.isLetterOrDigit() && it.code < 128 || it == '-' }.ifEmpty { "Font" }
+        }
+
+        private fun readFile(path: String): ByteArray? {
+            val file = fopen(path, "rb") ?: return null
+            try {
+                if (fseek(file, 0.convert(), SEEK_END) != 0) {
+                    return null
+                }
+                val size: Long = ftell(file).convert()
+                if (size <= 0 || size > Int.MAX_VALUE || fseek(file, 0.convert(), SEEK_SET) != 0) {
+                    return null
+                }
+
+                val bytes = ByteArray(size.toInt())
+                val read: Long = bytes.usePinned { fread(it.addressOf(0), 1.convert(), size.convert(), file) }.convert()
+                return bytes.takeIf { read == size }
+            } finally {
+                fclose(file)
+            }
+        }
+    }
+}
@@ -0,0 +1,460 @@
+/*
+ * Copyright (c) 2026. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.imagick.canvas
+
+import org.jetbrains.letsPlot.commons.geometry.AffineTransform
+import org.jetbrains.letsPlot.commons.geometry.DoubleRectangle
+import org.jetbrains.letsPlot.commons.values.Bitmap
+import org.jetbrains.letsPlot.commons.values.Color
+import org.jetbrains.letsPlot.core.canvas.*
+import org.jetbrains.letsPlot.core.canvas.Path2d.*
+import kotlin.math.PI
+import kotlin.math.abs
+
+/**
+ * Fonts of the PDF text and the text metrics (must be the same as used for the plot layout).
+ */
+interface PdfFontProvider {
+    fun pdfFont(font: Font): PdfFont
+    fun measureText(font: Font, text: String): TextMetrics
+
+    /**
+     * The text drawn as an image, for the text the PDF font can't show (e.g. Greek or CJK text in a standard font).
+     * Null if the text can't be drawn: the missing characters are shown as the missing glyph then.
+     *
+     * @param lineWidth - the line width of the stroked text, 0 for the filled text.
+     * @param pixelDensity - image pixels per text pixel.
+     */
+    fun textImage(font: Font, text: String, color: Color, lineWidth: Double, pixelDensity: Double): TextImage? = null
+}
+
+/**
+ * The [bitmap] drawn at ([x], [y]) relative to the text origin, scaled to [width] x [height] pixels.
+ */
+class TextImage(
+    val bitmap: Bitmap,
+    val x: Double,
+    val y: Double,
+    val width: Double,
+    val height: Double,
+)
+
+/**
+ * Draws a page of the [PdfDocument] as vector graphics.
+ * The coordinates are in pixels (1/96 in), call [finishPage] to write the page content.
+ *
+ * @param scale - zoom of the page: the page size is `width * scale` x `height * scale` pixels.
+ * @param pageRef - the page reserved by [PdfDocument.reservePage], a new page is appended to the document by default.
+ * The pages reserved in advance can be painted concurrently.
+ */
+class PdfContext2d(
+    private val document: PdfDocument,
+    private val width: Double,
+    private val height: Double,
+    private val fontProvider: PdfFontProvider,
+    private val scale: Double = 1.0,
+    private val pageRef: Int = document.reservePage(),
+    private val stateDelegate: ContextStateDelegate = ContextStateDelegate(),
+) : Context2d by stateDelegate {
+    private val content = StringBuilder()
+    private var saveDepth = 0
+
+    private val fontNames = LinkedHashMap<Int, String>()       // font object -> resource name
+    private val graphicStates = LinkedHashMap<String, String>() // alpha -> resource name
+    private val images = LinkedHashMap<Any, Pair<String, Int>>() // snapshot or text image -> resource name, image object
+
+    init {
+        // Pixels to points, the origin at the top left corner, y-axis down.
+        val k = PT_PER_PX * scale
+        content.append("${pdfNumber(k)} 0 0 ${pdfNumber(-k)} 0 ${pdfNumber(height * k)} cm\n")
+    }
+
+    fun finishPage() {
+        repeat(saveDepth) { content.append("Q\n") }
+        saveDepth = 0
+
+        val resources = StringBuilder("<<")
+        if (fontNames.isNotEmpty()) {
+            resources.append(" /Font << ${fontNames.entries.joinToString(" ") { (ref, name) -> "/$name $ref 0 R" }} >>")
+        }
+        if (graphicStates.isNotEmpty()) {
+            resources.append(" /ExtGState << ")
+            graphicStates.forEach { (alpha, name) -> resources.append("/$name << /ca $alpha /CA $alpha >> ") }
+            resources.append(">>")
+        }
+        if (images.isNotEmpty()) {
+            resources.append(" /XObject << ${images.values.joinToString(" ") { (name, ref) -> "/$name $ref 0 R" }} >>")
+        }
+        resources.append(" >>")
+
+        document.setPage(pageRef, width * PT_PER_PX * scale, height * PT_PER_PX * scale, content.toString().encodeToByteArray(), resources.toString())
+    }
+
+    override fun save() {
+        stateDelegate.save()
+        saveDepth++
+        content.append("q\n")
+    }
+
+    override fun restore() {
+        stateDelegate.restore()
+        if (saveDepth > 0) {
+            saveDepth--
+            content.append("Q\n")
+        }
+    }
+
+    override fun clip() {
+        stateDelegate.clip()
+
+        // The clip path is in the page coordinates, PDF intersects it with the current clip.
+        appendPath(stateDelegate.getClipPath().getCommands(), AffineTransform.IDENTITY)
+        content.append("W n\n")
+    }
+
+    override fun clearRect(rect: DoubleRectangle) {
+        clearRect(rect.left, rect.top, rect.width, rect.height)
+    }
+
+    override fun clearRect(x: Double, y: Double, w: Double, h: Double) {
+        // Nothing to clear: the page is drawn once, from scratch.
+    }
+
+    override fun fill() {
+        paint(fill = true, stroke = false) { appendCurrentPath(it) }
+    }
+
+    override fun fillEvenOdd() {
+        paint(fill = true, stroke = false, evenOdd = true) { appendCurrentPath(it) }
+    }
+
+    override fun stroke() {
+        paint(fill = false, stroke = true) { appendCurrentPath(it) }
+    }
+
+    override fun fillRect(x: Double, y: Double, w: Double, h: Double) {
+        paint(fill = true, stroke = false) { appendRect(x, y, w, h) }
+    }
+
+    override fun strokeRect(x: Double, y: Double, w: Double, h: Double) {
+        paint(fill = false, stroke = true) { appendRect(x, y, w, h) }
+    }
+
+    // Fills and strokes the circle the same way as MagickContext2d.
+    override fun drawCircle(x: Double, y: Double, radius: Double) {
+        val circle = Path2d().arc(x, y, radius, 0.0, 2 * PI, anticlockwise = false).closePath()
+        paint(fill = true, stroke = true) { appendPath(circle.getCommands(), AffineTransform.IDENTITY) }
+    }
+
+    override fun fillText(text: String, x: Double, y: Double) {
+        drawText(text, x, y, fill = true)
+    }
+
+    override fun strokeText(text: String, x: Double, y: Double) {
+        drawText(text, x, y, fill = false)
+    }
+
+    override fun measureText(str: String): TextMetrics {
+        return fontProvider.measureText(stateDelegate.getFont(), str)
+    }
+
+    override fun measureTextWidth(str: String): Double {
+        return measureText(str).bbox.width
+    }
+
+    override fun drawImage(snapshot: Canvas.Snapshot) {
+        drawImage(snapshot, 0.0, 0.0)
+    }
+
+    override fun drawImage(snapshot: Canvas.Snapshot, x: Double, y: Double) {
+        drawImage(snapshot, x, y, snapshot.size.x.toDouble(), snapshot.size.y.toDouble())
+    }
+
+    override fun drawImage(snapshot: Canvas.Snapshot, x: Double, y: Double, dw: Double, dh: Double) {
+        val w = snapshot.size.x.toDouble()
+        val h = snapshot.size.y.toDouble()
+        drawImage(snapshot, 0.0, 0.0, w, h, x, y, dw, dh)
+    }
+
+    override fun drawImage(
+        snapshot: Canvas.Snapshot,
+        sx: Double,
+        sy: Double,
+        sw: Double,
+        sh: Double,
+        dx: Double,
+        dy: Double,
+        dw: Double,
+        dh: Double
+    ) {
+        val ctm = stateDelegate.getCTM()
+        if (ctm.inverse() == null || sw <= 0 || sh <= 0) {
+            return
+        }
+
+        val (name, _) = images.getOrPut(snapshot) {
+            "Im${images.size + 1}" to document.addImage(snapshot.bitmap, stateDelegate.getImageSmoothingEnabled())
+        }
+
+        // The whole image is scaled, positioned and clipped to draw its (sx, sy, sw, sh) part at (dx, dy, dw, dh).
+        val kx = dw / sw
+        val ky = dh / sh
+        val imageWidth = snapshot.size.x * kx
+        val imageHeight = snapshot.size.y * ky
+
+        content.append("q\n")
+        appendTransform(ctm)
+        appendAlpha(stateDelegate.getGlobalAlpha())
+        if (sx != 0.0 || sy != 0.0 || sw != snapshot.size.x.toDouble() || sh != snapshot.size.y.toDouble()) {
+            appendRect(dx, dy, dw, dh)
+            content.append("W n\n")
+        }
+        // The image space is the unit square with the origin at the bottom left corner of the image.
+        content.append(
+            "${pdfNumber(imageWidth)} 0 0 ${pdfNumber(-imageHeight)} " +
+                    "${pdfNumber(dx - sx * kx)} ${pdfNumber(dy - sy * ky + imageHeight)} cm\n"
+        )
+        content.append("/$name Do\nQ\n")
+    }
+
+    private fun drawText(text: String, x: Double, y: Double, fill: Boolean) {
+        val color = if (fill) stateDelegate.getFillColor() else stateDelegate.getStrokeColor()
+        val ctm = stateDelegate.getCTM()
+        if (text.isEmpty() || color.alpha == 0 || ctm.inverse() == null) {
+            return
+        }
+
+        val font = stateDelegate.getFont()
+        val pdfFont = fontProvider.pdfFont(font)
+        val fontRef = document.fontRef(pdfFont)
+
+        val align = stateDelegate.getTextAlign()
+        val baseline = stateDelegate.getTextBaseline()
+        val metrics = if (align != TextAlign.START || baseline != TextBaseline.ALPHABETIC) measureText(text) else null
+        val textX = when (align) {
+            TextAlign.START -> x
+            TextAlign.CENTER -> x - metrics!!.bbox.width / 2
+            TextAlign.END -> x - metrics!!.bbox.width
+        }
+        val textY = when (baseline) {
+            TextBaseline.ALPHABETIC -> y
+            TextBaseline.TOP -> y + metrics!!.ascent
+            TextBaseline.MIDDLE -> y + (metrics!!.ascent - abs(metrics.descent)) / 2
+            TextBaseline.BOTTOM -> y - abs(metrics!!.descent)
+        }
+
+        var codes = document.encodeText(fontRef, text, substitute = false)
+        if (codes == null) {
+            if (drawTextImage(text, textX, textY, color, fill)) {
+                return
+            }
+            codes = document.encodeText(fontRef, text, substitute = true)!!
+        }
+        val fontName = fontNames.getOrPut(fontRef) { "F${fontNames.size + 1}" }
+
+        content.append("q\n")
+        appendTransform(ctm)
+        appendAlpha(color.alpha / 255.0 * stateDelegate.getGlobalAlpha())
+
+        val renderingMode = when {
+            !fill -> {
+                appendStrokeStyle(color)
+                1 // stroke
+            }
+
+            pdfFont.emulateBold -> {
+                appendFillColor(color)
+                appendStrokeColor(color)
+                content.append("${pdfNumber(font.fontSize * FAUX_BOLD_STROKE_WIDTH)} w\n")
+                2 // fill, then stroke
+            }
+
+            else -> {
+                appendFillColor(color)
+                0 // fill
+            }
+        }
+
+        // The text space y-axis is up: flip it back.
+        val shear = if (pdfFont.emulateItalic) FAUX_ITALIC_SHEAR else 0.0
+        content.append("BT\n/$fontName ${pdfNumber(font.fontSize)} Tf\n$renderingMode Tr\n")
+        content.append("1 0 ${pdfNumber(shear)} -1 ${pdfNumber(textX)} ${pdfNumber(textY)} Tm\n")
+        content.append("<")
+        codes.forEach { b ->
+            val code = b.toInt() and 0xFF
+            content.append(HEX_DIGITS[code shr 4]).append(HEX_DIGITS[code and 0x0F])
+        }
+        content.append("> Tj\nET\nQ\n")
+    }
+
+    // The text the font can't show is drawn as an image.
+    private fun drawTextImage(text: String, x: Double, y: Double, color: Color, fill: Boolean): Boolean {
+        val lineWidth = if (fill) 0.0 else stateDelegate.getLineWidth()
+        val image = fontProvider.textImage(stateDelegate.getFont(), text, color, lineWidth, TEXT_IMAGE_DENSITY * scale)
+            ?: return false
+
+        val (name, _) = images.getOrPut(image) { "Im${images.size + 1}" to document.addImage(image.bitmap, interpolate = true) }
+
+        content.append("q\n")
+        appendTransform(stateDelegate.getCTM())
+        appendAlpha(stateDelegate.getGlobalAlpha()) // The text color alpha is in the image.
+        content.append(
+            "${pdfNumber(image.width)} 0 0 ${pdfNumber(-image.height)} " +
+                    "${pdfNumber(x + image.x)} ${pdfNumber(y + image.y + image.height)} cm\n"
+        )
+        content.append("/$name Do\nQ\n")
+        return true
+    }
+
+    // Paints the shape in the user space (stroke width and dashes are transformed by the CTM as well).
+    private fun paint(fill: Boolean, stroke: Boolean, evenOdd: Boolean = false, shape: (AffineTransform) -> Unit) {
+        val fillColor = stateDelegate.getFillColor().takeIf { fill && it.alpha > 0 }
+        // PDF draws the thinnest line possible for the zero line width, canvas draws nothing.
+        val strokeColor = stateDelegate.getStrokeColor().takeIf { stroke && it.alpha > 0 && stateDelegate.getLineWidth() > 0 }
+        if (fillColor == null && strokeColor == null) {
+            return
+        }
+
+        // null for degenerate case, e.g., scale(0, 0) - skip drawing.
+        val ctm = stateDelegate.getCTM()
+        val inverseCtm = ctm.inverse() ?: return
+
+        val globalAlpha = stateDelegate.getGlobalAlpha()
+        if (fillColor != null && strokeColor != null && fillColor.alpha != strokeColor.alpha) {
+            // Different opacity of the fill and the stroke: paint them separately.
+            paint(fill = true, stroke = false, evenOdd = evenOdd, shape = shape)
+            paint(fill = false, stroke = true, evenOdd = evenOdd, shape = shape)
+            return
+        }
+
+        content.append("q\n")
+        appendTransform(ctm)
+        appendAlpha((fillColor ?: strokeColor)!!.alpha / 255.0 * globalAlpha)
+        fillColor?.let(::appendFillColor)
+        strokeColor?.let(::appendStrokeStyle)
+
+        shape(inverseCtm)
+
+        val operator = when {
+            fillColor != null && strokeColor != null -> if (evenOdd) "B*" else "B"
+            fillColor != null -> if (evenOdd) "f*" else "f"
+            else -> "S"
+        }
+        content.append(operator).append("\nQ\n")
+    }
+
+    // The current path is in the page coordinates.
+    private fun appendCurrentPath(inverseCtm: AffineTransform) {
+        appendPath(stateDelegate.getCurrentPath(), inverseCtm)
+    }
+
+    private fun appendPath(commands: List<PathCommand>, transform: AffineTransform) {
+        var started = false
+        commands
+            .asSequence()
+            .map { cmd -> cmd.transform(transform) }
+            .forEach { cmd ->
+                when (cmd) {
+                    is MoveTo -> {
+                        appendPoint(cmd.x, cmd.y, "m")
+                        started = true
+                    }
+
+                    is LineTo -> {
+                        appendPoint(cmd.x, cmd.y, if (started) "l" else "m")
+                        started = true
+                    }
+
+                    is CubicCurveTo -> {
+                        cmd.controlPoints.windowed(size = 3, step = 3).forEach { (cp1, cp2, cp3) ->
+                            content.append(pdfNumber(cp1.x)).append(' ').append(pdfNumber(cp1.y)).append(' ')
+                            content.append(pdfNumber(cp2.x)).append(' ').append(pdfNumber(cp2.y)).append(' ')
+                            appendPoint(cp3.x, cp3.y, "c")
+                        }
+                    }
+
+                    is ClosePath -> content.append("h\n")
+                }
+            }
+
+        if (!started) {
+            // An empty path: the painting operator still needs a path.
+            content.append("0 0 m\n")
+        }
+    }
+
+    private fun appendPoint(x: Double, y: Double, operator: String) {
+        content.append(pdfNumber(x)).append(' ').append(pdfNumber(y)).append(' ').append(operator).append('\n')
+    }
+
+    private fun appendRect(x: Double, y: Double, w: Double, h: Double) {
+        content.append("${pdfNumber(x)} ${pdfNumber(y)} ${pdfNumber(w)} ${pdfNumber(h)} re\n")
+    }
+
+    private fun appendTransform(ctm: AffineTransform) {
+        if (!ctm.isIdentity) {
+            content.append(
+                "${pdfNumber(ctm.sx)} ${pdfNumber(ctm.ry)} ${pdfNumber(ctm.rx)} ${pdfNumber(ctm.sy)} " +
+                        "${pdfNumber(ctm.tx)} ${pdfNumber(ctm.ty)} cm\n"
+            )
+        }
+    }
+
+    private fun appendAlpha(alpha: Double) {
+        val value = pdfNumber(alpha.coerceIn(0.0, 1.0))
+        if (value != "1") {
+            val name = graphicStates.getOrPut(value) { "GS${graphicStates.size + 1}" }
+            content.append("/$name gs\n")
+        }
+    }
+
+    private fun appendFillColor(color: Color) {
+        content.append("${colorComponents(color)} rg\n")
+    }
+
+    private fun appendStrokeColor(color: Color) {
+        content.append("${colorComponents(color)} RG\n")
+    }
+
+    private fun appendStrokeStyle(color: Color) {
+        appendStrokeColor(color)
+        content.append("${pdfNumber(stateDelegate.getLineWidth())} w\n")
+        content.append(
+            when (stateDelegate.getLineCap()) {
+                LineCap.BUTT -> "0 J\n"
+                LineCap.ROUND -> "1 J\n"
+                LineCap.SQUARE -> "2 J\n"
+            }
+        )
+        content.append(
+            when (stateDelegate.getLineJoin()) {
+                LineJoin.MITER -> "0 j\n"
+                LineJoin.ROUND -> "1 j\n"
+                LineJoin.BEVEL -> "2 j\n"
+            }
+        )
+        content.append("${pdfNumber(stateDelegate.getMiterLimit().coerceAtLeast(1.0))} M\n")
+
+        val lineDash = stateDelegate.getLineDash()
+        if (lineDash.isNotEmpty() && lineDash.any { it > 0 }) {
+            content.append("[${lineDash.joinToString(" ") { pdfNumber(it) }}] ${pdfNumber(stateDelegate.getLineDashOffset())} d\n")
+        }
+    }
+
+    private fun colorComponents(color: Color): String {
+        return "${pdfNumber(color.red / 255.0)} ${pdfNumber(color.green / 255.0)} ${pdfNumber(color.blue / 255.0)}"
+    }
+
+    companion object {
+        const val PT_PER_PX = 72.0 / 96.0
+
+        private const val FAUX_BOLD_STROKE_WIDTH = 0.03 // of the font size
+        private const val FAUX_ITALIC_SHEAR = 0.25 // approx. 14 degrees, see MagickContext2d
+        private const val TEXT_IMAGE_DENSITY = 4.0 // 384 dpi
+
+        private const val HEX_DIGITS = "0123456789ABCDEF"
+    }
+}
@@ -0,0 +1,391 @@
+/*
+ * Copyright (c) 2026. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.imagick.canvas
+
+import org.jetbrains.letsPlot.commons.encoding.deflate
+import org.jetbrains.letsPlot.commons.intern.concurrent.Lock
+import org.jetbrains.letsPlot.commons.intern.concurrent.execute
+import org.jetbrains.letsPlot.commons.values.Bitmap
+import kotlin.math.abs
+import kotlin.math.roundToLong
+
+/**
+ * Minimal PDF 1.4 writer: pages with vector content streams (see [PdfContext2d]), fonts and images.
+ * Fonts are written once and shared by all pages: the standard fonts as simple fonts with WinAnsiEncoding,
+ * the embedded TrueType fonts as composite fonts (Type0) showing any of their glyphs.
+ *
+ * Pages can be painted concurrently: the page order is the order of [reservePage] calls.
+ */
+class PdfDocument {
+    private val lock = Lock()
+    private val objects = ArrayList<ByteArray?>() // object number - 1 -> object body
+    private val pagesRef = reserveObject()
+    private val pageRefs = ArrayList<Int>()
+    private val fontRefs = HashMap<String, Int>()
+    private val compositeFonts = LinkedHashMap<Int, CompositeFont>() // Type0 font object -> font
+    private var finished = false
+
+    val pageCount: Int get() = lock.execute { pageRefs.size }
+
+    /**
+     * Adds a page of the given size (in points).
+     *
+     * @param content - the page content stream.
+     * @param resources - the resource dictionary of the page (fonts, graphics states, images).
+     */
+    fun addPage(width: Double, height: Double, content: ByteArray, resources: String) {
+        setPage(reservePage(), width, height, content, resources)
+    }
+
+    /**
+     * Appends an empty page to the document, the page content is set later by [setPage].
+     *
+     * @return the page object number.
+     */
+    fun reservePage(): Int {
+        return lock.execute {
+            check(!finished) { "The PDF document is already written." }
+            reserveObject().also { pageRefs += it }
+        }
+    }
+
+    fun setPage(pageRef: Int, width: Double, height: Double, content: ByteArray, resources: String) {
+        val contentRef = addStream("", content)
+        setObject(
+            pageRef,
+            "<< /Type /Page /Parent $pagesRef 0 R /MediaBox [0 0 ${pdfNumber(width)} ${pdfNumber(height)}] " +
+                    "/Resources $resources /Contents $contentRef 0 R >>"
+        )
+    }
+
+    fun toByteArray(): ByteArray = lock.execute {
+        check(pageRefs.isNotEmpty()) { "The PDF document has no pages." }
+        check(!finished) { "The PDF document is already written." }
+
+        compositeFonts.forEach { (ref, font) -> writeCompositeFont(ref, font) }
+        setObject(pagesRef, "<< /Type /Pages /Kids [${pageRefs.joinToString(" ") { "$it 0 R" }}] /Count ${pageRefs.size} >>")
+        val catalogRef = addObject("<< /Type /Catalog /Pages $pagesRef 0 R >>")
+        val infoRef = addObject("<< /Producer (Lets-Plot) >>")
+        finished = true
+
+        val chunks = ArrayList<ByteArray>()
+        var offset = 0
+        fun write(bytes: ByteArray) {
+            chunks += bytes
+            offset += bytes.size
+        }
+
+        // The binary comment tells file transfer tools that the file contains binary data.
+        write("%PDF-1.4\n%".encodeToByteArray() + byteArrayOf(0xE2.toByte(), 0xE3.toByte(), 0xCF.toByte(), 0xD3.toByte(), 0x0A))
+
+        val offsets = IntArray(objects.size)
+        objects.forEachIndexed { i, body ->
+            offsets[i] = offset
+            write("${i + 1} 0 obj\n".encodeToByteArray())
+            write(body ?: error("PDF object ${i + 1} is not written (a page is not finished?)"))
+            write("\nendobj\n".encodeToByteArray())
+        }
+
+        val xrefOffset = offset
+        val xref = StringBuilder()
+        xref.append("xref\n0 ${objects.size + 1}\n0000000000 65535 f \n")
+        offsets.forEach { xref.append(it.toString().padStart(10, '0')).append(" 00000 n \n") }
+        xref.append("trailer\n<< /Size ${objects.size + 1} /Root $catalogRef 0 R /Info $infoRef 0 R >>\n")
+        xref.append("startxref\n$xrefOffset\n%%EOF\n")
+        write(xref.toString().encodeToByteArray())
+
+        val result = ByteArray(offset)
+        var position = 0
+        chunks.forEach {
+            it.copyInto(result, position)
+            position += it.size
+        }
+        result
+    }
+
+    internal fun fontRef(font: PdfFont): Int {
+        return lock.execute { fontRefs.getOrPut(font.key) { addFont(font) } }
+    }
+
+    /**
+     * The character codes of the text shown with the font [fontRef] (see [PdfDocument.fontRef]).
+     *
+     * @param substitute - replace the characters the font can't show with the missing glyph ('?' for a standard font),
+     * otherwise return null for such text.
+     */
+    internal fun encodeText(fontRef: Int, text: String, substitute: Boolean): ByteArray? {
+        val compositeFont = lock.execute { compositeFonts[fontRef] }
+            ?: return if (substitute) toWinAnsi(text) else encodeWinAnsi(text)
+
+        val codePoints = codePoints(text)
+        val glyphIds = IntArray(codePoints.size)
+        codePoints.forEachIndexed { i, codePoint ->
+            val glyphId = compositeFont.glyphId(codePoint)
+            if (glyphId == 0 && !substitute) {
+                return null
+            }
+            glyphIds[i] = glyphId
+        }
+
+        lock.execute {
+            glyphIds.forEachIndexed { i, glyphId -> compositeFont.usedGlyphs.getOrPut(glyphId) { codePoints[i] } }
+        }
+
+        // Identity-H encoding: two-byte codes equal to the glyph ids.
+        val codes = ByteArray(glyphIds.size * 2)
+        glyphIds.forEachIndexed { i, glyphId ->
+            codes[i * 2] = (glyphId shr 8).toByte()
+            codes[i * 2 + 1] = glyphId.toByte()
+        }
+        return codes
+    }
+
+    // Image XObject with the alpha channel as a soft mask (omitted for opaque images).
+    internal fun addImage(bitmap: Bitmap, interpolate: Boolean): Int {
+        val pixelCount = bitmap.width * bitmap.height
+        val rgb = ByteArray(pixelCount * 3)
+        val alpha = ByteArray(pixelCount)
+        var opaque = true
+        for (i in 0 until pixelCount) {
+            val pixel = bitmap.argbInts[i]
+            rgb[i * 3] = (pixel shr 16).toByte()
+            rgb[i * 3 + 1] = (pixel shr 8).toByte()
+            rgb[i * 3 + 2] = pixel.toByte()
+            alpha[i] = (pixel ushr 24).toByte()
+            opaque = opaque && (pixel ushr 24) == 0xFF
+        }
+
+        val imageDict = "/Type /XObject /Subtype /Image /Width ${bitmap.width} /Height ${bitmap.height} " +
+                "/BitsPerComponent 8" + if (interpolate) " /Interpolate true" else ""
+        val softMask = if (opaque) "" else " /SMask ${addStream("$imageDict /ColorSpace /DeviceGray", alpha)} 0 R"
+        return addStream("$imageDict /ColorSpace /DeviceRGB$softMask", rgb)
+    }
+
+    private fun addFont(font: PdfFont): Int {
+        val fontFile = font.fontFile
+        if (fontFile == null) {
+            return addObject(
+                "<< /Type /Font /Subtype /Type1 /BaseFont /${font.name} /FirstChar $FIRST_CHAR /LastChar $LAST_CHAR " +
+                        "/Widths [${font.widths.joinToString(" ")}] /Encoding /WinAnsiEncoding >>"
+            )
+        }
+
+        // The glyphs used by the pages are known when the document is written.
+        return reserveObject().also { compositeFonts[it] = CompositeFont(font, fontFile) }
+    }
+
+    private fun writeCompositeFont(ref: Int, compositeFont: CompositeFont) {
+        val font = compositeFont.font
+        val fontFile = compositeFont.fontFile
+        val usedGlyphs = compositeFont.usedGlyphs.entries.sortedBy { it.key }
+
+        val fontFileRef = addStream("/Length1 ${fontFile.bytes.size}", fontFile.bytes)
+        val descriptorRef = addObject(
+            "<< /Type /FontDescriptor /FontName /${font.name} /Flags 4 " + // Symbolic: the glyphs are selected by ids
+                    "/FontBBox [${font.bbox.joinToString(" ")}] /ItalicAngle 0 " +
+                    "/Ascent ${font.ascent} /Descent ${font.descent} /CapHeight ${font.ascent} /StemV 80 " +
+                    "/FontFile2 $fontFileRef 0 R >>"
+        )
+
+        val widths = usedGlyphs.joinToString(" ") { (glyphId, _) -> "$glyphId [${fontFile.glyphWidth(glyphId)}]" }
+        val cidFontRef = addObject(
+            "<< /Type /Font /Subtype /CIDFontType2 /BaseFont /${font.name} " +
+                    "/CIDSystemInfo << /Registry (Adobe) /Ordering (Identity) /Supplement 0 >> " +
+                    "/FontDescriptor $descriptorRef 0 R /DW ${fontFile.glyphWidth(0)} /W [$widths] /CIDToGIDMap /Identity >>"
+        )
+
+        // Makes the text searchable and copyable.
+        val toUnicode = StringBuilder(
+            "/CIDInit /ProcSet findresource begin\n12 dict begin\nbegincmap\n" +
+                    "/CIDSystemInfo << /Registry (Adobe) /Ordering (UCS) /Supplement 0 >> def\n" +
+                    "/CMapName /Adobe-Identity-UCS def\n/CMapType 2 def\n" +
+                    "1 begincodespacerange\n<0000> <FFFF>\nendcodespacerange\n"
+        )
+        usedGlyphs.filter { (glyphId, _) -> glyphId != 0 }.chunked(100).forEach { chunk ->
+            toUnicode.append("${chunk.size} beginbfchar\n")
+            chunk.forEach { (glyphId, codePoint) ->
+                toUnicode.append('<').append(hex16(glyphId)).append("> <")
+                utf16(codePoint).forEach { toUnicode.append(hex16(it)) }
+                toUnicode.append(">\n")
+            }
+            toUnicode.append("endbfchar\n")
+        }
+        toUnicode.append("endcmap\nCMapName currentdict /CMap defineresource pop\nend\nend\n")
+        val toUnicodeRef = addStream("", toUnicode.toString().encodeToByteArray())
+
+        setObject(
+            ref,
+            "<< /Type /Font /Subtype /Type0 /BaseFont /${font.name} /Encoding /Identity-H " +
+                    "/DescendantFonts [$cidFontRef 0 R] /ToUnicode $toUnicodeRef 0 R >>"
+        )
+    }
+
+    private fun reserveObject(): Int = lock.execute {
+        objects.add(null)
+        objects.size
+    }
+
+    private fun setObject(ref: Int, body: String) {
+        setObject(ref, body.encodeToByteArray())
+    }
+
+    private fun setObject(ref: Int, body: ByteArray) {
+        lock.execute {
+            check(!finished) { "The PDF document is already written." }
+            objects[ref - 1] = body
+        }
+    }
+
+    private fun addObject(body: String): Int {
+        return reserveObject().also { setObject(it, body) }
+    }
+
+    // The data is compressed out of the lock: the pages painted concurrently don't wait for each other.
+    private fun addStream(dict: String, data: ByteArray): Int {
+        val compressed = deflate(data)
+        val head = "<< $dict /Filter /FlateDecode /Length ${compressed.size} >>\nstream\n".encodeToByteArray()
+        return reserveObject().also { setObject(it, head + compressed + "\nendstream".encodeToByteArray()) }
+    }
+
+    private class CompositeFont(val font: PdfFont, val fontFile: TrueTypeFont) {
+        val usedGlyphs = HashMap<Int, Int>() // glyph id -> code point
+
+        fun glyphId(codePoint: Int): Int {
+            return fontFile.glyphId(codePoint).takeIf { it != 0 }
+                ?: substitutes[codePoint]?.let(fontFile::glyphId)
+                ?: 0
+        }
+    }
+
+    companion object {
+        // The character codes of the simple fonts (WinAnsiEncoding).
+        const val FIRST_CHAR = 32
+        const val LAST_CHAR = 255
+
+        // cp1252 codes 0x80..0x9F (0 - not defined)
+        private val WIN_ANSI_80_9F = intArrayOf(
+            0x20AC, 0, 0x201A, 0x0192, 0x201E, 0x2026, 0x2020, 0x2021,
+            0x02C6, 0x2030, 0x0160, 0x2039, 0x0152, 0, 0x017D, 0,
+            0, 0x2018, 0x2019, 0x201C, 0x201D, 0x2022, 0x2013, 0x2014,
+            0x02DC, 0x2122, 0x0161, 0x203A, 0x0153, 0, 0x017E, 0x0178
+        )
+
+        private val WIN_ANSI_CODES: Map<Char, Int> = WIN_ANSI_80_9F
+            .withIndex()
+            .filter { (_, unicode) -> unicode != 0 }
+            .associate { (i, unicode) -> unicode.toChar() to 0x80 + i }
+
+        /**
+         * The character of the WinAnsiEncoding code or null if the code is not defined.
+         */
+        fun winAnsiChar(code: Int): Char? {
+            return when (code) {
+                in 0x20..0x7E, in 0xA0..0xFF -> code.toChar()
+                in 0x80..0x9F -> WIN_ANSI_80_9F[code - 0x80].takeIf { it != 0 }?.toChar()
+                else -> null
+            }
+        }
+
+        // The characters shown with another glyph if the font has no glyph for them.
+        private val substitutes = mapOf(
+            0x2212 to '-'.code, // minus sign in the tick labels
+            0x09 to ' '.code,
+            0x0A to ' '.code,
+            0x0D to ' '.code,
+        )
+
+        /**
+         * The text in WinAnsiEncoding: unsupported characters are replaced with '?'.
+         */
+        fun toWinAnsi(text: String): ByteArray {
+            return ByteArray(text.length) { i -> (winAnsiCode(text[i]) ?: '?'.code).toByte() }
+        }
+
+        // The text in WinAnsiEncoding or null if it has unsupported characters.
+        private fun encodeWinAnsi(text: String): ByteArray? {
+            val bytes = ByteArray(text.length)
+            text.forEachIndexed { i, ch -> bytes[i] = (winAnsiCode(ch) ?: return null).toByte() }
+            return bytes
+        }
+
+        private fun winAnsiCode(ch: Char): Int? {
+            val code = substitutes[ch.code] ?: ch.code
+            return when (code) {
+                in 0x20..0x7E, in 0xA0..0xFF -> code
+                else -> WIN_ANSI_CODES[code.toChar()]
+            }
+        }
+
+        private fun codePoints(text: String): IntArray {
+            val codePoints = IntArray(text.length)
+            var count = 0
+            var i = 0
+            while (i < text.length) {
+                val ch = text[i]
+                val low = text.getOrNull(i + 1)
+                if (ch.isHighSurrogate() && low != null && low.isLowSurrogate()) {
+                    codePoints[count++] = 0x10000 + ((ch.code - 0xD800) shl 10) + (low.code - 0xDC00)
+                    i += 2
+                } else {
+                    codePoints[count++] = ch.code
+                    i++
+                }
+            }
+            return codePoints.copyOf(count)
+        }
+
+        private fun utf16(codePoint: Int): IntArray {
+            if (codePoint < 0x10000) {
+                return intArrayOf(codePoint)
+            }
+            val offset = codePoint - 0x10000
+            return intArrayOf(0xD800 + (offset shr 10), 0xDC00 + (offset and 0x3FF))
+        }
+
+        private fun hex16(value: Int): String {
+            return value.toString(16).uppercase().padStart(4, '0')
+        }
+    }
+}
+
+/**
+ * PDF font: a standard font with WinAnsiEncoding or an embedded TrueType font.
+ *
+ * @param key - identifies the font in the document.
+ * @param name - the PostScript name of the font (BaseFont).
+ * @param widths - glyph widths of the codes [PdfDocument.FIRST_CHAR]..[PdfDocument.LAST_CHAR] in 1/1000 of the font size
+ * (for a standard font).
+ * @param fontFile - TrueType font program to embed or null for a standard font (Helvetica, Times-Roman, Courier).
+ * @param emulateBold - the font has no bold variant, draw the glyph outlines with a thin stroke.
+ * @param emulateItalic - the font has no italic variant, shear the glyphs.
+ */
+class PdfFont(
+    val key: String,
+    val name: String,
+    val widths: IntArray,
+    val ascent: Int,
+    val descent: Int,
+    val bbox: IntArray,
+    val fontFile: TrueTypeFont?,
+    val emulateBold: Boolean,
+    val emulateItalic: Boolean,
+)
+
+// PDF real number: at most 3 decimal places, no exponent.
+internal fun pdfNumber(value: Double): String {
+    if (!value.isFinite()) {
+        return "0"
+    }
+
+    val scaled = (value * 1000).roundToLong()
+    val sign = if (scaled < 0) "-" else ""
+    val integer = abs(scaled) / 1000
+    val fraction = abs(scaled) % 1000
+    return when (fraction) {
+        0L -> "$sign$integer"
+        else -> "$sign$integer." + fraction.toString().padStart(3, '0').trimEnd('0')
+    }
+}
@@ -0,0 +1,190 @@
+/*
+ * Copyright (c) 2026. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.imagick.canvas
+
+/**
+ * TrueType font program embedded into PDF: the glyphs of the characters and the glyph widths.
+ *
+ * @param bytes - the font file.
+ * @param bbox - FontBBox in 1/1000 of the em or null if the font has no 'head' table.
+ */
+class TrueTypeFont private constructor(
+    val bytes: ByteArray,
+    val bbox: IntArray?,
+    private val glyphIds: Map<Int, Int>,
+    private val glyphWidths: IntArray,
+) {
+    /**
+     * The glyph of the Unicode code point or 0 (the missing glyph).
+     */
+    fun glyphId(codePoint: Int): Int {
+        return glyphIds[codePoint] ?: 0
+    }
+
+    /**
+     * The advance width of the glyph in 1/1000 of the em.
+     */
+    fun glyphWidth(glyphId: Int): Int {
+        return when {
+            glyphWidths.isEmpty() -> 0
+            glyphId < glyphWidths.size -> glyphWidths[glyphId]
+            else -> glyphWidths.last() // The glyphs after numberOfHMetrics have the width of the last one.
+        }
+    }
+
+    companion object {
+        /**
+         * Parses the font file or returns null if it's not a TrueType font (e.g. OpenType CFF or font collection)
+         * or has no Unicode character map.
+         */
+        fun parse(bytes: ByteArray): TrueTypeFont? {
+            if (bytes.size < 12) {
+                return null
+            }
+            val version = u32(bytes, 0)
+            if (version != 0x00010000L && version != 0x74727565L) { // 'true'
+                return null
+            }
+
+            val tables = HashMap<String, Int>() // tag -> offset
+            val numTables = u16(bytes, 4)
+            for (i in 0 until numTables) {
+                val entry = 12 + i * 16
+                if (entry + 16 > bytes.size) {
+                    return null
+                }
+                val offset = u32(bytes, entry + 8)
+                val length = u32(bytes, entry + 12)
+                if (offset + length <= bytes.size) {
+                    tables[bytes.decodeToString(entry, entry + 4)] = offset.toInt()
+                }
+            }
+
+            val head = tables["head"]?.takeIf { it + 54 <= bytes.size }
+            val unitsPerEm = head?.let { u16(bytes, it + 18) }?.takeIf { it > 0 } ?: 1000
+            val bbox = head?.let {
+                intArrayOf(
+                    i16(bytes, it + 36) * 1000 / unitsPerEm, // xMin
+                    i16(bytes, it + 38) * 1000 / unitsPerEm, // yMin
+                    i16(bytes, it + 40) * 1000 / unitsPerEm, // xMax
+                    i16(bytes, it + 42) * 1000 / unitsPerEm, // yMax
+                )
+            }
+
+            val glyphIds = tables["cmap"]?.let { readCmap(bytes, it) } ?: return null
+            return TrueTypeFont(bytes, bbox, glyphIds, readWidths(bytes, tables, unitsPerEm))
+        }
+
+        // Advance widths from the 'hmtx' table.
+        private fun readWidths(bytes: ByteArray, tables: Map<String, Int>, unitsPerEm: Int): IntArray {
+            val hhea = tables["hhea"]?.takeIf { it + 36 <= bytes.size } ?: return IntArray(0)
+            val hmtx = tables["hmtx"] ?: return IntArray(0)
+            val numberOfHMetrics = u16(bytes, hhea + 34).coerceAtMost((bytes.size - hmtx) / 4)
+            return IntArray(numberOfHMetrics) { i -> u16(bytes, hmtx + i * 4) * 1000 / unitsPerEm }
+        }
+
+        // Unicode code point -> glyph id from the Unicode subtable of the 'cmap' table: format 12 (full repertoire)
+        // is preferred to format 4 (BMP only).
+        private fun readCmap(bytes: ByteArray, cmap: Int): Map<Int, Int>? {
+            if (cmap + 4 > bytes.size) {
+                return null
+            }
+
+            var format4: Int? = null
+            var format12: Int? = null
+            val numSubtables = u16(bytes, cmap + 2)
+            for (i in 0 until numSubtables) {
+                val record = cmap + 4 + i * 8
+                if (record + 8 > bytes.size) {
+                    break
+                }
+                val platformId = u16(bytes, record)
+                val encodingId = u16(bytes, record + 2)
+                val subtable = cmap + u32(bytes, record + 4).toInt()
+                if (subtable < 0 || subtable + 4 > bytes.size) {
+                    continue
+                }
+                val unicode = platformId == 0 || platformId == 3 && (encodingId == 1 || encodingId == 10)
+                when {
+                    !unicode -> {}
+                    u16(bytes, subtable) == 4 -> format4 = format4 ?: subtable
+                    u16(bytes, subtable) == 12 -> format12 = format12 ?: subtable
+                }
+            }
+
+            return format12?.let { readCmapFormat12(bytes, it) } ?: format4?.let { readCmapFormat4(bytes, it) }
+        }
+
+        private fun readCmapFormat4(bytes: ByteArray, subtable: Int): Map<Int, Int>? {
+            val segCountX2 = u16(bytes, subtable + 6)
+            val endCodes = subtable + 14
+            val startCodes = endCodes + segCountX2 + 2
+            val idDeltas = startCodes + segCountX2
+            val idRangeOffsets = idDeltas + segCountX2
+            if (idRangeOffsets + segCountX2 > bytes.size) {
+                return null
+            }
+
+            val glyphIds = HashMap<Int, Int>()
+            for (segment in 0 until segCountX2 / 2) {
+                val start = u16(bytes, startCodes + segment * 2)
+                val end = u16(bytes, endCodes + segment * 2)
+                val idDelta = u16(bytes, idDeltas + segment * 2)
+                val idRangeOffsetAddress = idRangeOffsets + segment * 2
+                val idRangeOffset = u16(bytes, idRangeOffsetAddress)
+                for (code in start..minOf(end, 0xFFFE)) {
+                    val glyphId = if (idRangeOffset == 0) {
+                        (code + idDelta) and 0xFFFF
+                    } else {
+                        val address = idRangeOffsetAddress + idRangeOffset + (code - start) * 2
+                        if (address + 2 > bytes.size) {
+                            break
+                        }
+                        u16(bytes, address).let { if (it == 0) 0 else (it + idDelta) and 0xFFFF }
+                    }
+                    if (glyphId != 0) {
+                        glyphIds[code] = glyphId
+                    }
+                }
+            }
+            return glyphIds
+        }
+
+        private fun readCmapFormat12(bytes: ByteArray, subtable: Int): Map<Int, Int>? {
+            if (subtable + 16 > bytes.size) {
+                return null
+            }
+            val numGroups = u32(bytes, subtable + 12)
+            if (subtable + 16 + numGroups * 12 > bytes.size) {
+                return null
+            }
+
+            val glyphIds = HashMap<Int, Int>()
+            for (group in 0 until numGroups.toInt()) {
+                val record = subtable + 16 + group * 12
+                val startCode = u32(bytes, record)
+                val endCode = minOf(u32(bytes, record + 4), 0x10FFFFL)
+                val startGlyphId = u32(bytes, record + 8)
+                for (code in startCode..endCode) {
+                    glyphIds[code.toInt()] = (startGlyphId + code - startCode).toInt()
+                }
+            }
+            return glyphIds
+        }
+
+        private fun u16(bytes: ByteArray, offset: Int): Int {
+            return ((bytes[offset].toInt() and 0xFF) shl 8) or (bytes[offset + 1].toInt() and 0xFF)
+        }
+
+        private fun i16(bytes: ByteArray, offset: Int): Int {
+            return u16(bytes, offset).toShort().toInt()
+        }
+
+        private fun u32(bytes: ByteArray, offset: Int): Long {
+            return (u16(bytes, offset).toLong() shl 16) or u16(bytes, offset + 2).toLong()
+        }
+    }
+}
@@ -0,0 +1,223 @@
+/*
+ * Copyright (c) 2026. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbraibs.letsPlot.imagick.canvas
+
+import org.jetbrains.letsPlot.commons.encoding.inflate
+import org.jetbrains.letsPlot.commons.geometry.DoubleRectangle
+import org.jetbrains.letsPlot.commons.values.Bitmap
+import org.jetbrains.letsPlot.commons.values.Color
+import org.jetbrains.letsPlot.core.canvas.Font
+import org.jetbrains.letsPlot.core.canvas.TextMetrics
+import org.jetbrains.letsPlot.imagick.canvas.PdfContext2d
+import org.jetbrains.letsPlot.imagick.canvas.PdfDocument
+import org.jetbrains.letsPlot.imagick.canvas.PdfFont
+import org.jetbrains.letsPlot.imagick.canvas.PdfFontProvider
+import org.jetbrains.letsPlot.imagick.canvas.TextImage
+import org.jetbrains.letsPlot.imagick.canvas.TrueTypeFont
+import kotlin.test.Test
+import kotlin.test.assertContentEquals
+import kotlin.test.assertEquals
+import kotlin.test.assertFalse
+import kotlin.test.assertNotNull
+import kotlin.test.assertTrue
+
+class PdfContext2dTest {
+    private val fontProvider = object : PdfFontProvider {
+        override fun pdfFont(font: Font) = PdfFont(
+            key = "helvetica",
+            name = "Helvetica",
+            widths = IntArray(PdfDocument.LAST_CHAR - PdfDocument.FIRST_CHAR + 1) { 500 },
+            ascent = 700,
+            descent = -200,
+            bbox = intArrayOf(-200, -200, 1000, 700),
+            fontFile = null,
+            emulateBold = false,
+            emulateItalic = false
+        )
+
+        override fun measureText(font: Font, text: String): TextMetrics {
+            val width = font.fontSize * text.length / 2
+            return TextMetrics(font.fontSize * 0.7, font.fontSize * 0.2, DoubleRectangle.XYWH(0.0, -font.fontSize * 0.7, width, font.fontSize))
+        }
+    }
+
+    @Test
+    fun pages() {
+        val document = PdfDocument()
+
+        val first = PdfContext2d(document, 100.0, 50.0, fontProvider)
+        first.setFillStyle(Color.RED)
+        first.fillRect(10.0, 10.0, 20.0, 20.0)
+        first.setFont(Font(fontSize = 12.0))
+        first.fillText("Hello", 10.0, 40.0)
+        first.finishPage()
+
+        val second = PdfContext2d(document, 100.0, 50.0, fontProvider, scale = 2.0)
+        second.setFillStyle(Color.BLACK)
+        second.setFont(Font(fontSize = 12.0))
+        second.fillText("World", 10.0, 40.0)
+        second.finishPage()
+
+        assertEquals(2, document.pageCount)
+
+        val pdf = latin1(document.toByteArray())
+        assertTrue(pdf.startsWith("%PDF-1.4"))
+        assertTrue(pdf.endsWith("%%EOF\n"))
+        assertTrue("/MediaBox [0 0 75 37.5]" in pdf)
+        assertTrue("/MediaBox [0 0 150 75]" in pdf)
+        assertTrue("/Count 2" in pdf)
+
+        // The font is shared by the pages.
+        assertEquals(1, "/BaseFont /Helvetica".toRegex().findAll(pdf).count())
+    }
+
+    @Test
+    fun pageOrder() {
+        val document = PdfDocument()
+        val first = PdfContext2d(document, 100.0, 50.0, fontProvider)
+        val second = PdfContext2d(document, 200.0, 50.0, fontProvider)
+
+        // The pages are in the order of the contexts creation, not the order they are finished.
+        second.finishPage()
+        first.finishPage()
+
+        val pdf = latin1(document.toByteArray())
+        val kids = pdf.substringAfter("/Kids [").substringBefore("]").split(" 0 R").map(String::trim).filter(String::isNotEmpty)
+        val pageSizes = kids.map { ref -> pdf.substringAfter("\n$ref 0 obj\n").substringAfter("/MediaBox [").substringBefore("]") }
+        assertEquals(listOf("0 0 75 37.5", "0 0 150 37.5"), pageSizes)
+    }
+
+    @Test
+    fun xrefOffsets() {
+        val document = PdfDocument()
+        PdfContext2d(document, 10.0, 10.0, fontProvider).finishPage()
+        val pdf = latin1(document.toByteArray())
+
+        val xref = pdf.substringAfter("startxref\n").substringBefore("\n").toInt()
+        assertTrue(pdf.startsWith("xref", xref))
+
+        val offsets = pdf.substring(xref).lines().drop(3).takeWhile { it.endsWith(" n ") }
+        offsets.forEachIndexed { i, entry ->
+            assertTrue(pdf.startsWith("${i + 1} 0 obj", entry.take(10).toInt()))
+        }
+    }
+
+    @Test
+    fun winAnsiText() {
+        assertContentEquals(
+            byteArrayOf(0x41, 0x2D, 0x80.toByte(), 0xE9.toByte(), 0x3F),
+            PdfDocument.toWinAnsi("A−€é中")
+        )
+    }
+
+    @Test
+    fun trueTypeFont() {
+        val font = assertNotNull(TrueTypeFont.parse(testFontFile()))
+
+        assertEquals(1, font.glyphId('A'.code))
+        assertEquals(2, font.glyphId('σ'.code))
+        assertEquals(0, font.glyphId('中'.code))
+        assertEquals(600, font.glyphWidth(1))
+        assertEquals(700, font.glyphWidth(5)) // after numberOfHMetrics
+    }
+
+    @Test
+    fun embeddedFontShowsUnicodeText() {
+        val trueType = TrueTypeFont.parse(testFontFile())
+        val embeddedFontProvider = object : PdfFontProvider by fontProvider {
+            override fun pdfFont(font: Font) = PdfFont(
+                key = "test",
+                name = "Test",
+                widths = IntArray(0),
+                ascent = 700,
+                descent = -200,
+                bbox = intArrayOf(0, -200, 1000, 700),
+                fontFile = trueType,
+                emulateBold = false,
+                emulateItalic = false
+            )
+        }
+
+        val document = PdfDocument()
+        val page = PdfContext2d(document, 100.0, 50.0, embeddedFontProvider)
+        page.setFillStyle(Color.BLACK)
+        page.setFont(Font(fontSize = 12.0))
+        page.fillText("Aσ", 10.0, 40.0)
+        page.finishPage()
+
+        val pdf = latin1(document.toByteArray())
+        assertTrue("/Subtype /Type0 /BaseFont /Test /Encoding /Identity-H" in pdf)
+        assertTrue("/Subtype /CIDFontType2" in pdf)
+        assertTrue("/W [1 [600] 2 [700]]" in pdf)
+
+        val toUnicodeRef = pdf.substringAfter("/ToUnicode ").substringBefore(" 0 R")
+        val toUnicode = inflate(streamData(pdf, toUnicodeRef), 10_000).decodeToString()
+        assertTrue("<0001> <0041>" in toUnicode)
+        assertTrue("<0002> <03C3>" in toUnicode)
+    }
+
+    @Test
+    fun textImageForUnsupportedCharacters() {
+        val textImages = ArrayList<String>()
+        val rasterizingFontProvider = object : PdfFontProvider by fontProvider {
+            override fun textImage(font: Font, text: String, color: Color, lineWidth: Double, pixelDensity: Double): TextImage {
+                textImages += text
+                return TextImage(Bitmap(2, 1, IntArray(2) { 0xFF000000.toInt() }), 0.0, -10.0, 20.0, 12.0)
+            }
+        }
+
+        val document = PdfDocument()
+        val page = PdfContext2d(document, 100.0, 50.0, rasterizingFontProvider)
+        page.setFillStyle(Color.BLACK)
+        page.setFont(Font(fontSize = 12.0))
+        page.fillText("Hello", 10.0, 20.0)
+        page.fillText("σ = 1", 10.0, 40.0)
+        page.finishPage()
+
+        assertEquals(listOf("σ = 1"), textImages)
+        val pdf = latin1(document.toByteArray())
+        assertTrue("/Subtype /Image /Width 2 /Height 1" in pdf)
+        assertEquals(1, "/BaseFont /Helvetica".toRegex().findAll(pdf).count())
+        assertFalse("/Type0" in pdf)
+    }
+
+    private fun streamData(pdf: String, ref: String): ByteArray {
+        val obj = pdf.substringAfter("\n$ref 0 obj\n")
+        val length = obj.substringAfter("/Length ").substringBefore(" ").toInt()
+        val data = obj.substringAfter("stream\n").take(length)
+        return ByteArray(data.length) { data[it].code.toByte() }
+    }
+
+    // A TrueType font with the glyphs of 'A' (1) and 'σ' (2) and the cmap, head, hhea, hmtx tables only.
+    private fun testFontFile(): ByteArray {
+        fun u16(vararg values: Int) = ByteArray(values.size * 2) { i -> (values[i / 2] shr (8 - i % 2 * 8)).toByte() }
+
+        val head = ByteArray(54).also { u16(1000).copyInto(it, 18) } // unitsPerEm
+        val hhea = ByteArray(36).also { u16(3).copyInto(it, 34) }    // numberOfHMetrics
+        val hmtx = u16(500, 0, 600, 0, 700, 0)
+        val cmap = u16(0, 1, 3, 1, 0, 12) + u16(
+            4, 40, 0, 6, 0, 0, 0,
+            'A'.code, 'σ'.code, 0xFFFF, 0,        // endCode, reservedPad
+            'A'.code, 'σ'.code, 0xFFFF,           // startCode
+            (1 - 'A'.code) and 0xFFFF, (2 - 'σ'.code) and 0xFFFF, 1, // idDelta
+            0, 0, 0                               // idRangeOffset
+        )
+
+        val tables = listOf("cmap" to cmap, "head" to head, "hhea" to hhea, "hmtx" to hmtx)
+        var offset = 12 + tables.size * 16
+        var directory = u16(1, 0, tables.size, 0, 0, 0)
+        tables.forEach { (tag, table) ->
+            directory += tag.encodeToByteArray() + u16(0, 0, offset shr 16, offset and 0xFFFF, 0, table.size)
+            offset += table.size
+        }
+        return tables.fold(directory) { bytes, (_, table) -> bytes + table }
+    }
+
+    // One char per byte, so the string indices are the file offsets.
+    private fun latin1(bytes: ByteArray): String {
+        return CharArray(bytes.size) { (bytes[it].toInt() and 0xFF).toChar() }.concatToString()
+    }
+}
@@ -0,0 +1,46 @@
+/*
+ * Copyright (c) 2026. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.core.commons.data
+
+/**
+ * Read-only list of values stored as a dictionary of unique values (levels)
+ * and per-row codes - indices into the levels, negative code stands for a missing value.
+ *
+ * Used for repetitive (i.e. categorical) string series: the memory footprint is
+ * proportional to the number of unique values, not to the number of rows.
+ */
+class DictionaryEncodedList<T : Any>(
+    val levels: List<T>,
+    private val codes: IntArray
+) : AbstractList<T?>(), RandomAccess {
+
+    override val size: Int
+        get() = codes.size
+
+    override fun get(index: Int): T? {
+        val code = codes[index]
+        return if (code < 0) null else levels[code]
+    }
+
+    /**
+     * Non-null values in the order of their first appearance.
+     * Computed over the codes without hashing of the values.
+     */
+    fun distinctValues(): List<T> {
+        val seen = BooleanArray(levels.size)
+        val result = ArrayList<T>()
+        for (code in codes) {
+            if (code >= 0 && !seen[code]) {
+                seen[code] = true
+                result.add(levels[code])
+                if (result.size == levels.size) {
+                    break
+                }
+            }
+        }
+        return result
+    }
+}
@@ -0,0 +1,19 @@
+/*
+ * Copyright (c) 2026. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.core.commons.data
+
+/**
+ * Read-only list view over primitive doubles: values are boxed on access only.
+ * Non-finite values (NaN is used as the validity mask for NaN/NaT and None) are read as null.
+ *
+ * Used for numeric series passed as contiguous buffers: the memory footprint is 8 bytes per row.
+ */
+class DoubleColumn(
+    private val values: DoubleArray
+) : AbstractList<Double?>(), RandomAccess {
+    override val size: Int get() = values.size
+    override fun get(index: Int): Double? = values[index].takeIf(Double::isFinite)
+}
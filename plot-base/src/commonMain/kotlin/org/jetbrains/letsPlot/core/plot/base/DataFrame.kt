@@ -7,6 +7,8 @@ package org.jetbrains.letsPlot.core.plot.base
 
 import org.jetbrains.letsPlot.commons.interval.DoubleSpan
 import org.jetbrains.letsPlot.commons.logging.PortableLogging
+import org.jetbrains.letsPlot.core.commons.data.DictionaryEncodedList
+import org.jetbrains.letsPlot.core.commons.data.DoubleColumn
 import org.jetbrains.letsPlot.core.commons.data.SeriesUtil
 import kotlin.jvm.JvmOverloads
 
@@ -111,7 +113,10 @@ class DataFrame private constructor(builder: Builder) {
             } else if (myFactorLevelsByVar.containsKey(variable)) {
                 myFactorLevelsByVar.getValue(variable).toSet().intersect(get(variable)).filterNotNull()
             } else {
-                get(variable).filterNotNull().toSet()
+                when (val values = get(variable)) {
+                    is DictionaryEncodedList<*> -> values.distinctValues()
+                    else -> values.filterNotNull()
+                }
             }.toSet()
         }
     }
@@ -361,7 +366,11 @@ class DataFrame private constructor(builder: Builder) {
         }
 
         internal fun putIntern(variable: Variable, v: List<*>) {
-            myVectorByVar[variable] = ArrayList(v)
+            myVectorByVar[variable] = when (v) {
+                // Read-only series are shared: no copying and no boxing of the values.
+                is DictionaryEncodedList<*>, is DoubleColumn -> v
+                else -> ArrayList(v)
+            }
         }
 
         fun remove(variable: Variable): Builder {
@@ -0,0 +1,34 @@
+/*
+ * Copyright (c) 2026. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.core.commons.data
+
+import org.jetbrains.letsPlot.core.plot.base.DataFrame
+import kotlin.test.Test
+import kotlin.test.assertEquals
+import kotlin.test.assertSame
+import kotlin.test.assertTrue
+
+class DoubleColumnTest {
+    private val variable = DataFrame.Variable("x")
+
+    @Test
+    fun nonFiniteValuesAreNull() {
+        val column = DoubleColumn(doubleArrayOf(1.0, Double.NaN, -2.5, Double.POSITIVE_INFINITY))
+        assertEquals(listOf(1.0, null, -2.5, null), column.toList())
+    }
+
+    @Test
+    fun dataFrameKeepsColumn() {
+        val column = DoubleColumn(doubleArrayOf(3.0, Double.NaN, 1.0))
+        val df = DataFrame.Builder()
+            .put(variable, column)
+            .build()
+
+        assertSame(column, df[variable])
+        assertTrue(df.isNumeric(variable))
+        assertEquals(setOf(3.0, 1.0), df.distinctValues(variable))
+    }
+}
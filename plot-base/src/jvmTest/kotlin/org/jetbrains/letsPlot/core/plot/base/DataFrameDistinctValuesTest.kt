@@ -5,6 +5,7 @@
 
 package org.jetbrains.letsPlot.core.plot.base
 
+import org.jetbrains.letsPlot.core.commons.data.DictionaryEncodedList
 import org.jetbrains.letsPlot.core.commons.data.SeriesUtil
 import org.jetbrains.letsPlot.core.plot.base.DataFrame
 import org.jetbrains.letsPlot.core.plot.base.DataFrame.OrderSpec
@@ -12,6 +13,7 @@ import org.jetbrains.letsPlot.core.plot.base.stat.Stats
 import java.lang.Double.NaN
 import kotlin.test.Test
 import kotlin.test.assertEquals
+import kotlin.test.assertSame
 
 class DataFrameDistinctValuesTest {
     private val variable = DataFrame.Variable("foo")
@@ -326,6 +328,19 @@ class DataFrameDistinctValuesTest {
         assertDistinctValues(df, expectedDistinctValues)
     }
 
+    @Test
+    fun `dictionary encoded values - distinct values in order of appearance`() {
+        // levels "A", "B", "C", "D": "D" is not used, code -1 is a missing value
+        val values = DictionaryEncodedList(listOf("A", "B", "C", "D"), intArrayOf(1, 0, -1, 1, 2, 0))
+        assertEquals(listOf("B", "A", null, "B", "C", "A"), values.toList())
+
+        val df = DataFrame.Builder()
+            .put(variable, values)
+            .build()
+        assertSame(values, df[variable])
+        assertDistinctValues(df, mapOf(variable to listOf("B", "A", "C")))
+    }
+
     private fun assertDistinctValues(df: DataFrame, expectedDistinctValues: Map<DataFrame.Variable, List<Any>>) {
         expectedDistinctValues.forEach { (variable, expected) ->
             assertEquals(expected, df.distinctValues(variable).toList())
@@ -128,6 +128,11 @@ object Option {
         const val FIGURES = "figures"
         const val LAYOUT = "layout"
 
+        // Data used by several sub-figures (or layers): ID -> data.
+        // Sub-figures and layers refer to it by the ID in the 'data_ref' option instead of 'data'.
+        const val SHARED_DATA = "shared_data"
+        const val DATA_REF = "data_ref"
+
         object Figure {
             const val BLANK = "blank"
         }
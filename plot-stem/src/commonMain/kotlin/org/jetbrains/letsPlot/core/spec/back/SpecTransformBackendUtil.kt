@@ -11,6 +11,7 @@ import org.jetbrains.letsPlot.core.spec.FigKind
 import org.jetbrains.letsPlot.core.spec.Option
 import org.jetbrains.letsPlot.core.spec.Option.SubPlots.Figure.BLANK
 import org.jetbrains.letsPlot.core.spec.back.transform.PlotConfigBackendTransforms
+import org.jetbrains.letsPlot.core.spec.config.CompositeFigureConfig
 import org.jetbrains.letsPlot.core.spec.config.PlotConfig
 
 
@@ -35,7 +36,9 @@ object SpecTransformBackendUtil {
 
             when (PlotConfig.figSpecKind(plotSpecRaw)) {
                 FigKind.PLOT_SPEC -> processTransformIntern(plotSpecRaw)
-                FigKind.SUBPLOTS_SPEC -> processTransformInSubPlots(plotSpecRaw)
+                FigKind.SUBPLOTS_SPEC -> processTransformInSubPlots(
+                    CompositeFigureConfig.resolveSharedData(plotSpecRaw)
+                )
                 FigKind.GG_BUNCH_SPEC -> {
                     val bunchSpecOld = processTransformInBunch(plotSpecRaw)
                     // No 'GG_BUNCH_SPEC' beyond this point
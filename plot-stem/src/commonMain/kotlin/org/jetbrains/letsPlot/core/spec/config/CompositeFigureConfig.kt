@@ -270,6 +270,46 @@ class CompositeFigureConfig constructor(
         return CompositeFigureDeckLayout(shareX = deckShareConfig.shareX, shareY = deckShareConfig.shareY)
     }
 
+    companion object {
+        /**
+         * Replaces 'data_ref' references in sub-figures and their layers
+         * with the data from the 'shared_data' section of the composite figure spec.
+         * The same data object is then used by all the referring sub-figures and layers.
+         *
+         * Called before the backend transform: the processed spec has the data of each sub-figure
+         * (i.e. the shared data is repeated in the HTML output).
+         */
+        internal fun resolveSharedData(compositeFigureSpecRaw: Map<String, Any>): Map<String, Any> {
+            val sharedData = compositeFigureSpecRaw[Option.SubPlots.SHARED_DATA] ?: return compositeFigureSpecRaw
+            require(sharedData is Map<*, *>) {
+                "'${Option.SubPlots.SHARED_DATA}': Map expected but was: ${sharedData::class.simpleName}"
+            }
+            return resolveDataRefs(compositeFigureSpecRaw - Option.SubPlots.SHARED_DATA, sharedData)
+        }
+
+        private fun resolveDataRefs(spec: Map<String, Any>, sharedData: Map<*, *>): Map<String, Any> {
+            val result = HashMap(spec)
+            result.remove(Option.SubPlots.DATA_REF)?.let { ref ->
+                result[Option.PlotBase.DATA] = requireNotNull(sharedData[ref]) {
+                    "'${Option.SubPlots.DATA_REF}': shared data '$ref' not found."
+                }
+            }
+
+            for (option in listOf(Option.SubPlots.FIGURES, Option.Plot.LAYERS)) {
+                val elements = spec[option] as? List<*> ?: continue
+                result[option] = elements.map { element ->
+                    if (element is Map<*, *>) {
+                        @Suppress("UNCHECKED_CAST")
+                        resolveDataRefs(element as Map<String, Any>, sharedData)
+                    } else {
+                        element
+                    }
+                }
+            }
+            return result
+        }
+    }
+
     enum class GuidesSharingMode(val id: String) {
         AUTO(Option.SubPlots.Guides.AUTO),
         COLLECT(Option.SubPlots.Guides.COLLECT),
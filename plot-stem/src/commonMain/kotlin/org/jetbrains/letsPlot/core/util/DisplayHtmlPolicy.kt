@@ -10,6 +10,9 @@ data class DisplayHtmlPolicy constructor(
     val forceImmediateRender: Boolean,
     val responsive: Boolean,
     val height100pct: Boolean,
+    // Embed numeric data columns as Base64-encoded typed arrays:
+    // TypedArrayDataEncoding.FLOAT64 or FLOAT32, null - as decimal numbers.
+    val typedArrayEncoding: String? = null,
 ) {
 
     companion object {
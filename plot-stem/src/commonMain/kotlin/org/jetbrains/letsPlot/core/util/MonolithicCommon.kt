@@ -56,9 +56,24 @@ object MonolithicCommon {
         sizeUnit: SizeUnit?,
         computationMessagesHandler: ((List<String>) -> Unit)
     ): String {
-        @Suppress("NAME_SHADOWING")
-        val plotSpec = processRawSpecs(plotSpec)
+        return buildSvgImageFromProcessedSpecs(
+            plotSpec = processRawSpecs(plotSpec),
+            plotSize = plotSize,
+            sizeUnit = sizeUnit,
+            computationMessagesHandler = computationMessagesHandler
+        )
+    }
 
+    /**
+     * Static SVG export of the plot spec already processed by [processRawSpecs],
+     * e.g. to export the same plot to several formats.
+     */
+    fun buildSvgImageFromProcessedSpecs(
+        plotSpec: Map<String, Any>,
+        plotSize: DoubleVector?,
+        sizeUnit: SizeUnit?,
+        computationMessagesHandler: ((List<String>) -> Unit)
+    ): String {
         val (sizingPolicy, _, unit) = computeExportParameters(plotSize = plotSize, unit = sizeUnit)
 
         val buildResult = buildPlotsFromProcessedSpecs(plotSpec, containerSize = null, sizingPolicy)
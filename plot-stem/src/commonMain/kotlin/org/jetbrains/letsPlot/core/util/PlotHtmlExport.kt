@@ -25,13 +25,16 @@ object PlotHtmlExport {
      * @param scriptUrl A URL to load the Lets-plot JS library from.
      * @param iFrame Whether to wrap HTML in IFrame.
      * @param plotSize Desired plot size.
+     * @param typedArrayEncoding Embed numeric data columns as Base64-encoded typed arrays
+     *          ([TypedArrayDataEncoding.FLOAT64] or [TypedArrayDataEncoding.FLOAT32]), null - as decimal numbers.
      */
     @Suppress("MemberVisibilityCanBePrivate")
     fun buildHtmlFromRawSpecs(
         plotSpec: MutableMap<String, Any>,
         scriptUrl: String,
         iFrame: Boolean = false,
-        plotSize: DoubleVector? = null
+        plotSize: DoubleVector? = null,
+        typedArrayEncoding: String? = null
     ): String {
 
         val fixedSizeQ = if (iFrame) {
@@ -81,7 +84,7 @@ object PlotHtmlExport {
             plotSpec,
             scriptUrl,
             sizingPolicy,
-            displayHtmlPolicy = DisplayHtmlPolicy.entirelyStatic(),
+            displayHtmlPolicy = DisplayHtmlPolicy.entirelyStatic().copy(typedArrayEncoding = typedArrayEncoding),
             style = style,
             removeComputationMessages = true,
             logComputationMessages = true
@@ -213,7 +213,9 @@ object PlotHtmlHelper {
             PlotConfigUtil.removeComputationMessages(plotSpec)
         }
 
-        val plotSpecJs = JsObjectSupportCommon.mapToJsObjectInitializer(plotSpec)
+        val plotSpecJs = JsObjectSupportCommon.mapToJsObjectInitializer(
+            displayHtmlPolicy.typedArrayEncoding?.let { TypedArrayDataEncoding.encode(plotSpec, it) } ?: plotSpec
+        )
         return getDisplayHtmlForProcessedSpecs(
             plotSpecJs,
             sizingPolicy,
@@ -24,4 +24,21 @@ object PlotSvgExport {
             }
         }
     }
-}
\ No newline at end of file
+
+    /**
+     * @param plotSpec Specification of a plot processed by [MonolithicCommon.processRawSpecs].
+     * @param plotSize Desired plot size.
+     * @param sizeUnit Size unit for the plot size. The default is pixels (PX). null for auto-detect.
+     */
+    fun buildSvgImageFromProcessedSpecs(
+        plotSpec: Map<String, Any>,
+        plotSize: DoubleVector? = null,
+        sizeUnit: SizeUnit? = SizeUnit.PX,
+    ): String {
+        return MonolithicCommon.buildSvgImageFromProcessedSpecs(plotSpec, plotSize, sizeUnit) { messages ->
+            messages.forEach {
+                LOG.info { "[when SVG generating] $it" }
+            }
+        }
+    }
+}
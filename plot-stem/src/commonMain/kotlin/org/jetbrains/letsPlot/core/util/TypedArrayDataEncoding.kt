@@ -0,0 +1,105 @@
+/*
+ * Copyright (c) 2026. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.core.util
+
+import org.jetbrains.letsPlot.commons.encoding.Base64
+import org.jetbrains.letsPlot.core.spec.Option
+
+/**
+ * Compact encoding of numeric data columns in plot specs embedded in HTML.
+ *
+ * A numeric column is replaced with an object:
+ *
+ *     {"typed_array": "float64", "base64": "AAAAAAAA8D8AAAAAAAAAQA=="}
+ *
+ * where "base64" is the Base64 string of little-endian Float64 (or Float32) values,
+ * NaN stands for a missing value.
+ *
+ * The columns are restored by lets-plot.js before the plot is built (see `buildPlotFromProcessedSpecs()`).
+ */
+object TypedArrayDataEncoding {
+    const val TYPED_ARRAY = "typed_array"
+    const val BASE64 = "base64"
+
+    const val FLOAT64 = "float64"
+    const val FLOAT32 = "float32"  // Reduced precision: ~7 significant digits.
+
+    // Shorter columns take about the same space in the decimal form.
+    private const val MIN_SIZE = 16
+
+    fun encode(plotSpec: Map<String, Any>, type: String): MutableMap<String, Any> {
+        require(type == FLOAT64 || type == FLOAT32) {
+            "Unsupported typed array type: '$type'. Use: '$FLOAT64' or '$FLOAT32'."
+        }
+        return transformData(plotSpec) { column -> encodeColumn(column, type) }
+    }
+
+    fun decode(plotSpec: Map<String, Any>): MutableMap<String, Any> {
+        return transformData(plotSpec, ::decodeColumn)
+    }
+
+    private fun transformData(spec: Map<String, Any>, transformColumn: (Any) -> Any): MutableMap<String, Any> {
+        val result = HashMap(spec)
+
+        (spec[Option.PlotBase.DATA] as? Map<*, *>)?.let { data ->
+            result[Option.PlotBase.DATA] = data.mapValues { (_, column) -> column?.let(transformColumn) }
+        }
+
+        for (option in listOf(Option.Plot.LAYERS, Option.SubPlots.FIGURES)) {
+            val elements = spec[option] as? List<*> ?: continue
+            result[option] = elements.map { element ->
+                if (element is Map<*, *>) {
+                    @Suppress("UNCHECKED_CAST")
+                    transformData(element as Map<String, Any>, transformColumn)
+                } else {
+                    element
+                }
+            }
+        }
+        return result
+    }
+
+    private fun encodeColumn(column: Any, type: String): Any {
+        if (column !is List<*> || column.size < MIN_SIZE) return column
+        if (column.any { it != null && (it !is Number) }) return column
+
+        val bytesPerValue = if (type == FLOAT64) 8 else 4
+        val bytes = ByteArray(column.size * bytesPerValue)
+        column.forEachIndexed { i, v ->
+            val d = (v as Number?)?.toDouble() ?: Double.NaN
+            val bits = if (type == FLOAT64) d.toRawBits() else d.toFloat().toRawBits().toLong()
+            for (k in 0 until bytesPerValue) {
+                bytes[i * bytesPerValue + k] = (bits ushr (8 * k)).toByte()
+            }
+        }
+
+        return mapOf(
+            TYPED_ARRAY to type,
+            BASE64 to Base64.encode(bytes)
+        )
+    }
+
+    private fun decodeColumn(column: Any): Any {
+        if (column !is Map<*, *> || !column.containsKey(TYPED_ARRAY)) return column
+
+        val type = column[TYPED_ARRAY]
+        val bytesPerValue = when (type) {
+            FLOAT64 -> 8
+            FLOAT32 -> 4
+            else -> throw IllegalArgumentException("Unsupported typed array type: '$type'.")
+        }
+        val bytes = Base64.decode(column[BASE64] as String)
+
+        return List(bytes.size / bytesPerValue) { i ->
+            var bits = 0L
+            for (k in 0 until bytesPerValue) {
+                bits = bits or ((bytes[i * bytesPerValue + k].toLong() and 0xff) shl (8 * k))
+            }
+            val d = if (type == FLOAT64) Double.fromBits(bits) else Float.fromBits(bits.toInt()).toDouble()
+            if (d.isNaN()) null else d
+        }
+    }
+}
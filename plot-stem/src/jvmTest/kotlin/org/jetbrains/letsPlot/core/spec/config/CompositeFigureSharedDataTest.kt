@@ -0,0 +1,87 @@
+/*
+ * Copyright (c) 2026. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.core.spec.config
+
+import org.jetbrains.letsPlot.core.spec.Option
+import kotlin.test.Test
+import kotlin.test.assertEquals
+import kotlin.test.assertFailsWith
+import kotlin.test.assertFalse
+import kotlin.test.assertSame
+
+class CompositeFigureSharedDataTest {
+
+    @Test
+    fun `data references are resolved in figures and layers`() {
+        val data = mapOf("x" to listOf(1.0, 2.0))
+        val spec = subplots(
+            listOf(
+                plot(mapOf("data_ref" to "0"), layer(mapOf("data_ref" to "0"))),
+                subplots(listOf(plot(emptyMap(), layer(mapOf("data_ref" to "0"))))),
+                "blank"
+            ),
+            sharedData = mapOf("0" to data)
+        )
+
+        val resolved = CompositeFigureConfig.resolveSharedData(spec)
+
+        assertFalse(resolved.containsKey(Option.SubPlots.SHARED_DATA))
+
+        val figures = resolved.getValue(Option.SubPlots.FIGURES) as List<*>
+        val plot = figures[0] as Map<*, *>
+        assertSame(data, plot[Option.PlotBase.DATA])
+        assertFalse(plot.containsKey(Option.SubPlots.DATA_REF))
+        assertSame(data, layers(plot)[0][Option.PlotBase.DATA])
+
+        val innerFigures = (figures[1] as Map<*, *>)[Option.SubPlots.FIGURES] as List<*>
+        assertSame(data, layers(innerFigures[0] as Map<*, *>)[0][Option.PlotBase.DATA])
+
+        assertEquals("blank", figures[2])
+    }
+
+    @Test
+    fun `spec without shared data is not changed`() {
+        val spec = subplots(listOf(plot(emptyMap(), layer(emptyMap()))))
+        assertSame(spec, CompositeFigureConfig.resolveSharedData(spec))
+    }
+
+    @Test
+    fun `unknown data reference`() {
+        val spec = subplots(
+            listOf(plot(mapOf("data_ref" to "1"))),
+            sharedData = mapOf("0" to mapOf("x" to listOf(1.0)))
+        )
+
+        assertFailsWith<IllegalArgumentException> {
+            CompositeFigureConfig.resolveSharedData(spec)
+        }
+    }
+
+    private companion object {
+        fun subplots(figures: List<Any>, sharedData: Map<String, Any>? = null): Map<String, Any> {
+            return mapOf(
+                Option.Meta.KIND to Option.Meta.Kind.SUBPLOTS,
+                Option.SubPlots.FIGURES to figures
+            ) + (sharedData?.let { mapOf(Option.SubPlots.SHARED_DATA to it) } ?: emptyMap())
+        }
+
+        fun plot(options: Map<String, Any>, vararg layers: Map<String, Any>): Map<String, Any> {
+            return options + mapOf(
+                Option.Meta.KIND to Option.Meta.Kind.PLOT,
+                Option.Plot.LAYERS to layers.toList()
+            )
+        }
+
+        fun layer(options: Map<String, Any>): Map<String, Any> {
+            return options + (Option.Layer.GEOM to Option.GeomName.POINT)
+        }
+
+        fun layers(plot: Map<*, *>): List<Map<*, *>> {
+            @Suppress("UNCHECKED_CAST")
+            return plot[Option.Plot.LAYERS] as List<Map<*, *>>
+        }
+    }
+}
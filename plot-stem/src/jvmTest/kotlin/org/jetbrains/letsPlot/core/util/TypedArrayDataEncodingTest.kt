@@ -0,0 +1,82 @@
+/*
+ * Copyright (c) 2026. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.core.util
+
+import org.assertj.core.api.Assertions.assertThat
+import org.assertj.core.data.Offset
+import org.jetbrains.letsPlot.core.util.TypedArrayDataEncoding.BASE64
+import org.jetbrains.letsPlot.core.util.TypedArrayDataEncoding.FLOAT32
+import org.jetbrains.letsPlot.core.util.TypedArrayDataEncoding.FLOAT64
+import org.jetbrains.letsPlot.core.util.TypedArrayDataEncoding.TYPED_ARRAY
+import org.junit.Test
+
+class TypedArrayDataEncodingTest {
+
+    private val xs: List<Double?> = List(20) { if (it == 3) null else it * 0.1 - 1.0 }
+    private val labels = List(20) { "label $it" }
+
+    @Test
+    fun `numeric columns in plot and layers are encoded`() {
+        val spec = plotSpec()
+
+        val encoded = TypedArrayDataEncoding.encode(spec, FLOAT64)
+
+        val data = encoded["data"] as Map<*, *>
+        assertThat(data["x"]).isEqualTo(mapOf(TYPED_ARRAY to FLOAT64, BASE64 to (data["x"] as Map<*, *>)[BASE64]))
+        assertThat(data["label"]).isEqualTo(labels)
+        assertThat(data["short"]).isEqualTo(listOf(1.0, 2.0))
+
+        val layerData = ((encoded["layers"] as List<*>)[0] as Map<*, *>)["data"] as Map<*, *>
+        assertThat((layerData["y"] as Map<*, *>)[TYPED_ARRAY]).isEqualTo(FLOAT64)
+    }
+
+    @Test
+    fun `float64 round trip`() {
+        val spec = plotSpec()
+
+        val decoded = TypedArrayDataEncoding.decode(TypedArrayDataEncoding.encode(spec, FLOAT64))
+
+        assertThat(decoded).isEqualTo(spec)
+    }
+
+    @Test
+    fun `float32 round trip`() {
+        val spec = mapOf("kind" to "plot", "data" to mapOf("x" to xs))
+
+        val decoded = TypedArrayDataEncoding.decode(TypedArrayDataEncoding.encode(spec, FLOAT32))
+
+        val x = (decoded["data"] as Map<*, *>)["x"] as List<*>
+        assertThat(x).hasSize(xs.size)
+        assertThat(x[3]).isNull()
+        xs.zip(x).filter { it.first != null }.forEach { (expected, actual) ->
+            assertThat(actual as Double).isCloseTo(expected!!, Offset.offset(1e-6))
+        }
+    }
+
+    @Test
+    fun `subplots figures are encoded`() {
+        val spec = mapOf("kind" to "subplots", "figures" to listOf(plotSpec(), null))
+
+        val encoded = TypedArrayDataEncoding.encode(spec, FLOAT64)
+        val figureData = ((encoded["figures"] as List<*>)[0] as Map<*, *>)["data"] as Map<*, *>
+
+        assertThat((figureData["x"] as Map<*, *>)[TYPED_ARRAY]).isEqualTo(FLOAT64)
+        assertThat(TypedArrayDataEncoding.decode(encoded)).isEqualTo(spec)
+    }
+
+    private fun plotSpec(): Map<String, Any> {
+        return mapOf(
+            "kind" to "plot",
+            "data" to mapOf("x" to xs, "label" to labels, "short" to listOf(1.0, 2.0)),
+            "layers" to listOf(
+                mapOf(
+                    "geom" to "point",
+                    "data" to mapOf("y" to xs.reversed())
+                )
+            )
+        )
+    }
+}
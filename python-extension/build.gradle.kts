@@ -4,6 +4,7 @@
  */
 
 import org.gradle.internal.os.OperatingSystem
+import org.jetbrains.kotlin.gradle.plugin.mpp.NativeBuildType
 
 plugins {
     kotlin("multiplatform")
@@ -62,6 +63,21 @@ kotlin {
             }
         }
 
+        // Tests calling the Python C API (see PyListConversionBenchmark) run an embedded interpreter.
+        if (!os.isWindows) {
+            val pythonBinPath = rootProject.project.extra["python.bin_path"]
+            val pythonLibOptions = providers.exec {
+                commandLine(
+                    "${pythonBinPath}/python",
+                    "-c",
+                    "import sysconfig as s; d = s.get_config_var('LIBDIR'); " +
+                            "print(f\"-L{d} -rpath {d} -lpython{s.get_config_var('LDVERSION')}\")"
+                )
+            }.standardOutput.asText.get().trim().split(" ")
+
+            target.binaries.getTest(NativeBuildType.DEBUG).linkerOpts += pythonLibOptions
+        }
+
         target.compilations.getByName("main") {
             val python by cinterops.creating {
                 compilerOpts("-I${rootProject.project.extra["python.include_path"]}")
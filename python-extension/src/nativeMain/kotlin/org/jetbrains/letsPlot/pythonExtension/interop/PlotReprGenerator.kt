@@ -3,14 +3,19 @@
  * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
  */
 
-@file:OptIn(kotlinx.cinterop.ExperimentalForeignApi::class)
+@file:OptIn(kotlinx.cinterop.ExperimentalForeignApi::class, kotlin.native.concurrent.ObsoleteWorkersApi::class)
 
 package org.jetbrains.letsPlot.pythonExtension.interop
 
 import ImageMagick.DrawGetVectorGraphics
 import Python.PyErr_SetString
+import Python.PyEval_RestoreThread
+import Python.PyEval_SaveThread
 import Python.PyExc_ValueError
+import Python.PyList_New
+import Python.PyList_SetItem
 import Python.PyObject
+import Python.Py_DecRef
 import Python.Py_BuildValue
 import kotlinx.cinterop.ByteVar
 import kotlinx.cinterop.CPointer
@@ -26,15 +31,35 @@ import org.jetbrains.letsPlot.core.util.PlotExportCommon.computeExportParameters
 import org.jetbrains.letsPlot.core.util.sizing.SizingPolicy
 import org.jetbrains.letsPlot.imagick.canvas.MagickCanvasPeer
 import org.jetbrains.letsPlot.imagick.canvas.MagickFontManager
+import org.jetbrains.letsPlot.imagick.canvas.MagickPdfFontProvider
+import org.jetbrains.letsPlot.imagick.canvas.PdfContext2d
+import org.jetbrains.letsPlot.imagick.canvas.PdfDocument
+import org.jetbrains.letsPlot.imagick.canvas.PdfFontProvider
+import org.jetbrains.letsPlot.pythonExtension.interop.TypeUtils.byteArrayToPyBytes
 import org.jetbrains.letsPlot.pythonExtension.interop.TypeUtils.pyDictToMap
+import org.jetbrains.letsPlot.pythonExtension.interop.TypeUtils.pyListToList
 import org.jetbrains.letsPlot.raster.view.PlotCanvasDrawable
 import org.jetbrains.letsPlot.raster.view.RenderingHints.KEY_OFFSCREEN_BUFFERING
 import org.jetbrains.letsPlot.raster.view.RenderingHints.VALUE_OFFSCREEN_BUFFERING_OFF
+import kotlin.native.concurrent.TransferMode
+import kotlin.native.concurrent.Worker
 import kotlin.time.TimeSource
 
 object PlotReprGenerator {
     private val defaultFontManager by lazy { MagickFontManager.default() }
 
+    // Runs the block with the GIL released, so that other Python threads
+    // (e.g. a thread pool exporting several plots) can proceed while the plot is being built and rendered.
+    // The block must not touch any Python objects: convert the arguments before and build the result after.
+    private inline fun <T> withoutGil(block: () -> T): T {
+        val threadState = PyEval_SaveThread()
+        try {
+            return block()
+        } finally {
+            PyEval_RestoreThread(threadState)
+        }
+    }
+
     // Deprecated: replaced by generateDisplayHtmlForRawSpec() with default parameters
     // Used to be called from kotlin_bridge.c generate_html() function
 //    @Suppress("unused") // This function is used in kotlin_bridge.c
@@ -72,11 +97,13 @@ object PlotReprGenerator {
             val plotSpecMap = pyDictToMap(plotSpecDict)
 
             @Suppress("UNCHECKED_CAST")
-            val svg = PlotSvgExport.buildSvgImageFromRawSpecs(
-                plotSpec = plotSpecMap as MutableMap<String, Any>,
-                plotSize = plotSize,
-                sizeUnit = sizeUnit
-            )
+            val svg = withoutGil {
+                PlotSvgExport.buildSvgImageFromRawSpecs(
+                    plotSpec = plotSpecMap as MutableMap<String, Any>,
+                    plotSize = plotSize,
+                    sizeUnit = sizeUnit
+                )
+            }
             Py_BuildValue("s", svg)
         } catch (e: Throwable) {
             val svgStr = """
@@ -94,18 +121,23 @@ object PlotReprGenerator {
     fun generateExportHtml(
         plotSpecDict: CPointer<PyObject>?,
         scriptUrlCStr: CPointer<ByteVar>,
-        iFrame: Int
+        iFrame: Int,
+        typedArrayEncodingCStr: CPointer<ByteVar>
     ): CPointer<PyObject>? {
         return try {
             val plotSpecMap = pyDictToMap(plotSpecDict)
             val scriptUrl = scriptUrlCStr.toKString()
+            val typedArrayEncoding = typedArrayEncodingCStr.toKString().ifEmpty { null }
 
             @Suppress("UNCHECKED_CAST")
-            val html = PlotHtmlExport.buildHtmlFromRawSpecs(
-                plotSpec = plotSpecMap as MutableMap<String, Any>,
-                scriptUrl = scriptUrl,
-                iFrame = iFrame == 1
-            )
+            val html = withoutGil {
+                PlotHtmlExport.buildHtmlFromRawSpecs(
+                    plotSpec = plotSpecMap as MutableMap<String, Any>,
+                    scriptUrl = scriptUrl,
+                    iFrame = iFrame == 1,
+                    typedArrayEncoding = typedArrayEncoding
+                )
+            }
             Py_BuildValue("s", html)
         } catch (e: Throwable) {
             Py_BuildValue("s", "generateExportHtml() - Exception: ${e.message}")
@@ -146,13 +178,15 @@ object PlotReprGenerator {
             )
 
             @Suppress("UNCHECKED_CAST")
-            val html = PlotHtmlHelper.getDisplayHtmlForRawSpec(
-                plotSpec = plotSpecMap as MutableMap<String, Any>,
-                sizingPolicy = sizingPolicy,
-                displayHtmlPolicy = displayHtmlPolicy,
-                removeComputationMessages = false,
-                logComputationMessages = false
-            )
+            val html = withoutGil {
+                PlotHtmlHelper.getDisplayHtmlForRawSpec(
+                    plotSpec = plotSpecMap as MutableMap<String, Any>,
+                    sizingPolicy = sizingPolicy,
+                    displayHtmlPolicy = displayHtmlPolicy,
+                    removeComputationMessages = false,
+                    logComputationMessages = false
+                )
+            }
             Py_BuildValue("s", html)
         } catch (e: Throwable) {
             Py_BuildValue("s", "generateDisplayHtmlForRawSpec() - Exception: ${e.message}")
@@ -182,14 +216,16 @@ object PlotReprGenerator {
             )
 
             @Suppress("UNCHECKED_CAST")
-            val html = PlotHtmlHelper.getStaticHtmlPageForRawSpec(
-                plotSpec = plotSpecMap as MutableMap<String, Any>,
-                scriptUrl = scriptUrl,
-                sizingPolicy = sizingPolicy,
-                displayHtmlPolicy = displayHtmlPolicy,
-                removeComputationMessages = false,
-                logComputationMessages = false
-            )
+            val html = withoutGil {
+                PlotHtmlHelper.getStaticHtmlPageForRawSpec(
+                    plotSpec = plotSpecMap as MutableMap<String, Any>,
+                    scriptUrl = scriptUrl,
+                    sizingPolicy = sizingPolicy,
+                    displayHtmlPolicy = displayHtmlPolicy,
+                    removeComputationMessages = false,
+                    logComputationMessages = false
+                )
+            }
             Py_BuildValue("s", html)
         } catch (e: Throwable) {
             Py_BuildValue("s", "generateStaticHtmlPageForRawSpec() - Exception: ${e.message}")
@@ -207,16 +243,28 @@ object PlotReprGenerator {
         antialiasing: Boolean = true
     ): Pair<Bitmap, Double> {
         val exportParameters = computeExportParameters(plotSize, dpi, sizeUnit, scale)
+        val bitmap = paintBitmap(processRawSpecs(plotSpec), exportParameters, fontManager, antialiasing)
+        return bitmap to exportParameters.dpi
+    }
 
+    private fun processRawSpecs(plotSpec: Map<*, *>): Map<String, Any> {
         @Suppress("UNCHECKED_CAST")
         val rawPlotSpec = plotSpec as MutableMap<String, Any>
+        return MonolithicCommon.processRawSpecs(rawPlotSpec, frontendOnly = false)
+    }
 
+    private fun paintBitmap(
+        processedSpec: Map<String, Any>,
+        exportParameters: PlotExportCommon.ExportParameters,
+        fontManager: MagickFontManager,
+        antialiasing: Boolean = true
+    ): Bitmap {
         val plotCanvasDrawable = PlotCanvasDrawable()
 
         plotCanvasDrawable.setRenderingHint(KEY_OFFSCREEN_BUFFERING, VALUE_OFFSCREEN_BUFFERING_OFF)
 
         plotCanvasDrawable.update(
-            processedSpec = MonolithicCommon.processRawSpecs(rawPlotSpec, frontendOnly = false),
+            processedSpec = processedSpec,
             sizingPolicy = exportParameters.sizingPolicy,
             computationMessagesHandler = { }
         )
@@ -246,7 +294,7 @@ object PlotReprGenerator {
             ctx.dispose()
             snapshot.dispose()
 
-            return bitmap to exportParameters.dpi
+            return bitmap
         } finally {
             canvasReg?.dispose()
         }
@@ -262,24 +310,323 @@ object PlotReprGenerator {
         scale: Float
     ): CPointer<PyObject>? {
         try {
+            val png = encodePng(plotSpecDict, width, height, unit, dpi, scale)
+            return Py_BuildValue("s", Base64.encode(png))
+        } catch (e: Throwable) {
+            //e.printStackTrace()
 
+            // Set a Python exception with the caught error message
+            PyErr_SetString(PyExc_ValueError, "${e.message}")
+            // Return null to signal that an exception was raised
+            return null
+        }
+    }
+
+    // Same as exportPng() but returns Python `bytes` without the Base64 round trip.
+    @Suppress("unused") // This function is used in kotlin_bridge.c
+    fun exportPngBytes(
+        plotSpecDict: CPointer<PyObject>?,
+        width: Float,
+        height: Float,
+        unit: CPointer<ByteVar>,
+        dpi: Int,
+        scale: Float
+    ): CPointer<PyObject>? {
+        try {
+            val png = encodePng(plotSpecDict, width, height, unit, dpi, scale)
+            return byteArrayToPyBytes(png)
+        } catch (e: Throwable) {
+            //e.printStackTrace()
+
+            // Set a Python exception with the caught error message
+            PyErr_SetString(PyExc_ValueError, "${e.message}")
+            // Return null to signal that an exception was raised
+            return null
+        }
+    }
+
+    private fun encodePng(
+        plotSpecDict: CPointer<PyObject>?,
+        width: Float,
+        height: Float,
+        unit: CPointer<ByteVar>,
+        dpi: Int,
+        scale: Float
+    ): ByteArray {
+        val plotSpec = pyDictToMap(plotSpecDict)
+        val sizeUnit = SizeUnit.fromName(unit.toKString())
+
+        return withoutGil {
             val (bitmap, bitmapDpi) = exportBitmap(
-                plotSpec = pyDictToMap(plotSpecDict),
+                plotSpec = plotSpec,
                 plotSize = if (width >= 0 && height >= 0) DoubleVector(width, height) else null,
-                sizeUnit = SizeUnit.fromName(unit.toKString()),
+                sizeUnit = sizeUnit,
                 dpi = if (dpi >= 0) dpi.toDouble() else null,
                 scale = if (scale >= 0) scale.toDouble() else null,
                 fontManager = defaultFontManager
             )
-            // We can't use PyBytes_FromStringAndSize(ptr, bytes.size.toLong()):
-            // Type mismatch: inferred type is CPointer<ByteVarOf<Byte>>? but String? was expected
-            // This happens because PyBytes_FromStringAndSize has the following signature:
-            // PyObject *PyBytes_FromStringAndSize(const char *v, Py_ssize_t len);
-            // Here `const char*` refers to a pointer to a byte buffer. Kotlin cinterop fails to infer that
-            // and generate a function with a String parameter instead of ByteArray
-
-            val png: ByteArray = Png.encode(bitmap, bitmapDpi)
-            return Py_BuildValue("s", Base64.encode(png))
+            Png.encode(bitmap, bitmapDpi)
+        }
+    }
+
+    // Adds the plot as a vector page to the document.
+    // The page size is the logical plot size (1px = 1/96 in) multiplied by `scale` (1.0 by default), `dpi` is ignored.
+    fun exportPdfPage(
+        document: PdfDocument,
+        plotSpec: Map<*, *>,
+        fontManager: MagickFontManager,
+        fontProvider: PdfFontProvider,
+        plotSize: DoubleVector? = null,
+        sizeUnit: SizeUnit? = null,
+        dpi: Number? = null,
+        scale: Number? = null,
+        pageRef: Int = document.reservePage(),
+    ) {
+        val exportParameters = computeExportParameters(plotSize, dpi, sizeUnit, scale)
+        paintPdfPage(document, processRawSpecs(plotSpec), fontManager, fontProvider, exportParameters, scale, pageRef)
+    }
+
+    private fun paintPdfPage(
+        document: PdfDocument,
+        processedSpec: Map<String, Any>,
+        fontManager: MagickFontManager,
+        fontProvider: PdfFontProvider,
+        exportParameters: PlotExportCommon.ExportParameters,
+        scale: Number?,
+        pageRef: Int = document.reservePage(),
+    ) {
+        val plotCanvasDrawable = PlotCanvasDrawable()
+
+        plotCanvasDrawable.setRenderingHint(KEY_OFFSCREEN_BUFFERING, VALUE_OFFSCREEN_BUFFERING_OFF)
+
+        plotCanvasDrawable.update(
+            processedSpec = processedSpec,
+            sizingPolicy = exportParameters.sizingPolicy,
+            computationMessagesHandler = { }
+        )
+
+        // The canvas peer is only used to measure text and decode images.
+        val magickCanvasPeer = MagickCanvasPeer(
+            pixelDensity = 1.0,
+            fontManager = fontManager
+        )
+
+        val canvasReg: Registration = plotCanvasDrawable.mapToCanvas(magickCanvasPeer)
+        try {
+            val size = plotCanvasDrawable.size
+            val ctx = PdfContext2d(
+                document = document,
+                width = size.x.toDouble(),
+                height = size.y.toDouble(),
+                fontProvider = fontProvider,
+                scale = scale?.toDouble()?.takeIf { it.isFinite() && it > 0.0 } ?: 1.0,
+                pageRef = pageRef
+            )
+            plotCanvasDrawable.paint(ctx)
+            ctx.finishPage()
+        } finally {
+            canvasReg.dispose()
+        }
+    }
+
+    // Builds a multi-page document: one page per plot, in the order of the plots.
+    // The pages are built and painted by up to `parallelism` threads, the fonts and images are shared by the pages.
+    fun exportPdfPages(
+        plotSpecs: List<Map<*, *>>,
+        fontManager: MagickFontManager,
+        plotSize: DoubleVector? = null,
+        sizeUnit: SizeUnit? = null,
+        dpi: Number? = null,
+        scale: Number? = null,
+        parallelism: Int = 1,
+    ): ByteArray {
+        val document = PdfDocument()
+        val fontProvider = MagickPdfFontProvider(fontManager)
+        try {
+            val tasks = plotSpecs.map { plotSpec ->
+                val pageRef = document.reservePage()
+                val task = {
+                    exportPdfPage(document, plotSpec, fontManager, fontProvider, plotSize, sizeUnit, dpi, scale, pageRef)
+                }
+                task
+            }
+            runConcurrently(tasks, parallelism)
+        } finally {
+            fontProvider.dispose()
+        }
+        return document.toByteArray()
+    }
+
+    // Runs the tasks on `parallelism` workers: the worker `i` runs the tasks `i`, `i + parallelism`, etc.
+    // Rethrows the first failure after all workers are done.
+    private fun runConcurrently(tasks: List<() -> Unit>, parallelism: Int) {
+        val workerCount = parallelism.coerceIn(1, maxOf(tasks.size, 1))
+        if (workerCount == 1) {
+            tasks.forEach { it() }
+            return
+        }
+
+        val workers = List(workerCount) { Worker.start(name = "lets-plot-pdf-$it") }
+        try {
+            val futures = workers.mapIndexed { i, worker ->
+                val slice = tasks.slice(i until tasks.size step workerCount)
+                val job = { slice.forEach { it() } }
+                worker.execute(TransferMode.SAFE, { job }) { job -> runCatching(job).exceptionOrNull() }
+            }
+            futures.map { it.result }.firstOrNull { it != null }?.let { throw it }
+        } finally {
+            workers.forEach { it.requestTermination().result }
+        }
+    }
+
+    // Returns the PDF file content as Python `bytes`.
+    @Suppress("unused") // This function is used in kotlin_bridge.c
+    fun exportPdfBytes(
+        plotSpecDict: CPointer<PyObject>?,
+        width: Float,
+        height: Float,
+        unit: CPointer<ByteVar>,
+        dpi: Int,
+        scale: Float
+    ): CPointer<PyObject>? {
+        try {
+            val plotSpec = pyDictToMap(plotSpecDict)
+            val sizeUnit = SizeUnit.fromName(unit.toKString())
+
+            val pdf = withoutGil {
+                exportPdfPages(
+                    plotSpecs = listOf(plotSpec),
+                    fontManager = defaultFontManager,
+                    plotSize = if (width >= 0 && height >= 0) DoubleVector(width, height) else null,
+                    sizeUnit = sizeUnit,
+                    dpi = if (dpi >= 0) dpi.toDouble() else null,
+                    scale = if (scale >= 0) scale.toDouble() else null
+                )
+            }
+            return byteArrayToPyBytes(pdf)
+        } catch (e: Throwable) {
+            //e.printStackTrace()
+
+            // Set a Python exception with the caught error message
+            PyErr_SetString(PyExc_ValueError, "${e.message}")
+            // Return null to signal that an exception was raised
+            return null
+        }
+    }
+
+    // Same as exportPdfBytes() but for a list of plots: returns a multi-page PDF document.
+    @Suppress("unused") // This function is used in kotlin_bridge.c
+    fun exportPdfPagesBytes(
+        plotSpecList: CPointer<PyObject>?,
+        width: Float,
+        height: Float,
+        unit: CPointer<ByteVar>,
+        dpi: Int,
+        scale: Float,
+        parallelism: Int
+    ): CPointer<PyObject>? {
+        try {
+            val plotSpecs = plotSpecList?.let(::pyListToList).orEmpty().map { it as Map<*, *> }
+            require(plotSpecs.isNotEmpty()) { "No plots to export." }
+            val sizeUnit = SizeUnit.fromName(unit.toKString())
+
+            val pdf = withoutGil {
+                exportPdfPages(
+                    plotSpecs = plotSpecs,
+                    fontManager = defaultFontManager,
+                    plotSize = if (width >= 0 && height >= 0) DoubleVector(width, height) else null,
+                    sizeUnit = sizeUnit,
+                    dpi = if (dpi >= 0) dpi.toDouble() else null,
+                    scale = if (scale >= 0) scale.toDouble() else null,
+                    parallelism = parallelism
+                )
+            }
+            return byteArrayToPyBytes(pdf)
+        } catch (e: Throwable) {
+            //e.printStackTrace()
+
+            // Set a Python exception with the caught error message
+            PyErr_SetString(PyExc_ValueError, "${e.message}")
+            // Return null to signal that an exception was raised
+            return null
+        }
+    }
+
+    // Exports the plot to several formats: "svg" (String), "png" and "pdf" (ByteArray).
+    // The plot spec is processed (data transforms, statistics) once for all formats.
+    fun exportFormats(
+        plotSpec: Map<*, *>,
+        formats: List<String>,
+        fontManager: MagickFontManager,
+        plotSize: DoubleVector? = null,
+        sizeUnit: SizeUnit? = null,
+        dpi: Number? = null,
+        scale: Number? = null,
+    ): List<Any> {
+        val processedSpec = processRawSpecs(plotSpec)
+        val exportParameters by lazy { computeExportParameters(plotSize, dpi, sizeUnit, scale) }
+
+        return formats.map { format ->
+            when (format.lowercase()) {
+                "svg" -> PlotSvgExport.buildSvgImageFromProcessedSpecs(processedSpec, plotSize, sizeUnit)
+                "png" -> Png.encode(paintBitmap(processedSpec, exportParameters, fontManager), exportParameters.dpi)
+                "pdf" -> {
+                    val document = PdfDocument()
+                    val fontProvider = MagickPdfFontProvider(fontManager)
+                    try {
+                        paintPdfPage(document, processedSpec, fontManager, fontProvider, exportParameters, scale)
+                    } finally {
+                        fontProvider.dispose()
+                    }
+                    document.toByteArray()
+                }
+
+                else -> throw IllegalArgumentException("Unsupported export format: '$format'. Please use one of: svg, png, pdf")
+            }
+        }
+    }
+
+    // Returns a Python list of the plot images in the requested formats: `str` for SVG, `bytes` for PNG and PDF.
+    @Suppress("unused") // This function is used in kotlin_bridge.c
+    fun exportFormatsBytes(
+        plotSpecDict: CPointer<PyObject>?,
+        formatList: CPointer<PyObject>?,
+        width: Float,
+        height: Float,
+        unit: CPointer<ByteVar>,
+        dpi: Int,
+        scale: Float
+    ): CPointer<PyObject>? {
+        try {
+            val plotSpec = pyDictToMap(plotSpecDict)
+            val formats = formatList?.let(::pyListToList).orEmpty().map { it as String }
+            val sizeUnit = SizeUnit.fromName(unit.toKString())
+
+            val images = withoutGil {
+                exportFormats(
+                    plotSpec = plotSpec,
+                    formats = formats,
+                    fontManager = defaultFontManager,
+                    plotSize = if (width >= 0 && height >= 0) DoubleVector(width, height) else null,
+                    sizeUnit = sizeUnit,
+                    dpi = if (dpi >= 0) dpi.toDouble() else null,
+                    scale = if (scale >= 0) scale.toDouble() else null
+                )
+            }
+
+            val pyList = PyList_New(images.size.toLong()) ?: return null
+            images.forEachIndexed { i, image ->
+                val item = when (image) {
+                    is String -> Py_BuildValue("s", image)
+                    else -> byteArrayToPyBytes(image as ByteArray)
+                }
+                if (item == null) {
+                    Py_DecRef(pyList)
+                    return null
+                }
+                PyList_SetItem(pyList, i.toLong(), item) // steals the reference
+            }
+            return pyList
         } catch (e: Throwable) {
             //e.printStackTrace()
 
@@ -300,14 +647,18 @@ object PlotReprGenerator {
         scale: Float
     ): CPointer<PyObject>? {
         try {
+            val plotSpec = pyDictToMap(plotSpecDict)
+            val sizeUnit = SizeUnit.fromName(unit.toKString())
 
-            val mvg = generateMvg(
-                plotSpec = pyDictToMap(plotSpecDict),
-                plotSize = if (width >= 0 && height >= 0) DoubleVector(width, height) else null,
-                sizeUnit = SizeUnit.fromName(unit.toKString()),
-                dpi = if (dpi >= 0) dpi.toDouble() else null,
-                scale = if (scale >= 0) scale.toDouble() else null
-            )
+            val mvg = withoutGil {
+                generateMvg(
+                    plotSpec = plotSpec,
+                    plotSize = if (width >= 0 && height >= 0) DoubleVector(width, height) else null,
+                    sizeUnit = sizeUnit,
+                    dpi = if (dpi >= 0) dpi.toDouble() else null,
+                    scale = if (scale >= 0) scale.toDouble() else null
+                )
+            }
             return Py_BuildValue("s", mvg)
         } catch (e: Throwable) {
             //e.printStackTrace()
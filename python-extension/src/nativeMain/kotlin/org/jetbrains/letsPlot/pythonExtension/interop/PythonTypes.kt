@@ -30,4 +30,8 @@ internal object PythonTypes {
     const val LIST = "list"
     const val DICT = "dict"
     const val TUPLE = "tuple"
+    const val MEMORYVIEW = "memoryview"
+
+    // Classes defined in `lets_plot/_type_utils.py`
+    const val DICTIONARY_ENCODED_COLUMN = "DictionaryEncodedColumn"
 }
@@ -7,18 +7,21 @@
 package org.jetbrains.letsPlot.pythonExtension.interop
 
 import Python.*
-import kotlinx.cinterop.CPointer
-import kotlinx.cinterop.CValuesRef
-import kotlinx.cinterop.toKString
+import kotlinx.cinterop.*
 import org.jetbrains.letsPlot.pythonExtension.interop.PythonTypes.BOOL
+import org.jetbrains.letsPlot.core.commons.data.DictionaryEncodedList
+import org.jetbrains.letsPlot.core.commons.data.DoubleColumn
 import org.jetbrains.letsPlot.pythonExtension.interop.PythonTypes.DICT
+import org.jetbrains.letsPlot.pythonExtension.interop.PythonTypes.DICTIONARY_ENCODED_COLUMN
 import org.jetbrains.letsPlot.pythonExtension.interop.PythonTypes.FLOAT
 import org.jetbrains.letsPlot.pythonExtension.interop.PythonTypes.INT
 import org.jetbrains.letsPlot.pythonExtension.interop.PythonTypes.LIST
+import org.jetbrains.letsPlot.pythonExtension.interop.PythonTypes.MEMORYVIEW
 import org.jetbrains.letsPlot.pythonExtension.interop.PythonTypes.NONE
 import org.jetbrains.letsPlot.pythonExtension.interop.PythonTypes.STR
 import org.jetbrains.letsPlot.pythonExtension.interop.PythonTypes.TUPLE
 import org.jetbrains.letsPlot.pythonExtension.interop.PythonTypes.getPyObjectType
+import platform.posix.memcpy
 
 typealias TPyObjPtr = CPointer<PyObject>
 
@@ -27,8 +30,17 @@ typealias TPyObjPtr = CPointer<PyObject>
  * will cause SEGFAULT and an interpreter crash (with Jupyter kernel) with no chance to prevent it.
  */
 internal object TypeUtils {
+    // Shorter lists are not worth the extra scan.
+    private const val FLOAT_LIST_MIN_SIZE = 32L
+
+    // The spec properties holding the data frames (dicts of columns): see `_DATA_PROPS` in `plot/core.py`.
+    private val DATA_PROPS = setOf("data", "map")
 
     fun pyDictToMap(dict: TPyObjPtr?): MutableMap<Any?, Any?> {
+        return pyDictToMap(dict, dataColumns = false)
+    }
+
+    private fun pyDictToMap(dict: TPyObjPtr?, dataColumns: Boolean): MutableMap<Any?, Any?> {
         if (dict == null) {
             return mutableMapOf()
         }
@@ -36,10 +48,29 @@ internal object TypeUtils {
         require(getPyObjectType(dict) == DICT) { "pyDictToMap() - unexpceted type: ${getPyObjectType(dict)}" }
 
         return asSequence(PyDict_Keys(dict)!!, ::PyList_Size, ::PyList_GetItem)
-            .associate { key -> pyObjectToKotlin(key!!) to pyObjectToKotlin(PyDict_GetItem(dict, key)) }
+            .associate { key ->
+                val name = pyObjectToKotlin(key!!)
+                val value = PyDict_GetItem(dict, key)
+                name to when {
+                    dataColumns -> pyColumnToKotlin(value)
+                    name in DATA_PROPS && value != null && getPyObjectType(value) == DICT -> pyDictToMap(value, dataColumns = true)
+                    else -> pyObjectToKotlin(value)
+                }
+            }
             .toMutableMap()
     }
 
+    // Creates Python `bytes` and copies the data right into its buffer.
+    // Note: PyBytes_FromStringAndSize(ptr, size) can't be used directly: cinterop maps `const char*` to String.
+    fun byteArrayToPyBytes(bytes: ByteArray): TPyObjPtr? {
+        val pyBytes = PyBytes_FromStringAndSize(null, bytes.size.toLong()) ?: return null
+        if (bytes.isNotEmpty()) {
+            val dst = PyBytes_AsString(pyBytes)
+            bytes.usePinned { memcpy(dst, it.addressOf(0), bytes.size.convert()) }
+        }
+        return pyBytes
+    }
+
     private fun pyObjectToKotlin(obj: TPyObjPtr?): Any? {
         if (obj == null) return null
 
@@ -51,13 +82,130 @@ internal object TypeUtils {
             FLOAT -> PyFloat_AsDouble(obj)
             BOOL -> PyObject_IsTrue(obj) == 1
             DICT -> pyDictToMap(obj)
-            LIST -> asSequence(obj, ::PyList_Size, ::PyList_GetItem).map(TypeUtils::pyObjectToKotlin).toMutableList()
+            LIST -> pyListToList(obj)
             TUPLE -> asSequence(obj, ::PyTuple_Size, ::PyTuple_GetItem).map(TypeUtils::pyObjectToKotlin).toMutableList()
+            MEMORYVIEW -> pyBufferToList(obj)
+            DICTIONARY_ENCODED_COLUMN -> pyDictionaryEncodedColumnToList(obj)
             NONE -> null
             else -> error("pyObjectToKotlin() - unexpected type: $objType")
         }
     }
 
+    internal fun pyListToList(obj: TPyObjPtr): MutableList<Any?> {
+        return asSequence(obj, ::PyList_Size, ::PyList_GetItem).map(TypeUtils::pyObjectToKotlin).toMutableList()
+    }
+
+    // A column of the data frame: the numeric columns are read-only lists backed by DoubleArray,
+    // the other values are converted as usual.
+    private fun pyColumnToKotlin(obj: TPyObjPtr?): Any? {
+        if (obj != null && getPyObjectType(obj) == LIST) {
+            return pyFloatListToList(obj) ?: pyListToList(obj)
+        }
+        return pyObjectToKotlin(obj)
+    }
+
+    // Numeric data columns exported by `standardize_dict()` as lists of float and None.
+    // The item types are checked by a single scan comparing type pointers (no type name lookup per item),
+    // then the values are copied to a DoubleArray without boxing.
+    // Returns null if the list is short or contains other items - it's converted item by item then.
+    internal fun pyFloatListToList(obj: TPyObjPtr): List<Double?>? {
+        val size = PyList_Size(obj)
+        if (size < FLOAT_LIST_MIN_SIZE) return null
+
+        val floatType = PyFloat_Type.ptr.reinterpret<PyObject>()
+        val none = _Py_NoneStruct.ptr
+        var hasFloats = false
+        for (i in 0 until size) {
+            val item = PyList_GetItem(obj, i) ?: return null
+            if (item == none) continue
+            val itemType = PyObject_Type(item)
+            Py_DecRef(itemType)
+            if (itemType != floatType) return null
+            hasFloats = true
+        }
+        if (!hasFloats) return null
+
+        val values = DoubleArray(size.toInt()) { i ->
+            val item = PyList_GetItem(obj, i.toLong())!!
+            if (item == none) Double.NaN else PyFloat_AsDouble(item)
+        }
+        return DoubleColumn(values)
+    }
+
+    // Columns exported by `standardize_dict(columnar=True)` in `_type_utils.py`:
+    // contiguous 1-dim buffers of float64 ('d') or bool ('?') values.
+    private fun pyBufferToList(obj: TPyObjPtr): List<Any?> {
+        return readPyBuffer(obj) { format, data, byteCount, size ->
+            when {
+                size == 0 -> mutableListOf()
+                format == "d" -> {
+                    val values = DoubleArray(size)
+                    values.usePinned { memcpy(it.addressOf(0), data, byteCount.convert()) }
+                    DoubleColumn(values)
+                }
+
+                format == "?" -> {
+                    val bytes = data!!.reinterpret<ByteVar>()
+                    BooleanArray(size) { i -> bytes[i] != 0.toByte() }.asList()
+                }
+
+                else -> error("pyBufferToList() - unsupported buffer format: '$format'")
+            }
+        }
+    }
+
+    // `DictionaryEncodedColumn` in `_type_utils.py`: list of unique values (levels)
+    // and int32 buffer of codes (indices into levels, -1 for missing values).
+    private fun pyDictionaryEncodedColumnToList(obj: TPyObjPtr): List<Any?> {
+        val levels = withPyAttr(obj, "levels") { pyObjectToKotlin(it) as List<*> }.requireNoNulls()
+        val codes = withPyAttr(obj, "codes") { codesBuffer ->
+            readPyBuffer(codesBuffer) { format, data, byteCount, size ->
+                require(format == "i") { "pyDictionaryEncodedColumnToList() - unsupported codes format: '$format'" }
+                val values = IntArray(size)
+                if (size > 0) {
+                    values.usePinned { memcpy(it.addressOf(0), data, byteCount.convert()) }
+                }
+                values
+            }
+        }
+        return DictionaryEncodedList(levels, codes)
+    }
+
+    private fun <T> withPyAttr(obj: TPyObjPtr, name: String, block: (TPyObjPtr) -> T): T {
+        val attr = PyObject_GetAttrString(obj, name)
+        if (attr == null) {
+            PyErr_Clear()
+            error("withPyAttr() - attribute not found: '$name'")
+        }
+
+        try {
+            return block(attr)
+        } finally {
+            Py_DecRef(attr)
+        }
+    }
+
+    private fun <T> readPyBuffer(
+        obj: TPyObjPtr,
+        read: (format: String, data: COpaquePointer?, byteCount: Long, size: Int) -> T
+    ): T = memScoped {
+        val view = alloc<Py_buffer>()
+        // PyBUF_ND: the exporter must provide a C-contiguous buffer or fail.
+        if (PyObject_GetBuffer(obj, view.ptr, PyBUF_FORMAT or PyBUF_ND) != 0) {
+            PyErr_Clear()
+            error("readPyBuffer() - can't get a contiguous buffer")
+        }
+
+        try {
+            // Buffers are produced in the native byte order - skip the optional byte order mark.
+            val format = (view.format?.toKString() ?: "B").trimStart('@', '=', '<')
+            val size = (view.len / maxOf(view.itemsize, 1L)).toInt()
+            read(format, view.buf, view.len, size)
+        } finally {
+            PyBuffer_Release(view.ptr)
+        }
+    }
+
     private fun asSequence(
         self: TPyObjPtr,
         getCount: (TPyObjPtr) -> Long,
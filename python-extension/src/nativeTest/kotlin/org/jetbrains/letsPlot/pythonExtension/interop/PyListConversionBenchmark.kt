@@ -0,0 +1,60 @@
+/*
+ * Copyright (c) 2026. JetBrains s.r.o.
+ * Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+ */
+
+package org.jetbrains.letsPlot.pythonExtension.interop
+
+import Python.*
+import kotlinx.cinterop.ptr
+import kotlin.test.Test
+import kotlin.test.assertEquals
+import kotlin.test.assertNotNull
+import kotlin.time.measureTime
+
+/**
+ * Compares conversion of a Python list of floats (a data column exported by `standardize_dict()`)
+ * by the generic item-by-item path and by the `DoubleArray` fast path.
+ */
+class PyListConversionBenchmark {
+
+    @Test
+    fun floatListConversion() {
+        if (Py_IsInitialized() == 0) {
+            Py_Initialize()
+        }
+
+        val n = 1_000_000
+        val pyList = PyList_New(n.toLong())!!
+        for (i in 0 until n) {
+            // PyList_SetItem steals the reference.
+            val item = if (i % 100 == 0) {
+                Py_IncRef(_Py_NoneStruct.ptr)
+                _Py_NoneStruct.ptr
+            } else {
+                PyFloat_FromDouble(i * 0.5)
+            }
+            PyList_SetItem(pyList, i.toLong(), item)
+        }
+
+        try {
+            var generic: List<Any?> = emptyList()
+            var fast: List<Double?>? = null
+
+            // Warm up and check that both paths give the same result.
+            repeat(2) {
+                generic = TypeUtils.pyListToList(pyList)
+                fast = TypeUtils.pyFloatListToList(pyList)
+            }
+            assertNotNull(fast)
+            assertEquals(generic, fast)
+
+            val genericTime = measureTime { repeat(5) { TypeUtils.pyListToList(pyList) } } / 5
+            val fastTime = measureTime { repeat(5) { TypeUtils.pyFloatListToList(pyList) } } / 5
+
+            println("Conversion of a list of $n floats: generic: $genericTime, fast path: $fastTime")
+        } finally {
+            Py_DecRef(pyList)
+        }
+    }
+}
@@ -80,6 +80,80 @@ static PyObject* export_png(PyObject* self, PyObject* args) {
     return imageData; // base64 encoded PNG
 }
 
+static PyObject* export_png_bytes(PyObject* self, PyObject* args) {
+    T_(PlotReprGenerator) reprGen = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator._instance();
+
+    PyObject *rawPlotSpecDict;
+    float width;
+    float height;
+    const char* unit;
+    int dpi;
+    float scale;
+    if (!PyArg_ParseTuple(args, "Offsif", &rawPlotSpecDict, &width, &height, &unit, &dpi, &scale)) {
+        PyErr_SetString(PyExc_TypeError, "export_png_bytes: failed to parse arguments");
+        return NULL;
+    }
+
+    PyObject* imageData = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator.exportPngBytes(reprGen, rawPlotSpecDict, width, height, unit, dpi, scale);
+    return imageData; // PNG bytes
+}
+
+static PyObject* export_pdf_bytes(PyObject* self, PyObject* args) {
+    T_(PlotReprGenerator) reprGen = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator._instance();
+
+    PyObject *rawPlotSpecDict;
+    float width;
+    float height;
+    const char* unit;
+    int dpi;
+    float scale;
+    if (!PyArg_ParseTuple(args, "Offsif", &rawPlotSpecDict, &width, &height, &unit, &dpi, &scale)) {
+        PyErr_SetString(PyExc_TypeError, "export_pdf_bytes: failed to parse arguments");
+        return NULL;
+    }
+
+    PyObject* pdfData = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator.exportPdfBytes(reprGen, rawPlotSpecDict, width, height, unit, dpi, scale);
+    return pdfData; // PDF bytes
+}
+
+static PyObject* export_pdf_pages_bytes(PyObject* self, PyObject* args) {
+    T_(PlotReprGenerator) reprGen = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator._instance();
+
+    PyObject *rawPlotSpecList;
+    float width;
+    float height;
+    const char* unit;
+    int dpi;
+    float scale;
+    int parallelism;
+    if (!PyArg_ParseTuple(args, "O!ffsifi", &PyList_Type, &rawPlotSpecList, &width, &height, &unit, &dpi, &scale, &parallelism)) {
+        PyErr_SetString(PyExc_TypeError, "export_pdf_pages_bytes: failed to parse arguments");
+        return NULL;
+    }
+
+    PyObject* pdfData = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator.exportPdfPagesBytes(reprGen, rawPlotSpecList, width, height, unit, dpi, scale, parallelism);
+    return pdfData; // PDF bytes
+}
+
+static PyObject* export_formats(PyObject* self, PyObject* args) {
+    T_(PlotReprGenerator) reprGen = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator._instance();
+
+    PyObject *rawPlotSpecDict;
+    PyObject *formatList;
+    float width;
+    float height;
+    const char* unit;
+    int dpi;
+    float scale;
+    if (!PyArg_ParseTuple(args, "OO!ffsif", &rawPlotSpecDict, &PyList_Type, &formatList, &width, &height, &unit, &dpi, &scale)) {
+        PyErr_SetString(PyExc_TypeError, "export_formats: failed to parse arguments");
+        return NULL;
+    }
+
+    PyObject* images = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator.exportFormatsBytes(reprGen, rawPlotSpecDict, formatList, width, height, unit, dpi, scale);
+    return images; // list of str (SVG) and bytes (PNG, PDF)
+}
+
 static PyObject* export_mvg(PyObject* self, PyObject* args) {
     T_(PlotReprGenerator) reprGen = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator._instance();
 
@@ -107,9 +181,10 @@ static PyObject* export_html(PyObject* self, PyObject* args) {
     PyObject *rawPlotSpecDict;
     const char *scriptUrl;
     int iframe;          // 0 - false, 1 - true
-    PyArg_ParseTuple(args, "Osp", &rawPlotSpecDict, &scriptUrl, &iframe);
+    const char *typedArrayEncoding;  // '' - embed numbers as decimals, 'float64' or 'float32' - as Base64 typed arrays
+    PyArg_ParseTuple(args, "Osps", &rawPlotSpecDict, &scriptUrl, &iframe, &typedArrayEncoding);
 
-    PyObject* html = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator.generateExportHtml(reprGen, rawPlotSpecDict, (void*)scriptUrl, iframe);
+    PyObject* html = __ kotlin.root.org.jetbrains.letsPlot.pythonExtension.interop.PlotReprGenerator.generateExportHtml(reprGen, rawPlotSpecDict, (void*)scriptUrl, iframe, (void*)typedArrayEncoding);
     return html;
 }
 
@@ -211,6 +286,10 @@ static PyMethodDef module_methods[] = {
    { "export_html", (PyCFunction)export_html, METH_VARARGS, "Generates HTML page showing plot." },
    { "export_mvg", (PyCFunction)export_mvg, METH_VARARGS, "Generates MVG string representing plot. For internal use." },
    { "export_png", (PyCFunction)export_png, METH_VARARGS, "Generates Base64-encoded PNG string representing plot." },
+   { "export_png_bytes", (PyCFunction)export_png_bytes, METH_VARARGS, "Generates PNG image (bytes) representing plot." },
+   { "export_pdf_bytes", (PyCFunction)export_pdf_bytes, METH_VARARGS, "Generates vector PDF document (bytes) representing plot." },
+   { "export_pdf_pages_bytes", (PyCFunction)export_pdf_pages_bytes, METH_VARARGS, "Generates multi-page vector PDF document (bytes), one page per plot." },
+   { "export_formats", (PyCFunction)export_formats, METH_VARARGS, "Generates plot images in several formats (SVG, PNG, PDF) processing the plot once." },
    { "get_static_configure_html", (PyCFunction)get_static_configure_html, METH_O, "Generates static HTML configuration." },
    { "get_display_html_for_raw_spec", (PyCFunction)get_display_html_for_raw_spec, METH_VARARGS, "Generates display HTML for raw plot spec." },
    { "get_static_html_page_for_raw_spec", (PyCFunction)get_static_html_page_for_raw_spec, METH_VARARGS, "Generates static HTML page for raw plot spec." },
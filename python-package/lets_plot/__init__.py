@@ -2,6 +2,7 @@
 # Copyright (c) 2019. JetBrains s.r.o.
 # Use of this source code is governed by the MIT license that can be found in the LICENSE file.
 #
+import importlib
 from pkgutil import extend_path
 from typing import Dict, Union
 
@@ -12,21 +13,44 @@ from ._version import __version__
 from ._global_settings import _settings, is_production, get_global_bool
 from ._global_settings import NO_JS, OFFLINE
 
-from .plot import *
-from .export import *
-from .frontend_context import *
+from . import plot
 from .mapping import *
 from .settings_utils import *
-from .plot._global_theme import _set_global_theme
+
+# Public names of the submodules imported on the first access (PEP 562), see also `plot._EXPORTS`.
+# The frontend context (IPython, notebook environment detection) is set up when a plot is shown for the first time.
+_EXPORTS = {
+    'export': ['ggsave', 'ggsave_pages', 'ggsave_batch'],
+}
+
+_MODULE_BY_NAME = {name: module for module, names in _EXPORTS.items() for name in names}
+
+# Submodules available as attributes of the package (e.g. `lets_plot.export`) without importing them explicitly.
+_SUBMODULES = ['export', 'frontend_context']
 
 __all__ = (plot.__all__ +
-           frontend_context.__all__ +
            mapping.__all__ +
            settings_utils.__all__ +
-           export.__all__ +
+           list(_MODULE_BY_NAME) +
            ['LetsPlot'])
 
-from .frontend_context import _configuration as cfg
+
+def __getattr__(name):
+    if name in plot.__all__:
+        value = getattr(plot, name)
+    elif name in _MODULE_BY_NAME:
+        value = getattr(importlib.import_module('.' + _MODULE_BY_NAME[name], __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module('.' + name, __name__)
+    else:
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_SUBMODULES))
 
 
 class LetsPlot:
@@ -197,6 +221,7 @@ class LetsPlot:
         offline = offline if offline is not None else get_global_bool(OFFLINE)
         no_js = no_js if no_js is not None else get_global_bool(NO_JS)
 
+        from .frontend_context import _configuration as cfg
         cfg._setup_html_context(isolated_frame=isolated_frame,
                                 offline=offline,
                                 no_js=no_js,
@@ -221,6 +246,12 @@ class LetsPlot:
         - html_isolated_frame : preload Lets-Plot JS library or not (bool). Do not use this parameter explicitly. Instead you should call `LetsPlot.setup_html() <https://lets-plot.org/python/pages/api/lets_plot.LetsPlot.html#lets_plot.LetsPlot.setup_html>`__.
         - offline : to work with notebook without the Internet connection (bool). Do not use this parameter explicitly. Instead you should call `LetsPlot.setup_html() <https://lets-plot.org/python/pages/api/lets_plot.LetsPlot.html#lets_plot.LetsPlot.setup_html>`__.
         - no_js : do not generate HTML+JS as an output (bool). Do not use this parameter explicitly. Instead you should call `LetsPlot.setup_html() <https://lets-plot.org/python/pages/api/lets_plot.LetsPlot.html#lets_plot.LetsPlot.setup_html>`__. Also note that without JS interactive maps and tooltips doesn't work!
+        - data_pruning : pass to the plotting engine only those data columns that are referenced in the plot specification (bool, default True). Set it to False if a plot uses the data columns in some way the library can't detect.
+        - column_cache : reuse the data columns already converted for the plotting engine when the same data is plotted again (bool, default True). Only the columns which can't be modified in place are reused: read-only numpy arrays and Arrow-backed pandas columns (e.g. the default string columns of pandas 3).
+        - html_typed_arrays : embed numeric data columns in the exported HTML pages as Base64-encoded typed arrays instead of decimal numbers: 'float64' or 'float32' (str, default None). The 'float32' encoding keeps about 7 significant digits of the values.
+        - type_inference_sampling : infer the types of long data columns (of dicts of lists and of pandas object columns) from a sample of values, the whole column is scanned only if the sample contains values of different types (bool, default True). Set it to False if a column may contain a few values of another type.
+        - headless : export-only mode for batch jobs (bool, default False). The notebook environment is not detected, IPython is not imported, ``LetsPlot.setup_html()`` does nothing and ``show()`` prints a short notice instead of the plot. The plots can still be exported with ``ggsave()``, ``to_svg()``, ``to_html()`` etc. Usually set by the ``LETS_PLOT_HEADLESS`` environment variable.
+        - stat_pushdown : compute the 'bin', 'bin2d', 'count', 'summary' and 'boxplot' stats of the layers with their own data in Python and pass only the aggregated rows to the plotting engine (bool, default False). Requires numpy. The stats are applied when the plot is built, and only in the layers which don't inherit the plot mapping, in the plots without facets and without scale transformations, limits or discrete scales: other layers are passed to the plotting engine as is. The 'bin' and 'bin2d' stats are applied only in the plots with a single layer: the bins cover the range of the data of all layers. The stat of a layer is computed once: the changes of its data made in place after that are not reflected.
 
         Interactive map settings could also be specified:
 
@@ -272,6 +303,7 @@ class LetsPlot:
             Theme spec provided by `theme(...) <https://lets-plot.org/python/pages/api/lets_plot.theme.html>`__, ``theme_xxx()``, ``flavor_xxx()`` functions, or their sum.
 
         """
+        from .plot._global_theme import _set_global_theme
         if theme is None:
             _set_global_theme(None)
             return
@@ -379,4 +411,5 @@ class LetsPlot:
             p.show()
 
         """
+        from .frontend_context import _configuration as cfg
         cfg._setup_wb_html_context(exec=exec, new=new)
@@ -0,0 +1,194 @@
+#
+# Copyright (c) 2026. JetBrains s.r.o.
+# Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+#
+import re
+from typing import Dict, Set, Any, Optional
+
+from ._data_sharing import SHARED_DATA, DATA_REF
+from ._global_settings import has_global_value, get_global_bool, DATA_PRUNING
+from ._type_utils import LazyModule
+
+pandas = LazyModule('pandas')
+polars = LazyModule('polars')
+pyarrow = LazyModule('pyarrow')
+
+# Same as SOURCE_RE_PATTERN in LineSpecConfig.kt:
+# escaping ('\^', '\@') or aes name ('^aesName') or variable name ('@varName', '@{var name with spaces}', '@..stat_var..')
+_SOURCE_RE = re.compile(r'(?:\\\^|\\@)|(\^\w+)|@(([\w^@]+)|(\{([\s\S]*?)\})|\.{2}\w+\.{2})')
+
+
+def is_data_pruning_enabled() -> bool:
+    if not has_global_value(DATA_PRUNING):
+        return True
+    return get_global_bool(DATA_PRUNING)
+
+
+def prune_unused_data(plot_spec: Dict) -> Dict:
+    """
+    Drop data columns which are not referenced in the plot specification.
+
+    The plot backend drops such columns anyway but only after the whole data
+    has been converted and passed to it.
+    Referenced are the variables used in mappings (including 'group'), facets, 'map_join',
+    tooltips and labels, 'order_by' of `as_discrete()` and the geometry column of a GeoDataFrame.
+
+    The data shared by sub-figures of a composite figure keeps the variables referenced by any of them.
+
+    The original spec and data objects are not modified.
+    Specs which can't be analysed (bistro) are returned as is.
+    Pruning can be disabled by `LetsPlot.set({'data_pruning': False})`
+    or the 'LETS_PLOT_DATA_PRUNING' environment variable.
+    """
+    if not is_data_pruning_enabled():
+        return plot_spec
+
+    kind = plot_spec.get('kind')
+    if kind == 'subplots':
+        figures = plot_spec.get('figures')
+        if not isinstance(figures, list):
+            return plot_spec
+        result = dict(plot_spec, figures=[
+            prune_unused_data(figure) if isinstance(figure, dict) else figure for figure in figures
+        ])
+
+        shared_data = plot_spec.get(SHARED_DATA)
+        if isinstance(shared_data, dict):
+            var_names_by_ref = {}
+            _collect_shared_data_var_names(plot_spec, var_names_by_ref)
+            result[SHARED_DATA] = {
+                ref: _select_columns(data, var_names_by_ref.get(ref, set())) for ref, data in shared_data.items()
+            }
+        return result
+
+    if kind != 'plot' or 'bistro' in plot_spec:
+        return plot_spec
+
+    layers = plot_spec.get('layers') or []
+    if not all(isinstance(layer, dict) for layer in layers):
+        return plot_spec
+
+    var_names = set()
+    for spec in [plot_spec] + layers:
+        _collect_var_names(spec, var_names)
+
+    result = _with_pruned_data(plot_spec, var_names)
+    if layers:
+        result['layers'] = [_with_pruned_data(layer, var_names) for layer in layers]
+    return result
+
+
+def _collect_shared_data_var_names(spec: Dict, var_names_by_ref: Dict[str, Set[str]]):
+    if spec.get('kind') == 'subplots':
+        for figure in spec.get('figures') or []:
+            if isinstance(figure, dict):
+                _collect_shared_data_var_names(figure, var_names_by_ref)
+        return
+
+    # Only plain plot specs refer to the shared data (see share_composite_data()).
+    specs = [spec] + (spec.get('layers') or [])
+    refs = [s[DATA_REF] for s in specs if DATA_REF in s]
+    if not refs:
+        return
+
+    var_names = set()
+    for s in specs:
+        _collect_var_names(s, var_names)
+
+    for ref in refs:
+        var_names_by_ref.setdefault(ref, set()).update(var_names)
+
+
+def _with_pruned_data(spec: Dict, var_names: Set[str]) -> Dict:
+    result = dict(spec)
+    data = spec.get('data')
+    if data is not None:
+        result['data'] = _select_columns(data, var_names)
+    return result
+
+
+def _select_columns(data: Any, var_names: Set[str]) -> Any:
+    if isinstance(data, dict) or pandas.lazy_is_instance(data, 'DataFrame'):
+        # Note: the result is a dict in both cases (a dict of Series for pandas.DataFrame)
+        # which is then handled by standardize_dict() the same way as the data frame.
+        return {name: column for name, column in data.items() if name in var_names}
+
+    if polars.lazy_is_instance(data, 'DataFrame'):
+        return data.select([name for name in data.columns if name in var_names])
+
+    if pyarrow.lazy_is_instance(data, 'Table'):
+        return data.select([name for name in data.column_names if name in var_names])
+
+    # Unknown data type - keep as is.
+    return data
+
+
+def _collect_var_names(spec: Dict, var_names: Set[str]):
+    mapping = spec.get('mapping')
+    if isinstance(mapping, dict):
+        for value in mapping.values():
+            # 'group' can be mapped to the list of variables
+            _add_names(value if isinstance(value, list) else [value], var_names)
+
+    facet = spec.get('facet')
+    if isinstance(facet, dict):
+        for key in ['x', 'y', 'facets']:
+            value = facet.get(key)
+            _add_names(value if isinstance(value, list) else [value], var_names)
+
+    map_join = spec.get('map_join')
+    if isinstance(map_join, list) and len(map_join) > 0 and isinstance(map_join[0], list):
+        _add_names(map_join[0], var_names)
+
+    for lines_spec in [spec.get('tooltips'), spec.get('labels')]:
+        if isinstance(lines_spec, dict):
+            _collect_lines_var_names(lines_spec, var_names)
+
+    data_meta = spec.get('data_meta')
+    if isinstance(data_meta, dict):
+        for annotation in data_meta.get('mapping_annotations') or []:
+            parameters = annotation.get('parameters') if isinstance(annotation, dict) else None
+            if isinstance(parameters, dict):
+                _add_names([parameters.get('order_by')], var_names)
+
+        gdf_meta = data_meta.get('geodataframe')
+        if isinstance(gdf_meta, dict):
+            _add_names([gdf_meta.get('geometry')], var_names)
+
+
+def _collect_lines_var_names(lines_spec: Dict, var_names: Set[str]):
+    for line in lines_spec.get('lines') or []:
+        _add_line_var_names(line, var_names)
+
+    _add_line_var_names(lines_spec.get('title'), var_names)
+
+    for fmt in lines_spec.get('formats') or []:
+        field = fmt.get('field') if isinstance(fmt, dict) else None
+        if isinstance(field, str) and field.startswith('@'):
+            var_names.add(_detach_var_name(field))
+
+    _add_names(lines_spec.get('variables') or [], var_names)
+
+
+def _add_line_var_names(line: Optional[str], var_names: Set[str]):
+    if not isinstance(line, str):
+        return
+
+    for m in _SOURCE_RE.finditer(line):
+        name = m.group(3) if m.group(3) is not None else m.group(5)
+        if name is not None:
+            var_names.add(name)
+
+
+def _detach_var_name(field: str) -> str:
+    # Same as LineSpecConfig.detachVariableName()
+    name = field[1:]
+    if name.startswith('{') and name.endswith('}'):
+        name = name[1:-1]
+    return name
+
+
+def _add_names(values, var_names: Set[str]):
+    for value in values:
+        if isinstance(value, str):
+            var_names.add(value)
@@ -0,0 +1,114 @@
+#
+# Copyright (c) 2026. JetBrains s.r.o.
+# Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+#
+from typing import Dict, List, Any
+
+# Same as Option.SubPlots.SHARED_DATA and Option.SubPlots.DATA_REF in Option.kt
+SHARED_DATA = 'shared_data'
+DATA_REF = 'data_ref'
+
+
+def share_composite_data(plot_spec: Dict) -> Dict:
+    """
+    Emit the data objects used by more than one sub-figure (or layer) of a composite figure only once.
+
+    Such data objects are moved to the 'shared_data' section of the composite figure spec
+    and the sub-figures and layers refer to them by the 'data_ref' ID.
+    The references are resolved by the plot backend (see CompositeFigureConfig.kt)
+    before the spec is processed, so the processed spec still has the data of every sub-figure.
+    This only reduces the Python memory and the data passed to the bridge:
+    the notebook output and the exported HTML embed the shared data once per sub-figure.
+
+    The data objects are compared by identity: the same data frame, or the dicts
+    containing the same column objects (``as_dict()`` copies the dicts but not the columns).
+
+    The original spec is not modified.
+    Specs other than composite figures are returned as is.
+    """
+    if plot_spec.get('kind') != 'subplots':
+        return plot_spec
+
+    entries = []
+    _collect_data_entries(plot_spec, entries)
+
+    counts = {}
+    for _, key in entries:
+        counts[key] = counts.get(key, 0) + 1
+
+    refs = {}
+    shared_data = {}
+    for spec, key in entries:
+        if counts[key] > 1 and key not in refs:
+            refs[key] = str(len(refs))
+            shared_data[refs[key]] = spec['data']
+
+    if not shared_data:
+        return plot_spec
+
+    result = _with_data_refs(plot_spec, refs)
+    result[SHARED_DATA] = shared_data
+    return result
+
+
+def _collect_data_entries(spec: Dict, entries: List):
+    if spec.get('kind') == 'subplots':
+        for figure in spec.get('figures') or []:
+            if isinstance(figure, dict):
+                _collect_data_entries(figure, entries)
+        return
+
+    if not _is_shareable_plot(spec):
+        return
+
+    for s in [spec] + spec.get('layers', []):
+        key = _data_key(s.get('data'))
+        if key is not None:
+            entries.append((s, key))
+
+
+def _with_data_refs(spec: Dict, refs: Dict) -> Dict:
+    if spec.get('kind') == 'subplots':
+        figures = spec.get('figures') or []
+        return dict(spec, figures=[
+            _with_data_refs(figure, refs) if isinstance(figure, dict) else figure for figure in figures
+        ])
+
+    if not _is_shareable_plot(spec):
+        return spec
+
+    result = _with_data_ref(spec, refs)
+    if spec.get('layers'):
+        result['layers'] = [_with_data_ref(layer, refs) for layer in spec['layers']]
+    return result
+
+
+def _with_data_ref(spec: Dict, refs: Dict) -> Dict:
+    ref = refs.get(_data_key(spec.get('data')))
+    if ref is None:
+        return spec
+
+    result = {k: v for k, v in spec.items() if k != 'data'}
+    result[DATA_REF] = ref
+    return result
+
+
+def _is_shareable_plot(spec: Dict) -> bool:
+    # Bistro specs are transformed by the backend as a whole, keep their data in place.
+    if spec.get('kind') != 'plot' or 'bistro' in spec:
+        return False
+
+    layers = spec.get('layers', [])
+    return isinstance(layers, list) and all(isinstance(layer, dict) for layer in layers)
+
+
+def _data_key(data: Any):
+    if data is None:
+        return None
+
+    if isinstance(data, dict):
+        if len(data) == 0:
+            return None
+        return tuple((name, id(column)) for name, column in data.items())
+
+    return id(data)
@@ -22,6 +22,12 @@ ENV_MAPTILES_KIND = 'LETS_PLOT_MAPTILES_KIND'
 ENV_MAPTILES_URL = 'LETS_PLOT_MAPTILES_URL'
 ENV_MAPTILES_THEME = 'LETS_PLOT_MAPTILES_THEME'
 ENV_GEOCODING_URL = 'LETS_PLOT_GEOCODING_URL'
+ENV_DATA_PRUNING = 'LETS_PLOT_DATA_PRUNING'  # bool
+ENV_COLUMN_CACHE = 'LETS_PLOT_COLUMN_CACHE'  # bool
+ENV_HTML_TYPED_ARRAYS = 'LETS_PLOT_HTML_TYPED_ARRAYS'  # 'float64' or 'float32'
+ENV_TYPE_INFERENCE_SAMPLING = 'LETS_PLOT_TYPE_INFERENCE_SAMPLING'  # bool
+ENV_HEADLESS = 'LETS_PLOT_HEADLESS'  # bool
+ENV_STAT_PUSHDOWN = 'LETS_PLOT_STAT_PUSHDOWN'  # bool
 
 # Dev mode env variables have 'LETS_PLOT_DEV_' prefix instead of 'LETS_PLOT_'.
 ENV_DEV_HTML_ISOLATED_FRAME = 'LETS_PLOT_DEV_HTML_ISOLATED_FRAME'  # bool
@@ -34,6 +40,12 @@ ENV_DEV_MAPTILES_KIND = 'LETS_PLOT_DEV_MAPTILES_KIND'
 ENV_DEV_MAPTILES_URL = 'LETS_PLOT_DEV_MAPTILES_URL'
 ENV_DEV_MAPTILES_THEME = 'LETS_PLOT_DEV_MAPTILES_THEME'
 ENV_DEV_GEOCODING_URL = 'LETS_PLOT_DEV_GEOCODING_URL'
+ENV_DEV_DATA_PRUNING = 'LETS_PLOT_DEV_DATA_PRUNING'  # bool
+ENV_DEV_COLUMN_CACHE = 'LETS_PLOT_DEV_COLUMN_CACHE'  # bool
+ENV_DEV_HTML_TYPED_ARRAYS = 'LETS_PLOT_DEV_HTML_TYPED_ARRAYS'  # 'float64' or 'float32'
+ENV_DEV_TYPE_INFERENCE_SAMPLING = 'LETS_PLOT_DEV_TYPE_INFERENCE_SAMPLING'  # bool
+ENV_DEV_HEADLESS = 'LETS_PLOT_DEV_HEADLESS'  # bool
+ENV_DEV_STAT_PUSHDOWN = 'LETS_PLOT_DEV_STAT_PUSHDOWN'  # bool
 
 # Options
 
@@ -61,6 +73,12 @@ TILES_CHESSBOARD = 'chessboard'
 GEOCODING_PROVIDER_URL = 'geocoding_url'
 GEOCODING_ROUTE = '/map_data/geocoding'
 FRAGMENTS_ENABLED = 'fragments_enabled'
+DATA_PRUNING = 'data_pruning'
+COLUMN_CACHE = 'column_cache'
+HTML_TYPED_ARRAYS = 'html_typed_arrays'
+TYPE_INFERENCE_SAMPLING = 'type_inference_sampling'
+HEADLESS = 'headless'
+STAT_PUSHDOWN = 'stat_pushdown'
 
 _DATALORE_TILES_SERVICE = 'wss://tiles.datalore.jetbrains.com'
 _DATALORE_TILES_ATTRIBUTION = '<a href="https://lets-plot.org">\u00a9 Lets-Plot</a>, map data: <a href="https://www.openstreetmap.org/copyright">\u00a9 OpenStreetMap contributors</a>.'
@@ -132,6 +150,13 @@ def is_production() -> bool:
     return 'dev' not in __version__
 
 
+def is_headless() -> bool:
+    """
+    Export-only mode: no notebook environment detection and no frontend context set up.
+    """
+    return has_global_value(HEADLESS) and get_global_bool(HEADLESS)
+
+
 def get_js_cdn_url() -> str:
     if has_global_value(JS_URL_MANUAL):
         return get_global_str(JS_URL_MANUAL)
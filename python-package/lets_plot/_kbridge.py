@@ -2,11 +2,13 @@
 #  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
 
 # noinspection PyUnresolvedReferences
-from typing import Dict, List
+from typing import Dict, List, Union
 
 import lets_plot_kotlin_bridge
 
-from ._global_settings import get_js_cdn_url
+from ._data_pruning import prune_unused_data
+from ._data_sharing import share_composite_data
+from ._global_settings import get_js_cdn_url, has_global_value, get_global_str, HTML_TYPED_ARRAYS
 from ._type_utils import standardize_dict
 
 
@@ -47,6 +49,66 @@ def _generate_png(bytestring: Dict, output_width: float, output_height: float, u
     return lets_plot_kotlin_bridge.export_png(plot_spec, output_width, output_height, unit, dpi, scale)
 
 
+def _generate_png_bytes(plot_spec: Dict, output_width: float, output_height: float, unit: str, dpi: int,
+                        scale: float) -> bytes:
+    """
+    Export a plot to PNG format. Returns the PNG image bytes.
+    """
+    plot_spec = _standardize_plot_spec(plot_spec)
+    output_width = -1.0 if output_width is None else float(output_width)
+    output_height = -1.0 if output_height is None else float(output_height)
+    unit = '' if unit is None else str(unit)  # None is not a valid value for str type - PyArg_ParseTuple will fail
+    dpi = -1 if dpi is None else int(dpi)
+    scale = -1.0 if scale is None else float(scale)
+    return lets_plot_kotlin_bridge.export_png_bytes(plot_spec, output_width, output_height, unit, dpi, scale)
+
+
+def _generate_pdf_bytes(plot_spec: Dict, output_width: float, output_height: float, unit: str, dpi: int,
+                        scale: float) -> bytes:
+    """
+    Export a plot to a single-page vector PDF document. Returns the PDF file bytes.
+    """
+    plot_spec = _standardize_plot_spec(plot_spec)
+    output_width = -1.0 if output_width is None else float(output_width)
+    output_height = -1.0 if output_height is None else float(output_height)
+    unit = '' if unit is None else str(unit)  # None is not a valid value for str type - PyArg_ParseTuple will fail
+    dpi = -1 if dpi is None else int(dpi)
+    scale = -1.0 if scale is None else float(scale)
+    return lets_plot_kotlin_bridge.export_pdf_bytes(plot_spec, output_width, output_height, unit, dpi, scale)
+
+
+def _generate_pdf_pages_bytes(plot_specs: List[Dict], output_width: float, output_height: float, unit: str, dpi: int,
+                              scale: float, workers: int) -> bytes:
+    """
+    Export plots to a multi-page vector PDF document, one page per plot. Returns the PDF file bytes.
+    The pages are rendered by up to `workers` threads.
+    """
+    plot_specs = [_standardize_plot_spec(plot_spec) for plot_spec in plot_specs]
+    output_width = -1.0 if output_width is None else float(output_width)
+    output_height = -1.0 if output_height is None else float(output_height)
+    unit = '' if unit is None else str(unit)  # None is not a valid value for str type - PyArg_ParseTuple will fail
+    dpi = -1 if dpi is None else int(dpi)
+    scale = -1.0 if scale is None else float(scale)
+    return lets_plot_kotlin_bridge.export_pdf_pages_bytes(plot_specs, output_width, output_height, unit, dpi, scale,
+                                                          int(workers))
+
+
+def _generate_formats(plot_spec: Dict, formats: List[str], output_width: float, output_height: float, unit: str,
+                      dpi: int, scale: float) -> List[Union[str, bytes]]:
+    """
+    Export a plot to several formats at once: 'svg', 'png' or 'pdf'.
+    The plot is processed once. Returns SVG as str and PNG, PDF as bytes in the order of the formats.
+    """
+    plot_spec = _standardize_plot_spec(plot_spec)
+    output_width = -1.0 if output_width is None else float(output_width)
+    output_height = -1.0 if output_height is None else float(output_height)
+    unit = '' if unit is None else str(unit)  # None is not a valid value for str type - PyArg_ParseTuple will fail
+    dpi = -1 if dpi is None else int(dpi)
+    scale = -1.0 if scale is None else float(scale)
+    return lets_plot_kotlin_bridge.export_formats(plot_spec, list(formats), output_width, output_height, unit, dpi,
+                                                  scale)
+
+
 def _generate_mvg(bytestring: Dict, output_width: float, output_height: float, unit: str, dpi: int,
                   scale: float) -> str:
     """
@@ -64,7 +126,23 @@ def _generate_mvg(bytestring: Dict, output_width: float, output_height: float, u
 def _generate_static_html_page(plot_spec: Dict, iframe: bool) -> str:
     plot_spec = _standardize_plot_spec(plot_spec)
     scriptUrl = get_js_cdn_url()
-    return lets_plot_kotlin_bridge.export_html(plot_spec, scriptUrl, iframe)
+    typed_arrays = _get_html_typed_arrays()
+    return lets_plot_kotlin_bridge.export_html(plot_spec, scriptUrl, iframe, typed_arrays)
+
+
+def _get_html_typed_arrays() -> str:
+    """
+    Encoding of numeric data columns in the exported HTML: 'float64', 'float32' or '' (decimal numbers).
+    """
+    if not has_global_value(HTML_TYPED_ARRAYS):
+        return ''
+
+    typed_arrays = get_global_str(HTML_TYPED_ARRAYS).lower()
+    if typed_arrays not in ['float64', 'float32']:
+        raise ValueError("Unsupported '{}' value: '{}'. Use: 'float64' or 'float32'.".format(
+            HTML_TYPED_ARRAYS, typed_arrays
+        ))
+    return typed_arrays
 
 
 def _generate_static_html_page_for_raw_spec(
@@ -96,7 +174,12 @@ def _standardize_plot_spec(plot_spec: Dict) -> Dict:
     if not isinstance(plot_spec, dict):
         raise ValueError("dict expected but was {}".format(type(plot_spec)))
 
-    return standardize_dict(plot_spec)
+    # Data shared by sub-figures is converted and passed to the bridge once.
+    # Unused data columns are not converted at all,
+    # the rest are passed to the bridge as contiguous buffers where possible.
+    plot_spec = share_composite_data(plot_spec)
+    plot_spec = prune_unused_data(plot_spec)
+    return standardize_dict(plot_spec, columnar=True)
 
 
 def _generate_static_configure_html() -> str:
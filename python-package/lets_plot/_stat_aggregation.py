@@ -0,0 +1,1121 @@
+#
+# Copyright (c) 2026. JetBrains s.r.o.
+# Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+#
+"""
+Layer stats computed in Python.
+
+The stat consumes the layer data chunk by chunk and produces the same rows as the corresponding
+Kotlin stat (``BinStat``, ``CountStat``, ``Bin2dStat``, ``SummaryStat``, ``ECDFStat``, ``BoxplotStat``,
+``BoxplotOutlierStat``), so the layer
+can be passed to the plot with ``stat='identity'`` and the aggregated data only.
+
+Differences from the Kotlin stats:
+- the bins are computed over the range of the layer data (Kotlin uses the range of all layers),
+- the ECDF is not padded with the infinite values (they are treated as missing by the bridge).
+"""
+import math
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ._type_utils import LazyModule
+from .mapping import MappingMeta
+
+numpy = LazyModule('numpy')
+pandas = LazyModule('pandas')
+
+# Iterates the data chunks: dicts of 1-dimensional numpy arrays by the variable name (all variables if None).
+ReadChunks = Callable[[Optional[List[str]]], Iterator[Dict[str, Any]]]
+
+# Aes.isPositional(): the variables mapped to these aesthetics don't split the data into groups.
+_POSITIONAL_AES = {'x', 'xintercept', 'xlower', 'xmiddle', 'xupper', 'xmin', 'xmax', 'xend',
+                   'y', 'ymin', 'ymax', 'intercept', 'yintercept', 'lower', 'middle', 'upper', 'sample', 'yend',
+                   'slope'}
+
+# Default stats of the geoms which are not 'identity' (see GeomProto.kt).
+_GEOM_DEFAULT_STATS = {
+    'smooth': 'smooth',
+    'bar': 'count',
+    'histogram': 'bin',
+    'dotplot': 'dotplot',
+    'contour': 'contour',
+    'contourf': 'contourf',
+    'boxplot': 'boxplot',
+    'area_ridges': 'densityridges',
+    'violin': 'ydensity',
+    'sina': 'sina',
+    'ydotplot': 'ydotplot',
+    'density': 'density',
+    'density2d': 'density2d',
+    'density2df': 'density2df',
+    'pointdensity': 'pointdensity',
+    'qq': 'qq',
+    'qq2': 'qq2',
+    'qq_line': 'qq_line',
+    'qq2_line': 'qq2_line',
+    'freqpoly': 'bin',
+    'bin2d': 'bin2d',
+    'hex': 'binhex',
+    'pie': 'count2d',
+}
+
+_MAX_BIN_COUNT = 500  # BinStatUtil.MAX_BIN_COUNT
+_DEF_BINS = 30
+
+DEF_SAMPLE_SIZE = 100_000  # DefaultSampling.POINT
+_SAMPLE_SEED = 37
+
+_ECDF_MAX_POINTS = 10_000
+
+_MAX_DECIMAL_PLACES = 12  # SeriesUtil.MAX_DECIMAL_PLACES
+_TINY = 1e-50
+
+
+def layer_stat(geom: str, stat: Optional[str]) -> str:
+    return stat if stat is not None else _GEOM_DEFAULT_STATS.get(geom, 'identity')
+
+
+class StatResult:
+    """
+    The data, mapping and the removed stat parameters of the layer with the stat applied.
+    """
+
+    def __init__(self, data: Dict[str, Any], mapping: Dict[str, Any], consumed_params: List[str]):
+        self.data = data
+        self.mapping = mapping
+        self.consumed_params = consumed_params
+
+
+# Stats computed in Python for the in-memory data (see the 'stat_pushdown' setting).
+_PUSHDOWN_STATS = ['bin', 'bin2d', 'count', 'summary', 'boxplot', 'boxplot_outlier']
+
+
+# Stats binning over the range of the data of all the plot layers (see StatContext.overallXRange()).
+_OVERALL_RANGE_STATS = ['bin', 'bin2d']
+
+
+def uses_overall_range(stat_name: str) -> bool:
+    """
+    Whether the stat result depends on the data of the other layers of the plot.
+    """
+    return stat_name in _OVERALL_RANGE_STATS
+
+
+def can_apply_stat(stat_name: str, mapping: Dict[str, Any], params: Dict[str, Any]) -> bool:
+    """
+    Whether the stat of the in-memory layer data can be computed in Python.
+    """
+    stat_class = _STATS.get(stat_name)
+    if stat_name not in _PUSHDOWN_STATS or params.get('orientation') == 'y':
+        return False
+    if any(aes not in mapping for aes in stat_class.REQUIRED_AES):
+        return False
+    variables = [spec.variable if isinstance(spec, MappingMeta) else spec for spec in mapping.values()]
+    return all(var in _STAT_VARS for var in variables if _is_stat_var(var))
+
+
+def apply_stat(stat_name: str, mapping: Dict[str, Any], params: Dict[str, Any],
+               read_chunks: ReadChunks, column_types: Callable[[], Dict[str, str]],
+               streaming: bool) -> StatResult:
+    """
+    Apply the stat to the layer data.
+
+    Parameters
+    ----------
+    stat_name : str
+        Name of the stat.
+    mapping : dict
+        Layer mapping: aesthetic to variable name (or ``MappingMeta``).
+    params : dict
+        Layer parameters (only the parameters of the stat are used).
+    read_chunks : callable
+        Iterates the data chunks (each call starts a new pass over the data).
+    column_types : callable
+        Returns the series types of the variables (available after the first pass).
+    streaming : bool
+        Whether the stat must consume the data with bounded memory.
+    """
+    stat_class = _STATS.get(stat_name)
+    if stat_class is None:
+        raise ValueError("Stat '{}' can't be computed on the Python side. Use one of: {}.".format(
+            stat_name, ', '.join(_STATS)))
+
+    if params.get('orientation') == 'y':
+        raise ValueError("Stat '{}' can't be computed on the Python side with orientation='y'.".format(stat_name))
+
+    variables = {aes: spec.variable if isinstance(spec, MappingMeta) else spec for aes, spec in mapping.items()}
+    for aes in stat_class.REQUIRED_AES:
+        if aes not in variables:
+            raise ValueError("Stat '{}' requires the '{}' aesthetic to be mapped in the layer.".format(stat_name, aes))
+
+    stat = stat_class(params, streaming)
+
+    consumed = {aes: variables[aes] for aes in stat_class.CONSUMED_AES if aes in variables}
+    groups = _Groups(mapping, variables, consumed)
+    columns = list(dict.fromkeys(list(consumed.values()) + groups.candidates))
+
+    def layer_chunks():
+        for chunk in read_chunks(columns):
+            yield {aes: chunk[var] for aes, var in consumed.items()}, chunk
+
+    if stat.NEEDS_RANGE:
+        for values, chunk in layer_chunks():
+            groups.detect_discrete(chunk)
+            stat.update_range(values, groups.ids(chunk))
+        stat.end_range()
+
+    for values, chunk in layer_chunks():
+        groups.detect_discrete(chunk)
+        stat.update(values, groups.ids(chunk))
+
+    group_index, stat_values = stat.result(len(groups.keys))
+
+    types = column_types() or {}
+    names = _stat_var_names(consumed, groups.names or [])
+    data = {}
+    for var, values in stat_values.items():
+        source_var = consumed.get(_STAT_VAR_AES.get(var))
+        if source_var is not None and types.get(source_var) in ('datetime', 'date'):
+            values = _to_datetime64(values)
+        data[names[var]] = values
+    data.update(groups.columns(group_index))
+
+    # Mapping to the stat variables: explicit ('..count..') or default.
+    result_mapping = {aes: spec for aes, spec in mapping.items() if aes not in consumed}
+    for aes, spec in mapping.items():
+        var = variables[aes]
+        if _is_stat_var(var):
+            if var not in names:
+                raise ValueError("Stat '{}' doesn't compute the '{}' variable.".format(stat_name, var))
+            result_mapping[aes] = names[var]
+
+    for aes, var in stat.DEF_MAPPING.items():
+        if aes not in result_mapping and params.get(aes) is None:
+            result_mapping[aes] = mapping[aes] if aes in consumed and _STAT_VAR_AES.get(var) == aes else names[var]
+
+    return StatResult(data, result_mapping, [p for p in stat_class.PARAMS if p in params])
+
+
+def sample_rows(read_chunks: ReadChunks, n: Optional[int], seed: Optional[int],
+                column_types: Callable[[], Dict[str, str]]) -> Dict[str, Any]:
+    """
+    Uniform random sample of ``n`` rows of the data (all rows if ``n`` is None) in the original order.
+    """
+    rng = numpy.random.default_rng(_SAMPLE_SEED if seed is None else seed)
+    kept: Optional[Dict[str, Any]] = None
+    kept_keys = numpy.empty(0)
+    kept_order = numpy.empty(0, dtype=numpy.int64)
+    row_count = 0
+    for chunk in read_chunks(None):
+        size = len(next(iter(chunk.values()))) if chunk else 0
+        keys = rng.random(size)
+        order = numpy.arange(row_count, row_count + size)
+        row_count += size
+        if kept is None:
+            kept = chunk
+        else:
+            kept = {name: numpy.concatenate([kept[name], chunk[name]]) for name in kept}
+            keys = numpy.concatenate([kept_keys, keys])
+            order = numpy.concatenate([kept_order, order])
+
+        if n is not None and len(keys) > n:
+            selected = numpy.argpartition(keys, n)[:n]
+            kept = {name: values[selected] for name, values in kept.items()}
+            keys, order = keys[selected], order[selected]
+        kept_keys, kept_order = keys, order
+
+    if kept is None:
+        return {}
+
+    original_order = numpy.argsort(kept_order, kind='stable')
+    types = column_types() or {}
+    return {name: _to_datetime64(values[original_order]) if types.get(name) in ('datetime', 'date')
+            else values[original_order] for name, values in kept.items()}
+
+
+def _is_stat_var(var) -> bool:
+    return isinstance(var, str) and len(var) > 4 and var.startswith('..') and var.endswith('..')
+
+
+# The stat variables mapped to a consumed aesthetic by default are named after the variable of the aesthetic.
+_STAT_VAR_AES = {'..x..': 'x', '..y..': 'y'}
+
+
+def _stat_var_names(consumed: Dict[str, str], group_names: List[str]) -> Dict[str, str]:
+    names = {}
+    for var in _STAT_VARS:
+        name = consumed.get(_STAT_VAR_AES.get(var)) or var.strip('.')
+        while name in group_names:
+            name = '..' + name + '..'
+        names[var] = name
+    return names
+
+
+_STAT_VARS = ['..x..', '..y..', '..count..', '..density..', '..sumprop..', '..sumpct..', '..prop..', '..proppct..',
+              '..sum..', '..ymin..', '..ymax..', '..lower..', '..middle..', '..upper..', '..width..']
+
+
+def _to_datetime64(values):
+    result = numpy.full(len(values), numpy.datetime64('NaT'), dtype='datetime64[ms]')
+    finite = numpy.isfinite(values)
+    result[finite] = values[finite].astype(numpy.int64)
+    return result
+
+
+def _as_float(values, name: str = None):
+    if values.dtype.kind in 'fb':
+        return values.astype(numpy.float64, copy=False)
+    try:
+        return numpy.array([numpy.nan if v is None else v for v in values], dtype=numpy.float64)
+    except (TypeError, ValueError):
+        raise ValueError("Stat requires numeric values{}.".format(" of '{}'".format(name) if name else ''))
+
+
+def _finite_weights(values: Dict[str, Any], size: int):
+    if 'weight' not in values:
+        return numpy.ones(size)
+    weights = _as_float(values['weight'], 'weight')
+    return numpy.where(numpy.isfinite(weights), weights, 0.0)
+
+
+def _factorize(values) -> Tuple[Any, List]:
+    """
+    Codes of the values and the list of the distinct values (None stands for a missing value).
+    """
+    if values.dtype.kind in 'fb':
+        levels, codes = numpy.unique(values, return_inverse=True)
+        return codes.reshape(-1), [None if isinstance(v, float) and math.isnan(v) else v for v in levels.tolist()]
+
+    if pandas.is_loaded:
+        codes, levels = pandas.factorize(values, use_na_sentinel=False)
+        return codes, [None if pandas.isna(v) else v for v in numpy.asarray(levels).tolist()]
+
+    ids = {}
+    codes = numpy.fromiter((ids.setdefault(v, len(ids)) for v in values.tolist()), dtype=numpy.int64,
+                           count=len(values))
+    return codes, list(ids)
+
+
+def _unique_combinations(codes: List, sizes: List[int]):
+    """
+    Distinct combinations of non-negative codes (``codes[i] < sizes[i]``): a 2-dimensional array
+    with a column per combination and the index of the combination of each row.
+    """
+    total = 1
+    for size in sizes:
+        total *= max(size, 1)
+    if total >= 2 ** 62:
+        combinations, inverse = numpy.unique(numpy.stack(codes), axis=1, return_inverse=True)
+        return combinations, inverse.reshape(-1)
+
+    key = numpy.ravel_multi_index(tuple(numpy.asarray(c, dtype=numpy.int64) for c in codes),
+                                  [max(size, 1) for size in sizes])
+    if total <= max(len(key), 1 << 20):
+        # dense keys: avoid sorting
+        present = numpy.flatnonzero(numpy.bincount(key, minlength=total))
+        index = numpy.empty(total, dtype=numpy.int64)
+        index[present] = numpy.arange(len(present))
+        keys, inverse = present, index[key]
+    else:
+        keys, inverse = numpy.unique(key, return_inverse=True)
+    return numpy.stack(numpy.unravel_index(keys, [max(size, 1) for size in sizes])), inverse.reshape(-1)
+
+
+class _Groups:
+    """
+    Groups of the rows (see GroupingContext.kt): by the variables mapped to the 'group' aesthetic
+    or, by default, by the discrete variables (non-numeric or marked by ``as_discrete()``)
+    mapped to the non-positional aesthetics.
+    """
+
+    def __init__(self, mapping: Dict[str, Any], variables: Dict[str, Any], consumed: Dict[str, str]):
+        explicit = variables.get('group')
+        if explicit is not None:
+            self.candidates = list(explicit) if isinstance(explicit, (list, tuple)) else [explicit]
+            self._discrete = set(self.candidates)
+        else:
+            group_aes = {aes: var for aes, var in variables.items()
+                         if aes not in consumed and aes not in _POSITIONAL_AES and not _is_stat_var(var)}
+            self.candidates = list(dict.fromkeys(group_aes.values()))
+            self._discrete = {var for aes, var in group_aes.items() if isinstance(mapping[aes], MappingMeta)}
+        self._ids: Dict[Tuple, int] = {}
+        self.names: Optional[List[str]] = None
+        self.keys: List[Tuple] = []
+
+    def detect_discrete(self, chunk: Dict[str, Any]):
+        if self.names is None:
+            self.names = [name for name in self.candidates
+                          if name in self._discrete or chunk[name].dtype.kind != 'f']
+
+    def ids(self, chunk: Dict[str, Any]):
+        size = len(next(iter(chunk.values()))) if chunk else 0
+        if not self.names:
+            if not self.keys:
+                self.keys.append(())
+                self._ids[()] = 0
+            return numpy.zeros(size, dtype=numpy.int64)
+
+        codes, levels = zip(*[_factorize(chunk[name]) for name in self.names])
+        combinations, inverse = _unique_combinations(codes, [len(names) for names in levels])
+        local_ids = numpy.array([
+            self._id(tuple(levels[i][code] for i, code in enumerate(combination)))
+            for combination in combinations.T.tolist()
+        ], dtype=numpy.int64)
+        return local_ids[inverse]
+
+    def _id(self, key: Tuple) -> int:
+        group_id = self._ids.get(key)
+        if group_id is None:
+            group_id = self._ids[key] = len(self.keys)
+            self.keys.append(key)
+        return group_id
+
+    def columns(self, group_index) -> Dict[str, Any]:
+        result = {}
+        for i, name in enumerate(self.names or []):
+            levels = [key[i] for key in self.keys]
+            if all(level is None or isinstance(level, (int, float)) for level in levels):
+                column = numpy.array([numpy.nan if level is None else level for level in levels], dtype=numpy.float64)
+            else:
+                column = numpy.empty(len(levels), dtype=object)
+                column[:] = levels
+            result[name] = column[group_index]
+        return result
+
+
+def _grow(arr, group_count: int):
+    # Accumulators are 2-dimensional: (group, bin).
+    if arr.shape[0] >= group_count:
+        return arr
+    return numpy.concatenate([arr, numpy.zeros((group_count - arr.shape[0],) + arr.shape[1:])])
+
+
+class _Stat:
+    REQUIRED_AES: Tuple[str, ...] = ()
+    CONSUMED_AES: Tuple[str, ...] = ()
+    DEF_MAPPING: Dict[str, str] = {}
+    PARAMS: Tuple[str, ...] = ()
+    NEEDS_RANGE = False
+
+    def __init__(self, params: Dict[str, Any], streaming: bool):
+        self._params = params
+        self._streaming = streaming
+
+    def update_range(self, values: Dict[str, Any], groups):
+        pass
+
+    def end_range(self):
+        pass
+
+    def update(self, values: Dict[str, Any], groups):
+        raise NotImplementedError
+
+    def result(self, group_count: int) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Group index of the stat rows and the values of the stat variables.
+        """
+        raise NotImplementedError
+
+
+class _Range:
+    def __init__(self):
+        self.lower = math.inf
+        self.upper = -math.inf
+
+    def update(self, values):
+        finite = values[numpy.isfinite(values)]
+        if len(finite) > 0:
+            self.lower = min(self.lower, float(finite.min()))
+            self.upper = max(self.upper, float(finite.max()))
+
+    def is_empty(self) -> bool:
+        return self.lower > self.upper
+
+    @property
+    def length(self) -> float:
+        return self.upper - self.lower
+
+
+def _bin_count_and_width(span: float, bins: int, binwidth: Optional[float]) -> Tuple[int, float]:
+    # BinStatUtil.binCountAndWidth()
+    if binwidth is not None and binwidth > 0:
+        return math.ceil(min(_MAX_BIN_COUNT, span / binwidth)), binwidth
+    return bins, span / bins
+
+
+def _bin_options(bins, binwidth) -> Tuple[int, Optional[float]]:
+    # BinStatUtil.BinOptions
+    return min(_MAX_BIN_COUNT, max(1, int(bins))), (float(binwidth) if binwidth is not None else None)
+
+
+def _bin_index(values, start: float, width: float):
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        index = numpy.floor((values - start) / width)
+    return numpy.where(numpy.isnan(index), 0, index)  # Kotlin: NaN.toInt() == 0
+
+
+class _BinStat(_Stat):
+    REQUIRED_AES = ('x',)
+    CONSUMED_AES = ('x', 'weight')
+    DEF_MAPPING = {'x': '..x..', 'y': '..count..'}
+    PARAMS = ('bins', 'binwidth', 'center', 'boundary', 'breaks', 'threshold')
+
+    def __init__(self, params: Dict[str, Any], streaming: bool):
+        super().__init__(params, streaming)
+        self._bins, self._binwidth = _bin_options(params.get('bins') or _DEF_BINS, params.get('binwidth'))
+        breaks = [float(b) for b in params.get('breaks') or [] if b is not None and math.isfinite(b)]
+        self._breaks = sorted(set(breaks))
+        if len(self._breaks) == 1:
+            raise ValueError("At least two breaks are required")
+        self.NEEDS_RANGE = not self._breaks
+        self._range = _Range()
+        self._counts = numpy.zeros((0, 0))
+        self._totals = numpy.zeros((0,))
+
+    def update_range(self, values, groups):
+        self._range.update(_as_float(values['x'], 'x'))
+
+    def end_range(self):
+        if self._range.is_empty():
+            return
+
+        boundary, center = self._params.get('boundary'), self._params.get('center')
+        x_pos_kind, x_pos = ('boundary', boundary) if boundary is not None else \
+            ('center', center) if center is not None else (None, 0.0)
+
+        # BinStatUtil.getBinningParameters()
+        start = self._range.lower
+        span = self._range.length
+        _, width = _bin_count_and_width(span, self._bins, self._binwidth)
+        start -= width * 0.7
+        span += width * 1.4
+        count, width = _bin_count_and_width(span, self._bins, self._binwidth)
+
+        if x_pos_kind is not None:
+            min_delta = math.inf if x_pos_kind == 'center' else x_pos - start
+            for i in range(count):
+                left = start + i * width
+                delta = x_pos - (left + width / 2) if x_pos_kind == 'center' else x_pos - (left + width)
+                if abs(delta) < abs(min_delta):
+                    min_delta = delta
+            start += math.fmod(min_delta, width / 2) if width > 0 else math.nan
+
+        self._start, self._width, self._count = start, width, count
+
+    def update(self, values, groups):
+        xs = _as_float(values['x'], 'x')
+        weights = _finite_weights(values, len(xs))
+        finite = numpy.isfinite(xs)
+        xs, weights, groups = xs[finite], weights[finite], groups[finite]
+
+        if self._breaks:
+            in_range = (xs >= self._breaks[0]) & (xs <= self._breaks[-1])
+            xs, weights, groups = xs[in_range], weights[in_range], groups[in_range]
+            # Left-open bins except the first one (see bracketingIndicesOrNull())
+            index = numpy.maximum(numpy.searchsorted(self._breaks, xs, side='left'), 1) - 1
+            count = len(self._breaks) - 1
+        elif self._range.is_empty():
+            return
+        else:
+            index = _bin_index(xs, self._start, self._width)
+            count = self._count
+
+        group_count = int(groups.max()) + 1 if len(groups) > 0 else 0
+        self._totals = _grow(self._totals[:, None], group_count)[:, 0]
+        self._totals[:group_count] += numpy.bincount(groups, weights, minlength=group_count)
+
+        # Values out of the bins are still counted in the totals (like in Kotlin).
+        in_bins = (index >= 0) & (index < count)
+        flat = groups[in_bins] * count + index[in_bins].astype(numpy.int64)
+        counts = numpy.bincount(flat, weights[in_bins], minlength=group_count * count).reshape(-1, count)
+        if self._counts.shape[1] != count:
+            self._counts = numpy.zeros((0, count))
+        self._counts = _grow(self._counts, group_count)
+        self._counts[:group_count] += counts
+
+    def result(self, group_count):
+        if self._breaks:
+            breaks = numpy.array(self._breaks)
+            widths = numpy.diff(breaks)
+            xs = breaks[:-1] + widths / 2
+        elif self._range.is_empty():
+            return numpy.empty(0, dtype=numpy.int64), {var: numpy.empty(0) for var in
+                                                       ['..x..', '..count..', '..density..', '..sumprop..',
+                                                        '..sumpct..']}
+        else:
+            xs = self._start + self._width / 2 + numpy.arange(self._count) * self._width
+            widths = None
+
+        bin_count = len(xs)
+        counts = _grow(self._counts if self._counts.shape[1] == bin_count else numpy.zeros((0, bin_count)),
+                       group_count)
+        totals = _grow(self._totals[:, None], group_count)[:, 0]
+
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            sum_prop = counts / totals[:, None]
+            if widths is None:
+                density = sum_prop * (1.0 / self._width if self._width > 0 else 1.0)
+            else:
+                density = counts / (numpy.abs(counts) * widths).sum(axis=1)[:, None]
+
+        x = numpy.tile(xs, (group_count, 1))
+        threshold = self._params.get('threshold')
+        if threshold is not None:
+            for g in range(group_count):
+                self._apply_threshold(threshold, x[g], counts[g], density[g], sum_prop[g])
+
+        group_index = numpy.repeat(numpy.arange(group_count), bin_count)
+        return group_index, {
+            '..x..': x.reshape(-1),
+            '..count..': counts.reshape(-1),
+            '..density..': density.reshape(-1),
+            '..sumprop..': sum_prop.reshape(-1),
+            '..sumpct..': sum_prop.reshape(-1) * 100,
+        }
+
+    @staticmethod
+    def _apply_threshold(threshold, x, count, density, sum_prop):
+        # BinStat: the bins with count <= threshold are dropped at both ends.
+        below = count <= threshold
+        left = [i for i in range(len(count)) if below[:i + 1].all()]
+        right = [i for i in reversed(range(len(count))) if below[i:].all()]
+        drop = left + right
+        count[drop] = numpy.nan
+        density[drop] = numpy.nan
+        sum_prop[drop] = numpy.nan
+
+        # Resolution hack: at least two consecutive x values are needed to compute the bin width.
+        if len(x) - len(drop) > 1:
+            drop_x = drop
+        elif left:
+            drop_x = left[:-1] + right
+        elif right:
+            drop_x = left + right[:-1]
+        else:
+            drop_x = []
+        x[drop_x] = numpy.nan
+
+
+def _is_present(values):
+    if values.dtype.kind == 'f':
+        return numpy.isfinite(values)
+    return numpy.array([v is not None for v in values.tolist()], dtype=bool)
+
+
+class _Locations:
+    """
+    The distinct values of a variable (numeric or discrete) in the order of appearance.
+    """
+
+    def __init__(self):
+        self._ids: Dict[Any, int] = {}
+
+    def ids(self, values):
+        codes, levels = _factorize(values)
+        location_ids = numpy.array([self._ids.setdefault(level, len(self._ids)) for level in levels],
+                                   dtype=numpy.int64)
+        return location_ids[codes]
+
+    def pairs(self, groups, values):
+        """
+        Distinct (group, location id) pairs of the rows (see ``_unique_combinations()``).
+        """
+        location_ids = self.ids(values)
+        return _unique_combinations([groups, location_ids], [int(groups.max()) + 1, len(self._ids)])
+
+    def __len__(self):
+        return len(self._ids)
+
+    def values(self):
+        locations = list(self._ids)
+        if all(isinstance(v, (int, float)) for v in locations):
+            return numpy.array(locations, dtype=numpy.float64)
+        result = numpy.empty(len(locations), dtype=object)
+        result[:] = locations
+        return result
+
+
+class _CountStat(_Stat):
+    REQUIRED_AES = ()
+    CONSUMED_AES = ('x', 'weight')
+    DEF_MAPPING = {'x': '..x..', 'y': '..count..'}
+
+    def __init__(self, params: Dict[str, Any], streaming: bool):
+        super().__init__(params, streaming)
+        self._locations = _Locations()
+        self._counts: Dict[Tuple[int, int], float] = {}
+
+    def update(self, values, groups):
+        size = len(groups)
+        xs = values['x'] if 'x' in values else numpy.zeros(size)
+        present = _is_present(xs)
+        weights = _finite_weights(values, size)[present]
+        xs, groups = xs[present], groups[present]
+        if len(xs) == 0:
+            return
+
+        pairs, inverse = self._locations.pairs(groups, xs)
+        sums = numpy.bincount(inverse, weights, minlength=pairs.shape[1])
+        for (group, location), s in zip(pairs.T.tolist(), sums.tolist()):
+            key = (group, location)
+            self._counts[key] = self._counts.get(key, 0.0) + s
+
+    def result(self, group_count):
+        keys = sorted(self._counts)
+        group_index = numpy.array([g for g, _ in keys], dtype=numpy.int64)
+        location_index = numpy.array([loc for _, loc in keys], dtype=numpy.int64)
+        counts = numpy.array([self._counts[key] for key in keys], dtype=numpy.float64)
+
+        # AbstractCountStat.normalize(): proportions of the groups at the location and of the location.
+        location_sums = numpy.bincount(location_index, counts, minlength=len(self._locations))
+        totals = location_sums[location_index]
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            prop = counts / totals
+            sum_prop = totals / location_sums.sum()
+
+        return group_index, {
+            '..x..': self._locations.values()[location_index],
+            '..count..': counts,
+            '..sum..': totals,
+            '..prop..': prop,
+            '..proppct..': prop * 100,
+            '..sumprop..': sum_prop,
+            '..sumpct..': sum_prop * 100,
+        }
+
+
+def _is_beyond_precision(lower: float, upper: float) -> bool:
+    # SeriesUtil.isBeyondPrecision()
+    delta = upper - lower
+
+    def beyond(base):
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            return bool(numpy.log10(base) - numpy.log10(delta) > _MAX_DECIMAL_PLACES)
+
+    return delta < _TINY or beyond(lower) or beyond(upper)
+
+
+class _Bin2dStat(_Stat):
+    REQUIRED_AES = ('x', 'y')
+    CONSUMED_AES = ('x', 'y', 'weight')
+    DEF_MAPPING = {'x': '..x..', 'y': '..y..', 'fill': '..count..'}
+    PARAMS = ('bins', 'binwidth', 'drop')
+    NEEDS_RANGE = True
+
+    def __init__(self, params: Dict[str, Any], streaming: bool):
+        super().__init__(params, streaming)
+        bins = _pair(params.get('bins'), _DEF_BINS)
+        binwidth = _pair(params.get('binwidth'), None)
+        self._options = [_bin_options(bins[0], binwidth[0]), _bin_options(bins[1], binwidth[1])]
+        self._drop = params.get('drop', True) is not False
+        self._ranges = [_Range(), _Range()]
+        self._counts = numpy.zeros((0, 0))
+        self._totals = numpy.zeros(0)
+
+    def update_range(self, values, groups):
+        xs, ys = _as_float(values['x'], 'x'), _as_float(values['y'], 'y')
+        finite = numpy.isfinite(xs) & numpy.isfinite(ys)
+        self._ranges[0].update(xs[finite])
+        self._ranges[1].update(ys[finite])
+
+    def end_range(self):
+        if self._ranges[0].is_empty():
+            return
+
+        self._axes = []
+        for r, (bins, binwidth) in zip(self._ranges, self._options):
+            lower, upper = r.lower, r.upper
+            # Initial: SeriesUtil.ensureApplicableRange()
+            init_lower, init_upper = (lower - 0.5, lower + 0.5) if _is_beyond_precision(lower, upper) else (lower, upper)
+            _, init_width = _bin_count_and_width(init_upper - init_lower, bins, binwidth)
+            # Final
+            expand = 0.5 if _is_beyond_precision(lower, upper) else init_width / 2.0
+            lower, upper = lower - expand, upper + expand
+            count, width = _bin_count_and_width(upper - lower, bins, binwidth)
+            self._axes.append((lower, upper - lower, count, width))
+        self._counts = numpy.zeros((0, self._axes[0][2] * self._axes[1][2]))
+
+    def update(self, values, groups):
+        if self._ranges[0].is_empty():
+            return
+
+        xs, ys = _as_float(values['x'], 'x'), _as_float(values['y'], 'y')
+        weights = _finite_weights(values, len(xs))
+        finite = numpy.isfinite(xs) & numpy.isfinite(ys)
+        xs, ys, weights, groups = xs[finite], ys[finite], weights[finite], groups[finite]
+
+        (x_start, _, x_count, x_width), (y_start, _, y_count, y_width) = self._axes
+        ix = _bin_index(xs, x_start, x_width)
+        iy = _bin_index(ys, y_start, y_width)
+        group_count = int(groups.max()) + 1 if len(groups) > 0 else 0
+
+        totals = numpy.bincount(groups, weights, minlength=group_count)
+        self._totals = _grow(self._totals[:, None], group_count)[:, 0]
+        self._totals[:group_count] += totals
+
+        in_bins = (ix >= 0) & (ix < x_count) & (iy >= 0) & (iy < y_count)
+        cells = x_count * y_count
+        flat = groups[in_bins] * cells + (ix[in_bins] * y_count + iy[in_bins]).astype(numpy.int64)
+        counts = numpy.bincount(flat, weights[in_bins], minlength=group_count * cells).reshape(-1, cells)
+        self._counts = _grow(self._counts, group_count)
+        self._counts[:group_count] += counts
+
+    def result(self, group_count):
+        if self._ranges[0].is_empty():
+            return numpy.empty(0, dtype=numpy.int64), {var: numpy.empty(0) for var in
+                                                       ['..x..', '..y..', '..count..', '..density..']}
+
+        (x_start, x_span, x_count, x_width), (y_start, y_span, y_count, y_width) = self._axes
+        counts = _grow(self._counts, group_count)
+        totals = _grow(self._totals[:, None], group_count)[:, 0]
+        density_factor = 1.0 / (x_span * y_span / (x_count * y_count))
+
+        x_centers = x_start + x_width / 2 + numpy.arange(x_count) * x_width
+        y_centers = y_start + y_width / 2 + numpy.arange(y_count) * y_width
+        x = numpy.repeat(x_centers, y_count)
+        y = numpy.tile(y_centers, x_count)
+        ix = numpy.repeat(numpy.arange(x_count), y_count)
+        iy = numpy.tile(numpy.arange(y_count), x_count)
+
+        columns = {'g': [], '..x..': [], '..y..': [], '..count..': [], '..density..': []}
+        for g in range(group_count):
+            count = counts[g]
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                density = count / totals[g] * density_factor
+            gx, gy, gcount, gdensity = x.copy(), y.copy(), count.copy(), density
+            keep = numpy.ones(len(count), dtype=bool)
+            if self._drop:
+                empty = count == 0.0
+                keep = ~empty
+                # Resolution hack (see Bin2dStat): keep the placeholders for the first two bins along each axis.
+                hack_x = empty & (ix == 0) & ((iy == 0) | (iy == 1))
+                hack_y = empty & ((ix == 0) | (ix == 1)) & (iy == 0) & ~hack_x
+                gx[hack_x] = numpy.nan
+                gy[hack_y] = numpy.nan
+                gcount[hack_x | hack_y] = numpy.nan
+                gdensity = numpy.where(hack_x | hack_y, numpy.nan, density)
+                keep |= hack_x | hack_y
+            columns['g'].append(numpy.full(int(keep.sum()), g))
+            columns['..x..'].append(gx[keep])
+            columns['..y..'].append(gy[keep])
+            columns['..count..'].append(gcount[keep])
+            columns['..density..'].append(gdensity[keep])
+
+        group_index = numpy.concatenate(columns.pop('g')) if group_count > 0 else numpy.empty(0, dtype=numpy.int64)
+        return group_index, {var: numpy.concatenate(parts) if parts else numpy.empty(0)
+                             for var, parts in columns.items()}
+
+
+def _pair(value, default):
+    if value is None:
+        return default, default
+    if isinstance(value, (list, tuple)):
+        return value[0], value[1]
+    return value, value
+
+
+# SummaryStat aggregate functions computed from the accumulators of the groups.
+_STREAMING_FUNCTIONS = {
+    'count': lambda acc: acc['count'],
+    'sum': lambda acc: acc['sum'],
+    'mean': lambda acc: acc['sum'] / acc['count'],
+    'min': lambda acc: acc['min'],
+    'max': lambda acc: acc['max'],
+}
+_QUANTILE_FUNCTIONS = ['median', 'lq', 'mq', 'uq']
+_DEF_QUANTILES = [0.25, 0.5, 0.75]
+
+
+class _Samples:
+    """
+    The values of the stat rows collected from all chunks (the stats computing quantiles are not streamable).
+    """
+
+    def __init__(self):
+        self._rows = []
+        self._values = []
+
+    def add(self, rows, values):
+        self._rows.append(rows)
+        self._values.append(values)
+
+    def sorted(self, row_count: int):
+        """
+        The values sorted within the rows, the start index and the number of the values of each row.
+        """
+        rows = numpy.concatenate(self._rows) if self._rows else numpy.empty(0, dtype=numpy.int64)
+        values = numpy.concatenate(self._values) if self._values else numpy.empty(0)
+        order = numpy.argsort(values)
+        if row_count <= numpy.iinfo(numpy.uint16).max:
+            # the stable sort of small integers is a radix sort: much faster than lexsort()
+            order = order[numpy.argsort(rows[order].astype(numpy.uint16), kind='stable')]
+        else:
+            order = order[numpy.argsort(rows[order], kind='stable')]
+        counts = numpy.bincount(rows, minlength=row_count)
+        starts = numpy.concatenate([[0], numpy.cumsum(counts)[:-1]]).astype(numpy.int64)
+        return values[order], rows[order], starts, counts
+
+
+def _quantiles(sorted_values, starts, counts, p: float):
+    # AggregateFunctions.quantile(): the mean of the neighbours if the place is not an integer.
+    place = p * (counts - 1)
+    lower = sorted_values[starts + numpy.floor(place).astype(numpy.int64)]
+    upper = sorted_values[starts + numpy.ceil(place).astype(numpy.int64)]
+    return numpy.where(place == numpy.floor(place), lower, (lower + upper) / 2)
+
+
+class _XYStat(_Stat):
+    """
+    Base of the stats of the y values at the x locations: the stat row is the (group, x) pair.
+    """
+    REQUIRED_AES = ('y',)
+    CONSUMED_AES = ('x', 'y')
+
+    def __init__(self, params: Dict[str, Any], streaming: bool):
+        super().__init__(params, streaming)
+        self._locations = _Locations()
+        self._keys: Dict[Tuple[int, int], int] = {}
+
+    def _rows(self, values, groups):
+        """
+        The rows of the present (x, y) pairs and the y values.
+        """
+        ys = _as_float(values['y'], 'y')
+        xs = values['x'] if 'x' in values else numpy.zeros(len(ys))
+        present = _is_present(xs) & numpy.isfinite(ys)
+        xs, ys, groups = xs[present], ys[present], groups[present]
+        if len(ys) == 0:
+            return numpy.empty(0, dtype=numpy.int64), ys
+
+        pairs, inverse = self._locations.pairs(groups, xs)
+        ids = numpy.array([self._keys.setdefault((g, loc), len(self._keys)) for g, loc in pairs.T.tolist()],
+                          dtype=numpy.int64)
+        return ids[inverse], ys
+
+    def _group_and_x(self):
+        keys = list(self._keys)
+        group_index = numpy.array([g for g, _ in keys], dtype=numpy.int64)
+        x = self._locations.values()[numpy.array([loc for _, loc in keys], dtype=numpy.int64)]
+        return group_index, x
+
+
+class _SummaryStat(_XYStat):
+    DEF_MAPPING = {'x': '..x..', 'y': '..y..', 'ymin': '..ymin..', 'ymax': '..ymax..'}
+    PARAMS = ('fun', 'fun_min', 'fun_max', 'quantiles')
+
+    def __init__(self, params: Dict[str, Any], streaming: bool):
+        super().__init__(params, streaming)
+        self._functions = [params.get('fun') or 'mean', params.get('fun_min') or 'min', params.get('fun_max') or 'max']
+        for f in self._functions:
+            if f in _QUANTILE_FUNCTIONS:
+                if streaming:
+                    raise ValueError("Summary function '{}' is not supported for chunked data. Use one of: {}.".format(
+                        f, ', '.join(_STREAMING_FUNCTIONS)))
+            elif f not in _STREAMING_FUNCTIONS:
+                raise ValueError("Unsupported function name: '{}'\nUse one of: {}.".format(
+                    f, ', '.join(list(_STREAMING_FUNCTIONS) + _QUANTILE_FUNCTIONS)))
+        lq, mq, uq = params.get('quantiles') or _DEF_QUANTILES
+        self._quantiles = {'median': 0.5, 'lq': lq, 'mq': mq, 'uq': uq}
+        self._acc = {'count': numpy.zeros(0), 'sum': numpy.zeros(0),
+                     'min': numpy.zeros(0), 'max': numpy.zeros(0)}
+        self._samples = _Samples() if any(f in _QUANTILE_FUNCTIONS for f in self._functions) else None
+
+    def update(self, values, groups):
+        rows, ys = self._rows(values, groups)
+        size = len(self._keys)
+        for name, fill in [('count', 0.0), ('sum', 0.0), ('min', numpy.inf), ('max', -numpy.inf)]:
+            acc = self._acc[name]
+            if len(acc) < size:
+                self._acc[name] = numpy.concatenate([acc, numpy.full(size - len(acc), fill)])
+
+        self._acc['count'] += numpy.bincount(rows, minlength=size)
+        self._acc['sum'] += numpy.bincount(rows, ys, minlength=size)
+        numpy.minimum.at(self._acc['min'], rows, ys)
+        numpy.maximum.at(self._acc['max'], rows, ys)
+        if self._samples is not None:
+            self._samples.add(rows, ys)
+
+    def result(self, group_count):
+        group_index, x = self._group_and_x()
+        if self._samples is not None:
+            sorted_values, _, starts, counts = self._samples.sorted(len(self._keys))
+        aggregated = {f: _STREAMING_FUNCTIONS[f](self._acc) if f in _STREAMING_FUNCTIONS
+                      else _quantiles(sorted_values, starts, counts, self._quantiles[f])
+                      for f in self._functions}
+        y, ymin, ymax = [aggregated[f] for f in self._functions]
+        return group_index, {'..x..': x, '..y..': y, '..ymin..': ymin, '..ymax..': ymax}
+
+
+class _BoxplotStat(_XYStat):
+    NAME = 'boxplot'
+    DEF_MAPPING = {'x': '..x..', 'ymin': '..ymin..', 'ymax': '..ymax..',
+                   'lower': '..lower..', 'middle': '..middle..', 'upper': '..upper..'}
+    PARAMS = ('coef', 'varwidth')
+
+    def __init__(self, params: Dict[str, Any], streaming: bool):
+        super().__init__(params, streaming)
+        if streaming:
+            raise ValueError("Stat '{}' is not supported for chunked data.".format(self.NAME))
+        self._coef = params.get('coef')
+        if self._coef is None:
+            self._coef = 1.5  # BoxplotStat.DEF_WHISKER_IQR_RATIO
+        self._var_width = bool(params.get('varwidth'))
+        if self._var_width:
+            self.DEF_MAPPING = {**self.DEF_MAPPING, 'width': '..width..'}
+        self._samples = _Samples()
+
+    def update(self, values, groups):
+        self._samples.add(*self._rows(values, groups))
+
+    def _summary(self):
+        # BoxplotStat.buildStat(): the quartiles and the whiskers - the range of the values within the fences.
+        row_count = len(self._keys)
+        sorted_values, rows, starts, counts = self._samples.sorted(row_count)
+        lower = _quantiles(sorted_values, starts, counts, 0.25)
+        middle = _quantiles(sorted_values, starts, counts, 0.5)
+        upper = _quantiles(sorted_values, starts, counts, 0.75)
+        iqr = upper - lower
+        lower_fence = lower - iqr * self._coef
+        upper_fence = upper + iqr * self._coef
+
+        boxed = (sorted_values >= lower_fence[rows]) & (sorted_values <= upper_fence[rows])
+        ymin = numpy.full(row_count, numpy.inf)
+        ymax = numpy.full(row_count, -numpy.inf)
+        numpy.minimum.at(ymin, rows[boxed], sorted_values[boxed])
+        numpy.maximum.at(ymax, rows[boxed], sorted_values[boxed])
+        has_boxed = numpy.bincount(rows[boxed], minlength=row_count) > 0
+        ymin = numpy.where(has_boxed, ymin, lower_fence)
+        ymax = numpy.where(has_boxed, ymax, upper_fence)
+        return {
+            'sorted': (sorted_values, rows, counts),
+            'fences': (lower_fence, upper_fence),
+            '..ymin..': ymin,
+            '..ymax..': ymax,
+            '..lower..': lower,
+            '..middle..': middle,
+            '..upper..': upper,
+        }
+
+    def result(self, group_count):
+        group_index, x = self._group_and_x()
+        summary = self._summary()
+        _, _, counts = summary['sorted']
+        stat_values = {var: summary[var] for var in ['..ymin..', '..ymax..', '..lower..', '..middle..', '..upper..']}
+        stat_values['..x..'] = x
+        if self._var_width:
+            # The width is normalized by the largest box of the group.
+            max_counts = numpy.zeros(group_count)
+            numpy.maximum.at(max_counts, group_index, counts)
+            stat_values['..width..'] = numpy.sqrt(counts) / numpy.sqrt(max_counts[group_index])
+        return group_index, stat_values
+
+
+class _BoxplotOutlierStat(_BoxplotStat):
+    NAME = 'boxplot_outlier'
+    DEF_MAPPING = {'x': '..x..', 'y': '..y..', 'ymin': '..ymin..', 'ymax': '..ymax..',
+                   'lower': '..lower..', 'middle': '..middle..', 'upper': '..upper..'}
+    PARAMS = ('coef',)
+
+    def result(self, group_count):
+        group_index, x = self._group_and_x()
+        summary = self._summary()
+        sorted_values, rows, counts = summary['sorted']
+        lower_fence, upper_fence = summary['fences']
+
+        # BoxplotOutlierStat: the outliers or a single NaN value if there are none.
+        outlier = (sorted_values < lower_fence[rows]) | (sorted_values > upper_fence[rows])
+        no_outliers = numpy.flatnonzero(numpy.bincount(rows[outlier], minlength=len(counts)) == 0)
+        out_rows = numpy.concatenate([rows[outlier], no_outliers])
+        out_y = numpy.concatenate([sorted_values[outlier], numpy.full(len(no_outliers), numpy.nan)])
+        order = numpy.argsort(out_rows, kind='stable')
+        out_rows, out_y = out_rows[order], out_y[order]
+
+        stat_values = {var: summary[var][out_rows] for var in ['..ymin..', '..ymax..', '..lower..', '..middle..',
+                                                               '..upper..']}
+        stat_values['..x..'] = x[out_rows]
+        stat_values['..y..'] = out_y
+        return group_index[out_rows], stat_values
+
+
+class _ECDFStat(_Stat):
+    REQUIRED_AES = ('x',)
+    CONSUMED_AES = ('x',)
+    DEF_MAPPING = {'x': '..x..', 'y': '..y..'}
+    PARAMS = ('n', 'pad')
+    NEEDS_RANGE = True
+
+    def __init__(self, params: Dict[str, Any], streaming: bool):
+        super().__init__(params, streaming)
+        self._n = params.get('n')
+        self._ranges: Dict[int, _Range] = {}
+        self._distinct: Dict[int, Any] = {}
+        self._grids: Dict[int, Any] = {}
+        self._counts: Dict[int, Any] = {}
+        self._totals: Dict[int, int] = {}
+
+    def _split(self, values, groups):
+        xs = _as_float(values['x'], 'x')
+        finite = numpy.isfinite(xs)
+        xs, groups = xs[finite], groups[finite]
+        for g in numpy.unique(groups).tolist():
+            yield g, xs[groups == g]
+
+    def update_range(self, values, groups):
+        for g, xs in self._split(values, groups):
+            self._ranges.setdefault(g, _Range()).update(xs)
+            if self._n is None:
+                distinct = self._distinct.get(g, numpy.empty(0))
+                if distinct is not None:
+                    distinct = numpy.union1d(distinct, xs)
+                    # ECDF "sketch": too many distinct values are replaced by a regular grid.
+                    self._distinct[g] = distinct if len(distinct) <= _ECDF_MAX_POINTS else None
+
+    def end_range(self):
+        for g, r in self._ranges.items():
+            distinct = self._distinct.get(g)
+            if self._n is None and distinct is not None:
+                self._grids[g] = distinct
+            else:
+                n = self._n if self._n is not None else _ECDF_MAX_POINTS
+                self._grids[g] = _linspace(r.lower, r.upper, n)
+            self._counts[g] = numpy.zeros(len(self._grids[g]) + 1)
+            self._totals[g] = 0
+
+    def update(self, values, groups):
+        for g, xs in self._split(values, groups):
+            grid = self._grids[g]
+            # The number of values <= grid[i] is the sum of the counts up to i.
+            index = numpy.searchsorted(grid, xs, side='left')
+            self._counts[g] += numpy.bincount(index, minlength=len(grid) + 1)
+            self._totals[g] += len(xs)
+
+    def result(self, group_count):
+        group_index, xs, ys = [], [], []
+        for g in sorted(self._grids):
+            grid = self._grids[g]
+            group_index.append(numpy.full(len(grid), g))
+            xs.append(grid)
+            ys.append(numpy.cumsum(self._counts[g])[:len(grid)] / self._totals[g])
+        if not group_index:
+            return numpy.empty(0, dtype=numpy.int64), {'..x..': numpy.empty(0), '..y..': numpy.empty(0)}
+        return numpy.concatenate(group_index), {'..x..': numpy.concatenate(xs), '..y..': numpy.concatenate(ys)}
+
+
+def _linspace(start: float, stop: float, num: int):
+    # ECDFStat.linspace()
+    if num <= 0:
+        return numpy.empty(0)
+    if num == 1:
+        return numpy.array([start])
+    step = (stop - start) / (num - 1)
+    return start + numpy.arange(num) * step
+
+
+_STATS = {
+    'bin': _BinStat,
+    'count': _CountStat,
+    'bin2d': _Bin2dStat,
+    'summary': _SummaryStat,
+    'ecdf': _ECDFStat,
+    'boxplot': _BoxplotStat,
+    'boxplot_outlier': _BoxplotOutlierStat,
+}
@@ -8,8 +8,12 @@ import importlib
 import json
 import math
 import sys
+import threading
+from collections import OrderedDict
 from datetime import datetime, date, time, timezone, timedelta
-from typing import Any, Union, Type, Dict
+from typing import Any, Union, Type, Dict, List, Callable
+
+from ._global_settings import has_global_value, get_global_bool, COLUMN_CACHE
 
 
 class LazyModule:
@@ -140,19 +144,166 @@ class LazyModule:
         return self._inst is not None
 
 
+class DictionaryEncodedColumn:
+    """
+    Dictionary-encoded column for the columnar bridge transport (see ``standardize_dict``).
+
+    ``levels`` - list of unique values in order of their first appearance,
+    ``codes`` - int32 buffer of indices into ``levels``, -1 stands for a missing value.
+
+    Kotlin side (``TypeUtils`` in the python-extension) recognizes the object by its class name.
+    """
+    __slots__ = ('levels', 'codes')
+
+    def __init__(self, levels: List, codes: memoryview):
+        self.levels = levels
+        self.codes = codes
+
+    def __len__(self):
+        return len(self.codes)
+
+    def tolist(self) -> List:
+        return [self.levels[code] if code >= 0 else None for code in self.codes.tolist()]
+
+
+class _ColumnCache:
+    """
+    LRU cache of the data columns converted by ``standardize_dict(columnar=True)``.
+
+    Makes a data frame shared by several layers, subplots or repeated exports of the same plot
+    to be converted only once.
+
+    Only the columns whose data can't be modified in place are cached: read-only numpy arrays
+    (with read-only base arrays) and pandas columns backed by Arrow arrays (e.g. the default string columns of pandas 3).
+    The key is the identity of the column storage: the buffer pointer, shape, strides and dtype of a numpy array
+    or the id of an Arrow array (the cache holds a reference to the storage, so neither can be reused).
+    The cache can be disabled by ``LetsPlot.set({'column_cache': False})``.
+    """
+
+    MAX_BYTES = 256 * 1024 * 1024
+    MIN_LENGTH = 1024  # Small columns are cheap to convert.
+
+    def __init__(self, max_bytes: int = MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (storage, result, nbytes)
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, storage, value, convert: Callable):
+        """
+        Return the cached result of ``convert(value)``, where ``storage`` is the array holding the column data:
+        ``value`` itself or the extension array of a pandas Series.
+        """
+        if len(storage) < self.MIN_LENGTH or not _is_column_cache_enabled():
+            return convert(value)
+
+        key, storage = self._key(storage)
+        if key is None:
+            return convert(value)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        result = convert(value)
+
+        nbytes = max(_estimate_nbytes(result), getattr(storage, 'nbytes', 0))
+        if nbytes <= self.max_bytes:
+            with self._lock:
+                self._remove(key)
+                self._entries[key] = (storage, result, nbytes)
+                self._total_bytes += nbytes
+                while self._total_bytes > self.max_bytes:
+                    self._remove(next(iter(self._entries)))
+
+        return result
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry[2]
+
+    @staticmethod
+    def _key(storage):
+        """
+        Return the key and the immutable storage of the column data, or (None, None) if the data can be modified.
+        """
+        if isinstance(storage, numpy.ndarray):
+            if not _is_read_only(storage):
+                return None, None
+            address = storage.__array_interface__['data'][0]
+            return ('ndarray', str(storage.dtype), address, storage.shape, storage.strides), storage
+
+        if pandas.lazy_is_instance(storage, 'arrays.ArrowExtensionArray'):
+            # An in-place modification of the column replaces the Arrow array.
+            arrow_array = storage.__arrow_array__()
+            return ('arrow', str(storage.dtype), id(arrow_array)), arrow_array
+
+        return None, None
+
+
+def _is_read_only(arr) -> bool:
+    # A read-only view of a writeable array still changes with the array.
+    while isinstance(arr, numpy.ndarray):
+        if arr.flags.writeable:
+            return False
+        arr = arr.base
+    return arr is None or isinstance(arr, bytes) or pyarrow.lazy_is_instance(arr, 'Buffer')
+
+
+def _is_column_cache_enabled() -> bool:
+    if not has_global_value(COLUMN_CACHE):
+        return True
+    return get_global_bool(COLUMN_CACHE)
+
+
+def _estimate_nbytes(standardized_column) -> int:
+    if isinstance(standardized_column, memoryview):
+        return standardized_column.nbytes
+    if isinstance(standardized_column, DictionaryEncodedColumn):
+        return standardized_column.codes.nbytes + sum(len(level) + 50 for level in standardized_column.levels)
+    if isinstance(standardized_column, list):
+        return len(standardized_column) * 32  # Pointer + a boxed float
+    return 0
+
+
 pandas = LazyModule('pandas')
 geopandas = LazyModule('geopandas')
 numpy = LazyModule('numpy')
 jax = LazyModule('jax')
 polars = LazyModule('polars')
+pyarrow = LazyModule('pyarrow')
+pyarrow_compute = LazyModule('pyarrow.compute')
 shapely = LazyModule('shapely')
 
 
 # Parameter 'value' can also be pandas.DataFrame
-def standardize_dict(value: Dict) -> Dict:
+def standardize_dict(value: Dict, columnar: bool = False) -> Dict:
+    """
+    Convert the dict (or a data frame) into the structure of Python built-in types.
+
+    With ``columnar=True`` the 1-dimensional numeric, temporal and boolean columns are not expanded
+    into lists but exported as contiguous ``memoryview`` buffers (float64 or bool) which
+    ``lets_plot_kotlin_bridge`` reads without per-element conversion. Missing values (NaN, NaT)
+    are encoded as NaN in float64 buffers. Categorical and repetitive string columns are exported
+    as ``DictionaryEncodedColumn``. The result is only suitable for passing to the bridge
+    (it is not JSON-serializable).
+    polars and pyarrow columns are converted by the polars and Arrow compute functions
+    straight from the Arrow buffers, honoring the null masks.
+    """
     result = {}
     for k, v in value.items():
-        result[_standardize_value(k)] = _standardize_value(v)
+        result[_standardize_value(k)] = _standardize_value(v, columnar)
 
     return result
 
@@ -170,7 +321,79 @@ def is_ndarray(data) -> bool:
     return False
 
 
-def _standardize_value(v):
+def _to_column_buffer(v) -> Union[memoryview, None]:
+    """
+    Export 1-dimensional numpy array as a contiguous buffer for the columnar bridge transport.
+    Return None if the array dtype is not supported by the transport.
+    """
+    kind = v.dtype.kind
+    if kind in 'fiu':
+        # No copy if the array is already a contiguous float64 array.
+        # Non-finite values are treated as missing on the Kotlin side.
+        return memoryview(numpy.ascontiguousarray(v, dtype=numpy.float64))
+
+    if kind == 'M' or kind == 'm':
+        unit = 'datetime64[ms]' if kind == 'M' else 'timedelta64[ms]'
+        buf = v.astype(unit).astype(numpy.int64).astype(numpy.float64)
+        buf[numpy.isnat(v)] = numpy.nan
+        return memoryview(buf)
+
+    if kind == 'b':
+        return memoryview(numpy.ascontiguousarray(v))
+
+    return None
+
+
+# The number of values checked before the dictionary encoding of a long column.
+_DICTIONARY_SAMPLE_SIZE = 1024
+
+
+def _to_dictionary_column(v, always: bool = False) -> Union[DictionaryEncodedColumn, None]:
+    """
+    Dictionary-encode a 1-dimensional array-like of strings (or a pandas categorical).
+    Return None if the values are not strings or (unless ``always``) are not repetitive enough
+    to make the encoding worth it.
+    """
+    if not always and not _is_repetitive_strings_sample(v):
+        return None
+
+    if pandas.is_loaded:
+        # Vectorized, keeps the order of appearance and reuses codes of a categorical.
+        # Missing values (None, NaN, NA) are coded as -1.
+        codes, uniques = pandas.factorize(v)
+        uniques = numpy.asarray(uniques)
+    elif isinstance(v, numpy.ndarray) and v.dtype.kind == 'U':
+        uniques, first_index, inverse = numpy.unique(v, return_index=True, return_inverse=True)
+        # numpy.unique() sorts the values: restore the order of appearance.
+        order = numpy.argsort(first_index)
+        remap = numpy.empty_like(order)
+        remap[order] = numpy.arange(len(order))
+        codes = remap[inverse.reshape(-1)]
+        uniques = uniques[order]
+    else:
+        return None
+
+    if not always and len(uniques) * 2 > len(codes):
+        return None
+
+    levels = uniques.tolist()
+    if not all(isinstance(level, str) for level in levels):
+        return None
+
+    return DictionaryEncodedColumn(levels, memoryview(numpy.ascontiguousarray(codes, dtype=numpy.int32)))
+
+
+def _is_repetitive_strings_sample(v: 'numpy.ndarray') -> bool:
+    # An evenly spaced sample (short columns as a whole) of strings and missing values, at most a half of them unique.
+    # Other values (e.g. lists) may be not hashable.
+    sample = v if len(v) <= _DICTIONARY_SAMPLE_SIZE else v[::len(v) // _DICTIONARY_SAMPLE_SIZE]
+    if v.dtype.kind == 'O':
+        if not all(isinstance(x, str) or x is None or isinstance(x, float) and math.isnan(x) for x in sample):
+            return False
+    return len(set(sample.tolist())) * 2 <= len(sample)
+
+
+def _standardize_value(v, columnar: bool = False):
     # Notes:
     # - Check libs first, because they may have custom types derived from built-in types that require special handling,
     #   e.g. pandas.NaT is a datetime subclass, but missing .timestamp() method and will fail in a regular conversion.
@@ -187,6 +410,11 @@ def _standardize_value(v):
                     # 0-dim array: process the single value. Don't use item() - it may break datetime64
                     return _standardize_value(v[()])
 
+                if columnar and v.ndim == 1:
+                    if v.flags.c_contiguous and (v.dtype == numpy.float64 or v.dtype == numpy.bool_):
+                        return memoryview(v)  # No conversion is needed.
+                    return _column_cache.get(v, v, _standardize_column_array)
+
                 # Optimization
                 kind = v.dtype.kind
                 if kind == 'f':  # Floats
@@ -237,9 +465,12 @@ def _standardize_value(v):
 
         if pandas.likely_defines(v):
             if isinstance(v, pandas.DataFrame):  # don't use is_dict_like - Series is dict-like, but should be list
-                return standardize_dict(v)
+                return standardize_dict(v, columnar)
             if pandas.api.types.is_list_like(v):
-                return _standardize_value(v.to_numpy())
+                if columnar and numpy.ndim(v) == 1 and isinstance(v.dtype, pandas.api.extensions.ExtensionDtype):
+                    # Columns backed by numpy arrays are cached by the array (see above).
+                    return _column_cache.get(getattr(v, 'array', v), v, _standardize_pandas_extension_column)
+                return _standardize_value(v.to_numpy(), columnar)
             if pandas.isna(v):
                 return None
             if isinstance(v, pandas.Timestamp):
@@ -251,19 +482,29 @@ def _standardize_value(v):
 
         if polars.likely_defines(v):
             if isinstance(v, polars.DataFrame):
-                return standardize_dict(v.to_dict())
+                return standardize_dict(v.to_dict(), columnar)
             if isinstance(v, polars.Series):
-                return _standardize_value(v.to_numpy())
+                if columnar:
+                    return _standardize_polars_column(v)
+                return _standardize_value(v.to_numpy(), columnar)
+
+        if pyarrow.likely_defines(v):
+            if isinstance(v, (pyarrow.Table, pyarrow.RecordBatch)):
+                return standardize_dict({name: v.column(name) for name in v.column_names}, columnar)
+            if isinstance(v, (pyarrow.ChunkedArray, pyarrow.Array)):
+                if columnar:
+                    return _standardize_arrow_column(v)
+                return _standardize_value(v.to_numpy(zero_copy_only=False), columnar)
 
         # Modern JAX arrays may be jax.Array without reporting a jax.* implementation module.
         # Do not use jax.likely_defines() - can be provided by jaxlib and won't pass the check.
         # Use string lookup because the dependency floor (>=0.3.25) still allows JAX versions without jax.Array.
         if jax.lazy_is_instance(v, 'Array'):
-            return _standardize_value(numpy.array(v))
+            return _standardize_value(numpy.array(v), columnar)
 
         if jax.likely_defines(v):
             if isinstance(v, jax.numpy.ndarray):
-                return _standardize_value(numpy.array(v))
+                return _standardize_value(numpy.array(v), columnar)
             if isinstance(v, jax.numpy.floating):
                 return float(v) if math.isfinite(v) else None
             if isinstance(v, jax.numpy.integer):
@@ -271,7 +512,7 @@ def _standardize_value(v):
 
         if geopandas.likely_defines(v):
             if isinstance(v, geopandas.GeoDataFrame):
-                return standardize_dict(v)
+                return standardize_dict(v, columnar)
             if isinstance(v, geopandas.GeoSeries):
                 return [_standardize_value(element) for element in v]
 
@@ -281,9 +522,10 @@ def _standardize_value(v):
 
         # python containers
         if isinstance(v, dict):
-            return standardize_dict(v)
+            return standardize_dict(v, columnar)
         if isinstance(v, list):
-            return [_standardize_value(elem) for elem in v]
+            # e.g. the list of layers: their data is also subject to the columnar export.
+            return [_standardize_value(elem, columnar) for elem in v]
         if isinstance(v, tuple):
             return [_standardize_value(elem) for elem in v]
         if isinstance(v, set):
@@ -315,6 +557,155 @@ def _standardize_value(v):
             # Standard Python timedelta: to milliseconds
             return v / timedelta(milliseconds=1)
 
+        if is_arrow_c_data(v):
+            return _standardize_value(arrow_c_data_to_pyarrow(v), columnar)
+
         return repr(v)
     except Exception as e:
         raise Exception('Failed to standardize type {0} ({1})'.format(type(v), str(v)[:100])) from e
+
+
+def is_arrow_c_data(v) -> bool:
+    """
+    Whether the object exposes the Arrow PyCapsule interface.
+    https://arrow.apache.org/docs/format/CDataInterface/PyCapsuleInterface.html
+    """
+    return hasattr(type(v), '__arrow_c_stream__') or hasattr(type(v), '__arrow_c_array__')
+
+
+def arrow_c_data_to_pyarrow(v):
+    """
+    Import an object exposing the Arrow PyCapsule interface (``__arrow_c_stream__`` or ``__arrow_c_array__``)
+    without copying the buffers: tabular (struct) data to ``pyarrow.Table``, other data
+    to ``pyarrow.ChunkedArray`` or ``pyarrow.Array``.
+    """
+    if hasattr(type(v), '__arrow_c_stream__'):
+        arr = pyarrow.chunked_array(v)
+    else:
+        arr = pyarrow.array(v)
+
+    if pyarrow.types.is_struct(arr.type):
+        return pyarrow.Table.from_struct_array(arr)
+    return arr
+
+
+def _standardize_column_array(v):
+    """
+    Convert 1-dimensional numpy array for the columnar bridge transport (see ``standardize_dict``).
+    """
+    buf = _to_column_buffer(v)
+    if buf is not None:
+        return buf
+    if v.dtype.kind in 'OU':
+        col = _to_dictionary_column(v)
+        if col is not None:
+            return col
+    return _standardize_value(v)
+
+
+def _standardize_pandas_extension_column(v):
+    if isinstance(v.dtype, pandas.CategoricalDtype):
+        col = _to_dictionary_column(v, always=True)
+        if col is not None:
+            return col
+
+    arr = _pandas_extension_to_numpy(v)
+    return _standardize_column_array(arr if arr is not None else v.to_numpy())
+
+
+def _pandas_extension_to_numpy(v):
+    """
+    Convert pandas extension arrays (nullable Int64/Float64, tz-aware datetime) to a plain numpy array
+    suitable for the column buffer. Otherwise, ``to_numpy()`` would produce an object array.
+    Return None for other dtypes.
+    """
+    dtype = getattr(v, 'dtype', None)
+    if not isinstance(dtype, pandas.api.extensions.ExtensionDtype):
+        return None
+
+    if dtype.kind in 'fiu':
+        return v.to_numpy(dtype=numpy.float64, na_value=numpy.nan)
+    if dtype.kind == 'M':
+        # tz-aware timestamps: UTC instants, same as Timestamp.timestamp()
+        return v.to_numpy(dtype='datetime64[ns]', na_value=numpy.datetime64('NaT'))
+
+    return None
+
+
+def _standardize_polars_column(v):
+    """
+    Convert polars Series for the columnar bridge transport (see ``standardize_dict``)
+    with polars compute functions, without Python objects for the values.
+    Null values are encoded as NaN in float64 buffers or as -1 codes of dictionary-encoded columns.
+    """
+    dtype = v.dtype
+    if dtype.is_numeric():
+        buf = v
+    elif isinstance(dtype, polars.Datetime):
+        buf = v.dt.epoch('ms')  # UTC instants, same as Timestamp.timestamp()
+    elif dtype == polars.Date:
+        buf = v.cast(polars.Datetime('ms')).dt.epoch('ms')
+    elif isinstance(dtype, polars.Duration):
+        buf = v.dt.total_milliseconds()
+    elif dtype == polars.Time:
+        buf = v.cast(polars.Int64) // 1_000_000  # ns to ms since midnight
+    elif dtype == polars.Boolean and v.null_count() == 0:
+        return memoryview(v.to_numpy())
+    elif dtype == polars.String or isinstance(dtype, (polars.Categorical, polars.Enum)):
+        v = v.cast(polars.String)
+        levels = v.drop_nulls().unique(maintain_order=True)
+        if dtype == polars.String and len(levels) * 2 > len(v):
+            return v.to_list()
+
+        codes = v.cast(polars.Enum(levels)).to_physical().cast(polars.Int32).fill_null(-1)
+        return DictionaryEncodedColumn(levels.to_list(), memoryview(codes.to_numpy()))
+    else:
+        return _standardize_value(v.to_numpy(), columnar=True)
+
+    return memoryview(buf.cast(polars.Float64).fill_null(float('nan')).to_numpy())
+
+
+def _standardize_arrow_column(v):
+    """
+    Convert pyarrow Array or ChunkedArray for the columnar bridge transport (see ``standardize_dict``)
+    with Arrow compute functions, without Python objects for the values.
+    Null values are encoded as NaN in float64 buffers or as -1 codes of dictionary-encoded columns.
+    """
+    if isinstance(v, pyarrow.ChunkedArray):
+        # combine_chunks() always copies: keep the single chunk (e.g. memory-mapped) as is.
+        v = v.chunk(0) if v.num_chunks == 1 else v.combine_chunks()
+
+    types = pyarrow.types
+    dtype = v.type
+    if types.is_integer(dtype) or types.is_floating(dtype) or types.is_decimal(dtype):
+        buf = v
+    elif types.is_timestamp(dtype):
+        buf = v.cast(pyarrow.timestamp('ms', tz=dtype.tz), safe=False).cast(pyarrow.int64())
+    elif types.is_date(dtype):
+        buf = v.cast(pyarrow.timestamp('ms')).cast(pyarrow.int64())
+    elif types.is_duration(dtype):
+        buf = v.cast(pyarrow.duration('ms'), safe=False).cast(pyarrow.int64())
+    elif types.is_time(dtype):
+        buf = v.cast(pyarrow.time32('ms'), safe=False).cast(pyarrow.int32())
+    elif types.is_boolean(dtype) and v.null_count == 0:
+        return memoryview(v.to_numpy(zero_copy_only=False))
+    elif _is_arrow_string(dtype) or types.is_dictionary(dtype) and _is_arrow_string(dtype.value_type):
+        if types.is_dictionary(dtype):
+            v = v.cast(dtype.value_type)  # The dictionary may be unordered and contain unused values.
+        encoded = pyarrow_compute.dictionary_encode(v)
+        if not types.is_dictionary(dtype) and len(encoded.dictionary) * 2 > len(v):
+            return v.to_pylist()
+
+        codes = pyarrow_compute.fill_null(encoded.indices, -1).cast(pyarrow.int32())
+        return DictionaryEncodedColumn(encoded.dictionary.to_pylist(), memoryview(codes.to_numpy()))
+    else:
+        return _standardize_value(v.to_numpy(zero_copy_only=False), columnar=True)
+
+    return memoryview(buf.cast(pyarrow.float64()).to_numpy(zero_copy_only=False))
+
+
+def _is_arrow_string(dtype) -> bool:
+    return pyarrow.types.is_string(dtype) or pyarrow.types.is_large_string(dtype)
+
+
+_column_cache = _ColumnCache()
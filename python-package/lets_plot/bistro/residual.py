@@ -13,6 +13,7 @@ from ._plot2d_common import _get_bin_params_2d, _get_geom2d_layer, _get_marginal
 np = LazyModule('numpy')
 pd = LazyModule('pandas')
 pl = LazyModule('polars')
+pa = LazyModule('pyarrow')
 
 __all__ = ['residual_plot']
 
@@ -103,8 +104,11 @@ def _get_stat_data(data, x, y, group_by, method, deg, span, seed, max_n):
         df = pd.DataFrame(data)
     elif isinstance(data, pd.DataFrame):
         df = data.copy()
-    elif pl is not None and isinstance(data, pl.DataFrame):
-        df = pd.DataFrame(data.to_dict(as_series=False))
+    elif pl.lazy_is_instance(data, 'DataFrame'):
+        # Column by column, without the conversion of the values to Python objects.
+        df = pd.DataFrame({name: data.get_column(name).to_numpy() for name in data.columns})
+    elif pa.lazy_is_instance(data, 'Table'):
+        df = data.to_pandas()
     else:
         raise Exception("Unsupported type of data: {0}".format(data))
     df = df[(df[x].notna()) & df[y].notna()]
@@ -136,7 +140,7 @@ def residual_plot(data=None, x=None, y=None, *,
 
     Parameters
     ----------
-    data : dict or Pandas or Polars ``DataFrame``
+    data : dict or Pandas or Polars ``DataFrame`` or PyArrow ``Table``
         The data to be displayed.
     x : str
         Name of independent variable.
@@ -0,0 +1,8 @@
+#  Copyright (c) 2026. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+from .chunked_ import *
+from .mmap_ import *
+
+__all__ = (chunked_.__all__ +
+           mmap_.__all__)
@@ -0,0 +1,182 @@
+#  Copyright (c) 2026. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+import os
+from typing import Any, Dict, Iterator, List, Optional
+
+from .._type_utils import LazyModule, DictionaryEncodedColumn, _standardize_value, is_arrow_c_data, \
+    arrow_c_data_to_pyarrow
+
+numpy = LazyModule('numpy')
+pandas = LazyModule('pandas')
+polars = LazyModule('polars')
+pyarrow = LazyModule('pyarrow')
+pyarrow_csv = LazyModule('pyarrow.csv')
+pyarrow_ipc = LazyModule('pyarrow.ipc')
+pyarrow_parquet = LazyModule('pyarrow.parquet')
+
+__all__ = ['chunked']
+
+DEF_CHUNK_SIZE = 1_000_000
+
+_PARQUET_EXTENSIONS = ('.parquet', '.pq')
+_CSV_EXTENSIONS = ('.csv', '.tsv')
+_ARROW_EXTENSIONS = ('.arrow', '.feather', '.ipc')
+
+
+class ChunkedData:
+    """
+    Plot data read chunk by chunk (see ``chunked()``).
+    """
+
+    def __init__(self, source, chunk_size: int):
+        self._source = source
+        self._chunk_size = chunk_size
+        self._consumed = False
+        self.column_types: Optional[Dict[str, str]] = None
+
+    def chunks(self, columns: Optional[List[str]]) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate the chunks of the data as dicts of 1-dimensional numpy arrays (all columns if ``columns`` is None).
+
+        Numeric, temporal and boolean columns are float64 or bool arrays with NaN for missing values
+        (temporal values are converted to milliseconds, the same way as for the bridge),
+        other columns are object arrays with None for missing values.
+        The series types of the columns are inferred from the first chunk (see ``column_types``).
+        """
+        from ..plot.series_meta import _infer_type
+
+        for chunk in self._raw_chunks(columns):
+            chunk = _as_frame(chunk)
+            if self.column_types is None:
+                self.column_types = _infer_type(chunk)
+            yield {name: _to_numpy(_column(chunk, name)) for name in (columns or _column_names(chunk))}
+
+    def _raw_chunks(self, columns: Optional[List[str]]):
+        source = self._source
+        if isinstance(source, (str, os.PathLike)):
+            yield from _read_file(os.fspath(source), columns, self._chunk_size)
+        elif callable(source):
+            yield from source()
+        elif isinstance(source, (list, tuple)):
+            yield from source
+        else:
+            if self._consumed:
+                raise ValueError("The chunks iterator is exhausted: the data has to be read more than once.\n"
+                                 "Pass a function returning a new iterator to chunked() instead.")
+            self._consumed = True
+            yield from source
+
+
+def chunked(source, *, chunk_size: int = DEF_CHUNK_SIZE) -> ChunkedData:
+    """
+    Plot data which is not loaded into memory at once but read chunk by chunk.
+
+    A layer with chunked data computes its stat in Python, consuming the chunks one by one,
+    and passes only the stat result to the plot (with ``stat='identity'``).
+    Supported stats: 'bin', 'bin2d', 'count', 'summary' (with 'count', 'sum', 'mean', 'min', 'max' functions),
+    'ecdf' and 'identity' (a random sample of the rows, see the ``sampling`` parameter of the layer).
+
+    Parameters
+    ----------
+    source : str or os.PathLike or list or callable or iterable
+        The data chunks: pandas, polars ``DataFrame``, pyarrow ``Table`` or ``RecordBatch``,
+        dict of columns or any object exposing the Arrow PyCapsule interface.
+        The source may be a path to a Parquet, CSV or Arrow IPC (Feather) file (requires pyarrow),
+        a list of chunks, a function returning an iterable of chunks, or an iterable of chunks.
+        Most stats need two passes over the data, so an iterator (which can only be consumed once)
+        is only suitable for the 'count' and 'identity' stats.
+    chunk_size : int, default=1000000
+        Number of rows per chunk read from a Parquet file.
+
+    Returns
+    -------
+    ``ChunkedData``
+        Data source to pass as the ``data`` argument of a layer.
+
+    Notes
+    -----
+    All mappings used by the layer must be specified in the layer itself.
+    Bins are computed over the range of the layer data (not of the whole plot).
+
+    Examples
+    --------
+    .. code-block:: python
+        :linenos:
+        :emphasize-lines: 11
+
+        import numpy as np
+        import pandas as pd
+        from lets_plot import *
+        from lets_plot.data import chunked
+        LetsPlot.setup_html()
+        def read_chunks():
+            rng = np.random.default_rng(42)
+            for _ in range(10):
+                yield pd.DataFrame({'x': rng.normal(size=100_000)})
+        ggplot() + \\
+            geom_histogram(aes(x='x'), data=chunked(read_chunks), bins=50)
+
+    """
+    if isinstance(source, ChunkedData):
+        return source
+    return ChunkedData(source, chunk_size)
+
+
+def _read_file(path: str, columns: Optional[List[str]], chunk_size: int):
+    ext = os.path.splitext(path)[1].lower()
+    if ext in _PARQUET_EXTENSIONS:
+        yield from pyarrow_parquet.ParquetFile(path).iter_batches(batch_size=chunk_size, columns=columns)
+    elif ext in _CSV_EXTENSIONS:
+        parse_options = pyarrow_csv.ParseOptions(delimiter='\t' if ext == '.tsv' else ',')
+        convert_options = pyarrow_csv.ConvertOptions(include_columns=columns or [])
+        yield from pyarrow_csv.open_csv(path, parse_options=parse_options, convert_options=convert_options)
+    elif ext in _ARROW_EXTENSIONS:
+        reader = pyarrow_ipc.open_file(path)
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            yield batch.select(columns) if columns is not None else batch
+    else:
+        raise ValueError("Unsupported file format: '{}'. Use one of: {}.".format(
+            path, ', '.join(_PARQUET_EXTENSIONS + _CSV_EXTENSIONS + _ARROW_EXTENSIONS)))
+
+
+def _as_frame(chunk):
+    if pyarrow.lazy_is_instance(chunk, 'RecordBatch'):
+        return pyarrow.Table.from_batches([chunk])
+    if isinstance(chunk, dict) or pandas.lazy_is_instance(chunk, 'DataFrame') \
+            or polars.lazy_is_instance(chunk, 'DataFrame') or pyarrow.lazy_is_instance(chunk, 'Table'):
+        return chunk
+    if is_arrow_c_data(chunk):
+        return arrow_c_data_to_pyarrow(chunk)
+    raise ValueError("Unsupported type of data chunk: {}".format(type(chunk).__name__))
+
+
+def _column_names(chunk) -> List[str]:
+    if polars.lazy_is_instance(chunk, 'DataFrame'):
+        return chunk.columns
+    if pyarrow.lazy_is_instance(chunk, 'Table'):
+        return chunk.column_names
+    return list(chunk.keys())
+
+
+def _column(chunk, name: str):
+    if name not in _column_names(chunk):
+        raise ValueError("Variable '{}' is not found in the data chunk.".format(name))
+
+    if pyarrow.lazy_is_instance(chunk, 'Table'):
+        return chunk.column(name)
+    return chunk[name]
+
+
+def _to_numpy(column):
+    standardized = _standardize_value(column, columnar=True)
+    if isinstance(standardized, memoryview):
+        return numpy.asarray(standardized)
+    if isinstance(standardized, DictionaryEncodedColumn):
+        levels = numpy.array(standardized.levels + [None], dtype=object)
+        return levels[numpy.asarray(standardized.codes)]  # -1 code is the missing value
+
+    values = numpy.empty(len(standardized), dtype=object)
+    values[:] = standardized
+    return values
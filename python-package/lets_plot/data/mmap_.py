@@ -0,0 +1,58 @@
+#  Copyright (c) 2026. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+import os
+from typing import List, Optional
+
+from .._type_utils import LazyModule
+
+pyarrow_feather = LazyModule('pyarrow.feather')
+
+__all__ = ['mmap']
+
+
+def mmap(path, *, columns: Optional[List[str]] = None):
+    """
+    Plot data memory-mapped from an Arrow IPC (Feather) file.
+
+    The numeric columns of the file are passed to the plot without reading them into Python objects:
+    float64 columns without nulls are exported straight from the mapped file pages (without copying),
+    so several processes rendering plots from the same file share the OS page cache.
+    Requires pyarrow.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Path to the Arrow IPC (Feather V2) or Feather V1 file.
+    columns : list of str
+        Names of the columns to read. By default, all columns are read.
+
+    Returns
+    -------
+    ``pyarrow.Table``
+        Table backed by the memory-mapped file, to pass as the ``data`` argument of a plot or a layer.
+
+    Notes
+    -----
+    Columns are exported without copying only if the file is written uncompressed as a single record batch,
+    for example, ``pyarrow.feather.write_feather(df, path, compression='uncompressed', chunksize=len(df))``.
+    Compressed files are decompressed to memory, columns of several record batches are concatenated.
+
+    Examples
+    --------
+    .. code-block:: python
+        :linenos:
+        :emphasize-lines: 9
+
+        import numpy as np
+        import pandas as pd
+        import pyarrow.feather
+        from lets_plot import *
+        from lets_plot.data import mmap
+        LetsPlot.setup_html()
+        df = pd.DataFrame({'x': np.random.normal(size=1000), 'y': np.random.normal(size=1000)})
+        pyarrow.feather.write_feather(df, 'data.arrow', compression='uncompressed', chunksize=len(df))
+        ggplot(mmap('data.arrow'), aes('x', 'y')) + geom_point()
+
+    """
+    return pyarrow_feather.read_table(os.fspath(path), columns=columns, memory_map=True)
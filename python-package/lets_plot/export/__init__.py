@@ -2,5 +2,6 @@
 #  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
 
 from .ggsave_ import *
+from .ggsave_batch_ import *
 
-__all__ = ggsave_.__all__
+__all__ = ggsave_.__all__ + ggsave_batch_.__all__
@@ -3,21 +3,22 @@
 
 import os
 from os.path import join
-from typing import Union, Optional
+from typing import Union, Optional, Iterable, List
 
 from ..plot.core import PlotSpec
-from ..plot.core import _to_svg, _to_html, _to_mvg, _export_as_raster
+from ..plot.core import _to_svg, _to_html, _to_mvg, _to_pdf, _to_pdf_pages, _export_as_raster, \
+    _export_formats
 from ..plot.plot import GGBunch
 from ..plot.subplots import SupPlotsSpec
 
-__all__ = ['ggsave']
+__all__ = ['ggsave', 'ggsave_pages']
 
 _DEF_EXPORT_DIR = "lets-plot-images"
 
 
-def ggsave(plot: Union[PlotSpec, SupPlotsSpec, GGBunch], filename: str, *, path: str = None, iframe: bool = True,
-           scale: float = None, w: Optional[float] = None, h: Optional[float] = None, unit: Optional[str] = None,
-           dpi: Optional[int] = None) -> str:
+def ggsave(plot: Union[PlotSpec, SupPlotsSpec, GGBunch], filename: Union[str, List[str]], *, path: str = None,
+           iframe: bool = True, scale: float = None, w: Optional[float] = None, h: Optional[float] = None,
+           unit: Optional[str] = None, dpi: Optional[int] = None) -> Union[str, List[str]]:
     """
     Export plot to a file.
     Supported formats: PNG, SVG, PDF, HTML.
@@ -29,9 +30,11 @@ def ggsave(plot: Union[PlotSpec, SupPlotsSpec, GGBunch], filename: str, *, path:
     ----------
     plot : ``PlotSpec``
         Plot specification to export.
-    filename : str
+    filename : str or list of str
         Name of the file. It must end with a file extension corresponding
-        to one of the supported formats: SVG, HTML (or HTM), PNG, PDF (requires the pillow library).
+        to one of the supported formats: SVG, HTML (or HTM), PNG, PDF.
+        A list of names exports the plot to several files at once, e.g. ``['plot.svg', 'plot.png', 'plot.pdf']``:
+        the plot data is processed (statistics, transforms) only once for all SVG, PNG and PDF files.
     path : str
         Path to a directory to save image files in.
         By default, it is ${user.dir}/lets-plot-images.
@@ -42,6 +45,7 @@ def ggsave(plot: Union[PlotSpec, SupPlotsSpec, GGBunch], filename: str, *, path:
     scale : float, default=2.0
         Scaling factor for raster output.
         Only applicable when exporting to PNG or PDF.
+        For PDF, it scales the page size and the default value is 1.0.
     w : float, default=None
         Width of the output image in units.
         Only applicable when exporting to SVG, PNG, or PDF.
@@ -53,7 +57,7 @@ def ggsave(plot: Union[PlotSpec, SupPlotsSpec, GGBunch], filename: str, *, path:
         Only applicable when exporting to SVG, PNG, or PDF.
     dpi : int, default=300
         Resolution in dots per inch.
-        Only applicable when exporting to PNG or PDF.
+        Only applicable when exporting to PNG.
         The default value depends on the unit:
 
         - for 'px' it is 96 (output image will have the same pixel size as ``w``, and ``h`` values)
@@ -61,8 +65,9 @@ def ggsave(plot: Union[PlotSpec, SupPlotsSpec, GGBunch], filename: str, *, path:
 
     Returns
     -------
-    str
+    str or list of str
         Absolute pathname of the created file.
+        A list of pathnames if a list of file names is given.
 
     Notes
     -----
@@ -75,7 +80,7 @@ def ggsave(plot: Union[PlotSpec, SupPlotsSpec, GGBunch], filename: str, *, path:
 
     The output format is inferred from the filename extension.
 
-    For PNG, and PDF formats:
+    For PNG format:
 
     - If ``w``, ``h``, ``unit``, and ``dpi`` are all specified:
 
@@ -99,6 +104,12 @@ def ggsave(plot: Union[PlotSpec, SupPlotsSpec, GGBunch], filename: str, *, path:
         - The plot maintains its aspect ratio, preserving layout, tick labels, and other visual elements.
         - Useful for generating high-resolution images suitable for publication.
 
+    For PDF format:
+
+    - The plot is exported as vector graphics, the page size is the plot's pixel size converted to inches
+      using the standard display PPI of 96 and multiplied by ``scale``.
+    - If ``w``, ``h``, and ``unit`` are specified, the plot is resized to fit the specified ``w`` x ``h`` area.
+
     For SVG format:
 
     - If ``w``, ``h``, and ``unit`` are specified:
@@ -144,29 +155,152 @@ def ggsave(plot: Union[PlotSpec, SupPlotsSpec, GGBunch], filename: str, *, path:
     if not (isinstance(plot, PlotSpec) or isinstance(plot, SupPlotsSpec) or isinstance(plot, GGBunch)):
         raise ValueError("PlotSpec, SupPlotsSpec or GGBunch expected but was: {}".format(type(plot)))
 
-    filename = filename.strip()
-    name, ext = os.path.splitext(filename)
-
-    if not name:
-        raise ValueError("Malformed filename: '{}'.".format(filename))
-    if not ext:
-        raise ValueError("Missing file extension: '{}'.".format(filename))
-
     if not path:
         path = join(os.getcwd(), _DEF_EXPORT_DIR)
 
-    pathname = join(path, filename)
+    if not isinstance(filename, str):
+        return _save_formats(plot, list(filename), path=path, iframe=iframe, scale=scale, w=w, h=h, unit=unit,
+                             dpi=dpi)
 
-    ext = ext[1:].lower()
+    pathname, ext = _parse_filename(filename, path)
     if ext == 'svg':
         return _to_svg(plot, pathname, w=w, h=h, unit=unit)
     elif ext in ['html', 'htm']:
         return _to_html(plot, pathname, iframe=iframe)
-    elif ext in ['png', 'pdf']:
+    elif ext == 'png':
         return _export_as_raster(plot, pathname, scale, export_format=ext, w=w, h=h, unit=unit, dpi=dpi)
+    elif ext == 'pdf':
+        return _to_pdf(plot, pathname, scale, w=w, h=h, unit=unit, dpi=dpi)
     elif ext == 'mvg':
         return _to_mvg(plot, pathname, scale, w=w, h=h, unit=unit, dpi=dpi)
     else:
         raise ValueError(
             "Unsupported file extension: '{}'\nPlease use one of: 'png', 'svg', 'pdf', 'html', 'htm'".format(ext)
         )
+
+
+# The formats exported by a single call to the plotting engine, see _save_formats().
+_RENDERED_FORMATS = ['svg', 'png', 'pdf']
+
+
+def _parse_filename(filename: str, path: str):
+    filename = filename.strip()
+    name, ext = os.path.splitext(filename)
+
+    if not name:
+        raise ValueError("Malformed filename: '{}'.".format(filename))
+    if not ext:
+        raise ValueError("Missing file extension: '{}'.".format(filename))
+
+    return join(path, filename), ext[1:].lower()
+
+
+def _save_formats(plot, filenames: List[str], *, path: str, iframe, scale, w, h, unit, dpi) -> List[str]:
+    if not filenames:
+        raise ValueError("No file names to export to.")
+
+    parsed = [_parse_filename(filename, path) for filename in filenames]
+    for filename, (_, ext) in zip(filenames, parsed):
+        if ext not in _RENDERED_FORMATS + ['html', 'htm', 'mvg']:
+            raise ValueError(
+                "Unsupported file extension: '{}'\nPlease use one of: 'png', 'svg', 'pdf', 'html', 'htm'".format(ext)
+            )
+
+    rendered = [i for i, (_, ext) in enumerate(parsed) if ext in _RENDERED_FORMATS]
+
+    result: List[Optional[str]] = [None] * len(filenames)
+    if len(rendered) > 1:
+        pathnames = _export_formats(plot,
+                                    [parsed[i][0] for i in rendered],
+                                    [parsed[i][1] for i in rendered],
+                                    scale, w=w, h=h, unit=unit, dpi=dpi)
+        for i, pathname in zip(rendered, pathnames):
+            result[i] = pathname
+
+    for i, filename in enumerate(filenames):
+        if result[i] is None:
+            result[i] = ggsave(plot, filename, path=path, iframe=iframe, scale=scale, w=w, h=h, unit=unit, dpi=dpi)
+    return result
+
+
+def ggsave_pages(plots: Iterable[Union[PlotSpec, SupPlotsSpec, GGBunch]], filename: str, *, path: str = None,
+                 scale: float = None, w: Optional[float] = None, h: Optional[float] = None,
+                 unit: Optional[str] = None, dpi: Optional[int] = None, workers: Optional[int] = None) -> str:
+    """
+    Export several plots to a multi-page PDF file, one page per plot.
+
+    The exported file is created in the directory ${user.dir}/lets-plot-images
+    if not specified otherwise (see the ``path`` parameter).
+
+    Parameters
+    ----------
+    plots : iterable of ``PlotSpec``, ``SupPlotsSpec`` or ``GGBunch``
+        Plot specifications to export, in the order of the pages.
+    filename : str
+        Name of the file. It must end with the '.pdf' extension.
+    path : str
+        Path to a directory to save the file in.
+        By default, it is ${user.dir}/lets-plot-images.
+    scale : float, default=1.0
+        Scaling factor of the page size.
+    w : float, default=None
+        Width of the pages in units.
+    h : float, default=None
+        Height of the pages in units.
+    unit : {'in', 'cm', 'mm', 'px'}, default='in'
+        Unit of the page size. One of: 'in', 'cm', 'mm' or 'px'.
+    dpi : int, default=None
+        Not used: the vector output doesn't depend on the resolution.
+    workers : int, default=None
+        Maximum number of threads rendering the pages.
+        By default, it is the number of CPUs.
+
+    Returns
+    -------
+    str
+        Absolute pathname of the created file.
+
+    Notes
+    -----
+    The pages are the same as exported by ``ggsave()`` to PDF,
+    but the fonts are embedded in the document once and shared by all pages.
+
+    The plots are rendered in a single call to the plotting engine.
+
+    Examples
+    --------
+    .. jupyter-execute::
+        :linenos:
+        :emphasize-lines: 7
+
+        import numpy as np
+        from lets_plot import *
+        LetsPlot.setup_html()
+        np.random.seed(42)
+        data = {'x': np.random.normal(size=100)}
+        plots = [ggplot(data, aes('x')) + geom_histogram(bins=bins) + ggtitle('bins={}'.format(bins)) for bins in [5, 10, 20]]
+        ggsave_pages(plots, 'report.pdf', w=6, h=4, unit='in')
+
+    """
+
+    plots = list(plots)
+    if not plots:
+        raise ValueError("No plots to export.")
+    for plot in plots:
+        if not (isinstance(plot, PlotSpec) or isinstance(plot, SupPlotsSpec) or isinstance(plot, GGBunch)):
+            raise ValueError("PlotSpec, SupPlotsSpec or GGBunch expected but was: {}".format(type(plot)))
+    if workers is not None and workers < 1:
+        raise ValueError("The number of workers must be positive but was: {}".format(workers))
+
+    filename = filename.strip()
+    name, ext = os.path.splitext(filename)
+
+    if not name:
+        raise ValueError("Malformed filename: '{}'.".format(filename))
+    if ext.lower() != '.pdf':
+        raise ValueError("Unsupported file extension: '{}'\nPlease use 'pdf'".format(ext[1:]))
+
+    if not path:
+        path = join(os.getcwd(), _DEF_EXPORT_DIR)
+
+    return _to_pdf_pages(plots, join(path, filename), scale, w=w, h=h, unit=unit, dpi=dpi, workers=workers)
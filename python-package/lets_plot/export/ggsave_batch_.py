@@ -0,0 +1,198 @@
+#  Copyright (c) 2026. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, BrokenExecutor, wait, \
+    FIRST_COMPLETED
+from os.path import join
+from typing import Iterable, Optional, List, Union, Callable, Tuple, Dict
+
+from .ggsave_ import ggsave, _DEF_EXPORT_DIR
+
+__all__ = ['ggsave_batch']
+
+_EXECUTORS = ['process', 'thread']
+
+# An item is tried again in a new pool if a worker process dies (e.g. killed by the OS) while exporting it.
+_MAX_ATTEMPTS = 2
+
+# The worker pools are kept between the calls: the workers have the plotting engine and the fonts already loaded.
+_pools: Dict[Tuple[str, int], Executor] = {}
+_pools_lock = threading.Lock()
+
+
+def ggsave_batch(items: Iterable, *, path: str = None, workers: Optional[int] = None, executor: str = 'process',
+                 on_result: Callable[[int, Union[str, Exception]], None] = None, **options) -> List[
+    Union[str, Exception]]:
+    """
+    Export many plots to files in parallel.
+
+    The plots are exported by a pool of worker processes (or threads) which is kept
+    for the subsequent calls, so the plotting engine and the fonts are loaded only once per worker.
+
+    Parameters
+    ----------
+    items : iterable
+        Plots to export. Each item is either a tuple ``(plot, filename)``, a tuple ``(plot, filename, options)``
+        or a dictionary with the ``plot`` and ``filename`` keys and other `ggsave() <https://lets-plot.org/python/pages/api/lets_plot.ggsave.html>`__ parameters.
+        The item options override the common options.
+    path : str
+        Path to a directory to save the files in.
+        By default, it is ${user.dir}/lets-plot-images.
+    workers : int
+        Number of worker processes (or threads).
+        By default, it is the number of CPUs.
+    executor : {'process', 'thread'}, default='process'
+        The kind of workers.
+        The threads share the memory with the caller (the plots are not copied to the workers),
+        the processes are more robust and also run the Python code of the export in parallel.
+    on_result : callable
+        Function called as soon as an item is exported: ``on_result(index, result)``,
+        where the result is the same as in the returned list.
+    options
+        Other `ggsave() <https://lets-plot.org/python/pages/api/lets_plot.ggsave.html>`__ parameters
+        (``scale``, ``w``, ``h``, ``unit``, ``dpi``, ``iframe``) common for all items.
+
+    Returns
+    -------
+    list
+        For each item in the order of the items: the absolute pathname of the created file,
+        or the exception raised while exporting the item.
+        A failed item doesn't stop the export of the other items.
+
+    Notes
+    -----
+    The worker processes are started with the 'spawn' method: the plots and the results are pickled,
+    and the scripts calling ``ggsave_batch()`` with the 'process' executor must guard the main code
+    with ``if __name__ == '__main__':``.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import numpy as np
+        from lets_plot import *
+        from lets_plot.export import ggsave_batch
+        if __name__ == '__main__':
+            np.random.seed(42)
+            data = {'x': np.random.normal(size=100)}
+            items = [(ggplot(data, aes('x')) + geom_histogram(bins=bins), 'hist_{}.png'.format(bins)) for bins in range(5, 50, 5)]
+            results = ggsave_batch(items, workers=4, w=6, h=4, unit='in')
+            failed = [r for r in results if isinstance(r, Exception)]
+
+    """
+
+    if executor not in _EXECUTORS:
+        raise ValueError("Unsupported executor: '{}'. Please use one of: {}".format(executor, _EXECUTORS))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("The number of workers must be positive but was: {}".format(workers))
+
+    # The workers may not share the current directory of the caller.
+    path = os.path.abspath(path if path else join(os.getcwd(), _DEF_EXPORT_DIR))
+
+    tasks = []
+    for item in items:
+        plot, filename, item_options = _parse_item(item)
+        tasks.append((plot, filename, path, dict(options, **item_options)))
+
+    results: List[Union[str, Exception, None]] = [None] * len(tasks)
+    attempts = [0] * len(tasks)
+    pending = {}  # future -> (item index, pool)
+
+    def submit(i, broken_pool=None):
+        attempts[i] += 1
+        pool = _get_pool(executor, workers, broken=broken_pool)
+        pending[pool.submit(_save_item, *tasks[i])] = (i, pool)
+
+    for i in range(len(tasks)):
+        submit(i)
+
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            i, pool = pending.pop(future)
+            try:
+                results[i] = future.result()
+            except BrokenExecutor as e:
+                if attempts[i] < _MAX_ATTEMPTS:
+                    # All items pending in the broken pool are retried in the same new pool.
+                    submit(i, broken_pool=pool)
+                    continue
+                results[i] = e
+            except Exception as e:
+                results[i] = e
+
+            if on_result is not None:
+                on_result(i, results[i])
+
+    return results
+
+
+def _parse_item(item) -> Tuple[object, str, dict]:
+    if isinstance(item, dict):
+        item_options = dict(item)
+        if 'plot' not in item_options or 'filename' not in item_options:
+            raise ValueError("The 'plot' and 'filename' keys expected in the item: {}".format(sorted(item)))
+        return item_options.pop('plot'), item_options.pop('filename'), item_options
+
+    if isinstance(item, (tuple, list)) and len(item) in (2, 3):
+        item_options = item[2] if len(item) == 3 else {}
+        if not isinstance(item_options, dict):
+            raise ValueError("The item options must be a dict but was: {}".format(type(item_options)))
+        return item[0], item[1], item_options
+
+    raise ValueError("(plot, filename), (plot, filename, options) or dict expected but was: {}".format(type(item)))
+
+
+def _save_item(plot, filename: str, path: str, options: dict) -> str:
+    return ggsave(plot, filename, path=path, **options)
+
+
+def _warm_up():
+    # Loads the plotting engine and the fonts in the worker.
+    from ..plot.core import _export_as_raster
+    from ..plot.plot import ggplot, ggsize
+    from ..plot.geom import geom_blank
+    from ..plot.label import ggtitle
+    try:
+        _export_as_raster(ggplot() + geom_blank() + ggtitle('_') + ggsize(10, 10), _NullOutput(), 1.0, 'png')
+    except Exception:
+        pass  # The errors are reported by the items.
+
+
+class _NullOutput:
+    def write(self, content):
+        pass
+
+
+def _get_pool(executor: str, workers: int, broken: Executor = None) -> Executor:
+    """
+    Return the pool of the workers, a new one if there is no pool yet or the current pool is ``broken``.
+    """
+    key = (executor, workers)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool is broken:
+            if pool is not None:
+                pool.shutdown(wait=False)
+            if executor == 'process':
+                pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                           initializer=_warm_up)
+            else:
+                pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='lets-plot-export',
+                                          initializer=_warm_up)
+            _pools[key] = pool
+        return pool
+
+
+@atexit.register
+def _shutdown_pools():
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown(wait=False)
+        _pools.clear()
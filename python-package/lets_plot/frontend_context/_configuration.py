@@ -8,8 +8,10 @@ from ._frontend_ctx import FrontendContext
 from ._html_contexts import _create_html_frontend_context, _create_wb_html_frontend_context
 from ._json_contexts import _create_json_frontend_context, _is_Intellij_Python_Lets_Plot_Plugin
 from ._mime_types import TEXT_HTML, LETS_PLOT_JSON
+from ._static_html_page_ctx import StaticHtmlPageContext
 from ._static_svg_ctx import StaticSvgImageContext
 from ._webbr_html_page_ctx import WebBrHtmlPageContext
+from .._global_settings import is_headless
 from .._version import __version__
 from ..plot.core import PlotSpec
 from ..plot.plot import GGBunch
@@ -20,7 +22,7 @@ __all__ = []
 _frontend_contexts: Dict[str, FrontendContext] = {}
 
 _default_mimetype = TEXT_HTML
-if _is_Intellij_Python_Lets_Plot_Plugin():
+if not is_headless() and _is_Intellij_Python_Lets_Plot_Plugin():
     _default_mimetype = LETS_PLOT_JSON
     _frontend_contexts[LETS_PLOT_JSON] = _create_json_frontend_context()
 
@@ -35,6 +37,10 @@ def _setup_html_context(*,
     Configures Lets-Plot HTML output.
     See the docstring in `setup_html()` for details on parameters.
     """
+    if is_headless():
+        # Export-only mode: no frontend to configure.
+        return
+
     global _default_mimetype
     if _default_mimetype == LETS_PLOT_JSON:
         # Plots will be rendered by Lets-Plot IntelliJ plugin.
@@ -87,6 +93,11 @@ def _display_plot(spec: Any):
             ctx.show(spec.as_dict())
             return
 
+        if is_headless():
+            # The spec may hold the whole data: don't build or print it.
+            print("Lets-Plot headless mode: plot is not displayed, use ggsave() to export it.")
+            return
+
         # If ctx is None, _as_html() will try to initialize the context lazily
         plot_html = _as_html(spec.as_dict())
         try:
@@ -115,6 +126,11 @@ def _as_html(plot_spec: Dict) -> str:
     """
     ctx = _frontend_contexts.get(TEXT_HTML)
 
+    if ctx is None and is_headless():
+        # A complete HTML page: doesn't depend on the environment.
+        ctx = StaticHtmlPageContext(offline=False)
+        _frontend_contexts[TEXT_HTML] = ctx
+
     if ctx is None:
         # Set up HTML context lazily
         _setup_html_context(isolated_frame=None,
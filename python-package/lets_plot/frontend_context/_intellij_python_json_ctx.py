@@ -7,6 +7,7 @@ from typing import Dict, Tuple
 
 from ._frontend_ctx import FrontendContext
 from ._mime_types import LETS_PLOT_JSON
+from .._data_pruning import prune_unused_data
 from .._type_utils import standardize_dict
 
 
@@ -16,7 +17,7 @@ class IntellijPythonJsonContext(FrontendContext):
         pass
 
     def show(self, plot_spec: Dict) -> str:
-        plot_spec_std = standardize_dict(plot_spec)
+        plot_spec_std = standardize_dict(prune_unused_data(plot_spec))
         data_object = DisplayDataObject(plot_spec_std)
 
         # See intellij.python.helpers module in IDEA
@@ -2,65 +2,93 @@
 # Copyright (c) 2019. JetBrains s.r.o.
 # Use of this source code is governed by the MIT license that can be found in the LICENSE file.
 #
-from .annotation import *
-from .coord import *
-from .core import *
-from .expand_limits_ import *
-from .facet import *
-from .font_features import *
-from .geom import *
-from .geom_extras import *
-from .geom_function_ import *
-from .geom_imshow_ import *
-from .geom_livemap_ import *
-from .ggbunch_ import *
-from .ggdeck_ import *
-from .gggrid_ import *
-from .ggtb_ import *
-from .guide import *
-from .label import *
-from .marginal_layer import *
-from .plot import *
-from .pos import *
-from .sampling import *
-from .scale import *
-from .scale_colormap_mpl import *
-from .scale_convenience import *
-from .scale_identity_ import *
-from .scale_position import *
-from .stat import *
-from .theme_ import *
-from .theme_set import *
-from .tooltip import *
+import importlib
 
-__all__ = (coord.__all__ +
-           core.__all__ +
-           facet.__all__ +
-           geom.__all__ +
-           geom_extras.__all__ +
-           geom_function_.__all__ +
-           geom_imshow_.__all__ +
-           geom_livemap_.__all__ +
-           guide.__all__ +
-           label.__all__ +
-           plot.__all__ +
-           pos.__all__ +
-           sampling.__all__ +
-           scale.__all__ +
-           scale_colormap_mpl.__all__ +
-           scale_convenience.__all__ +
-           scale_identity_.__all__ +
-           scale_position.__all__ +
-           stat.__all__ +
-           theme_.__all__ +
-           theme_set.__all__ +
-           tooltip.__all__ +
-           annotation.__all__ +
-           marginal_layer.__all__ +
-           font_features.__all__ +
-           ggbunch_.__all__ +
-           ggdeck_.__all__ +
-           gggrid_.__all__ +
-           ggtb_.__all__ +
-           expand_limits_.__all__
-           )
+# Public names by submodule.
+# The submodules are imported on the first access to any of their names (PEP 562),
+# so that ``import lets_plot`` doesn't load the whole API.
+_EXPORTS = {
+    'annotation': ['layer_labels', 'smooth_labels'],
+    'coord': ['coord_cartesian', 'coord_fixed', 'coord_map', 'coord_flip', 'coord_polar'],
+    'core': ['aes', 'layer'],
+    'expand_limits_': ['expand_limits'],
+    'facet': ['facet_grid', 'facet_wrap'],
+    'font_features': ['font_metrics_adjustment', 'font_family_info'],
+    'geom': [
+        'geom_point', 'geom_path', 'geom_line', 'geom_smooth', 'geom_bar', 'geom_histogram', 'geom_dotplot',
+        'geom_bin2d', 'geom_hex', 'geom_tile', 'geom_raster', 'geom_errorbar', 'geom_crossbar', 'geom_linerange',
+        'geom_pointrange', 'geom_contour', 'geom_contourf', 'geom_polygon', 'geom_map', 'geom_abline', 'geom_hline',
+        'geom_vline', 'geom_band', 'geom_boxplot', 'geom_violin', 'geom_sina', 'geom_ydotplot', 'geom_area_ridges',
+        'geom_ribbon', 'geom_area', 'geom_density', 'geom_density2d', 'geom_density2df', 'geom_pointdensity',
+        'geom_jitter', 'geom_qq', 'geom_qq2', 'geom_qq_line', 'geom_qq2_line', 'geom_freqpoly', 'geom_step',
+        'geom_rect', 'geom_segment', 'geom_curve', 'geom_spoke', 'geom_text', 'geom_label', 'geom_text_repel',
+        'geom_label_repel', 'geom_pie', 'geom_lollipop', 'geom_bracket', 'geom_bracket_dodge', 'geom_count',
+        'geom_blank'],
+    'geom_extras': ['arrow'],
+    'geom_function_': ['geom_function'],
+    'geom_imshow_': ['geom_imshow'],
+    'geom_livemap_': ['geom_livemap'],
+    'ggbunch_': ['ggbunch'],
+    'ggdeck_': ['ggdeck'],
+    'gggrid_': ['gggrid'],
+    'ggtb_': ['ggtb'],
+    'guide': ['guide_legend', 'guide_colorbar', 'guides', 'layer_key'],
+    'label': ['ggtitle', 'labs', 'xlab', 'ylab'],
+    'marginal_layer': ['ggmarginal'],
+    'plot': ['ggplot', 'ggsize', 'GGBunch'],
+    'pos': [
+        'position_dodge', 'position_dodgev', 'position_jitter', 'position_nudge', 'position_jitterdodge',
+        'position_stack', 'position_fill'],
+    'sampling': [
+        'sampling_random', 'sampling_random_stratified', 'sampling_pick', 'sampling_systematic',
+        'sampling_group_random', 'sampling_group_systematic', 'sampling_vertex_vw', 'sampling_vertex_dp'],
+    'scale': [
+        'scale_shape', 'scale_manual', 'scale_color_manual', 'scale_fill_manual', 'scale_size_manual',
+        'scale_shape_manual', 'scale_linetype_manual', 'scale_alpha_manual', 'scale_continuous',
+        'scale_fill_continuous', 'scale_color_continuous', 'scale_gradient', 'scale_fill_gradient',
+        'scale_color_gradient', 'scale_gradient2', 'scale_fill_gradient2', 'scale_color_gradient2', 'scale_gradientn',
+        'scale_fill_gradientn', 'scale_color_gradientn', 'scale_hue', 'scale_fill_hue', 'scale_color_hue',
+        'scale_discrete', 'scale_fill_discrete', 'scale_color_discrete', 'scale_grey', 'scale_fill_grey',
+        'scale_color_grey', 'scale_brewer', 'scale_fill_brewer', 'scale_color_brewer', 'scale_viridis',
+        'scale_fill_viridis', 'scale_color_viridis', 'scale_alpha', 'scale_size', 'scale_size_area', 'scale_linewidth',
+        'scale_stroke'],
+    'scale_colormap_mpl': ['scale_cmapmpl', 'scale_fill_cmapmpl', 'scale_color_cmapmpl'],
+    'scale_convenience': ['lims', 'xlim', 'ylim'],
+    'scale_identity_': [
+        'scale_identity', 'scale_color_identity', 'scale_fill_identity', 'scale_shape_identity',
+        'scale_linetype_identity', 'scale_alpha_identity', 'scale_size_identity', 'scale_linewidth_identity',
+        'scale_stroke_identity'],
+    'scale_position': [
+        'scale_x_discrete', 'scale_y_discrete', 'scale_x_discrete_reversed', 'scale_y_discrete_reversed',
+        'scale_x_continuous', 'scale_y_continuous', 'scale_x_log10', 'scale_y_log10', 'scale_x_log2', 'scale_y_log2',
+        'scale_x_reverse', 'scale_y_reverse', 'scale_x_datetime', 'scale_y_datetime', 'scale_x_time', 'scale_y_time'],
+    'stat': ['stat_summary', 'stat_summary_bin', 'stat_ecdf', 'stat_sum'],
+    'theme_': [
+        'theme', 'element_blank', 'element_line', 'element_rect', 'element_text', 'element_markdown', 'margin',
+        'element_geom'],
+    'theme_set': [
+        'theme_grey', 'theme_gray', 'theme_light', 'theme_classic', 'theme_minimal', 'theme_minimal2', 'theme_none',
+        'theme_bw', 'theme_void', 'flavor_darcula', 'flavor_solarized_light', 'flavor_solarized_dark',
+        'flavor_high_contrast_light', 'flavor_high_contrast_dark', 'flavor_standard'],
+    'tooltip': ['layer_tooltips'],
+}
+
+_MODULE_BY_NAME = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULE_BY_NAME)
+
+
+def __getattr__(name):
+    if name in _MODULE_BY_NAME:
+        value = getattr(importlib.import_module('.' + _MODULE_BY_NAME[name], __name__), name)
+    elif name in _EXPORTS:
+        value = importlib.import_module('.' + name, __name__)
+    else:
+        raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -197,7 +197,7 @@ def _specs_to_dict(opts_raw):
     opts = {}
     for k, v in opts_raw.items():
         if isinstance(v, FeatureSpec):
-            opts[k] = v.as_dict()
+            opts[k] = _spec_dict(v)
         elif isinstance(v, dict):
             opts[k] = _specs_to_dict(v)
         else:
@@ -206,6 +206,40 @@ def _specs_to_dict(opts_raw):
     return _filter_none(opts)
 
 
+def _spec_dict(spec) -> dict:
+    # The specs overriding as_dict() build their dicts by themselves and are not cached.
+    if type(spec).as_dict is FeatureSpec.as_dict:
+        return spec._dict()
+    return spec.as_dict()
+
+
+# The properties holding the data: the data may be modified in place, so the dicts of such specs are not cached.
+_DATA_PROPS = ['data', 'map']
+
+
+def _copy_spec_dict(d: dict) -> dict:
+    # Copies the containers of the spec structure, the data is passed by reference as by _specs_to_dict().
+    return {k: v if k in _DATA_PROPS else _copy_spec_value(v) for k, v in d.items()}
+
+
+def _copy_spec_value(v):
+    if isinstance(v, dict):
+        return _copy_spec_dict(v)
+    if isinstance(v, list) and any(isinstance(e, dict) for e in v):
+        return [_copy_spec_value(e) for e in v]
+    return v
+
+
+def _collect_specs(opts_raw, out):
+    for v in opts_raw.values():
+        if isinstance(v, FeatureSpec):
+            out.append(v)
+        elif isinstance(v, dict):
+            _collect_specs(v, out)
+
+    return out
+
+
 class FeatureSpec():
     """
     A base class of the plot objects.
@@ -225,8 +259,12 @@ class FeatureSpec():
         if name is not None:
             self.__props['name'] = name
         self.__props.update(**kwargs)
+        # as_dict() result and the dicts of the nested specs it was built of.
+        self.__dict_cache = None
 
     def props(self):
+        # The properties may be modified by the caller: drop the cached dict.
+        self.__dict_cache = None
         return self.__props
 
     def as_dict(self):
@@ -250,7 +288,37 @@ class FeatureSpec():
             p = ggplot({'x': [0], 'y': [0]}) + geom_point(aes('x', 'y'))
             p.as_dict()
         """
-        return _specs_to_dict(self.props())
+        return _copy_spec_dict(self._dict())
+
+    def _dict(self) -> dict:
+        """
+        Return the dictionary of the object which may be shared with the cache and shouldn't be modified.
+        """
+        return self._cached_dict(self._props_to_dict, self._nested_specs())
+
+    def _props_to_dict(self):
+        return _specs_to_dict(self.__props)
+
+    def _nested_specs(self) -> list:
+        return _collect_specs(self.__props, [])
+
+    def _cached_dict(self, build, nested_specs) -> dict:
+        """
+        Return the dict built by ``build()`` and cached until ``props()`` is accessed
+        or the dict of any of ``nested_specs`` is rebuilt. The objects with data are not cached.
+        """
+        if any(self.__props.get(prop) is not None for prop in _DATA_PROPS):
+            self.__dict_cache = None
+            return build()
+
+        nested_dicts = [_spec_dict(spec) if spec is not None else None for spec in nested_specs]
+        cache = self.__dict_cache
+        if cache is None or len(cache[1]) != len(nested_dicts) \
+                or any(d is not cached_d for d, cached_d in zip(nested_dicts, cache[1])):
+            cache = (build(), nested_dicts)
+            self.__dict_cache = cache
+
+        return cache[0]
 
     def __str__(self):
         return json.dumps(self.as_dict(), indent=2)
@@ -397,81 +465,135 @@ class PlotSpec(FeatureSpec):
 
         elif isinstance(other, FeatureSpec):
             plot = PlotSpec.duplicate(self)
-            if other.kind == 'layer':
-                if other.props()['geom'] == 'livemap':
-                    plot.__is_livemap = True
-
-                if geopandas.lazy_is_instance(other.props().get('data'), 'GeoDataFrame') \
-                        or geopandas.lazy_is_instance(other.props().get('map'), 'GeoDataFrame'):
-                    if plot.__crs_initialized:
-                        if plot.__crs != other.props().get('use_crs'):
-                            raise ValueError(
-                                'All geoms with map parameter should either use same `use_crs` or not use it at all')
-                    else:
-                        plot.__crs_initialized = True
-                        plot.__crs = other.props().get('use_crs')
-
-                if plot.__is_livemap and plot.__crs is not None:
-                    raise ValueError("livemap doesn't support `use_crs`")
-
-                other.before_append(plot.__is_livemap)
-                plot.__layers.append(other)
-                return plot
-
-            if other.kind == 'scale':
-                plot.__scales.append(other)
-                return plot
-
-            if other.kind == 'theme':
-                new_theme_options = {k: v for k, v in other.props().items() if v is not None}
-                if 'name' in new_theme_options:
-                    # keep the previously specified flavor
-                    if plot.props().get('theme', {}).get('flavor', None) is not None:
-                        new_theme_options.update({'flavor': plot.props()['theme']['flavor']})
-
-                    # pre-configured theme overrides existing theme altogether.
-                    plot.props()['theme'] = new_theme_options
+            plot.__append(other)
+            return plot
+
+        return super().__add__(other)
+
+    def extend(self, features):
+        """
+        Add several specs to the ``PlotSpec`` object at once.
+
+        Same as ``p + f1 + f2 + ...`` but the plot is copied only once,
+        so that adding many layers (or other features) takes linear time.
+
+        Parameters
+        ----------
+        features : iterable of ``FeatureSpec``
+            Layers, scales, themes and other specs to add to the plot.
+
+        Returns
+        -------
+        ``PlotSpec``
+            New plot object. The original plot is not modified.
+
+        Examples
+        --------
+        .. jupyter-execute::
+            :linenos:
+            :emphasize-lines: 6
+
+            import numpy as np
+            from lets_plot import *
+            LetsPlot.setup_html()
+            x = np.linspace(0, 2 * np.pi, 50)
+            p = ggplot() + ggsize(600, 300)
+            p.extend([geom_line(x=x, y=np.sin(x + k / 10), color=k) for k in range(20)])
+
+        """
+        plot = PlotSpec.duplicate(self)
+        for feature in features:
+            if not isinstance(feature, FeatureSpec):
+                raise TypeError('unsupported operand type(s) for +: {} and {}'
+                                .format(self.__class__, feature.__class__))
+            plot.__append(feature)
+        return plot
+
+    def __append(self, other):
+        # Adds the feature to this plot in place:
+        # only to be used with a fresh copy made by `duplicate()`.
+        if isinstance(other, DummySpec):
+            return
+
+        if other.kind == 'layer':
+            if other.props()['geom'] == 'livemap':
+                self.__is_livemap = True
+
+            if geopandas.lazy_is_instance(other.props().get('data'), 'GeoDataFrame') \
+                    or geopandas.lazy_is_instance(other.props().get('map'), 'GeoDataFrame'):
+                if self.__crs_initialized:
+                    if self.__crs != other.props().get('use_crs'):
+                        raise ValueError(
+                            'All geoms with map parameter should either use same `use_crs` or not use it at all')
                 else:
-                    # merge themes
-                    old_theme_options = plot.props().get('theme', {})
-                    plot.props()['theme'] = _theme_dicts_merge(old_theme_options, new_theme_options)
+                    self.__crs_initialized = True
+                    self.__crs = other.props().get('use_crs')
 
-                return plot
+            if self.__is_livemap and self.__crs is not None:
+                raise ValueError("livemap doesn't support `use_crs`")
 
-            if other.kind == 'metainfo':
-                plot.__metainfo_list.append(other)
-                return plot
+            other.before_append(self.__is_livemap)
+            self.__layers.append(other)
+            return
 
-            if isinstance(other, FeatureSpecArray):
-                for spec in other.elements():
-                    plot = plot.__add__(spec)
-                return plot
-
-            if other.kind == 'guides':
-                existing_options = plot.props().get('guides', {})
-                plot.props()['guides'] = _merge_dicts_recursively(existing_options, other.as_dict())
-                return plot
-
-            if other.kind == 'mapping':  # +aes(..)
-                # existing_spec = plot.props().get('mapping', aes())
-                # merged_mapping = {**existing_spec.as_dict(), **other.as_dict()}
-                # plot.props()['mapping'] = aes(**merged_mapping)
-                from lets_plot.plot.util import update_plot_aes_mapping  # local import to break circular reference
-                update_plot_aes_mapping(plot, other)
-                return plot
-
-            # add feature to properties
-            plot.props()[other.kind] = other
-            return plot
+        if other.kind == 'scale':
+            self.__scales.append(other)
+            return
 
-        return super().__add__(other)
+        if other.kind == 'theme':
+            new_theme_options = {k: v for k, v in other.props().items() if v is not None}
+            if 'name' in new_theme_options:
+                # keep the previously specified flavor
+                if self.props().get('theme', {}).get('flavor', None) is not None:
+                    new_theme_options.update({'flavor': self.props()['theme']['flavor']})
 
-    def as_dict(self):
-        d = super().as_dict()
+                # pre-configured theme overrides existing theme altogether.
+                self.props()['theme'] = new_theme_options
+            else:
+                # merge themes
+                old_theme_options = self.props().get('theme', {})
+                self.props()['theme'] = _theme_dicts_merge(old_theme_options, new_theme_options)
+
+            return
+
+        if other.kind == 'metainfo':
+            self.__metainfo_list.append(other)
+            return
+
+        if isinstance(other, FeatureSpecArray):
+            for spec in other.elements():
+                self.__append(spec)
+            return
+
+        if other.kind == 'guides':
+            existing_options = self.props().get('guides', {})
+            self.props()['guides'] = _merge_dicts_recursively(existing_options, other.as_dict())
+            return
+
+        if other.kind == 'mapping':  # +aes(..)
+            # existing_spec = self.props().get('mapping', aes())
+            # merged_mapping = {**existing_spec.as_dict(), **other.as_dict()}
+            # self.props()['mapping'] = aes(**merged_mapping)
+            from lets_plot.plot.util import update_plot_aes_mapping  # local import to break circular reference
+            update_plot_aes_mapping(self, other)
+            return
+
+        # add feature to properties
+        self.props()[other.kind] = other
+
+    def _dict(self):
+        nested_specs = self._nested_specs() + self.__scales + self.__layers + self.__metainfo_list
+        return self._cached_dict(self.__to_dict, nested_specs)
+
+    def __to_dict(self):
+        d = self._props_to_dict()
         d['kind'] = self.kind
-        d['scales'] = [scale.as_dict() for scale in self.__scales]
-        d['layers'] = [layer.as_dict() for layer in self.__layers]
-        d['metainfo_list'] = [metainfo.as_dict() for metainfo in self.__metainfo_list]
+        d['scales'] = [_spec_dict(scale) for scale in self.__scales]
+        d['layers'] = [_spec_dict(layer) for layer in self.__layers]
+        if self.__layers:
+            # The stats are applied in Python only when the plot mapping, facets and scales are known.
+            d['layers'] = [layer._stat_applied_dict(layer_dict, d) for layer, layer_dict in zip(self.__layers, d['layers'])]
+        d['metainfo_list'] = [_spec_dict(metainfo) for metainfo in self.__metainfo_list]
         return d
 
     def __str__(self):
@@ -697,6 +819,8 @@ class PlotSpec(FeatureSpec):
         """
         Export a plot to a file or to a file-like object in PDF format.
 
+        The plot is exported as vector graphics: a single page with selectable text.
+
         Plots containing ``geom_livemap()`` are not supported.
 
         Parameters
@@ -707,20 +831,16 @@ class PlotSpec(FeatureSpec):
             Can be either a string specifying a file path or a file-like object.
             If a string is provided, the result will be exported to the file at that path.
             If a file-like object is provided, the result will be exported to that object.
-        scale : float
-            Scaling factor for raster output. Default value is 2.0.
+        scale : float, default=1.0
+            Scaling factor of the page size.
         w : float, default=None
-            Width of the output image in units.
+            Width of the page in units.
         h : float, default=None
-            Height of the output image in units.
+            Height of the page in units.
         unit : {'in', 'cm', 'mm', 'px'}, default='in'
-            Unit of the output image. One of: 'in', 'cm', 'mm' or 'px'.
-        dpi : int, default=300
-            Resolution in dots per inch.
-            The default value depends on the unit:
-
-            - for 'px' it is 96 (output image will have the same pixel size as ``w`` and ``h`` values)
-            - for physical units ('in', 'cm', 'mm') it is 300
+            Unit of the page size. One of: 'in', 'cm', 'mm' or 'px'.
+        dpi : int, default=None
+            Not used: the vector output doesn't depend on the resolution.
 
 
         Returns
@@ -730,27 +850,12 @@ class PlotSpec(FeatureSpec):
 
         Notes
         -----
-        - If ``w``, ``h``, ``unit``, and ``dpi`` are all specified:
-
-          - The plot's pixel size (default or set by `ggsize() <https://lets-plot.org/python/pages/api/lets_plot.ggsize.html>`__) is ignored.
-          - The output size is calculated using the specified ``w``, ``h``, ``unit``, and ``dpi``.
-
-            - The plot is resized to fit the specified ``w`` x ``h`` area, which may affect the layout, tick labels, and other elements.
-
-        - If only ``dpi`` is specified:
-
-          - The plot's pixel size (default or set by `ggsize() <https://lets-plot.org/python/pages/api/lets_plot.ggsize.html>`__) is converted to inches using the standard display PPI of 96.
-          - The output size is then calculated based on the specified DPI.
-
-            - The plot maintains its aspect ratio, preserving layout, tick labels, and other visual elements.
-            - Useful for printing - the plot will appear nearly the same size as on screen.
-
-        - If ``w``, ``h`` are not specified:
-
-          - The ``scale`` parameter is used to determine the output size.
-
-            - The plot maintains its aspect ratio, preserving layout, tick labels, and other visual elements.
-            - Useful for generating high-resolution images suitable for publication.
+        - The page size is the plot's pixel size (default or set by `ggsize() <https://lets-plot.org/python/pages/api/lets_plot.ggsize.html>`__)
+          converted to inches using the standard display PPI of 96 and multiplied by ``scale``.
+        - If ``w`` and ``h`` are specified, the plot is resized to fit the specified ``w`` x ``h`` area,
+          which may affect the layout, tick labels, and other elements.
+        - The TrueType fonts are embedded in the document, other fonts are replaced with the standard PDF fonts.
+          The text with the characters a font can't show (e.g. non-Latin text in a standard PDF font) is embedded as an image.
 
         Examples
         --------
@@ -773,7 +878,7 @@ class PlotSpec(FeatureSpec):
             p.to_pdf(file_like)
 
         """
-        return _export_as_raster(self, path, scale, 'pdf', w=w, h=h, unit=unit, dpi=dpi)
+        return _to_pdf(self, path, scale, w=w, h=h, unit=unit, dpi=dpi)
 
 
 class LayerSpec(FeatureSpec):
@@ -797,6 +902,25 @@ class LayerSpec(FeatureSpec):
 
     def __init__(self, **kwargs):
         super().__init__('layer', name=None, **kwargs)
+        # The dict with the stat computed in Python (see the 'stat_pushdown' setting).
+        self.__stat_applied_dict = None
+
+    def props(self):
+        self.__stat_applied_dict = None
+        return super().props()
+
+    def _stat_applied_dict(self, d: dict, plot: dict) -> dict:
+        """
+        Return the layer dict ``d`` with the stat applied if it can be computed in Python for this ``plot``.
+        The stat is computed once, until ``props()`` is accessed.
+        """
+        from lets_plot.plot.util import can_pre_apply_stat, pre_apply_stat  # local import to break circular reference
+
+        if not can_pre_apply_stat(d, plot):
+            return d
+        if self.__stat_applied_dict is None:
+            self.__stat_applied_dict = pre_apply_stat(d)
+        return self.__stat_applied_dict
 
     def before_append(self, is_livemap):
         from .util import normalize_map_join, auto_join_geo_names, geo_data_frame_to_crs, \
@@ -1019,63 +1143,75 @@ def _to_html(spec, path, iframe: bool) -> Union[str, None]:
 
     if path is None:
         return html_page
-    elif isinstance(path, str):
-        abspath = _makedirs(path)
-        with io.open(abspath, mode="w", encoding="utf-8") as f:
-            f.write(html_page)
-            return abspath
-    else:
-        path.write(html_page.encode())
-        return None
+
+    return _write_str(html_page, path)
 
 
 def _export_as_raster(spec, path, scale: float, export_format: str, w=None, h=None, unit=None, dpi=None) -> Union[
     str, None]:
-    import base64
     from .. import _kbridge
 
+    if export_format.lower() == 'pdf':
+        return _to_pdf(spec, path, scale, w=w, h=h, unit=unit, dpi=dpi)
+    elif export_format.lower() != 'png':
+        raise ValueError("Unknown export format: {}".format(export_format))
+
+    png = _kbridge._generate_png_bytes(spec.as_dict(), w, h, unit, dpi, scale)
+    return _write_bytes(png, path)
+
+
+def _to_pdf(spec, path, scale: float, w=None, h=None, unit=None, dpi=None) -> Union[str, None]:
+    from .. import _kbridge
+
+    pdf = _kbridge._generate_pdf_bytes(spec.as_dict(), w, h, unit, dpi, scale)
+    return _write_bytes(pdf, path)
+
+
+def _to_pdf_pages(specs, path, scale: float, w=None, h=None, unit=None, dpi=None, workers=None) -> Union[str, None]:
+    from .. import _kbridge
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    pdf = _kbridge._generate_pdf_pages_bytes([spec.as_dict() for spec in specs], w, h, unit, dpi, scale, workers)
+    return _write_bytes(pdf, path)
+
+
+def _export_formats(spec, paths: List[str], formats: List[str], scale: float, w=None, h=None, unit=None,
+                    dpi=None) -> List[str]:
+    from .. import _kbridge
+
+    images = _kbridge._generate_formats(spec.as_dict(), formats, w, h, unit, dpi, scale)
+
+    result = []
+    for path, image in zip(paths, images):
+        if isinstance(image, str):
+            result.append(_write_str(image, path))
+        else:
+            result.append(_write_bytes(image, path))
+    return result
+
+
+def _write_str(content: str, path) -> Union[str, None]:
     if isinstance(path, str):
-        file_path = _makedirs(path)
-        file_like_object = None
+        abspath = _makedirs(path)
+        with io.open(abspath, mode="w", encoding="utf-8") as f:
+            f.write(content)
+            return abspath
     else:
-        file_like_object = path
-        file_path = None
+        path.write(content.encode())
+        return None
 
-    png_base64 = _kbridge._generate_png(spec.as_dict(), w, h, unit, dpi, scale)
-    png = base64.b64decode(png_base64)
 
-    if export_format.lower() == 'png':
-        if file_path is not None:
-            with open(file_path, 'wb') as f:
-                f.write(png)
-            return file_path
-        else:
-            file_like_object.write(png)
-            return None
-    elif export_format.lower() == 'pdf':
-        try:
-            from PIL import Image
-        except ImportError:
-            import sys
-            print("\n"
-                  "To export Lets-Plot figure to a PDF file please install pillow library"
-                  "to your Python environment.\n"
-                  "Pillow is free and distributed under the MIT-CMU license.\n"
-                  "For more details visit: https://python-pillow.github.io/\n", file=sys.stderr)
-            return None
-
-        with Image.open(io.BytesIO(png)) as img:
-            if img.mode == 'RGBA':
-                img = img.convert('RGB')
-
-            if file_path is not None:
-                img.save(file_path, "PDF", dpi=img.info.get("dpi"))
-                return file_path
-            else:
-                img.save(file_like_object, "PDF", dpi=img.info.get("dpi"))
-                return None
+def _write_bytes(content: bytes, path) -> Union[str, None]:
+    if isinstance(path, str):
+        file_path = _makedirs(path)
+        with open(file_path, 'wb') as f:
+            f.write(content)
+        return file_path
     else:
-        raise ValueError("Unknown export format: {}".format(export_format))
+        path.write(content)
+        return None
 
 
 def _to_mvg(spec, path, scale: float, w=None, h=None, unit=None, dpi=None) -> Union[str, None]:
@@ -3,11 +3,13 @@
 # Use of this source code is governed by the MIT license that can be found in the LICENSE file.
 #
 from lets_plot._type_utils import LazyModule
+from lets_plot.data.chunked_ import ChunkedData
 from lets_plot.geo_data_internals.utils import is_geocoder
 from .annotation import smooth_labels
 from .core import FeatureSpec, LayerSpec
 from .tooltip import layer_tooltips
-from .util import as_annotated_data, geo_data_frame_to_crs, get_geo_data_frame_meta, key_int2str
+from .util import as_annotated_data, geo_data_frame_to_crs, get_geo_data_frame_meta, key_int2str, \
+    apply_stat_to_chunked_data
 
 geopandas = LazyModule('geopandas')
 
@@ -9796,9 +9798,17 @@ def _geom(name, *,
     if is_geocoder(data):
         data = data.get_geocodes()
 
+    pre_applied_stat = None
+    if isinstance(data, ChunkedData):
+        data, mapping, kwargs, pre_applied_stat = apply_stat_to_chunked_data(name, data, mapping, stat, sampling, kwargs)
+        if pre_applied_stat is not None:
+            stat = 'identity'
+
     data = key_int2str(data)
 
     data, mapping, data_meta = as_annotated_data(data, mapping)
+    if pre_applied_stat is not None:
+        data_meta['data_meta']['pre_applied_stat'] = pre_applied_stat
 
     # GDF in a map parameter has higher priority for defining a geo_data_meta
     if geopandas.lazy_is_instance(data, 'GeoDataFrame') and not geopandas.lazy_is_instance(kwargs.get('map'), 'GeoDataFrame'):
@@ -20,9 +20,11 @@ def ggplot(data=None, mapping=None):
 
     Parameters
     ----------
-    data : dict or Pandas or Polars ``DataFrame``
+    data : dict or Pandas or Polars ``DataFrame`` or PyArrow ``Table``
         Default dataset to use for the plot. If not specified,
         must be supplied in each layer added to the plot.
+        Any other tabular data exposing the Arrow PyCapsule interface
+        (``__arrow_c_stream__`` or ``__arrow_c_array__``) is accepted too.
     mapping : ``FeatureSpec``
         Default list of aesthetic mappings to use for the plot.
         If not specified, must be supplied in each layer added to the plot.
@@ -1,13 +1,16 @@
 #  Copyright (c) 2024. JetBrains s.r.o.
 #  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+import time as _time
 from datetime import datetime, date, time
-from typing import Union, Dict, Iterable, Optional
+from typing import Union, Dict, Iterable, Optional, Callable, List
 
+from lets_plot._global_settings import has_global_value, get_global_bool, TYPE_INFERENCE_SAMPLING
 from lets_plot._type_utils import LazyModule
 
 numpy = LazyModule('numpy')
 pandas = LazyModule('pandas')
 polars = LazyModule('polars')
+pyarrow = LazyModule('pyarrow')
 
 TYPE_INTEGER = 'int'
 TYPE_FLOATING = 'float'
@@ -18,32 +21,104 @@ TYPE_DATE = 'date'  # Local date (no time zone)
 TYPE_TIME = 'time'  # Local time (we ignore time zone even if it is present)
 TYPE_UNKNOWN = 'unknown'
 
+# Columns longer than SAMPLING_MIN_SIZE are inferred from a sample: the head, the tail
+# and evenly spaced values in between, SAMPLE_SIZE values in total.
+SAMPLING_MIN_SIZE = 10_000
+SAMPLE_SIZE = 1000
+SAMPLE_HEAD_TAIL_SIZE = 100
 
-def _infer_type(data: Union[Dict, 'pandas.DataFrame', 'polars.DataFrame']) -> Dict[str, str]:
+# The sampled pandas types which are accepted without the scan of the whole column.
+_PANDAS_SAMPLE_DTYPES = {'string', 'floating', 'integer', 'boolean', 'datetime64', 'datetime', 'date', 'time'}
+
+_debug_hook: Optional[Callable[[str, str, float], None]] = None
+
+
+def set_debug_hook(hook: Optional[Callable[[str, str, float], None]]):
+    """
+    Set a function called after the type of each data column is inferred
+    with the column name, the inferred type and the time spent (in seconds).
+    None removes the hook.
+    """
+    global _debug_hook
+    _debug_hook = hook
+
+
+def _infer_type(data: Union[Dict, 'pandas.DataFrame', 'polars.DataFrame', 'pyarrow.Table']) -> Dict[str, str]:
     type_info = {}
 
     if isinstance(data, dict):
         for var_name, var_content in data.items():
-            type_info[var_name] = _infer_type_dict(var_name, var_content)
+            type_info[var_name] = _timed(_infer_type_dict, var_name, var_content)
     elif pandas.lazy_is_instance(data, 'DataFrame'):
         for var_name, var_content in data.items():
-            type_info[var_name] = _infer_type_pandas_dataframe(var_name, var_content)
+            type_info[var_name] = _timed(_infer_type_pandas_dataframe, var_name, var_content)
     elif polars.lazy_is_instance(data, 'DataFrame'):
         for var_name, var_type in data.schema.items():
-            type_info[var_name] = _infer_type_polars_dataframe(var_name, var_type)
+            type_info[var_name] = _timed(_infer_type_polars_dataframe, var_name, var_type)
+    elif pyarrow.lazy_is_instance(data, 'Table'):
+        for field in data.schema:
+            type_info[field.name] = _timed(_infer_type_arrow_table, field.name, field.type)
 
     return type_info
 
 
+def _timed(infer_type: Callable, var_name: str, var_content) -> str:
+    hook = _debug_hook
+    if hook is None:
+        return infer_type(var_name, var_content)
+
+    start = _time.perf_counter()
+    lp_dtype = infer_type(var_name, var_content)
+    hook(var_name, lp_dtype, _time.perf_counter() - start)
+    return lp_dtype
+
+
+def _is_sampling_enabled() -> bool:
+    if not has_global_value(TYPE_INFERENCE_SAMPLING):
+        return True
+    return get_global_bool(TYPE_INFERENCE_SAMPLING)
+
+
+def _sample(var_content) -> Optional[List]:
+    """
+    Return a sample of values of a long list, tuple or 1-dimensional ndarray,
+    or None if the whole column should be inspected.
+    """
+    if not (isinstance(var_content, (list, tuple))
+            or numpy.lazy_is_instance(var_content, 'ndarray') and var_content.ndim == 1):
+        return None
+    if len(var_content) <= SAMPLING_MIN_SIZE or not _is_sampling_enabled():
+        return None
+
+    n = len(var_content)
+    step = (n - 2 * SAMPLE_HEAD_TAIL_SIZE) // (SAMPLE_SIZE - 2 * SAMPLE_HEAD_TAIL_SIZE)
+    return list(var_content[:SAMPLE_HEAD_TAIL_SIZE]) \
+        + list(var_content[SAMPLE_HEAD_TAIL_SIZE:n - SAMPLE_HEAD_TAIL_SIZE:step]) \
+        + list(var_content[n - SAMPLE_HEAD_TAIL_SIZE:])
+
+
 def _infer_type_pandas_dataframe(var_name: str, var_content) -> str:
     if var_content.empty:
         return TYPE_UNKNOWN
-    elif var_content.isna().all():
-        return TYPE_UNKNOWN
+
+    pandas_dtype = None
+    if var_content.dtype == object:
+        # The sample is enough unless it contains missing values only or values of different types.
+        sample = _sample(var_content.values)
+        if sample is not None:
+            sample_dtype = pandas.api.types.infer_dtype(sample, skipna=True)
+            if sample_dtype in _PANDAS_SAMPLE_DTYPES:
+                pandas_dtype = sample_dtype
+
+    if pandas_dtype is None:
+        # Integer and bool numpy arrays have no missing values.
+        can_hold_na = not (isinstance(var_content.dtype, numpy.dtype) and var_content.dtype.kind in 'iub')
+        if can_hold_na and var_content.isna().all():
+            return TYPE_UNKNOWN
+
+        pandas_dtype = pandas.api.types.infer_dtype(var_content.values, skipna=True)
 
     lp_dtype = TYPE_UNKNOWN
-    time_zone = None
-    pandas_dtype = pandas.api.types.infer_dtype(var_content.values, skipna=True)
 
     if pandas_dtype == "categorical":
         dtype = var_content.cat.categories.dtype
@@ -116,6 +191,34 @@ def _infer_type_polars_dataframe(var_name: str, var_type) -> str:
     return lp_dtype
 
 
+def _infer_type_arrow_table(var_name: str, var_type) -> str:
+    # https://arrow.apache.org/docs/python/api/datatypes.html
+    types = pyarrow.types
+    if types.is_dictionary(var_type):
+        var_type = var_type.value_type
+
+    if types.is_floating(var_type) or types.is_decimal(var_type):
+        lp_dtype = TYPE_FLOATING
+    elif types.is_integer(var_type):
+        lp_dtype = TYPE_INTEGER
+    elif types.is_string(var_type) or types.is_large_string(var_type):
+        lp_dtype = TYPE_STRING
+    elif types.is_boolean(var_type):
+        lp_dtype = TYPE_BOOLEAN
+    elif types.is_timestamp(var_type):
+        lp_dtype = TYPE_DATE_TIME
+    elif types.is_date(var_type):
+        lp_dtype = TYPE_DATE
+    elif types.is_time(var_type):
+        lp_dtype = TYPE_TIME
+    elif types.is_null(var_type):
+        lp_dtype = TYPE_UNKNOWN
+    else:
+        lp_dtype = 'unknown(pyarrow:' + str(var_type) + ')'
+
+    return lp_dtype
+
+
 def _infer_type_dict(var_name: str, var_content) -> str:
     if isinstance(var_content, Iterable):
         if not any(True for _ in var_content):  # empty
@@ -123,10 +226,7 @@ def _infer_type_dict(var_name: str, var_content) -> str:
     else:
         return TYPE_UNKNOWN
 
-    type_set = set(type(val) for val in var_content)
-    if type(None) in type_set:
-        type_set.remove(type(None))
-
+    type_set = _value_types(var_content)
     if len(type_set) == 0:
         return TYPE_UNKNOWN
 
@@ -171,7 +271,25 @@ def _infer_type_dict(var_name: str, var_content) -> str:
     return lp_dtype
 
 
-def _detect_time_zone(var_name: str, data: Union[Dict, 'pandas.DataFrame', 'polars.DataFrame']) -> Optional[str]:
+def _value_types(var_content) -> set:
+    if numpy.lazy_is_instance(var_content, 'ndarray') and var_content.ndim == 1 and var_content.dtype != object:
+        # All values are of the same scalar type.
+        return {type(var_content[0])}
+
+    sample = _sample(var_content)
+    if sample is not None:
+        # The sample is enough unless it contains missing values only or values of different types.
+        type_set = set(type(val) for val in sample)
+        type_set.discard(type(None))
+        if len(type_set) == 1:
+            return type_set
+
+    type_set = set(type(val) for val in var_content)
+    type_set.discard(type(None))
+    return type_set
+
+
+def _detect_time_zone(var_name: str, data: Union[Dict, 'pandas.DataFrame', 'polars.DataFrame', 'pyarrow.Table']) -> Optional[str]:
     if pandas.lazy_is_instance(data, 'DataFrame'):
         if var_name in data:
             var_content = data[var_name]
@@ -183,11 +301,17 @@ def _detect_time_zone(var_name: str, data: Union[Dict, 'pandas.DataFrame', 'pola
             if hasattr(col_dtype, 'time_zone'):
                 if col_dtype.time_zone is not None:
                     return str(col_dtype.time_zone)
+    elif pyarrow.lazy_is_instance(data, 'Table'):
+        if var_name in data.column_names:
+            col_type = data.schema.field(var_name).type
+            if pyarrow.types.is_timestamp(col_type) and col_type.tz is not None:
+                return str(col_type.tz)
     elif isinstance(data, dict):
         if var_name in data:
             var_content = data[var_name]
             if isinstance(var_content, Iterable):
-                for val in var_content:
+                sample = _sample(var_content)
+                for val in (var_content if sample is None else sample):
                     if isinstance(val, datetime) and val.tzinfo is not None:
                         return str(val.tzinfo)
 
@@ -9,9 +9,9 @@ from typing import Dict
 from lets_plot.plot.core import DummySpec
 from lets_plot.plot.core import FeatureSpec
 from lets_plot.plot.core import FeatureSpecArray
-from lets_plot.plot.core import _specs_to_dict
+from lets_plot.plot.core import _specs_to_dict, _spec_dict
 from lets_plot.plot.core import _theme_dicts_merge
-from lets_plot.plot.core import _to_svg, _to_html, _export_as_raster
+from lets_plot.plot.core import _to_svg, _to_html, _to_pdf, _export_as_raster
 
 __all__ = ['SupPlotsSpec']
 
@@ -93,11 +93,14 @@ class SupPlotsSpec(FeatureSpec):
 
         return super().__add__(other)
 
-    def as_dict(self):
-        d = super().as_dict()
+    def _dict(self):
+        return self._cached_dict(self.__to_dict, self._nested_specs() + self.__figures)
+
+    def __to_dict(self):
+        d = self._props_to_dict()
         d['kind'] = self.kind
         d['layout'] = self.__layout.as_dict()
-        d['figures'] = [figure.as_dict() if figure is not None else None for figure in self.__figures]
+        d['figures'] = [_spec_dict(figure) if figure is not None else None for figure in self.__figures]
 
         return d
 
@@ -280,24 +283,16 @@ class SupPlotsSpec(FeatureSpec):
             Can be either a string specifying a file path or a file-like object.
             If a string is provided, the result will be exported to the file at that path.
             If a file-like object is provided, the result will be exported to that object.
-        scale : float
-            Scaling factor for raster output. Default value is 2.0.
+        scale : float, default=1.0
+            Scaling factor of the page size.
         w : float, default=None
-            Width of the output image in units.
-            Only applicable when exporting to PNG or PDF.
+            Width of the page in units.
         h : float, default=None
-            Height of the output image in units.
-            Only applicable when exporting to PNG or PDF.
+            Height of the page in units.
         unit : {'in', 'cm', 'mm', 'px'}, default='in'
-            Unit of the output image. One of: 'in', 'cm', 'mm' or 'px'.
-            Only applicable when exporting to PNG or PDF.
-        dpi : int, default=300
-            Resolution in dots per inch.
-            Only applicable when exporting to PNG or PDF.
-            The default value depends on the unit:
-
-            - for 'px' it is 96 (output image will have the same pixel size as ``w`` and ``h`` values)
-            - for physical units ('in', 'cm', 'mm') it is 300
+            Unit of the page size. One of: 'in', 'cm', 'mm' or 'px'.
+        dpi : int, default=None
+            Not used: the vector output doesn't depend on the resolution.
 
 
         Returns
@@ -307,7 +302,9 @@ class SupPlotsSpec(FeatureSpec):
 
         Notes
         -----
-        Export to a PDF file uses the pillow library.
+        The plots are exported as vector graphics on a single page.
+        The page size is the figure's pixel size converted to inches using the standard display PPI of 96
+        and multiplied by ``scale``.
 
         Examples
         --------
@@ -328,4 +325,4 @@ class SupPlotsSpec(FeatureSpec):
             file_like = io.BytesIO()
             p.to_pdf(file_like)
         """
-        return _export_as_raster(self, path, scale, 'pdf', w=w, h=h, unit=unit, dpi=dpi)
+        return _to_pdf(self, path, scale, w=w, h=h, unit=unit, dpi=dpi)
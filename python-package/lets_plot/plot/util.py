@@ -4,7 +4,8 @@
 #
 from typing import Any, Tuple, Sequence, Optional, Dict, List
 
-from lets_plot._type_utils import LazyModule
+from lets_plot._global_settings import has_global_value, get_global_bool, STAT_PUSHDOWN
+from lets_plot._type_utils import LazyModule, is_arrow_c_data, arrow_c_data_to_pyarrow
 from lets_plot.geo_data_internals.utils import find_geo_names
 from lets_plot.mapping import MappingMeta
 from lets_plot.plot.core import aes, FeatureSpec, PlotSpec
@@ -12,6 +13,7 @@ from lets_plot.plot.series_meta import _infer_type, TYPE_UNKNOWN, TYPE_DATE_TIME
 
 pandas = LazyModule('pandas')
 polars = LazyModule('polars')
+pyarrow = LazyModule('pyarrow')
 
 
 def as_boolean(val, *, default):
@@ -36,7 +38,28 @@ def update_plot_aes_mapping(plot: PlotSpec, add_mapping: FeatureSpec):
         plot.props()[key] = value
 
 
+def _arrow_c_data_as_table(data: Any) -> Any:
+    # Any tabular data exposing the Arrow PyCapsule interface (e.g. pyarrow.RecordBatch, DuckDB or nanoarrow objects)
+    # is imported as pyarrow.Table: its schema is used for the series annotations, its buffers - by the bridge.
+    if isinstance(data, dict) or pandas.lazy_is_instance(data, 'DataFrame') or polars.lazy_is_instance(data, 'DataFrame'):
+        return data
+    if pyarrow.lazy_is_instance(data, 'Table') or not is_arrow_c_data(data):
+        return data
+
+    table = arrow_c_data_to_pyarrow(data)
+    return table if pyarrow.lazy_is_instance(table, 'Table') else data
+
+
+def _is_ordered_arrow_dictionary(data, var_name: str) -> bool:
+    if var_name not in data.column_names or data.column(var_name).num_chunks == 0:
+        return False
+    col_type = data.schema.field(var_name).type
+    return pyarrow.types.is_dictionary(col_type) and col_type.ordered
+
+
 def as_annotated_data(data: Any, mapping_spec: FeatureSpec) -> Tuple:
+    data = _arrow_c_data_as_table(data)
+
     data_type_by_var: Dict[str, str] = {}  # VarName to Type
     mapping_meta_by_var: Dict[str, Dict[str, MappingMeta]] = {}  # VarName to Dict[Aes, MappingMeta]
     mappings = {}  # Aes to VarName
@@ -90,6 +113,10 @@ def as_annotated_data(data: Any, mapping_spec: FeatureSpec) -> Tuple:
                 # series_annotation['factor_levels'] = categories_series.to_list()
                 pass
 
+        elif pyarrow.lazy_is_instance(data, 'Table') and _is_ordered_arrow_dictionary(data, var_name):
+            column = data.column(var_name).unify_dictionaries()
+            series_annotation['factor_levels'] = column.chunk(0).dictionary.to_pylist()
+
         elif var_name in mapping_meta_by_var:
             levels = last_not_none(list(map(lambda mm: mm.levels, mapping_meta_by_var[var_name].values())))
             if levels is not None:
@@ -149,6 +176,126 @@ def as_annotated_data(data: Any, mapping_spec: FeatureSpec) -> Tuple:
     return data, aes(**mappings), {'data_meta': data_meta}
 
 
+def apply_stat_to_chunked_data(geom_name: str, data: 'ChunkedData', mapping_spec: Optional[FeatureSpec],
+                               stat: Optional[str], sampling: Any, params: Dict[str, Any]) -> Tuple:
+    """
+    Compute the stat of the layer over the chunked data.
+
+    Returns the aggregated data, the mapping to the stat variables, the layer parameters
+    without the parameters of the stat and the name of the applied stat (None for the 'identity' stat:
+    the data is only sampled).
+    """
+    from lets_plot._stat_aggregation import apply_stat, layer_stat, sample_rows, DEF_SAMPLE_SIZE
+
+    stat_name = layer_stat(geom_name, stat)
+    if stat_name == 'identity':
+        n, seed = _random_sample_size(sampling, DEF_SAMPLE_SIZE)
+        return sample_rows(data.chunks, n, seed, lambda: data.column_types), mapping_spec, params, None
+
+    mapping = {aes_name: spec for aes_name, spec in (mapping_spec.props() if mapping_spec else {}).items()
+               if aes_name != 'name' and spec is not None}
+    result = apply_stat(stat_name, mapping, params, data.chunks, lambda: data.column_types, streaming=True)
+    params = {k: v for k, v in params.items() if k not in result.consumed_params}
+    return result.data, aes(**result.mapping), params, stat_name
+
+
+def can_pre_apply_stat(layer: Dict[str, Any], plot: Dict[str, Any]) -> bool:
+    """
+    Whether the stat of the layer can be computed over its in-memory data by ``pre_apply_stat()``.
+
+    ``layer`` and ``plot`` are the dicts of the layer spec and of the plot spec it belongs to.
+    False if the 'stat_pushdown' setting is off, the stat, the data or the layer mapping is not supported,
+    or if the result could differ from the stat of the plotting engine: the plot has facets,
+    scale transformations, limits or discrete scales, the layer inherits the plot mapping,
+    or the bins would be computed over the range of the other layers too.
+    """
+    from lets_plot._stat_aggregation import layer_stat, can_apply_stat, uses_overall_range
+
+    if not (has_global_value(STAT_PUSHDOWN) and get_global_bool(STAT_PUSHDOWN)):
+        return False
+
+    data = layer.get('data')
+    if not (isinstance(data, dict) or polars.lazy_is_instance(data, 'DataFrame')
+            or pyarrow.lazy_is_instance(data, 'Table')
+            or pandas.lazy_is_instance(data, 'DataFrame') and not is_geo_data_frame(data)):
+        return False
+
+    if layer.get('map') is not None or plot.get('facet') is not None:
+        return False
+    if plot.get('mapping') and layer.get('inherit_aes') is not False:
+        return False
+    if any(scale.get(option) is not None for scale in plot.get('scales', []) for option in ['trans', 'limits', 'discrete']):
+        return False
+
+    stat_name = layer_stat(layer['geom'], layer.get('stat'))
+    if uses_overall_range(stat_name) and len(plot.get('layers', [])) > 1:
+        return False
+    return can_apply_stat(stat_name, _stat_mapping(layer), layer)
+
+
+def pre_apply_stat(layer: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return the dict of the layer with the stat computed over its in-memory data (see ``can_pre_apply_stat()``).
+    """
+    from lets_plot._stat_aggregation import apply_stat, layer_stat
+    from lets_plot.data import chunked
+
+    data = layer['data']
+    data_meta = layer.get('data_meta') or {}
+    mapping_annotations = data_meta.get('mapping_annotations', [])
+    series_annotations = data_meta.get('series_annotations', [])
+
+    stat_name = layer_stat(layer['geom'], layer.get('stat'))
+    mapping = _stat_mapping(layer)
+
+    source = chunked([data])
+    result = apply_stat(stat_name, mapping, layer, source.chunks, lambda: source.column_types, streaming=False)
+    result_mapping = {aes_name: spec.variable if isinstance(spec, MappingMeta) else spec
+                      for aes_name, spec in result.mapping.items()}
+    result_data, _, result_meta = as_annotated_data(result.data, aes(**result_mapping))
+    result_meta = result_meta['data_meta']
+
+    # The annotations of the source columns (types, factor levels) and of the mapping stay valid for the columns
+    # of the result with the same names: these are the group variables and the stat variables of the same units.
+    annotations = {annotation['column']: annotation for annotation in result_meta.get('series_annotations', [])}
+    annotations.update({annotation['column']: annotation for annotation in series_annotations
+                        if annotation['column'] in result_data})
+    result_meta = {key: value for key, value in data_meta.items() if key not in ['series_annotations', 'mapping_annotations']}
+    if annotations:
+        result_meta['series_annotations'] = list(annotations.values())
+    kept_mapping_annotations = [annotation for annotation in mapping_annotations
+                                if result_mapping.get(annotation['aes']) == layer['mapping'].get(annotation['aes'])]
+    if kept_mapping_annotations:
+        result_meta['mapping_annotations'] = kept_mapping_annotations
+    result_meta['pre_applied_stat'] = stat_name
+
+    result_layer = {key: value for key, value in layer.items() if key not in result.consumed_params}
+    result_layer.update(stat='identity', data=result_data, mapping=result_mapping, data_meta=result_meta)
+    return result_layer
+
+
+def _stat_mapping(layer: Dict[str, Any]) -> Dict[str, Any]:
+    # The layer mapping: the variables marked by as_discrete() are grouped as discrete ones.
+    data_meta = layer.get('data_meta') or {}
+    discrete_aes = {annotation['aes'] for annotation in data_meta.get('mapping_annotations', [])
+                    if annotation.get('annotation') == 'as_discrete'}
+    discrete_vars = {annotation['column'] for annotation in data_meta.get('series_annotations', [])
+                     if 'factor_levels' in annotation}
+    return {aes_name: MappingMeta(var, 'as_discrete', None) if aes_name in discrete_aes or var in discrete_vars else var
+            for aes_name, var in (layer.get('mapping') or {}).items() if var is not None}
+
+
+def _random_sample_size(sampling: Any, default_size: int) -> Tuple[Optional[int], Optional[int]]:
+    # The rows of the chunked data are sampled before the layer sampling is applied by the plot.
+    if isinstance(sampling, FeatureSpec) and sampling.kind == 'sampling':
+        name = sampling.props().get('name')
+        if name == 'random':
+            return sampling.props().get('n'), sampling.props().get('seed')
+        if name == 'none':
+            return None, None
+    return default_size, None
+
+
 def is_data_pub_stream(data: Any) -> bool:
     # try:
     #     from lets_plot.display import DataPubStream
@@ -0,0 +1,81 @@
+#  Copyright (c) 2026. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+# Measures the time of `import lets_plot` in a fresh interpreter and checks it against the budget.
+# `import lets_plot` only loads the core modules: the plotting API is imported on the first access
+# to its names, the frontend context - when a plot is shown for the first time.
+#
+# Not collected by pytest: the time depends on the machine load.
+#
+# Usage: python manual_import_perf.py [runs_count]
+
+import os
+import subprocess
+import sys
+
+RUNS_COUNT = 5
+
+# Seconds, the best of RUNS_COUNT runs.
+IMPORT_TIME_BUDGET = 0.15
+
+# Modules which must not be loaded by `import lets_plot`.
+LAZY_MODULES = [
+    'lets_plot.plot.core',
+    'lets_plot.plot.geom',
+    'lets_plot.plot.scale',
+    'lets_plot.plot.theme_set',
+    'lets_plot.plot.geom_livemap_',
+    'lets_plot.geo_data_internals.utils',
+    'lets_plot.frontend_context',
+    'lets_plot._kbridge',
+    'IPython',
+    'numpy',
+    'pandas',
+]
+
+_SCRIPT = """
+import sys
+import time
+t0 = time.perf_counter()
+import lets_plot
+t = time.perf_counter() - t0
+print(t)
+print(' '.join(sorted(sys.modules)))
+"""
+
+
+def measure_import():
+    """
+    Return the time of `import lets_plot` (in seconds) and the names of the loaded modules.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    output = subprocess.check_output([sys.executable, '-c', _SCRIPT], env=env, text=True)
+    import_time, modules = output.splitlines()[-2:]
+    return float(import_time), set(modules.split())
+
+
+def test_import_time():
+    best_time = min(measure_import()[0] for _ in range(RUNS_COUNT))
+    assert best_time < IMPORT_TIME_BUDGET, \
+        'import lets_plot took {:.3f}s, the budget is {:.3f}s'.format(best_time, IMPORT_TIME_BUDGET)
+
+
+def test_import_is_lazy():
+    _, modules = measure_import()
+    assert [m for m in LAZY_MODULES if m in modules] == []
+
+
+if __name__ == '__main__':
+    runs_count = int(sys.argv[1]) if len(sys.argv) > 1 else RUNS_COUNT
+
+    times = []
+    for _ in range(runs_count):
+        import_time, modules = measure_import()
+        times.append(import_time)
+
+    print('lets_plot import took {:.3f}s (best of {}), the budget is {:.3f}s'.format(
+        min(times), runs_count, IMPORT_TIME_BUDGET))
+    print('lets_plot modules loaded:')
+    for module in sorted(m for m in modules if m.startswith('lets_plot')):
+        print('  ' + module)
+    print('lazy modules loaded: {}'.format([m for m in LAZY_MODULES if m in modules]))
@@ -0,0 +1,71 @@
+#  Copyright (c) 2026. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+# Measures how a batch export scales with the number of threads.
+# The bridge releases the GIL while a plot is built and rendered, so the export time
+# of the batch should decrease with more threads (up to the number of CPU cores).
+#
+# Usage: python manual_threaded_export_perf_test.py [plots_count] [points_count]
+
+import io
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from lets_plot import *
+
+PLOTS_COUNT = 32
+POINTS_COUNT = 20_000
+
+
+def make_plot(seed):
+    rng = np.random.default_rng(seed)
+    data = {
+        'x': rng.normal(size=POINTS_COUNT),
+        'y': rng.normal(size=POINTS_COUNT),
+        'g': rng.choice(['a', 'b', 'c', 'd'], size=POINTS_COUNT),
+    }
+    return ggplot(data, aes('x', 'y', color='g')) \
+        + geom_point(alpha=0.3) \
+        + geom_density2d() \
+        + facet_wrap('g')
+
+
+def export_png(p):
+    p.to_png(io.BytesIO())
+
+
+def export_svg(p):
+    p.to_svg()
+
+
+def run(export, plots, threads):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(export, plots))
+    return time.perf_counter() - start
+
+
+def main():
+    plots = [make_plot(i) for i in range(PLOTS_COUNT)]
+    export_png(plots[0])  # warm up: fonts, lazy initialization
+
+    threads_counts = sorted({1, 2, 4, 8, os.cpu_count() or 1})
+    print(f'{PLOTS_COUNT} plots x {POINTS_COUNT} points, CPU count: {os.cpu_count()}')
+    for name, export in [('svg', export_svg), ('png', export_png)]:
+        base_time = None
+        for threads in threads_counts:
+            t = run(export, plots, threads)
+            base_time = base_time or t
+            print(f'{name}: {threads:>2} thread(s): {t:.3f}s, speedup x{base_time / t:.2f}')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        PLOTS_COUNT = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        POINTS_COUNT = int(sys.argv[2])
+    main()
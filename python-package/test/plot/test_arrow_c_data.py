@@ -0,0 +1,60 @@
+#  Copyright (c) 2026. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+import pytest
+
+import lets_plot as gg
+from lets_plot._type_utils import LazyModule, standardize_dict, DictionaryEncodedColumn
+
+pa = LazyModule('pyarrow')
+
+
+class _ArrowStream:
+    # Exposes only the Arrow PyCapsule stream interface (like DuckDB or nanoarrow objects do).
+    def __init__(self, obj):
+        self._obj = obj
+
+    def __arrow_c_stream__(self, requested_schema=None):
+        return self._obj.__arrow_c_stream__(requested_schema)
+
+
+class _ArrowArray:
+    def __init__(self, obj):
+        self._obj = obj
+
+    def __arrow_c_array__(self, requested_schema=None):
+        return self._obj.__arrow_c_array__(requested_schema)
+
+
+def _batch():
+    return pa.record_batch({'x': [1.5, 2.5], 'c': ['a', 'a']})
+
+
+@pytest.mark.skipif(not pa, reason='requires pyarrow')
+@pytest.mark.parametrize('wrap', [_ArrowStream, _ArrowArray, lambda batch: batch])
+def test_plot_data(wrap):
+    spec = (gg.ggplot(wrap(_batch()), gg.aes('x', 'c')) + gg.geom_point(data=wrap(_batch()))).as_dict()
+
+    for data, data_meta in [(spec['data'], spec['data_meta']), (spec['layers'][0]['data'], spec['layers'][0]['data_meta'])]:
+        assert isinstance(data, pa.Table)
+        assert data_meta['series_annotations'] == [
+            {'type': 'float', 'column': 'x'},
+            {'type': 'str', 'column': 'c'},
+        ]
+
+
+@pytest.mark.skipif(not pa, reason='requires pyarrow')
+def test_columnar_buffers():
+    result = standardize_dict({'data': _ArrowStream(_batch())}, columnar=True)['data']
+
+    assert result['x'].format == 'd' and result['x'].tolist() == [1.5, 2.5]
+    assert isinstance(result['c'], DictionaryEncodedColumn) and result['c'].tolist() == ['a', 'a']
+
+
+@pytest.mark.skipif(not pa, reason='requires pyarrow')
+def test_columns():
+    result = standardize_dict({
+        'stream': _ArrowStream(pa.chunked_array([[1, 2], [None]])),
+        'array': _ArrowArray(pa.array(['a', None])),
+    })
+
+    assert result == {'stream': [1.0, 2.0, None], 'array': ['a', None]}
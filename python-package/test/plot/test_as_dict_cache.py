@@ -0,0 +1,99 @@
+#  Copyright (c) 2026. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+import lets_plot as gg
+
+
+def _plot():
+    return gg.ggplot(mapping=gg.aes('x', 'y')) \
+        + gg.geom_point(gg.aes(color='x')) \
+        + gg.scale_x_log10() \
+        + gg.ggtitle('Title')
+
+
+def test_repeated_as_dict_is_cached():
+    p = _plot()
+
+    d = p._dict()
+
+    assert p._dict() is d
+    assert p.as_dict() == _plot().as_dict()
+
+
+def test_as_dict_returns_new_dict():
+    p = _plot()
+
+    d = p.as_dict()
+    d['layers'].append({'geom': 'line'})
+    d['ggtitle']['text'] = 'Other'
+
+    assert p.as_dict() is not d
+    assert len(p.as_dict()['layers']) == 1
+    assert p.as_dict()['ggtitle'] == {'text': 'Title'}
+
+
+def test_dicts_of_unchanged_specs_are_reused():
+    p = _plot()
+    p2 = p + gg.geom_line()
+
+    layers = p._dict()['layers']
+    layers2 = p2._dict()['layers']
+
+    assert layers2[0] is layers[0]
+    assert p2._dict()['scales'][0] is p._dict()['scales'][0]
+    assert len(p.as_dict()['layers']) == 1
+
+
+def test_specs_with_data_are_not_cached():
+    data = {'x': [1, 2]}
+    layer_data = {'x': [3, 4]}
+    p = gg.ggplot(data) + gg.geom_point(gg.aes('x'), data=layer_data)
+    p.as_dict()
+
+    # In-place modifications of the data.
+    data['x'][0] = 0
+    layer_data['x'].append(5)
+
+    d = p.as_dict()
+    assert d['data'] == {'x': [0, 2]}
+    assert d['layers'][0]['data'] == {'x': [3, 4, 5]}
+
+
+def test_props_modification_invalidates_cache():
+    p = _plot()
+    p.as_dict()
+
+    p.props()['ggtitle'] = gg.ggtitle('Other')
+
+    assert p.as_dict()['ggtitle'] == {'text': 'Other'}
+
+
+def test_nested_spec_modification_invalidates_cache():
+    layer = gg.geom_point()
+    p = gg.ggplot() + layer
+    p.as_dict()
+
+    layer.props()['size'] = 5
+
+    assert p.as_dict()['layers'][0]['size'] == 5
+
+
+def test_tooltips_modification_is_visible():
+    tooltips = gg.layer_tooltips()
+    p = gg.ggplot() + gg.geom_point(tooltips=tooltips)
+    p.as_dict()
+
+    tooltips.line('@x')
+
+    assert p.as_dict()['layers'][0]['tooltips']['lines'] == ['@x']
+
+
+def test_subplots_figure_modification_invalidates_cache():
+    p = _plot()
+    grid = gg.gggrid([p, None])
+    grid.as_dict()
+
+    assert grid._dict() is grid._dict()
+
+    p.props()['ggtitle'] = gg.ggtitle('Other')
+
+    assert grid.as_dict()['figures'][0]['ggtitle'] == {'text': 'Other'}
@@ -0,0 +1,182 @@
+#  Copyright (c) 2026. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+import numpy as np
+import pandas as pd
+import pytest
+
+import lets_plot as gg
+from lets_plot.data import chunked
+
+X = [float(v) for v in range(10)]
+CHUNKS = [{'x': X[:4]}, {'x': X[4:]}]
+
+
+def _layer(layer):
+    d = layer.as_dict()
+    return d['data'], d['mapping'], d
+
+
+def _list(values):
+    return [None if isinstance(v, float) and np.isnan(v) else v for v in np.asarray(values).tolist()]
+
+
+def test_histogram_bins():
+    data, mapping, d = _layer(gg.geom_histogram(gg.aes('x'), data=chunked(CHUNKS), bins=3))
+
+    # span: 9 -> 9 + 1.4 * 3, start: -0.7 * 3
+    assert _list(data['x']) == pytest.approx([0.1, 4.5, 8.9])
+    assert _list(data['count']) == [3.0, 4.0, 3.0]
+    assert _list(data['sumprop']) == pytest.approx([0.3, 0.4, 0.3])
+    assert _list(data['density']) == pytest.approx([0.3 / 4.4, 0.4 / 4.4, 0.3 / 4.4])
+    assert mapping == {'x': 'x', 'y': 'count'}
+    assert d['stat'] == 'identity'
+    assert d['data_meta']['pre_applied_stat'] == 'bin'
+    assert 'bins' not in d
+
+
+def test_histogram_breaks_and_stat_var_mapping():
+    data, mapping, _ = _layer(gg.geom_histogram(gg.aes('x', y='..density..'), data=chunked(CHUNKS),
+                                                breaks=[0, 3, 9]))
+
+    # the first bin is closed: [0, 3], (3, 9]
+    assert _list(data['count']) == [4.0, 6.0]
+    assert _list(data['density']) == pytest.approx([4 / 48, 6 / 48])
+    assert mapping == {'x': 'x', 'y': 'density'}
+
+
+def test_histogram_groups():
+    chunks = [{'x': [0.0, 1.0, 2.0], 'g': ['a', 'b', 'a']}, {'x': [3.0, 4.0], 'g': ['b', 'b']}]
+
+    data, mapping, _ = _layer(gg.geom_histogram(gg.aes('x', fill='g'), data=chunked(chunks), bins=2))
+
+    assert _list(data['g']) == ['a', 'a', 'b', 'b']
+    # bins: [-1.4, 2.0), [2.0, 5.4)
+    assert _list(data['count']) == [1.0, 1.0, 1.0, 2.0]
+    assert mapping == {'x': 'x', 'y': 'count', 'fill': 'g'}
+
+
+def test_chunked_equals_in_memory():
+    rng = np.random.default_rng(3)
+    df = pd.DataFrame({'v': rng.normal(size=1000)})
+    whole, _, _ = _layer(gg.geom_histogram(gg.aes('v'), data=chunked([df])))
+    parts, _, _ = _layer(gg.geom_histogram(gg.aes('v'), data=chunked(lambda: (df.iloc[i:i + 128]
+                                                                               for i in range(0, 1000, 128)))))
+
+    assert _list(parts['v']) == pytest.approx(_list(whole['v']))
+    assert _list(parts['count']) == _list(whole['count'])
+    assert sum(_list(parts['count'])) == 1000
+
+
+def test_iterator_is_read_once():
+    with pytest.raises(ValueError, match='exhausted'):
+        gg.geom_histogram(gg.aes('x'), data=chunked(iter(CHUNKS)))
+
+    data, _, _ = _layer(gg.geom_bar(gg.aes('x'), data=chunked(iter(CHUNKS))))
+    assert len(data['count']) == 10
+
+
+def test_count():
+    chunks = [{'c': ['a', 'b', 'a', None]}, pd.DataFrame({'c': ['a', 'c'], 'w': [1, 1]})[['c']]]
+
+    data, mapping, d = _layer(gg.geom_bar(gg.aes('c'), data=chunked(chunks)))
+
+    assert _list(data['c']) == ['a', 'b', 'c']
+    assert _list(data['count']) == [3.0, 1.0, 1.0]
+    assert _list(data['sumprop']) == pytest.approx([0.6, 0.2, 0.2])
+    assert mapping == {'x': 'c', 'y': 'count'}
+    assert d['data_meta']['pre_applied_stat'] == 'count'
+
+
+def test_bin2d():
+    chunks = [{'x': [0.0, 1.0], 'y': [0.0, 1.0]}, {'x': [1.0, 0.0], 'y': [1.0, 1.0]}]
+
+    data, mapping, _ = _layer(gg.geom_bin2d(gg.aes('x', 'y'), data=chunked(chunks), bins=[2, 2]))
+
+    # range [0, 1] is expanded by a half of the initial bin width: [-0.25, 1.25]
+    assert mapping == {'x': 'x', 'y': 'y', 'fill': 'count'}
+    assert _list(data['x']) == pytest.approx([0.125, 0.125, 0.875, 0.875])
+    # the empty bin is kept (with NaN values) to preserve the bin height
+    assert _list(data['y']) == [pytest.approx(0.125), pytest.approx(0.875), None, pytest.approx(0.875)]
+    assert _list(data['count']) == [1.0, 1.0, None, 2.0]
+
+
+def test_summary():
+    chunks = [{'g': ['a', 'b', 'a'], 'v': [1.0, 10.0, 3.0]}, {'g': ['b', 'a'], 'v': [20.0, 5.0]}]
+
+    data, mapping, _ = _layer(gg.stat_summary(gg.aes('g', 'v'), data=chunked(chunks), fun='sum'))
+
+    assert _list(data['g']) == ['a', 'b']
+    assert _list(data['v']) == [9.0, 30.0]
+    assert _list(data['ymin']) == [1.0, 10.0]
+    assert _list(data['ymax']) == [5.0, 20.0]
+    assert mapping == {'x': 'g', 'y': 'v', 'ymin': 'ymin', 'ymax': 'ymax'}
+
+
+def test_summary_quantiles_are_not_streamed():
+    with pytest.raises(ValueError, match="'median' is not supported"):
+        gg.stat_summary(gg.aes('x', 'x'), data=chunked(CHUNKS), fun='median')
+
+
+def test_ecdf():
+    data, mapping, _ = _layer(gg.stat_ecdf(gg.aes('x'), data=chunked([{'x': [2.0, 1.0]}, {'x': [2.0, 3.0]}])))
+
+    assert _list(data['x']) == [1.0, 2.0, 3.0]
+    assert _list(data['y']) == [0.25, 0.75, 1.0]
+    assert mapping == {'x': 'x', 'y': 'y'}
+
+
+def test_ecdf_n():
+    data, _, _ = _layer(gg.stat_ecdf(gg.aes('x'), data=chunked(CHUNKS), n=4))
+
+    assert _list(data['x']) == [0.0, 3.0, 6.0, 9.0]
+    assert _list(data['y']) == [0.1, 0.4, 0.7, 1.0]
+
+
+def test_point_sampling():
+    chunks = [{'x': list(range(i, i + 100)), 'y': list(range(i, i + 100))} for i in range(0, 1000, 100)]
+
+    data, _, d = _layer(gg.geom_point(gg.aes('x', 'y'), data=chunked(chunks),
+                                      sampling=gg.sampling_random(50, seed=1)))
+
+    assert len(data['x']) == 50
+    assert _list(data['x']) == sorted(_list(data['x']))
+    assert d.get('stat') is None
+    assert 'pre_applied_stat' not in d['data_meta']
+
+    again, _, _ = _layer(gg.geom_point(gg.aes('x', 'y'), data=chunked(chunks),
+                                       sampling=gg.sampling_random(50, seed=1)))
+    assert _list(again['x']) == _list(data['x'])
+
+
+def test_temporal_x():
+    dates = pd.Series(pd.to_datetime(['2020-01-01', '2020-01-02', '2020-01-02']))
+
+    data, _, d = _layer(gg.geom_bar(gg.aes('d'), data=chunked([pd.DataFrame({'d': dates})])))
+
+    assert _list(data['count']) == [1.0, 2.0]
+    assert {'type': 'datetime', 'column': 'd'} in d['data_meta']['series_annotations']
+
+
+def test_file_sources(tmp_path):
+    pyarrow = pytest.importorskip('pyarrow')
+    import pyarrow.csv
+    import pyarrow.parquet
+
+    table = pyarrow.table({'x': X, 'other': ['v'] * 10})
+    pyarrow.parquet.write_table(table, str(tmp_path / 'data.parquet'))
+    pyarrow.csv.write_csv(table, str(tmp_path / 'data.csv'))
+
+    for name in ['data.parquet', 'data.csv']:
+        data, _, _ = _layer(gg.geom_histogram(gg.aes('x'), data=chunked(tmp_path / name, chunk_size=3), bins=3))
+        assert _list(data['count']) == [3.0, 4.0, 3.0]
+
+
+def test_errors():
+    with pytest.raises(ValueError, match="requires the 'x' aesthetic"):
+        gg.geom_histogram(data=chunked(CHUNKS))
+
+    with pytest.raises(ValueError, match="Stat 'smooth' can't be computed"):
+        gg.geom_smooth(gg.aes('x', 'x'), data=chunked(CHUNKS))
+
+    with pytest.raises(ValueError, match="Variable 'z' is not found"):
+        gg.geom_histogram(gg.aes('z'), data=chunked(CHUNKS))
@@ -0,0 +1,106 @@
+#  Copyright (c) 2026. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+import pytest
+
+import lets_plot as gg
+from lets_plot._data_pruning import prune_unused_data
+from lets_plot._global_settings import _settings, _to_actual_name, DATA_PRUNING
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+DATA = {name: [1, 2, 3] for name in ['x', 'y', 'c', 'g', 'f', 't', 'v', 'o', 'key', 'unused']}
+
+
+def _columns(spec):
+    return sorted(spec['data'].keys())
+
+
+def test_mapped_and_faceted_columns_are_kept():
+    p = gg.ggplot(DATA, gg.aes('x', 'y')) \
+        + gg.geom_point(gg.aes(color='c', group=['g'])) \
+        + gg.facet_wrap(facets='f')
+
+    pruned = prune_unused_data(p.as_dict())
+
+    assert _columns(pruned) == ['c', 'f', 'g', 'x', 'y']
+
+
+def test_tooltips_labels_and_annotations_columns_are_kept():
+    p = gg.ggplot(DATA) + gg.geom_point(
+        gg.aes(x='x', color=gg.as_discrete('c', order_by='o')),
+        tooltips=gg.layer_tooltips(['v']).line('@t @{..count..} ^y').format('@{key}', '.1f'),
+        data=DATA
+    )
+
+    pruned = prune_unused_data(p.as_dict())
+
+    assert _columns(pruned) == ['c', 'key', 'o', 't', 'v', 'x']
+    assert _columns(pruned['layers'][0]) == ['c', 'key', 'o', 't', 'v', 'x']
+
+
+def test_map_join_columns_are_kept():
+    p = gg.ggplot() + gg.geom_polygon(data=DATA, map_join=['key', 'id'])
+
+    pruned = prune_unused_data(p.as_dict())
+
+    assert _columns(pruned['layers'][0]) == ['key']
+
+
+def test_subplots():
+    p = gg.gggrid([gg.ggplot(DATA, gg.aes('x', 'y')) + gg.geom_point()])
+
+    pruned = prune_unused_data(p.as_dict())
+
+    assert _columns(pruned['figures'][0]) == ['x', 'y']
+
+
+def test_original_spec_is_not_modified():
+    spec = (gg.ggplot(DATA, gg.aes('x')) + gg.geom_bar()).as_dict()
+
+    data = spec['data']
+
+    prune_unused_data(spec)
+
+    assert spec['data'] is data
+    assert sorted(data.keys()) == sorted(DATA.keys())
+
+
+def test_data_pruning_disabled():
+    spec = (gg.ggplot(DATA, gg.aes('x')) + gg.geom_bar()).as_dict()
+
+    _settings[_to_actual_name(DATA_PRUNING)] = False
+    try:
+        assert prune_unused_data(spec) is spec
+    finally:
+        del _settings[_to_actual_name(DATA_PRUNING)]
+
+
+@pytest.mark.skipif(pd is None, reason='requires pandas')
+def test_pandas_data_frame():
+    df = pd.DataFrame(DATA)
+    spec = (gg.ggplot(df, gg.aes('x', 'y')) + gg.geom_point()).as_dict()
+
+    pruned = prune_unused_data(spec)
+
+    assert _columns(pruned) == ['x', 'y']
+    assert pruned['data']['x'] is not None
+    assert list(df.columns) == list(DATA.keys())
+
+
+@pytest.mark.skipif(pa is None, reason='requires pyarrow')
+def test_arrow_table():
+    table = pa.table(DATA)
+    spec = (gg.ggplot(table, gg.aes('x', 'y')) + gg.geom_point()).as_dict()
+
+    pruned = prune_unused_data(spec)
+
+    assert pruned['data'].column_names == ['x', 'y']
+    assert table.column_names == list(DATA.keys())
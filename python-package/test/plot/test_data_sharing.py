@@ -0,0 +1,93 @@
+#  Copyright (c) 2026. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+import pytest
+
+import lets_plot as gg
+from lets_plot._data_pruning import prune_unused_data
+from lets_plot._data_sharing import share_composite_data
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+DATA = {'x': [1, 2, 3], 'y': [4, 5, 6], 'c': ['a', 'b', 'c'], 'unused': [0, 0, 0]}
+
+
+def test_data_used_by_several_figures_is_shared():
+    p = gg.gggrid([
+        gg.ggplot(DATA, gg.aes('x', 'y')) + gg.geom_point(),
+        gg.ggplot(DATA, gg.aes('x')) + gg.geom_bar(),
+        gg.ggplot({'x': [0]}, gg.aes('x')) + gg.geom_bar(),
+    ])
+
+    spec = share_composite_data(p.as_dict())
+
+    assert list(spec['shared_data'].keys()) == ['0']
+    assert spec['shared_data']['0'] == DATA
+    assert spec['figures'][0]['data_ref'] == '0'
+    assert spec['figures'][1]['data_ref'] == '0'
+    assert 'data' not in spec['figures'][0]
+    assert spec['figures'][2]['data'] == {'x': [0]}
+    assert 'data_ref' not in spec['figures'][2]
+
+
+def test_layer_and_nested_figure_data_is_shared():
+    p = gg.ggdeck([
+        gg.ggplot() + gg.geom_point(gg.aes('x', 'y'), data=DATA),
+        gg.gggrid([gg.ggplot(DATA, gg.aes('x', 'y')) + gg.geom_line()]),
+    ])
+
+    spec = share_composite_data(p.as_dict())
+
+    assert spec['figures'][0]['layers'][0]['data_ref'] == '0'
+    assert spec['figures'][1]['figures'][0]['data_ref'] == '0'
+    assert 'shared_data' not in spec['figures'][1]
+
+
+def test_not_shared_data():
+    p = gg.gggrid([
+        gg.ggplot(DATA, gg.aes('x', 'y')) + gg.geom_point(),
+        gg.ggplot(dict(DATA), gg.aes('x', 'y')) + gg.geom_point(),
+    ])
+    spec = p.as_dict()
+
+    # The dicts contain the same columns
+    assert 'shared_data' in share_composite_data(spec)
+
+    single = (gg.ggplot(DATA) + gg.geom_point(data=DATA)).as_dict()
+    assert share_composite_data(single) is single
+
+    different = gg.gggrid([gg.ggplot({'x': [1]}), gg.ggplot({'x': [1]})]).as_dict()
+    assert share_composite_data(different) is different
+
+
+def test_original_spec_is_not_modified():
+    spec = gg.gggrid([gg.ggplot(DATA, gg.aes('x')) + gg.geom_bar()] * 2).as_dict()
+
+    share_composite_data(spec)
+
+    assert 'shared_data' not in spec
+    assert spec['figures'][0]['data'] == DATA
+
+
+def test_shared_data_pruning():
+    p = gg.gggrid([
+        gg.ggplot(DATA, gg.aes('x')) + gg.geom_bar(),
+        gg.ggplot(DATA) + gg.geom_point(gg.aes('y', color='c')),
+    ])
+
+    spec = prune_unused_data(share_composite_data(p.as_dict()))
+
+    assert sorted(spec['shared_data']['0'].keys()) == ['c', 'x', 'y']
+
+
+@pytest.mark.skipif(pd is None, reason='requires pandas')
+def test_pandas_data_frame():
+    df = pd.DataFrame(DATA)
+    p = gg.gggrid([gg.ggplot(df, gg.aes('x', 'y')) + gg.geom_point()] * 3)
+
+    spec = share_composite_data(p.as_dict())
+
+    assert spec['shared_data']['0'] is df
+    assert all(figure['data_ref'] == '0' for figure in spec['figures'])
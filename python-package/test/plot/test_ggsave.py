@@ -193,7 +193,6 @@ def test_filelike_ggsave_png():
     assert_png(out_buffer, 400, 300)
 
 
-@pytest.mark.skipif(not pillow_image, reason="Requires Pillow")
 def test_ggsave_pdf():
     p = gg.ggplot() + gg.geom_blank()
     out_path = gg.ggsave(p, filename=temp_file('test_ggsave.pdf'))
@@ -202,28 +201,24 @@ def test_ggsave_pdf():
         assert content.startswith(b'%PDF-1.')
 
 
-@pytest.mark.skipif(not pillow_image, reason="Requires Pillow")
 def test_ggsave_pdf_5x3_inch():
     p = gg.ggplot() + gg.geom_blank()
     out_path = gg.ggsave(p, filename=temp_file('test_ggsave_5x3_inch.pdf'), w=5, h=3, unit='in', scale=1)
     assert_pdf(out_path, w=5, h=3, unit='in')
 
 
-@pytest.mark.skipif(not pillow_image, reason="Requires Pillow")
 def test_ggsave_pdf_5x3_inch_150dpi():
     p = gg.ggplot() + gg.geom_blank()
     out_path = gg.ggsave(p, filename=temp_file('test_ggsave_5x3_inch_150dpi.pdf'), w=5, h=3, unit='in', dpi=150, scale=1)
     assert_pdf(out_path, w=5, h=3, unit='in')
 
 
-@pytest.mark.skipif(not pillow_image, reason="Requires Pillow")
 def test_ggsave_pdf_5x3_inch_300dpi():
     p = gg.ggplot() + gg.geom_blank()
     out_path = gg.ggsave(p, filename=temp_file('test_ggsave_5x3_inch_300dpi.pdf'), w=5, h=3, dpi=300, unit='in', scale=1)
     assert_pdf(out_path, w=5, h=3, unit='in')
 
 
-@pytest.mark.skipif(not pillow_image, reason="Requires Pillow")
 def test_ggsave_pdf_5x3_inch_150dpi_2Xscale():
     p = gg.ggplot() + gg.geom_blank()
     out_path = gg.ggsave(p, filename=temp_file('test_ggsave_5x3_inch_150dpi_2Xscale.pdf'), w=5, h=3, unit='in', dpi=150, scale=2)
@@ -231,24 +226,73 @@ def test_ggsave_pdf_5x3_inch_150dpi_2Xscale():
     assert_pdf(out_path, w=10, h=6, unit='in')
 
 
-@pytest.mark.skipif(not pillow_image, reason="Requires Pillow")
 def test_ggsave_pdf_5x3_cm():
     p = gg.ggplot() + gg.geom_blank()
     out_path = gg.ggsave(p, filename=temp_file('test_ggsave_5x3_cm.pdf'), w=5, h=3, unit='cm', scale=1)
     assert_pdf(out_path, w=5, h=3, unit='cm')
 
 
-@pytest.mark.skipif(not pillow_image, reason="Requires Pillow")
 def test_ggsave_pdf_5x3_cm_150dpi():
     p = gg.ggplot() + gg.geom_blank()
     out_path = gg.ggsave(p, filename=temp_file('test_ggsave_5x3_cm_150dpi.pdf'), w=5, h=3, unit='cm', dpi=150, scale=1)
     assert_pdf(out_path, w=5, h=3, unit='cm')
 
 
-@pytest.mark.skipif(not pillow_image, reason="Requires Pillow")
 def test_filelike_ggsave_pdf():
     p = gg.ggplot() + gg.geom_blank()
     out_buffer = io.BytesIO()
     p.to_pdf(path=out_buffer)
 
     assert out_buffer.getvalue().startswith(b'%PDF-1.')
+
+
+def test_ggsave_pages_pdf():
+    plots = [gg.ggplot() + gg.geom_blank() + gg.ggtitle(str(i)) for i in range(3)]
+    out_path = gg.ggsave_pages(plots, temp_file('test_ggsave_pages.pdf'), w=5, h=3, unit='in', workers=2)
+    assert_pdf(out_path, w=5, h=3, unit='in')
+
+    with open(out_path, 'rb') as f:
+        assert b'/Count 3' in f.read()
+
+
+@pytest.mark.parametrize('plots, filename, workers', [
+    ([], 'pages.pdf', None),
+    (['not a plot'], 'pages.pdf', None),
+    ([gg.ggplot()], 'pages.png', None),
+    ([gg.ggplot()], 'pages.pdf', 0),
+])
+def test_ggsave_pages_invalid_args(plots, filename, workers):
+    with pytest.raises(ValueError):
+        gg.ggsave_pages(plots, temp_file(filename), workers=workers)
+
+
+def test_ggsave_formats():
+    p = gg.ggplot() + gg.geom_blank() + gg.ggsize(400, 300)
+    out_paths = gg.ggsave(p, [temp_file('test_formats.svg'), temp_file('test_formats.png'), temp_file('test_formats.pdf')])
+
+    assert out_paths == [temp_file('test_formats.svg'), temp_file('test_formats.png'), temp_file('test_formats.pdf')]
+    with open(out_paths[0], encoding='utf-8') as f:
+        assert f.read().startswith('<svg')
+    assert_png(out_paths[1], 800, 600)
+    with open(out_paths[2], 'rb') as f:
+        assert f.read().startswith(b'%PDF-1.')
+
+
+def test_ggsave_formats_without_rendering():
+    p = gg.ggplot({'x': [1, 2]}, gg.aes('x')) + gg.geom_point()
+    out_paths = gg.ggsave(p, [temp_file('test_formats.html'), temp_file('test_formats_2.html')])
+
+    for out_path in out_paths:
+        with open(out_path, encoding='utf-8') as f:
+            assert '<html' in f.read()
+
+
+@pytest.mark.parametrize('filenames', [
+    [],
+    ['test_formats.svg', 'test_formats.txt'],
+    ['test_formats.svg', 'test_formats'],
+])
+def test_ggsave_formats_invalid_filenames(filenames):
+    p = gg.ggplot() + gg.geom_blank()
+    with pytest.raises(ValueError):
+        gg.ggsave(p, [temp_file(name) for name in filenames])
@@ -0,0 +1,97 @@
+#  Copyright (c) 2026. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+import os
+import tempfile
+
+import pytest
+
+import lets_plot as gg
+from lets_plot.export import ggsave_batch
+from lets_plot.export import ggsave_batch_
+
+
+def _plot(title):
+    return gg.ggplot({'x': [1, 2]}, gg.aes('x')) + gg.geom_point() + gg.ggtitle(title)
+
+
+def _has_title(file_path, title):
+    with open(file_path, encoding='utf-8') as f:
+        return '>{}<'.format(title) in f.read()
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_ggsave_batch(executor):
+    out_dir = tempfile.mkdtemp()
+    items = [
+        (_plot('a'), 'a.svg'),
+        (_plot('b'), 'b.svg', {}),
+        {'plot': _plot('c'), 'filename': 'c.svg'},
+    ]
+
+    results = ggsave_batch(items, path=out_dir, workers=2, executor=executor)
+
+    assert results == [os.path.join(out_dir, name) for name in ['a.svg', 'b.svg', 'c.svg']]
+    assert all(_has_title(r, title) for r, title in zip(results, ['a', 'b', 'c']))
+
+
+def test_ggsave_batch_item_failures():
+    out_dir = tempfile.mkdtemp()
+    reported = {}
+    items = [
+        (_plot('a'), 'a.svg'),
+        ('not a plot', 'b.svg'),
+        (_plot('c'), 'c.unknown'),
+        (_plot('d'), 'd.svg'),
+    ]
+
+    results = ggsave_batch(items, path=out_dir, workers=2, executor='thread',
+                           on_result=lambda i, result: reported.update({i: result}))
+
+    assert results[0] == os.path.join(out_dir, 'a.svg')
+    assert isinstance(results[1], ValueError)
+    assert isinstance(results[2], ValueError)
+    assert results[3] == os.path.join(out_dir, 'd.svg')
+    assert reported == dict(enumerate(results))
+
+
+class _KillWorker:
+    # Kills the worker process unpickling it.
+    def __reduce__(self):
+        return os._exit, (1,)
+
+
+def test_ggsave_batch_broken_pool(monkeypatch):
+    created_pools = []
+
+    class CountingProcessPoolExecutor(ggsave_batch_.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created_pools.append(self)
+
+    monkeypatch.setattr(ggsave_batch_, 'ProcessPoolExecutor', CountingProcessPoolExecutor)
+    monkeypatch.setattr(ggsave_batch_, '_pools', {})
+
+    out_dir = tempfile.mkdtemp()
+    items = [(_plot(str(i)), '{}.svg'.format(i)) for i in range(12)]
+    items.insert(6, (_KillWorker(), 'killer.svg'))
+    try:
+        results = ggsave_batch(items, path=out_dir, workers=2)
+    finally:
+        ggsave_batch_._shutdown_pools()
+
+    assert isinstance(results[6], Exception)
+    # The items pending in a broken pool are retried in the same new pool.
+    assert len(created_pools) <= 3
+
+
+@pytest.mark.parametrize('items, kwargs', [
+    ([(_plot('a'), 'a.svg')], {'executor': 'fork'}),
+    ([(_plot('a'), 'a.svg')], {'workers': 0}),
+    ([_plot('a')], {}),
+    ([{'plot': _plot('a')}], {}),
+    ([(_plot('a'), 'a.svg', 'png')], {}),
+])
+def test_ggsave_batch_invalid_args(items, kwargs):
+    with pytest.raises(ValueError):
+        ggsave_batch(items, **kwargs)
@@ -0,0 +1,67 @@
+#  Copyright (c) 2026. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip('lets_plot_kotlin_bridge')
+
+import lets_plot as gg
+from lets_plot._global_settings import _settings, _to_actual_name, HEADLESS
+from lets_plot.frontend_context import _configuration as cfg
+from lets_plot.frontend_context._mime_types import TEXT_HTML
+from lets_plot.frontend_context._static_html_page_ctx import StaticHtmlPageContext
+
+
+@pytest.fixture
+def headless(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError('Frontend environment must not be probed in headless mode')
+
+    monkeypatch.setattr(cfg, '_create_html_frontend_context', fail)
+    monkeypatch.setattr(cfg, '_frontend_contexts', {})
+    _settings[_to_actual_name(HEADLESS)] = True
+    yield
+    _settings.pop(_to_actual_name(HEADLESS), None)
+
+
+def test_setup_html_does_nothing(headless):
+    gg.LetsPlot.setup_html()
+
+    assert cfg._frontend_contexts.get(TEXT_HTML) is None
+
+
+def test_show_prints_notice(headless, capsys, monkeypatch):
+    p = gg.ggplot() + gg.geom_point(x=0, y=0)
+    monkeypatch.setattr(type(p), 'as_dict', lambda self: pytest.fail('The spec must not be built'))
+
+    p.show()
+
+    assert 'ggsave()' in capsys.readouterr().out
+
+
+def test_html_is_complete_page(headless, monkeypatch):
+    monkeypatch.setattr(StaticHtmlPageContext, 'as_str', lambda self, plot_spec: '<html/>')
+
+    html = (gg.ggplot() + gg.geom_point(x=0, y=0))._repr_html_()
+
+    assert html == '<html/>'
+    assert isinstance(cfg._frontend_contexts[TEXT_HTML], StaticHtmlPageContext)
+
+
+def test_no_ipython_import():
+    script = '\n'.join([
+        'import sys',
+        'from lets_plot import *',
+        'LetsPlot.setup_html()',
+        '(ggplot() + geom_point(x=0, y=0)).show()',
+        'assert "IPython" not in sys.modules, "IPython is imported"',
+    ])
+    env = dict(os.environ,
+               LETS_PLOT_HEADLESS='true',
+               LETS_PLOT_DEV_HEADLESS='true',
+               PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+
+    subprocess.check_call([sys.executable, '-c', script], env=env, stdout=subprocess.DEVNULL)
@@ -0,0 +1,36 @@
+#  Copyright (c) 2026. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+import pytest
+
+pytest.importorskip('lets_plot_kotlin_bridge')
+
+from lets_plot._global_settings import _settings, _to_actual_name, HTML_TYPED_ARRAYS
+from lets_plot._kbridge import _get_html_typed_arrays
+
+
+@pytest.fixture
+def html_typed_arrays():
+    def set_value(value):
+        _settings[_to_actual_name(HTML_TYPED_ARRAYS)] = value
+
+    yield set_value
+    _settings.pop(_to_actual_name(HTML_TYPED_ARRAYS), None)
+
+
+def test_default_is_decimal_numbers():
+    assert _get_html_typed_arrays() == ''
+
+
+@pytest.mark.parametrize('value,expected', [
+    ('float64', 'float64'),
+    ('Float32', 'float32'),
+])
+def test_typed_arrays(html_typed_arrays, value, expected):
+    html_typed_arrays(value)
+    assert _get_html_typed_arrays() == expected
+
+
+def test_unsupported_typed_arrays(html_typed_arrays):
+    html_typed_arrays('int8')
+    with pytest.raises(ValueError):
+        _get_html_typed_arrays()
@@ -0,0 +1,70 @@
+#  Copyright (c) 2026. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+
+from datetime import datetime, date, time
+
+import pytest
+
+import lets_plot as gg
+from lets_plot._type_utils import LazyModule
+from lets_plot.plot import series_meta
+
+pa = LazyModule("pyarrow")
+
+
+@pytest.mark.skipif(not pa, reason="Requires pyarrow")
+def test_infer_type_arrow_table():
+    table = pa.table({
+        'int_col': pa.array([1, 2], pa.int8()),
+        'float_col': pa.array([1.1, 2.2], pa.float32()),
+        'str_col': ['a', 'b'],
+        'large_str_col': pa.array(['a', 'b'], pa.large_string()),
+        'dict_col': pa.array(['a', 'b']).dictionary_encode(),
+        'bool_col': [True, False],
+        'datetime_col': [datetime(2023, 1, 1), datetime(2023, 1, 2)],
+        'date_col': [date(2023, 1, 1), date(2023, 1, 2)],
+        'time_col': [time(10, 0), time(11, 0)],
+        'null_col': pa.nulls(2),
+        'list_col': [[1], [2]],
+    })
+
+    assert series_meta._infer_type(table) == {
+        'int_col': series_meta.TYPE_INTEGER,
+        'float_col': series_meta.TYPE_FLOATING,
+        'str_col': series_meta.TYPE_STRING,
+        'large_str_col': series_meta.TYPE_STRING,
+        'dict_col': series_meta.TYPE_STRING,
+        'bool_col': series_meta.TYPE_BOOLEAN,
+        'datetime_col': series_meta.TYPE_DATE_TIME,
+        'date_col': series_meta.TYPE_DATE,
+        'time_col': series_meta.TYPE_TIME,
+        'null_col': series_meta.TYPE_UNKNOWN,
+        'list_col': 'unknown(pyarrow:list<item: int64>)',
+    }
+
+
+@pytest.mark.skipif(not pa, reason="Requires pyarrow")
+def test_detect_time_zone_arrow_table():
+    table = pa.table({
+        'utc': pa.array([datetime(2023, 1, 1)], pa.timestamp('us', tz='UTC')),
+        'naive': pa.array([datetime(2023, 1, 1)], pa.timestamp('us')),
+    })
+
+    assert series_meta._detect_time_zone('utc', table) == 'UTC'
+    assert series_meta._detect_time_zone('naive', table) is None
+
+
+@pytest.mark.skipif(not pa, reason="Requires pyarrow")
+def test_ordered_dictionary_factor_levels():
+    ordered = pa.dictionary(pa.int8(), pa.string(), ordered=True)
+    table = pa.table({
+        'ordered': pa.DictionaryArray.from_arrays([1, 0, 1], ['lo', 'hi'], ordered=True).cast(ordered),
+        'unordered': pa.array(['b', 'a']).dictionary_encode().take([0, 1, 0]),
+    })
+
+    data_meta = (gg.ggplot(table) + gg.geom_point()).as_dict()['data_meta']
+
+    assert data_meta['series_annotations'] == [
+        {'type': 'str', 'factor_levels': ['lo', 'hi'], 'column': 'ordered'},
+        {'type': 'str', 'column': 'unordered'},
+    ]
@@ -0,0 +1,102 @@
+#  Copyright (c) 2026. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+from datetime import datetime, timezone
+
+import pytest
+
+from lets_plot._global_settings import _settings, _to_actual_name, TYPE_INFERENCE_SAMPLING
+from lets_plot._type_utils import LazyModule
+from lets_plot.plot import series_meta
+
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
+
+N = series_meta.SAMPLING_MIN_SIZE * 3
+
+
+@pytest.fixture
+def no_sampling():
+    _settings[_to_actual_name(TYPE_INFERENCE_SAMPLING)] = False
+    yield
+    _settings.pop(_to_actual_name(TYPE_INFERENCE_SAMPLING), None)
+
+
+@pytest.fixture
+def debug_hook():
+    calls = []
+    series_meta.set_debug_hook(lambda *args: calls.append(args))
+    yield calls
+    series_meta.set_debug_hook(None)
+
+
+def _floats_with_string():
+    values = [float(i) for i in range(N)]
+    values[N // 2 + 1] = 'a'  # Not in the sample
+    return values
+
+
+def test_long_column_is_inferred_from_sample():
+    type_info = series_meta._infer_type({'x': _floats_with_string()})
+    assert type_info['x'] == series_meta.TYPE_FLOATING
+
+
+def test_whole_column_is_scanned_without_sampling(no_sampling):
+    type_info = series_meta._infer_type({'x': _floats_with_string()})
+    assert type_info['x'] == 'unknown(mixed types)'
+
+
+def test_mixed_sample_falls_back_to_whole_column():
+    values = [i if i % 2 else float(i) for i in range(N)]
+    assert series_meta._infer_type({'x': values})['x'] == series_meta.TYPE_FLOATING
+
+    values[N // 2 + 1] = 'a'
+    assert series_meta._infer_type({'x': values})['x'] == 'unknown(mixed types)'
+
+
+def test_missing_values_in_sample():
+    values = [None] * N
+    values[N // 2 + 1] = 'a'
+    assert series_meta._infer_type({'x': values})['x'] == series_meta.TYPE_STRING
+
+
+def test_time_zone_is_detected_from_sample():
+    values = [datetime(2025, 1, 1, tzinfo=timezone.utc)] * N
+    assert series_meta._detect_time_zone('x', {'x': values}) == 'UTC'
+
+
+@pytest.mark.skipif(not np, reason="Requires numpy")
+def test_numpy_dtype():
+    data = {
+        'int': np.arange(N),
+        'float': np.linspace(0, 1, N),
+        'str': np.array(['a', 'b'] * (N // 2)),
+    }
+    assert series_meta._infer_type(data) == {
+        'int': series_meta.TYPE_INTEGER,
+        'float': series_meta.TYPE_FLOATING,
+        'str': series_meta.TYPE_STRING,
+    }
+
+
+@pytest.mark.skipif(not pd, reason="Requires pandas")
+def test_pandas_object_column():
+    df = pd.DataFrame({
+        'str': ['a'] * N,
+        'mixed': [1] * (N - 1) + ['a'],  # The tail is in the sample
+        'none': [None] * N,
+    })
+    assert series_meta._infer_type(df) == {
+        'str': series_meta.TYPE_STRING,
+        'mixed': 'unknown(pandas:mixed-integer)',
+        'none': series_meta.TYPE_UNKNOWN,
+    }
+
+
+def test_debug_hook(debug_hook):
+    series_meta._infer_type({'x': [1, 2], 'y': ['a', 'b']})
+
+    assert [(name, lp_dtype) for name, lp_dtype, _ in debug_hook] == [
+        ('x', series_meta.TYPE_INTEGER),
+        ('y', series_meta.TYPE_STRING),
+    ]
+    assert all(seconds >= 0 for _, _, seconds in debug_hook)
@@ -0,0 +1,54 @@
+#  Copyright (c) 2026. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+import importlib
+
+import pytest
+
+import lets_plot
+import lets_plot.plot
+
+
+@pytest.mark.parametrize('module_name', list(lets_plot.plot._EXPORTS))
+def test_plot_exports_match_module(module_name):
+    module = importlib.import_module('lets_plot.plot.' + module_name)
+
+    assert set(lets_plot.plot._EXPORTS[module_name]) <= set(module.__all__)
+    for name in module.__all__:
+        assert getattr(lets_plot.plot, name) is getattr(module, name)
+
+
+@pytest.mark.parametrize('module_name', list(lets_plot._EXPORTS))
+def test_exports_match_module(module_name):
+    module = importlib.import_module('lets_plot.' + module_name)
+
+    assert set(lets_plot._EXPORTS[module_name]) == set(module.__all__)
+
+
+def test_all_names_are_resolved():
+    for name in lets_plot.__all__:
+        assert getattr(lets_plot, name) is not None
+
+
+def test_star_import():
+    namespace = {}
+    exec('from lets_plot import *', namespace)
+
+    assert {'ggplot', 'geom_point', 'ggsave', 'as_discrete', 'LetsPlot'} <= set(namespace)
+
+
+def test_unknown_name():
+    with pytest.raises(AttributeError):
+        lets_plot.no_such_function
+
+    with pytest.raises(ImportError):
+        exec('from lets_plot.plot import no_such_function', {})
+
+
+def test_submodule_access():
+    assert lets_plot.plot.geom_imshow_.geom_imshow is lets_plot.geom_imshow
+
+
+@pytest.mark.parametrize('module_name', ['export', 'frontend_context'])
+def test_subpackage_attributes(module_name):
+    assert getattr(lets_plot, module_name) is importlib.import_module('lets_plot.' + module_name)
+    assert module_name in dir(lets_plot)
@@ -0,0 +1,45 @@
+#  Copyright (c) 2026. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+import numpy as np
+import pytest
+
+import lets_plot as gg
+from lets_plot._type_utils import standardize_dict
+
+pyarrow = pytest.importorskip('pyarrow')
+import pyarrow.feather
+
+from lets_plot.data import mmap
+
+N = 10_000
+
+
+@pytest.fixture
+def arrow_file(tmp_path):
+    path = tmp_path / 'data.arrow'
+    table = pyarrow.table({'x': np.arange(N, dtype=np.float64), 'c': ['a', 'b'] * (N // 2)})
+    pyarrow.feather.write_feather(table, str(path), compression='uncompressed', chunksize=N)
+    return path
+
+
+def test_numeric_column_is_not_copied(arrow_file):
+    table = mmap(arrow_file)
+    allocated = pyarrow.total_allocated_bytes()
+
+    standardized = standardize_dict({'x': table.column('x')}, columnar=True)
+
+    assert isinstance(standardized['x'], memoryview)
+    assert np.asarray(standardized['x']).tolist() == list(range(N))
+    assert pyarrow.total_allocated_bytes() == allocated
+
+
+def test_columns(arrow_file):
+    assert mmap(arrow_file, columns=['c']).column_names == ['c']
+
+
+def test_plot_data(arrow_file):
+    p = gg.ggplot(mmap(str(arrow_file)), gg.aes('x', 'x', color='c')) + gg.geom_point()
+    data = standardize_dict(p.as_dict(), columnar=True)['data']
+
+    assert isinstance(data['x'], memoryview)
+    assert data['c'].levels == ['a', 'b']
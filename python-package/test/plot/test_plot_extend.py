@@ -0,0 +1,65 @@
+#  Copyright (c) 2026. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+import pytest
+
+import lets_plot as gg
+from lets_plot.plot.core import DummySpec
+
+
+def _features():
+    return [
+        gg.geom_point(x=0, y=0),
+        gg.geom_line(x=[0, 1], y=[0, 1]),
+        gg.scale_x_log10(),
+        gg.theme_grey(),
+        gg.theme(axis_title='blank'),
+        gg.ggtitle('Title'),
+        gg.aes(color='x'),
+        gg.ggsize(400, 300),
+    ]
+
+
+def test_extend_same_as_add():
+    p = gg.ggplot({'x': [0, 1]})
+
+    expected = p
+    for feature in _features():
+        expected += feature
+
+    assert p.extend(_features()).as_dict() == expected.as_dict()
+
+
+def test_extend_does_not_modify_plot():
+    p = gg.ggplot() + gg.geom_point(x=0, y=0)
+    p_dict = p.as_dict()
+
+    p2 = p.extend([gg.geom_line(x=[0, 1], y=[0, 1]), gg.theme_minimal()])
+
+    assert p.as_dict() == p_dict
+    assert len(p2.as_dict()['layers']) == 2
+
+
+def test_extend_with_feature_list_and_dummy():
+    p = gg.ggplot()
+    features = [gg.geom_point(x=0, y=0) + gg.geom_line(x=[0, 1], y=[0, 1]), DummySpec()]
+
+    assert p.extend(features).as_dict() == (p + features[0] + features[1]).as_dict()
+
+
+def test_extend_with_generator():
+    p = gg.ggplot().extend(gg.geom_point(x=i, y=i) for i in range(100))
+
+    assert len(p.as_dict()['layers']) == 100
+
+
+def test_add_feature_list_does_not_modify_plot():
+    p = gg.ggplot() + gg.geom_point(x=0, y=0)
+    p2 = p + (gg.geom_line(x=[0, 1], y=[0, 1]) + gg.geom_text(x=0, y=0, label='a'))
+
+    assert len(p.as_dict()['layers']) == 1
+    assert [layer['geom'] for layer in p2.as_dict()['layers']] == ['point', 'line', 'text']
+
+
+def test_extend_unsupported():
+    with pytest.raises(TypeError):
+        gg.ggplot().extend([gg.geom_point(), 'point'])
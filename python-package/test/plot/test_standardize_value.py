@@ -13,10 +13,13 @@ np = LazyModule('numpy')
 pd = LazyModule('pandas')
 jax = LazyModule('jax')
 pl = LazyModule('polars')
+pa = LazyModule('pyarrow')
 shapely = LazyModule('shapely')
 gpd = LazyModule('geopandas')
 
-from lets_plot._type_utils import _standardize_value, is_ndarray, LazyModule
+from lets_plot._global_settings import _settings, _to_actual_name, COLUMN_CACHE
+from lets_plot._type_utils import _standardize_value, standardize_dict, is_ndarray, LazyModule, DictionaryEncodedColumn, \
+    _column_cache
 
 
 def test_standardize_value_types():
@@ -430,6 +433,202 @@ def test_perf_datetime_pandas_series():
     assert standardized_large_series[-1] == 1672576245000.0  # Normal datetime converted to epoch millis
 
 
+@pytest.mark.skipif(not np, reason='requires numpy')
+def test_columnar_numpy_buffers():
+    result = standardize_dict({
+        'f': np.array([1.5, np.nan, np.inf]),
+        'i': np.array([1, 2, 3], dtype=np.int32),
+        'b': np.array([True, False]),
+        'd': np.array(['2023-01-01T12:30:45', 'NaT'], dtype='datetime64[s]'),
+        's': np.array(['foo', 'bar']),
+    }, columnar=True)
+
+    assert isinstance(result['f'], memoryview) and result['f'].format == 'd'
+    assert result['f'].tolist()[0] == 1.5
+    assert math.isnan(result['f'].tolist()[1])  # NaN marks a missing value
+    assert result['f'].tolist()[2] == math.inf  # non-finite values are treated as missing by the bridge
+
+    assert result['i'].format == 'd' and result['i'].tolist() == [1.0, 2.0, 3.0]
+    assert result['b'].format == '?' and result['b'].tolist() == [True, False]
+
+    assert result['d'].format == 'd'
+    assert result['d'].tolist()[0] == 1672576245000.0
+    assert math.isnan(result['d'].tolist()[1])
+
+    assert result['s'] == ['foo', 'bar']  # not supported by the buffer transport
+
+
+@pytest.mark.skipif(not np, reason='requires numpy')
+def test_columnar_is_not_applied_to_scalars_and_nd_arrays():
+    result = standardize_dict({
+        'v': np.float64(1.5),
+        'm': np.array([[1, 2], [3, 4]]),
+    }, columnar=True)
+
+    assert result == {'v': 1.5, 'm': [[1.0, 2.0], [3.0, 4.0]]}
+
+
+@pytest.mark.skipif(not np or not pd, reason='requires numpy and pandas')
+def test_columnar_pandas_extension_arrays():
+    df = pd.DataFrame({
+        'i': pd.array([1, None, 3], dtype='Int64'),
+        't': pd.to_datetime(['2023-01-01T12:30:45', None, None]).tz_localize('UTC'),
+    })
+
+    result = standardize_dict(df, columnar=True)
+
+    assert result['i'].format == 'd'
+    assert result['i'].tolist()[0] == 1.0
+    assert math.isnan(result['i'].tolist()[1])
+
+    assert result['t'].tolist()[0] == 1672576245000.0
+    assert math.isnan(result['t'].tolist()[1])
+    assert math.isnan(result['t'].tolist()[2])
+
+
+@pytest.mark.skipif(not np, reason='requires numpy')
+def test_columnar_dictionary_encoded_strings():
+    result = standardize_dict({
+        'rep': np.array(['b', 'a', 'b', 'a', 'b', 'c']),
+        'obj': np.array(['x', None, 'x', 'x'], dtype=object),
+        'uniq': np.array(['foo', 'bar', 'baz']),
+        'mixed': np.array(['a', 1, 'a', 1], dtype=object),
+    }, columnar=True)
+
+    assert isinstance(result['rep'], DictionaryEncodedColumn)
+    assert result['rep'].levels == ['b', 'a', 'c']  # order of appearance
+    assert result['rep'].codes.format == 'i'
+    assert result['rep'].codes.tolist() == [0, 1, 0, 1, 0, 2]
+
+    assert result['obj'].levels == ['x']
+    assert result['obj'].tolist() == ['x', None, 'x', 'x']
+
+    # Not worth encoding
+    assert result['uniq'] == ['foo', 'bar', 'baz']
+    assert result['mixed'] == ['a', 1.0, 'a', 1.0]
+
+
+@pytest.mark.skipif(not np, reason='requires numpy')
+def test_columnar_dictionary_encoding_of_long_columns(monkeypatch):
+    import lets_plot._type_utils as type_utils
+    n = 5000
+    rep = np.array(['a', 'b', None, 'c'] * (n // 4), dtype=object)
+    uniq = np.array(['s{}'.format(i) for i in range(n)], dtype=object)
+    mixed = np.array([1, 'a'] * (n // 2), dtype=object)
+
+    factorized = []
+    factorize = type_utils.pandas.factorize if type_utils.pandas.is_loaded else None
+    if factorize is not None:
+        monkeypatch.setattr(type_utils.pandas._inst, 'factorize', lambda v: factorized.append(len(v)) or factorize(v))
+
+    result = standardize_dict({'rep': rep, 'uniq': uniq, 'mixed': mixed}, columnar=True)
+
+    assert isinstance(result['rep'], DictionaryEncodedColumn)
+    assert result['rep'].levels == ['a', 'b', 'c']
+    assert result['uniq'] == uniq.tolist()
+    assert result['mixed'][:2] == [1.0, 'a']
+    if factorize is not None:
+        # The sample of the not repetitive and not string columns is checked only.
+        assert factorized == [n]
+
+
+@pytest.mark.skipif(not np or not pd, reason='requires numpy and pandas')
+def test_columnar_not_hashable_values():
+    df = pd.DataFrame({'a': [[1, 2], [3]], 'b': [{'k': 1}, {'k': 1}]})
+
+    result = standardize_dict({'data': df}, columnar=True)
+
+    assert result['data']['a'] == [[1, 2], [3]]
+    assert result['data']['b'] == [{'k': 1}, {'k': 1}]
+
+
+@pytest.mark.skipif(not np or not pd, reason='requires numpy and pandas')
+def test_columnar_pandas_categorical():
+    df = pd.DataFrame({
+        'c': pd.Categorical(['lo', 'hi', None], categories=['hi', 'lo', 'unused']),
+    })
+
+    result = standardize_dict({'data': df, 'layers': [{'data': df}]}, columnar=True)
+
+    for col in [result['data']['c'], result['layers'][0]['data']['c']]:
+        # Categoricals are always encoded, only the used categories are passed.
+        assert isinstance(col, DictionaryEncodedColumn)
+        assert col.tolist() == ['lo', 'hi', None]
+        assert col.levels == ['lo', 'hi']
+
+
+@pytest.mark.skipif(not np, reason='requires numpy')
+def test_columnar_conversion_is_cached():
+    _column_cache.clear()
+    arr = np.arange(2000)
+    arr.flags.writeable = False
+
+    first = standardize_dict({'x': arr}, columnar=True)['x']
+    second = standardize_dict({'x': arr[:]}, columnar=True)['x']  # another view of the same data
+
+    assert second is first
+    assert len(_column_cache) == 1
+
+
+@pytest.mark.skipif(not np, reason='requires numpy')
+def test_writeable_columns_are_not_cached():
+    _column_cache.clear()
+    arr = np.arange(2000)
+    view = arr[:]
+    view.flags.writeable = False  # a read-only view of a writeable array
+
+    standardize_dict({'x': arr}, columnar=True)
+    first = standardize_dict({'x': view}, columnar=True)['x']
+    assert len(_column_cache) == 0
+
+    arr[1000] = -1  # in-place modification
+    second = standardize_dict({'x': view}, columnar=True)['x']
+    assert second.tolist()[1000] == -1.0
+    assert first.tolist()[1000] == 1000.0
+
+
+@pytest.mark.skipif(not np or not pd, reason='requires numpy and pandas')
+def test_columnar_conversion_of_pandas_columns_is_cached():
+    pytest.importorskip('pyarrow')
+    _column_cache.clear()
+    df = pd.DataFrame({
+        's': pd.array(['a', 'b'] * 1000, dtype='string[pyarrow]'),
+        'p': pd.array(range(2000), dtype='int64[pyarrow]'),
+        'n': pd.array(range(2000), dtype='Int64'),
+        'c': pd.Categorical(['a', 'b'] * 1000),
+    })
+
+    first = standardize_dict(df, columnar=True)
+    second = standardize_dict(df, columnar=True)
+
+    # Only the Arrow-backed columns: the other ones can be modified in place.
+    assert second['s'] is first['s']
+    assert second['p'] is first['p']
+    assert len(_column_cache) == 2
+
+    df.loc[7, 'n'] = 99
+    df.loc[7, 's'] = 'zzz'
+    df.loc[7, 'p'] = 99
+    third = standardize_dict(df, columnar=True)
+
+    assert third['n'].tolist()[7] == 99.0
+    assert third['s'].tolist()[7] == 'zzz'
+    assert third['p'].tolist()[7] == 99.0
+
+
+@pytest.mark.skipif(not np, reason='requires numpy')
+def test_column_cache_disabled():
+    _column_cache.clear()
+    _settings[_to_actual_name(COLUMN_CACHE)] = False
+    try:
+        arr = np.arange(2000)
+        arr.flags.writeable = False
+        standardize_dict({'x': arr}, columnar=True)
+        assert len(_column_cache) == 0
+    finally:
+        del _settings[_to_actual_name(COLUMN_CACHE)]
+
+
 @pytest.mark.skipif(not np, reason='requires numpy')
 @pytest.mark.skipif(not jax, reason='requires jax')
 def test_is_ndarray():
@@ -617,3 +816,91 @@ def test_standardize_value_numpy_datetime64_consistency():
     assert standardized_start_time == standardized_array[0]
 
     assert standardized_list == standardized_array
+
+
+
+def _arrow_test_data():
+    return {
+        'i': [1, None, 3],
+        'f': [1.5, None, float('nan')],
+        'b': [True, False, True],
+        'bn': [True, None, False],
+        'rep': ['b', None, 'b'],
+        'uniq': ['foo', None, 'bar'],
+        't': [datetime(2023, 1, 1, 12, 30, 45, tzinfo=timezone.utc), None, None],
+        'd': [date(2023, 1, 1), None, None],
+        'tm': [time(12, 34, 56, 789000), None, None],
+        'td': [timedelta(days=1, hours=2, minutes=30), None, None],
+    }
+
+
+def _assert_columnar_arrow_columns(result):
+    assert result['i'].format == 'd'
+    assert result['i'].tolist()[::2] == [1.0, 3.0]
+    assert math.isnan(result['i'].tolist()[1])  # null
+    assert math.isnan(result['f'].tolist()[1]) and math.isnan(result['f'].tolist()[2])
+
+    assert result['b'].format == '?' and result['b'].tolist() == [True, False, True]
+    assert result['bn'] == [True, None, False]
+
+    assert isinstance(result['rep'], DictionaryEncodedColumn)
+    assert result['rep'].levels == ['b']
+    assert result['rep'].codes.format == 'i'
+    assert result['rep'].codes.tolist() == [0, -1, 0]
+    assert result['uniq'] == ['foo', None, 'bar']  # not worth encoding
+
+    for name, value in [('t', 1672576245000.0), ('d', 1672531200000.0), ('tm', 45296789.0), ('td', 95400000.0)]:
+        assert result[name].format == 'd'
+        assert result[name].tolist()[0] == value
+        assert math.isnan(result[name].tolist()[1])
+
+
+@pytest.mark.skipif(not pl, reason='requires polars')
+def test_columnar_polars_columns():
+    result = standardize_dict({'data': pl.DataFrame(_arrow_test_data())}, columnar=True)
+
+    _assert_columnar_arrow_columns(result['data'])
+
+
+@pytest.mark.skipif(not pl, reason='requires polars')
+def test_columnar_polars_categorical():
+    df = pl.DataFrame({
+        'c': pl.Series(['lo', 'hi', None], dtype=pl.Categorical),
+        'e': pl.Series(['lo', 'hi', None], dtype=pl.Enum(['hi', 'lo', 'unused'])),
+    })
+
+    result = standardize_dict({'data': df}, columnar=True)['data']
+
+    for col in [result['c'], result['e']]:
+        # Categoricals are always encoded, only the used categories are passed.
+        assert isinstance(col, DictionaryEncodedColumn)
+        assert col.tolist() == ['lo', 'hi', None]
+        assert col.levels == ['lo', 'hi']
+
+
+@pytest.mark.skipif(not pa, reason='requires pyarrow')
+def test_columnar_arrow_table():
+    result = standardize_dict({'data': pa.table(_arrow_test_data())}, columnar=True)
+
+    _assert_columnar_arrow_columns(result['data'])
+
+
+@pytest.mark.skipif(not pa, reason='requires pyarrow')
+def test_columnar_arrow_chunked_dictionary():
+    column = pa.chunked_array([
+        pa.array(['lo', 'hi']).dictionary_encode(),
+        pa.array([None, 'lo', 'mid']).dictionary_encode(),
+    ])
+
+    result = standardize_dict({'c': column}, columnar=True)
+
+    assert isinstance(result['c'], DictionaryEncodedColumn)
+    assert result['c'].tolist() == ['lo', 'hi', None, 'lo', 'mid']
+    assert result['c'].levels == ['lo', 'hi', 'mid']
+
+
+@pytest.mark.skipif(not pa, reason='requires pyarrow')
+def test_arrow_table():
+    table = pa.table({'x': [1, None], 's': ['a', None]})
+
+    assert standardize_dict({'data': table}) == {'data': {'x': [1.0, None], 's': ['a', None]}}
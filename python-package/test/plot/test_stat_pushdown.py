@@ -0,0 +1,192 @@
+#  Copyright (c) 2026. JetBrains s.r.o.
+#  Use of this source code is governed by the MIT license that can be found in the LICENSE file.
+import numpy as np
+import pandas as pd
+import pytest
+
+import lets_plot as gg
+from lets_plot._global_settings import _settings, _to_actual_name, STAT_PUSHDOWN
+
+DATA = {
+    'g': ['a'] * 5 + ['b'] * 2,
+    'v': [1.0, 2.0, 3.0, 4.0, 100.0, 5.0, 6.0],
+}
+
+
+@pytest.fixture
+def pushdown():
+    _settings[_to_actual_name(STAT_PUSHDOWN)] = True
+    yield
+    _settings.pop(_to_actual_name(STAT_PUSHDOWN), None)
+
+
+def _layers(*layers):
+    return gg.ggplot().extend(layers).as_dict()['layers']
+
+
+def _layer(layer):
+    return _layers(layer)[0]
+
+
+def _list(values):
+    return [None if isinstance(v, float) and np.isnan(v) else v for v in np.asarray(values).tolist()]
+
+
+def test_disabled_by_default():
+    d = _layer(gg.geom_bar(gg.aes('g'), data=DATA))
+
+    assert d['data'] == DATA
+    assert 'stat' not in d
+    assert 'pre_applied_stat' not in d['data_meta']
+
+
+def test_count(pushdown):
+    d = _layer(gg.geom_bar(gg.aes('g'), data=pd.DataFrame(DATA)))
+
+    assert _list(d['data']['g']) == ['a', 'b']
+    assert _list(d['data']['count']) == [5.0, 2.0]
+    assert d['mapping'] == {'x': 'g', 'y': 'count'}
+    assert d['stat'] == 'identity'
+    assert d['data_meta']['pre_applied_stat'] == 'count'
+
+
+def test_summary_quantiles(pushdown):
+    d = _layer(gg.stat_summary(gg.aes('g', 'v'), data=DATA, fun='median', fun_min='lq', fun_max='uq'))
+
+    assert _list(d['data']['v']) == [3.0, 5.5]
+    # AggregateFunctions.quantile(): the mean of the neighbours, not an interpolation
+    assert _list(d['data']['ymin']) == [2.0, 5.5]
+    assert _list(d['data']['ymax']) == [4.0, 5.5]
+    assert d['data_meta']['pre_applied_stat'] == 'summary'
+    assert 'fun' not in d
+
+
+def test_boxplot(pushdown):
+    box, outliers = _layers(gg.geom_boxplot(gg.aes('g', 'v'), data=DATA))
+
+    assert box['mapping'] == {'x': 'g', 'ymin': 'ymin', 'ymax': 'ymax',
+                              'lower': 'lower', 'middle': 'middle', 'upper': 'upper'}
+    assert _list(box['data']['g']) == ['a', 'b']
+    assert _list(box['data']['lower']) == [2.0, 5.5]
+    assert _list(box['data']['middle']) == [3.0, 5.5]
+    assert _list(box['data']['upper']) == [4.0, 5.5]
+    # no values within the fences: the whiskers are at the fences
+    assert _list(box['data']['ymin']) == [1.0, 5.5]
+    assert _list(box['data']['ymax']) == [4.0, 5.5]
+    assert box['data_meta']['pre_applied_stat'] == 'boxplot'
+
+    assert outliers['data_meta']['pre_applied_stat'] == 'boxplot_outlier'
+    assert outliers['mapping']['y'] == 'v'
+    assert _list(outliers['data']['g']) == ['a', 'b', 'b']
+    assert _list(outliers['data']['v']) == [100.0, 5.0, 6.0]
+
+
+def test_boxplot_varwidth(pushdown):
+    box = _layer(gg.geom_boxplot(gg.aes('g', 'v', fill='g'), data=DATA, varwidth=True))
+
+    # each box is a separate group: the width is normalized by its own count
+    assert _list(box['data']['width']) == [1.0, 1.0]
+    assert box['mapping']['width'] == 'width'
+
+
+def test_histogram_groups(pushdown):
+    data = {'x': [0.0, 1.0, 2.0, 3.0, 4.0], 'c': ['a', 'b', 'a', 'b', 'b']}
+
+    d = _layer(gg.geom_histogram(gg.aes('x', fill='c'), data=data, bins=2))
+
+    assert _list(d['data']['c']) == ['a', 'a', 'b', 'b']
+    assert _list(d['data']['count']) == [1.0, 1.0, 1.0, 2.0]
+    assert d['data_meta']['pre_applied_stat'] == 'bin'
+
+
+def test_explicit_group(pushdown):
+    data = {'x': [0.0, 1.0, 2.0], 'c': ['a', 'a', 'a'], 'k': [1, 2, 1]}
+
+    d = _layer(gg.geom_bar(gg.aes('x', fill='c', group='k'), data=data))
+
+    # the 'group' mapping overrides the grouping by the discrete variables
+    assert _list(d['data']['k']) == [1.0, 1.0, 2.0]
+    assert 'c' not in d['data']
+
+
+def test_unsupported_layers_are_kept(pushdown):
+    assert _layer(gg.geom_point(gg.aes('g', 'v'), data=DATA))['data'] == DATA
+    assert _layer(gg.geom_bar(gg.aes('g'), data=DATA, orientation='y'))['data'] == DATA
+    assert _layer(gg.geom_histogram(data=DATA))['data'] == DATA
+    assert 'data' not in _layer(gg.geom_histogram(gg.aes('v')))
+
+
+def test_standalone_layer_is_kept(pushdown):
+    # The plot mapping, facets and scales are not known yet.
+    d = gg.geom_bar(gg.aes('g'), data=DATA).as_dict()
+
+    assert d['data'] == DATA
+    assert 'pre_applied_stat' not in d['data_meta']
+
+
+@pytest.mark.parametrize('feature', [
+    gg.facet_wrap('g'),
+    gg.scale_x_log10(),
+    gg.xlim(0, 10),
+    gg.scale_fill_discrete(),
+])
+def test_plot_features_keep_layers(pushdown, feature):
+    p = gg.ggplot() + gg.geom_histogram(gg.aes('v'), data=DATA) + feature
+
+    d = p.as_dict()['layers'][0]
+
+    assert d['data'] == DATA
+    assert 'pre_applied_stat' not in d['data_meta']
+
+
+def test_inherited_plot_mapping_keeps_layers(pushdown):
+    data = dict(DATA, c=['u', 'w'] * 3 + ['u'])
+
+    inherited = (gg.ggplot(data, gg.aes(fill='c')) + gg.geom_histogram(gg.aes('v'), data=data)).as_dict()
+    own = (gg.ggplot(data, gg.aes(fill='c')) + gg.geom_histogram(gg.aes('v'), data=data, inherit_aes=False)).as_dict()
+
+    assert inherited['layers'][0]['data'] == data
+    assert own['layers'][0]['data_meta']['pre_applied_stat'] == 'bin'
+
+
+def test_as_discrete_groups(pushdown):
+    data = {'x': [0.0, 1.0, 2.0], 'k': [1, 2, 1]}
+
+    d = _layer(gg.geom_bar(gg.aes('x', fill=gg.as_discrete('k', label='K')), data=data))
+
+    assert _list(d['data']['k']) == [1.0, 1.0, 2.0]
+    assert d['data_meta']['mapping_annotations'][0]['parameters'] == {'label': 'K'}
+
+
+def test_bins_over_other_layers_keep_layers(pushdown):
+    # The bins cover the x range of all layers: the histogram is computed by the plotting engine.
+    p = gg.ggplot() + gg.geom_histogram(gg.aes('v'), data={'v': [0, 1, 2, 3]}, bins=2) \
+        + gg.geom_point(gg.aes('x', 'y'), data={'x': [100], 'y': [1]})
+
+    d = p.as_dict()['layers'][0]
+
+    assert d['data'] == {'v': [0, 1, 2, 3]}
+    assert 'pre_applied_stat' not in d['data_meta']
+
+
+def test_count_with_other_layers(pushdown):
+    p = gg.ggplot() + gg.geom_bar(gg.aes('g'), data=DATA) + gg.geom_point(gg.aes('x', 'y'), data={'x': [100], 'y': [1]})
+
+    assert p.as_dict()['layers'][0]['data_meta']['pre_applied_stat'] == 'count'
+
+
+def test_stat_is_computed_once(pushdown, monkeypatch):
+    from lets_plot.plot import util
+    calls = []
+    pre_apply_stat = util.pre_apply_stat
+    monkeypatch.setattr(util, 'pre_apply_stat', lambda layer: calls.append(layer) or pre_apply_stat(layer))
+
+    layer = gg.geom_bar(gg.aes('g'), data=DATA)
+    p = gg.ggplot() + layer
+    p.as_dict()
+    (p + gg.ggtitle('t')).as_dict()
+    assert len(calls) == 1
+
+    layer.props()['width'] = 0.5
+    assert p.as_dict()['layers'][0]['width'] == 0.5
+    assert len(calls) == 2